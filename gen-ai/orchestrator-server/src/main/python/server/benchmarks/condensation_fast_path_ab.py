@@ -0,0 +1,140 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+A/B comparison of the retrieval quality, with the question condensation
+LLM call (A) and with the condensation fast path (B), for first-turn questions.
+
+For each question, the retrieval runs twice against the real providers and
+vector store of the given RAG request, then stops (no answer generation):
+  A: the condensed question and its key words come from the condensing LLM,
+  B: the question is used as is, its key words are extracted locally.
+
+Reported per question and on average:
+  - overlap@k: Jaccard similarity of the retrieved chunks,
+  - recall@k: share of the A chunks also retrieved by B,
+  - top-1 agreement,
+  - time to retrieved documents, for A and B.
+
+Usage (from the server directory):
+    PYTHONPATH=src python benchmarks/condensation_fast_path_ab.py \
+        --request rag_request.json --questions questions.txt [--output results.json]
+
+    rag_request.json: a /rag request body (its dialog history is ignored)
+    questions.txt: one question per line
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.models.streaming.stream_event import StreamEventType
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.rag_chain import stream_rag_chain
+
+
+def first_turn_request(request_body: dict, question: str) -> RAGRequest:
+    body = json.loads(json.dumps(request_body))
+    body['dialog'] = {**(body.get('dialog') or {}), 'history': []}
+    body['question_answering_prompt']['inputs']['question'] = question
+    return RAGRequest(**body)
+
+
+async def retrieve(request: RAGRequest, fast_path: bool) -> dict:
+    """Run the RAG chain until the documents are retrieved."""
+    application_settings.rag_condensation_fast_path_enabled = fast_path
+    result = {'condensed_question': None, 'documents': []}
+    start_time = time.perf_counter()
+
+    events = stream_rag_chain(request, debug=False)
+    async for event in events:
+        if event.event == StreamEventType.CONDENSED_QUESTION:
+            result['condensed_question'] = event.data
+        elif event.event == StreamEventType.DOCUMENTS:
+            result['documents'] = [
+                f"{footnote.identifier}:{(footnote.metadata or {}).get('chunk')}"
+                for footnote in event.data
+            ]
+            break
+    await events.aclose()
+
+    result['duration'] = time.perf_counter() - start_time
+    return result
+
+
+def compare(a: dict, b: dict) -> dict:
+    a_docs, b_docs = set(a['documents']), set(b['documents'])
+    union = a_docs | b_docs
+    return {
+        'overlap': len(a_docs & b_docs) / len(union) if union else 1.0,
+        'recall': len(a_docs & b_docs) / len(a_docs) if a_docs else 1.0,
+        'top1_agreement': a['documents'][:1] == b['documents'][:1],
+        'a_duration': a['duration'],
+        'b_duration': b['duration'],
+    }
+
+
+async def main(request_path: str, questions_path: str, output_path: str) -> None:
+    with open(request_path, encoding='utf-8') as request_file:
+        request_body = json.load(request_file)
+    with open(questions_path, encoding='utf-8') as questions_file:
+        questions = [line.strip() for line in questions_file if line.strip()]
+
+    results = []
+    for question in questions:
+        request = first_turn_request(request_body, question)
+        a = await retrieve(request, fast_path=False)
+        b = await retrieve(request, fast_path=True)
+        comparison = compare(a, b)
+        results.append({'question': question, 'a': a, 'b': b, **comparison})
+        print(
+            f"overlap={comparison['overlap']:.2f} recall={comparison['recall']:.2f} "
+            f"top1={'yes' if comparison['top1_agreement'] else 'no '} "
+            f"A={comparison['a_duration'] * 1000:.0f}ms "
+            f"B={comparison['b_duration'] * 1000:.0f}ms | {question}"
+        )
+
+    if not results:
+        print('No question to compare.')
+        return
+
+    print(f"\n{len(results)} questions")
+    print(f"  mean overlap@k : {statistics.mean(r['overlap'] for r in results):.3f}")
+    print(f"  mean recall@k  : {statistics.mean(r['recall'] for r in results):.3f}")
+    print(
+        f"  top-1 agreement: {statistics.mean(r['top1_agreement'] for r in results):.1%}"
+    )
+    print(
+        f"  time to documents, median: A={statistics.median(r['a_duration'] for r in results) * 1000:.0f}ms"
+        f" B={statistics.median(r['b_duration'] for r in results) * 1000:.0f}ms"
+    )
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            json.dump(results, output_file, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--request', required=True, help='A /rag request body (JSON)')
+    parser.add_argument('--questions', required=True, help='One question per line')
+    parser.add_argument('--output', default=None, help='Detailed results (JSON)')
+    args = parser.parse_args()
+
+    asyncio.run(main(args.request, args.questions, args.output))
@@ -0,0 +1,209 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark of the hybrid search: the two-request fusion (A) against the
+single-request native hybrid search (B), on OpenSearch or PGVector.
+
+For each question, the hybrid retrieval runs against the vector store index of
+the given RAG request, the question being used as the condensed question, and
+its key words being extracted locally:
+  A: a vector search and a full-text search, run concurrently (two requests,
+     two pool connections with PGVector) and fused by the RAG chain
+     (FusionRetriever, with the fusion params of the request),
+  B: one hybrid request, fused by the vector store:
+     - OpenSearch: a hybrid query and a normalization search pipeline
+       (neural-search plugin 2.10+),
+     - PGVector: a single SQL statement (ANN and full-text CTEs, fused in SQL).
+The query embedding is computed once beforehand (query embedding cache), so
+that only the vector store round trips and the fusion are measured.
+With --concurrency N, N retrievals run at the same time (e.g. to see the
+effect of the pool size, since A holds two connections per retrieval).
+
+Reported per question and on average:
+  - overlap@k: Jaccard similarity of the retrieved chunks,
+  - top-1 agreement,
+  - latency of A and B (median and p95 of the repetitions).
+
+Usage (from the server directory):
+    PYTHONPATH=src python benchmarks/hybrid_search_benchmark.py \
+        --request rag_request.json --questions questions.txt [--repeat 5] \
+        [--concurrency 1]
+
+    rag_request.json: a /rag request body, with OpenSearch or PGVector settings
+                      (e.g. a local PostgreSQL with the pgvector extension)
+    questions.txt: one question per line
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_em_factory,
+    get_vector_store_factory,
+)
+from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    FusionRetriever,
+    build_fts_fusion_source,
+    build_vector_fusion_source,
+    get_chunk_identifier,
+)
+from gen_ai_orchestrator.services.utils.keyword_extractor import (
+    extract_keywords,
+)
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(ratio * len(values)))]
+
+
+async def measure(
+    retrieve, repeat: int, concurrency: int
+) -> tuple[list[str], list[float]]:
+    """
+    Run a retrieval several times (concurrency times at once), and return its
+    chunks and durations.
+    """
+
+    async def timed_retrieve():
+        start_time = time.perf_counter()
+        documents = await retrieve()
+        return documents, time.perf_counter() - start_time
+
+    durations = []
+    for _ in range(repeat):
+        results = await asyncio.gather(*[timed_retrieve() for _ in range(concurrency)])
+        documents = results[0][0]
+        durations += [duration for _, duration in results]
+    return [get_chunk_identifier(doc) for doc in documents], durations
+
+
+async def main(
+    request_path: str, questions_path: str, repeat: int, concurrency: int
+) -> None:
+    with open(request_path, encoding='utf-8') as request_file:
+        request = RAGRequest(**json.load(request_file))
+    with open(questions_path, encoding='utf-8') as questions_file:
+        questions = [line.strip() for line in questions_file if line.strip()]
+
+    embedding_model = get_em_factory(
+        setting=request.embedding_question_em_setting
+    ).get_embedding_model()
+    vector_store_factory = get_vector_store_factory(
+        setting=request.vector_store_setting,
+        index_name=request.document_index_name,
+        embedding_function=embedding_model,
+    )
+    search_kwargs = request.document_search_params.to_dict()
+    fusion = request.document_search_params.fusion
+
+    fusion_retriever = FusionRetriever(
+        sources=[
+            build_vector_fusion_source(
+                'similarity',
+                vector_store_factory.get_vector_store_retriever(search_kwargs),
+                weight=fusion.weights.get('similarity', 1.0),
+            ),
+            build_fts_fusion_source(
+                'fts',
+                vector_store_factory.get_text_store_retriever(search_kwargs),
+                weight=fusion.weights.get('fts', 1.0),
+            ),
+        ],
+        method=fusion.method,
+        rrf_k=fusion.rrf_k,
+        top_n=search_kwargs['k'],
+        timeout=fusion.timeout,
+    )
+    hybrid_search_retriever = vector_store_factory.get_hybrid_search_retriever(
+        search_kwargs, fusion
+    )
+
+    results = []
+    for question in questions:
+        key_words = extract_keywords(
+            question, request.question_answering_prompt.inputs.get('locale')
+        )
+        inputs = {
+            'chat_chain_result': {'condensed_question': question, 'key_words': key_words}
+        }
+        # Warm up: query embedding cache, connections
+        await embedding_model.aembed_query(question)
+        await hybrid_search_retriever.ahybrid_search(question, key_words)
+
+        a_chunks, a_durations = await measure(
+            lambda: fusion_retriever.retrieve(inputs), repeat, concurrency
+        )
+        b_chunks, b_durations = await measure(
+            lambda: hybrid_search_retriever.ahybrid_search(question, key_words),
+            repeat,
+            concurrency,
+        )
+        union = set(a_chunks) | set(b_chunks)
+        result = {
+            'question': question,
+            'overlap': len(set(a_chunks) & set(b_chunks)) / len(union) if union else 1.0,
+            'top1_agreement': a_chunks[:1] == b_chunks[:1],
+            'a_duration': statistics.median(a_durations),
+            'b_duration': statistics.median(b_durations),
+            'a_durations': a_durations,
+            'b_durations': b_durations,
+        }
+        results.append(result)
+        print(
+            f"overlap={result['overlap']:.2f} "
+            f"top1={'yes' if result['top1_agreement'] else 'no '} "
+            f"A={result['a_duration'] * 1000:.0f}ms "
+            f"B={result['b_duration'] * 1000:.0f}ms | {question}"
+        )
+
+    if not results:
+        print('No question to compare.')
+        return
+
+    a_durations = [d for r in results for d in r['a_durations']]
+    b_durations = [d for r in results for d in r['b_durations']]
+    print(
+        f"\n{len(results)} questions, {repeat} repetitions, concurrency {concurrency}"
+    )
+    print(f"  mean overlap@k : {statistics.mean(r['overlap'] for r in results):.3f}")
+    print(
+        f"  top-1 agreement: {statistics.mean(r['top1_agreement'] for r in results):.1%}"
+    )
+    print(
+        f"  latency, median: A={statistics.median(a_durations) * 1000:.0f}ms"
+        f" B={statistics.median(b_durations) * 1000:.0f}ms"
+    )
+    print(
+        f"  latency, p95   : A={percentile(a_durations, 0.95) * 1000:.0f}ms"
+        f" B={percentile(b_durations, 0.95) * 1000:.0f}ms"
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--request', required=True, help='A /rag request body (JSON)')
+    parser.add_argument('--questions', required=True, help='One question per line')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions per question')
+    parser.add_argument(
+        '--concurrency', type=int, default=1, help='Concurrent retrievals per repetition'
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.request, args.questions, args.repeat, args.concurrency))
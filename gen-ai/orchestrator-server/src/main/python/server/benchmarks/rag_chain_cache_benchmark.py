@@ -0,0 +1,111 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark of the RAG chain acquisition latency, with the RAG chain cache on and off.
+
+The measure covers what the orchestrator does for each /rag call before the
+first provider round trip: prompt validation, factories, clients, retrievers
+and chain assembly. Provider calls are not made, so no network is needed.
+
+Usage (from the server directory):
+    PYTHONPATH=src python benchmarks/rag_chain_cache_benchmark.py [--iterations 200]
+"""
+
+import argparse
+import statistics
+import time
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    create_rag_chain,
+)
+from gen_ai_orchestrator.services.langchain.rag_chain_cache import (
+    rag_chain_cache,
+)
+
+
+def build_request(question: str) -> RAGRequest:
+    llm_setting = {
+        'provider': 'OpenAI',
+        'api_key': {'type': 'Raw', 'secret': 'sk-benchmark'},
+        'temperature': 0,
+        'model': 'gpt-4o-mini',
+    }
+    return RAGRequest(
+        **{
+            'dialog': {'history': [], 'tags': []},
+            'question_condensing_llm_setting': llm_setting,
+            'question_condensing_prompt': {
+                'formatter': 'jinja2',
+                'template': 'Reformulate the question in {{ locale }}.',
+                'inputs': {'locale': 'French'},
+            },
+            'question_answering_llm_setting': llm_setting,
+            'question_answering_prompt': {
+                'formatter': 'jinja2',
+                'template': 'Context: {{ context }}\nQuestion: {{ question }}',
+                'inputs': {'question': question},
+            },
+            'embedding_question_em_setting': {
+                'provider': 'OpenAI',
+                'api_key': {'type': 'Raw', 'secret': 'sk-benchmark'},
+                'model': 'text-embedding-3-small',
+            },
+            'document_index_name': 'benchmark-index',
+            'document_search_params': {'provider': 'OpenSearch', 'k': 4},
+            'vector_store_setting': {
+                'provider': 'OpenSearch',
+                'host': 'localhost',
+                'port': 9200,
+                'username': 'admin',
+                'password': {'type': 'Raw', 'secret': 'admin'},
+            },
+        }
+    )
+
+
+def run(iterations: int, cache_enabled: bool) -> list[float]:
+    application_settings.rag_chain_cache_enabled = cache_enabled
+    rag_chain_cache.clear()
+
+    durations = []
+    for i in range(iterations):
+        request = build_request(question=f'Question number {i}?')
+        start = time.perf_counter()
+        create_rag_chain(request)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(name: str, durations: list[float]) -> None:
+    ordered = sorted(durations)
+    print(
+        f"{name:<10} mean={statistics.mean(ordered):8.3f} ms  "
+        f"p50={ordered[len(ordered) // 2]:8.3f} ms  "
+        f"p95={ordered[int(len(ordered) * 0.95) - 1]:8.3f} ms  "
+        f"max={ordered[-1]:8.3f} ms"
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    report('cache off', run(args.iterations, cache_enabled=False))
+    report('cache on', run(args.iterations, cache_enabled=True))
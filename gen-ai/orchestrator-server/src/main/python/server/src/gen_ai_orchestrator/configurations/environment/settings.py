@@ -23,7 +23,7 @@ from enum import Enum, unique
 from typing import Optional
 
 from path import Path
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from gen_ai_orchestrator.models.vector_stores.vector_store_provider import (
@@ -44,6 +44,29 @@ class _Environment(str, Enum):
     PROD = 'PROD'
 
 
+@unique
+class SpeculativeRetrievalSimilarity(str, Enum):
+    """Enumeration to list the question similarity measures of the speculative retrieval"""
+
+    STRING = 'string'
+    EMBEDDING = 'embedding'
+
+
+@unique
+class SemanticCacheStore(str, Enum):
+    """Enumeration to list the stores of the semantic answer cache"""
+
+    MEMORY = 'memory'
+    PGVECTOR = 'pgvector'
+
+
+class LLMRateLimitBudget(BaseModel):
+    """The per minute budgets of an LLM rate limiter (0 is unlimited)"""
+
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+
+
 class _Settings(BaseSettings):
     """Application class for settings, allowing values to be overridden by environment variables."""
 
@@ -58,10 +81,158 @@ class _Settings(BaseSettings):
     """Request timeout: set the maximum time (in seconds) for the request to be completed."""
     llm_provider_timeout: int = 30
     llm_provider_max_retries: int = 0
-    """ Enable or not the rate limit for the LLM call"""
+    """
+    LLM rate limits: one limiter per provider, endpoint and deployment (Azure OpenAI) or API key (OpenAI).
+    Each call waits (first come, first served) for one request and its estimated tokens (prompt plus maximum
+    completion, counted with tiktoken) within the per minute budgets, 0 being unlimited. The budgets can be
+    overridden per provider ('AzureOpenAIService') or per deployment ('AzureOpenAIService/my-deployment').
+    """
     llm_rate_limits: bool = True
+    llm_rate_limit_requests_per_minute: int = 600
+    llm_rate_limit_tokens_per_minute: int = 0
+    llm_rate_limit_overrides: dict[str, LLMRateLimitBudget] = {}
+    """Completion tokens counted for the calls without maximum completion tokens."""
+    llm_rate_limit_completion_tokens: int = 1024
     em_provider_timeout: int = 4
+    """Failed EM requests (connection errors, timeouts, 429 and 5xx responses) are retried with an exponential backoff."""
+    em_provider_max_retries: int = 2
+    """Delay (in seconds) before the first retry, doubled at each retry."""
+    em_provider_retry_backoff: float = 0.5
+    """Bloomz EM: the texts are sent by sub-batches of this size, with a bounded number of concurrent requests."""
+    em_bloomz_batch_size: int = 32
+    em_bloomz_max_concurrency: int = 4
+    """
+    Query embedding cache: the query embeddings (e.g. condensed questions) are kept in memory (float32),
+    per EM setting and normalized text. Least recently used embeddings are evicted beyond the maximum size.
+    """
+    em_query_cache_enabled: bool = True
+    em_query_cache_max_size_mb: int = 64
+    """Time to live (in seconds) of a cached query embedding. No expiry when 0."""
+    em_query_cache_ttl: int = 0
+    """Concurrent cache misses of the same query embedding share one EM call (single-flight)."""
+    em_query_coalescing_enabled: bool = True
     compressor_provider_timeout: int = 7
+    guardrail_provider_timeout: int = 5
+
+    """
+    Admission control of the RAG, QA and completion routers: one adaptive concurrency limit per router (AIMD).
+    The limit grows by one request per limit of fast responses, and is multiplied by the backoff ratio when a
+    response is slower than the latency tolerance times the average latency (at most once per average latency).
+    Beyond the limit, requests wait in a bounded FIFO queue: they are rejected with a 429 when the queue is full,
+    and with a 503 when they are not admitted before the queue timeout (in seconds). Both come with Retry-After.
+    """
+    admission_control_enabled: bool = True
+    admission_control_initial_limit: int = 20
+    admission_control_min_limit: int = 2
+    admission_control_max_limit: int = 200
+    admission_control_latency_tolerance: float = 2.0
+    admission_control_backoff_ratio: float = 0.9
+    admission_control_max_queue_size: int = 50
+    admission_control_queue_timeout: float = 5
+
+    """LLM and EM clients registry: clients are reused across requests for the same provider setting."""
+    provider_client_registry_max_size: int = 128
+    provider_client_registry_ttl: int = 3600
+    """Shared HTTP connection pool (one per provider host) used by the LLM and EM clients."""
+    provider_http_max_connections: int = 100
+    provider_http_max_keepalive_connections: int = 20
+    """Idle keep-alive connections are closed after this delay (in seconds)."""
+    provider_http_keepalive_expiry: float = 30.0
+    """Enable HTTP/2 towards the providers. It requires the optional 'h2' package."""
+    provider_http2: bool = False
+
+    """RAG chain cache: chains are reused for requests sharing the same settings and prompt templates."""
+    rag_chain_cache_enabled: bool = True
+    rag_chain_cache_max_size: int = 64
+    """Time to live (in seconds) of a cached RAG chain. Secrets resolved at build time are refreshed on expiry."""
+    rag_chain_cache_ttl: int = 3600
+    """
+    Skip the question condensation LLM call when the dialog has no history:
+    the user question is used as is, and its key words are extracted locally.
+    """
+    rag_condensation_fast_path_enabled: bool = True
+    rag_fast_path_max_keywords: int = 10
+    """
+    Speculative retrieval: the vector retrieval starts on the raw user question, concurrently
+    with the question condensation. Its documents are reused when the condensed question is
+    similar enough to the user question (string or embedding similarity), otherwise it is
+    cancelled and the retrieval is done with the condensed question.
+    """
+    rag_speculative_retrieval_enabled: bool = False
+    rag_speculative_retrieval_similarity: SpeculativeRetrievalSimilarity = (
+        SpeculativeRetrievalSimilarity.STRING
+    )
+    rag_speculative_retrieval_threshold: float = 0.9
+    """
+    Reranking (when a compressor setting is given): the retrievers fetch this many times the requested number of
+    documents, the candidates are reranked, and the best ones (up to the compressor max_documents) are kept.
+    """
+    rag_rerank_overfetch_factor: int = 3
+    """
+    Retrievers fusion (hybrid search, additional indexes): the retrievers run concurrently, at most this many at
+    a time, each one within the timeout (in seconds, unless set in the document search params). A retriever that
+    times out is left out of the fusion, instead of delaying the answer.
+    """
+    rag_fusion_max_concurrency: int = 4
+    rag_fusion_source_timeout: float = 5
+    """
+    Diversification (when the document search params enable the near-duplicate collapsing or MMR): the retrievers
+    fetch this many times the requested number of documents, then the near-duplicates are collapsed into the best
+    ranked ones, and the documents are selected by maximal marginal relevance (query and document embeddings).
+    """
+    rag_diversification_overfetch_factor: int = 2
+    """
+    Context packing: the documents are serialized into the answering prompt context in their rank order (fused or
+    reranked), as long as they fit within the token budget (counted with tiktoken), a document that does not fit being
+    skipped. The budget can be set per request (context_token_budget), 0 is unlimited. With a score gap, the documents
+    after the first score drop (reranking or RRF score) larger than this fraction of the best score are left out, 0
+    disables it. The compact serialization has no indentation.
+    """
+    rag_context_token_budget: int = 0
+    rag_context_score_gap: float = 0
+    rag_context_compact: bool = False
+    """
+    Incremental guardrail (streaming): the answer streamed so far is checked each time it grows by
+    this many characters, without pausing the stream. The stream is cut off as soon as a check detects
+    toxicities. The whole answer is checked at the end of the stream anyway.
+    """
+    rag_guardrail_streaming_enabled: bool = False
+    rag_guardrail_streaming_check_chars: int = 200
+    """
+    Semantic answer cache: the RAG answers are cached with the embedding of their condensed question,
+    per document index, answering prompt and index session. When a condensed question is similar enough
+    (cosine similarity) to a cached one, the cached answer and footnotes are returned without retrieval
+    nor answer generation. The 'pgvector' store is shared by the orchestrator instances, it requires a
+    PGVector vector store (the 'memory' store is used otherwise).
+    """
+    rag_semantic_cache_enabled: bool = False
+    rag_semantic_cache_store: SemanticCacheStore = SemanticCacheStore.MEMORY
+    rag_semantic_cache_threshold: float = 0.95
+    rag_semantic_cache_max_size: int = 1024
+    """Time to live (in seconds) of a cached answer."""
+    rag_semantic_cache_ttl: int = 86400
+    """
+    The 'pgvector' store searches the embeddings of this dimension through an HNSW index (pgvector indexes
+    need a fixed dimension), with this hnsw.ef_search, the others exactly. Its expired and least recently
+    used answers are evicted at most once per eviction interval (in seconds).
+    """
+    rag_semantic_cache_index_dimensions: int = 1536
+    rag_semantic_cache_ef_search: int = 100
+    rag_semantic_cache_eviction_interval: int = 60
+    """
+    RAG request coalescing (single-flight): concurrent identical RAG requests (not streamed) share the execution
+    of the first one. Requests are compared by a canonical hash of their body, without the excluded fields (dotted
+    paths): when the dialog identifiers are excluded, the coalesced requests get the observability trace of the first.
+    """
+    rag_coalescing_enabled: bool = True
+    rag_coalescing_excluded_fields: list[str] = ['dialog.dialog_id', 'dialog.user_id']
+
+    """Secret cache: secrets fetched from the secret managers are kept for this time (in seconds)."""
+    secret_cache_ttl: int = 900
+    secret_cache_max_size: int = 256
+    """Cached secrets are refreshed in background once this fraction of their time to live has elapsed."""
+    secret_cache_refresh_ratio: float = 0.8
+    secret_cache_max_workers: int = 4
 
     vector_store_provider: Optional[VectorStoreProvider] = (
         VectorStoreProvider.OPEN_SEARCH
@@ -75,15 +246,51 @@ class _Settings(BaseSettings):
     vector_store_credentials_secret_name: Optional[str] = None
     """Request timeout: set the maximum time (in seconds) for the request to be completed."""
     vector_store_timeout: int = 4
+    """
+    Native hybrid search: the vector and full-text searches are fused by the vector store, in a single request
+    (OpenSearch: hybrid query and normalization search pipeline, with the neural-search plugin 2.10+).
+    (PGVector: a single SQL statement, fusing the ANN and full-text searches).
+    Otherwise, or with additional indexes, each search is a request, fused by the RAG chain.
+    """
+    vector_store_native_hybrid_search_enabled: bool = False
+    """
+    PGVector full-text search: the text search configuration of the queries. It must be the language of the
+    generated fts_vector column (see the indexing tools pgvector index management, --language).
+    """
+    vector_store_fts_language: str = 'french'
     """Maximum number of documents to be retrieved from the Vector Store"""
     vector_store_test_max_docs_retrieved: int = 4
     vector_store_test_query: str = 'Any definition'
 
+    """
+    OpenSearch clients: reused for the same setting (LRU + TTL eviction), and closed once evicted or replaced.
+    Each client keeps up to open_search_pool_maxsize connections open, idle ones for the keep-alive timeout (seconds).
+    """
+    open_search_client_registry_max_size: int = 32
+    open_search_client_registry_ttl: int = 3600
+    open_search_pool_maxsize: int = 20
+    open_search_keepalive_timeout: float = 30.0
+
+    """
+    Database pools (PGVector): reused for the same setting, and disposed once unused for db_pool_registry_ttl
+    seconds, or least recently used beyond db_pool_registry_max_size pools.
+    At startup, the pool of the default PGVector vector store opens its db_pool_size connections (warm-up).
+    """
+    db_pool_registry_max_size: int = 128
+    db_pool_registry_ttl: int = 3600
+    db_pool_warm_up_enabled: bool = True
     db_pool_size: int = 10
     db_max_overflow: int = 5
     db_pool_timeout: int = 30
     db_pool_recycle: int = 3600
     """Any connection lasting longer than 3600 seconds will be closed and reestablished."""
+    """
+    Prepared statements: psycopg prepares a query once executed this many times on a connection
+    (None disables them, e.g. behind a PgBouncer pool in transaction mode).
+    """
+    db_prepare_threshold: Optional[int] = 2
+    """PGVector stores kept per database pool, with their collection id resolved once (per index session)."""
+    pgvector_store_cache_max_size: int = 256
 
     """Observability Setting"""
     observability_provider_max_retries: int = 0
@@ -16,6 +16,7 @@
 Gen AI orchestrator Exception Module
 """
 
+from http import HTTPStatus
 from typing import Optional
 
 from gen_ai_orchestrator.models.errors.errors_models import (
@@ -90,3 +91,45 @@ class GenAIPromptTemplateException(GenAIOrchestratorException):
 
     def __init__(self, info: ErrorInfo):
         super().__init__(ErrorCode.GEN_AI_PROMPT_TEMPLATE_ERROR, info)
+
+
+class GenAIOverloadedException(GenAIOrchestratorException):
+    """
+    The service is saturated: the request is rejected before being processed,
+    with the HTTP status to return and the delay (in seconds) before a retry.
+    """
+
+    def __init__(
+        self,
+        error_code: ErrorCode,
+        status_code: int,
+        retry_after: int,
+        info: Optional[ErrorInfo] = None,
+    ):
+        super().__init__(error_code, info)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class GenAITooManyRequestsException(GenAIOverloadedException):
+    """The admission queue is full (429 Too Many Requests)"""
+
+    def __init__(self, retry_after: int, info: Optional[ErrorInfo] = None):
+        super().__init__(
+            ErrorCode.GEN_AI_TOO_MANY_REQUESTS,
+            HTTPStatus.TOO_MANY_REQUESTS,
+            retry_after,
+            info,
+        )
+
+
+class GenAIQueueTimeoutException(GenAIOverloadedException):
+    """The request was not admitted before its deadline (503 Service Unavailable)"""
+
+    def __init__(self, retry_after: int, info: Optional[ErrorInfo] = None):
+        super().__init__(
+            ErrorCode.GEN_AI_QUEUE_TIMEOUT,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            retry_after,
+            info,
+        )
@@ -14,31 +14,48 @@
 #
 """Module of the FastAPI handlers"""
 
+import logging
+from typing import AsyncIterator
+
 from fastapi import Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
+from fastapi.sse import ServerSentEvent
 
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIOrchestratorException,
+    GenAIOverloadedException,
     GenAIUnknownErrorException,
 )
 from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.models.streaming.stream_event import (
+    StreamEvent,
+    StreamEventType,
+)
 from gen_ai_orchestrator.routers.responses.responses import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 
 def business_exception_handler(_, exc: GenAIOrchestratorException) -> JSONResponse:
     """Business exception handler. It manages a Gen AI Orchestrator exception"""
 
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
-        content=jsonable_encoder(
-            ErrorResponse(
-                code=exc.error_code.value,
-                message=exc.message,
-                detail=exc.detail,
-                info=exc.info,
-            )
-        ),
+        content=jsonable_encoder(create_error_response(exc)),
+    )
+
+
+def overloaded_exception_handler(_, exc: GenAIOverloadedException) -> JSONResponse:
+    """
+    Overloaded exception handler. The request was rejected by the admission control:
+    it returns the exception status (429 or 503) and a Retry-After header.
+    """
+
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=jsonable_encoder(create_error_response(exc)),
+        headers={'Retry-After': str(exc.retry_after)},
     )
 
 
@@ -56,6 +73,54 @@ def generic_exception_handler(_, exc: Exception):
     )
 
 
+def create_error_response(exc: Exception) -> ErrorResponse:
+    """
+    Create the ErrorResponse of an exception
+
+    Args:
+        exc: the raised exception (a Gen AI Orchestrator exception or any other exception)
+    Returns:
+        The ErrorResponse exposing the exception
+    """
+
+    if not isinstance(exc, GenAIOrchestratorException):
+        exc = GenAIUnknownErrorException(
+            ErrorInfo(
+                error=exc.__class__.__name__,
+                cause=str(exc),
+            )
+        )
+
+    return ErrorResponse(
+        code=exc.error_code.value,
+        message=exc.message,
+        detail=exc.detail,
+        info=exc.info,
+    )
+
+
+async def server_sent_events(
+    events: AsyncIterator[StreamEvent],
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Convert stream events to server-sent events. Once the stream has started,
+    the HTTP status can no longer change: an exception is sent as a terminal
+    'error' event holding the ErrorResponse.
+
+    Args:
+        events: the stream events
+    """
+
+    try:
+        async for event in events:
+            yield ServerSentEvent(event=event.event.value, data=event.data)
+    except Exception as exc:
+        logger.error('Streaming interrupted by an error: %s', exc)
+        yield ServerSentEvent(
+            event=StreamEventType.ERROR.value, data=create_error_response(exc)
+        )
+
+
 def create_error_info_not_found(
     http_request: Request, provider: str, accepted_values: list[str]
 ) -> ErrorInfo:
@@ -101,20 +166,3 @@ def create_error_info_bad_request(
         request=f"[{http_request.method}] {http_request.url}",
     )
 
-
-def create_error_response(exc: GenAIOrchestratorException) -> ErrorResponse:
-    """
-    Create ErrorResponse for a Gen AI Orchestrator exception
-
-    Args:
-        exc: the Gen AI Orchestrator exception
-    Returns:
-        The ErrorResponse with the exception parameters
-    """
-
-    return ErrorResponse(
-        code=exc.error_code.value,
-        message=exc.message,
-        detail=exc.detail,
-        info=exc.info,
-    )
@@ -14,6 +14,7 @@
 #
 """Module of the OpenAI handlers"""
 
+import inspect
 import logging
 
 from openai import (
@@ -44,7 +45,8 @@ logger = logging.getLogger(__name__)
 
 def openai_exception_handler(provider: str):
     """
-    Managing OpenAI exceptions
+    Managing OpenAI exceptions (of coroutine functions and async generator
+    functions, whose exceptions are raised while they are iterated)
 
     Args:
         provider: The AI Provider type
@@ -53,38 +55,56 @@ def openai_exception_handler(provider: str):
     def decorator(func):
         """A decorator of handler function"""
 
+        if inspect.isasyncgenfunction(func):
+
+            async def stream_wrapper(*args, **kwargs):
+                """Exception handling logic, while streaming"""
+
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                except APIError as exc:
+                    _manage_api_error(exc, provider)
+
+            return stream_wrapper
+
         async def wrapper(*args, **kwargs):
             """Exception handling logic"""
 
             try:
                 return await func(*args, **kwargs)
-            except APIConnectionError as exc:
-                logger.error(exc)
-                raise GenAIConnectionErrorException(
-                    create_error_info_openai(exc, provider)
-                )
-            except AuthenticationError as exc:
-                logger.error(exc)
-                raise GenAIAuthenticationException(
-                    create_error_info_openai(exc, provider)
-                )
-            except NotFoundError as exc:
-                logger.error(exc)
-                _manage_not_found_error(exc, provider)
-            except BadRequestError as exc:
-                logger.error(exc)
-                _manage_bad_request_error(exc, provider)
             except APIError as exc:
-                logger.error(exc)
-                raise AIProviderAPIErrorException(
-                    create_error_info_openai(exc, provider)
-                )
+                _manage_api_error(exc, provider)
 
         return wrapper
 
     return decorator
 
 
+def _manage_api_error(exc: APIError, provider: str):
+    """
+    Manage an API error
+
+    Args:
+        exc: the OpenAI API error
+        provider: the AI provider type
+    Returns:
+        Raise a specific Gen AI Orchestrator exception according to the OpenAI error
+    """
+
+    logger.error(exc)
+    if isinstance(exc, APIConnectionError):
+        raise GenAIConnectionErrorException(create_error_info_openai(exc, provider))
+    elif isinstance(exc, AuthenticationError):
+        raise GenAIAuthenticationException(create_error_info_openai(exc, provider))
+    elif isinstance(exc, NotFoundError):
+        _manage_not_found_error(exc, provider)
+    elif isinstance(exc, BadRequestError):
+        _manage_bad_request_error(exc, provider)
+    else:
+        raise AIProviderAPIErrorException(create_error_info_openai(exc, provider))
+
+
 def create_error_info_openai(exc: OpenAIError, provider: str) -> ErrorInfo:
     """
     Create ErrorInfo for a OpenAI error
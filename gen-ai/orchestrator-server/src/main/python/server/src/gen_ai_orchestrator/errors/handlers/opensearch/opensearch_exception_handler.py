@@ -14,6 +14,7 @@
 #
 """Module of the OpenSearch handlers"""
 
+import inspect
 import logging
 from typing import Union
 
@@ -42,39 +43,68 @@ logger = logging.getLogger(__name__)
 
 
 def opensearch_exception_handler(func):
-    """A decorator function for managing OpenSearch exceptions"""
+    """
+    A decorator function for managing OpenSearch exceptions (of coroutine
+    functions and async generator functions, whose exceptions are raised while
+    they are iterated)
+    """
+
+    if inspect.isasyncgenfunction(func):
+
+        async def stream_wrapper(*args, **kwargs):
+            """Exception handling logic, while streaming"""
+
+            try:
+                async for item in func(*args, **kwargs):
+                    yield item
+            except (OpenSearchImproperlyConfigured, OpenSearchTransportError) as exc:
+                _manage_opensearch_error(exc)
+
+        return stream_wrapper
 
     async def wrapper(*args, **kwargs):
         """Exception handling logic"""
 
         try:
             return await func(*args, **kwargs)
-        except OpenSearchImproperlyConfigured as exc:
-            logger.error(exc)
-            raise GenAIOpenSearchSettingException(create_error_info_opensearch(exc))
-        except OpenSearchConnectionError as exc:
-            logger.error(exc)
-            raise GenAIConnectionErrorException(create_error_info_opensearch(exc))
-        except OpenSearchAuthenticationException as exc:
-            logger.error(exc)
-            raise GenAIAuthenticationException(create_error_info_opensearch(exc))
-        except OpenSearchNotFoundError as exc:
-            logger.error(exc)
-            if 'index_not_found_exception' == exc.error:
-                raise GenAIOpenSearchIndexNotFoundException(
-                    create_error_info_opensearch(exc)
-                )
-            else:
-                raise GenAIOpenSearchResourceNotFoundException(
-                    create_error_info_opensearch(exc)
-                )
-        except OpenSearchTransportError as exc:
-            logger.error(exc)
-            raise GenAIOpenSearchTransportException(create_error_info_opensearch(exc))
+        except (OpenSearchImproperlyConfigured, OpenSearchTransportError) as exc:
+            _manage_opensearch_error(exc)
 
     return wrapper
 
 
+def _manage_opensearch_error(
+    exc: Union[OpenSearchImproperlyConfigured, OpenSearchTransportError],
+):
+    """
+    Manage an OpenSearch error
+
+    Args:
+        exc: the OpenSearch error
+    Returns:
+        Raise a specific Gen AI Orchestrator exception according to the OpenSearch error
+    """
+
+    logger.error(exc)
+    if isinstance(exc, OpenSearchImproperlyConfigured):
+        raise GenAIOpenSearchSettingException(create_error_info_opensearch(exc))
+    elif isinstance(exc, OpenSearchConnectionError):
+        raise GenAIConnectionErrorException(create_error_info_opensearch(exc))
+    elif isinstance(exc, OpenSearchAuthenticationException):
+        raise GenAIAuthenticationException(create_error_info_opensearch(exc))
+    elif isinstance(exc, OpenSearchNotFoundError):
+        if 'index_not_found_exception' == exc.error:
+            raise GenAIOpenSearchIndexNotFoundException(
+                create_error_info_opensearch(exc)
+            )
+        else:
+            raise GenAIOpenSearchResourceNotFoundException(
+                create_error_info_opensearch(exc)
+            )
+    else:
+        raise GenAIOpenSearchTransportException(create_error_info_opensearch(exc))
+
+
 def create_error_info_opensearch(
     exc: Union[
         OpenSearchImproperlyConfigured, OpenSearchException, OpenSearchDslException
@@ -15,16 +15,32 @@
 """Main module to create and launch FastAPI application"""
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    SemanticCacheStore,
+    application_settings,
+)
 from gen_ai_orchestrator.configurations.logging.logger import setup_logging
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIOrchestratorException,
+    GenAIOverloadedException,
 )
 from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
     business_exception_handler,
     generic_exception_handler,
+    overloaded_exception_handler,
+)
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_client_registry import (
+    open_search_client_registry,
+)
+from gen_ai_orchestrator.models.vector_stores.pgvector.database_pool_registry import (
+    db_pool_registry,
+)
+from gen_ai_orchestrator.models.vector_stores.vector_store_provider import (
+    VectorStoreProvider,
 )
 from gen_ai_orchestrator.routers.app_monitors_router import (
     application_check_router,
@@ -45,18 +61,58 @@ from gen_ai_orchestrator.routers.rag_router import rag_router
 from gen_ai_orchestrator.routers.vector_store_providers_router import (
     vector_store_providers_router,
 )
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_default_pgvector_setting,
+)
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
+from gen_ai_orchestrator.services.langchain.rag_chain_cache import (
+    rag_chain_cache,
+)
+from gen_ai_orchestrator.services.langchain.semantic_answer_cache import (
+    setup_semantic_answer_store,
+)
 
 # configure logging
 setup_logging()
 logger = logging.getLogger(__name__)
 logger.info('Logging configuration completed')
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Warm up the pool of the default PGVector vector store on startup, and set
+    up its semantic answer cache table. Release the shared resources
+    (cached RAG chains, connection pools, clients) on shutdown.
+    """
+    if application_settings.vector_store_provider == VectorStoreProvider.PGVECTOR:
+        if application_settings.db_pool_warm_up_enabled:
+            logger.info('Generative AI Orchestrator - Database pool warm-up')
+            await db_pool_registry.awarm_up(get_default_pgvector_setting())
+        if (
+            application_settings.rag_semantic_cache_enabled
+            and application_settings.rag_semantic_cache_store
+            == SemanticCacheStore.PGVECTOR
+        ):
+            logger.info('Generative AI Orchestrator - Semantic answer cache set up')
+            await setup_semantic_answer_store(get_default_pgvector_setting())
+    yield
+    logger.info('Generative AI Orchestrator - Shutdown')
+    rag_chain_cache.clear()
+    await provider_client_registry.aclose()
+    await open_search_client_registry.aclose()
+    await db_pool_registry.aclose()
+
+
 logger.info('Generative AI Orchestrator - Starting...')
-app = FastAPI(title='Generative AI Orchestrator')
+app = FastAPI(title='Generative AI Orchestrator', lifespan=lifespan)
 
 # Add functional exception handler
 logger.info('Generative AI Orchestrator - Add exception handlers')
 app.add_exception_handler(GenAIOrchestratorException, business_exception_handler)
+app.add_exception_handler(GenAIOverloadedException, overloaded_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 logger.info('Generative AI Orchestrator - Add routers')
@@ -35,6 +35,8 @@ class ErrorCode(Enum):
     GEN_AI_UNKNOWN_PROVIDER_SETTING = 1003
     GEN_AI_GUARD_CHECK_ERROR = 1004
     GEN_AI_PROMPT_TEMPLATE_ERROR = 1005
+    GEN_AI_TOO_MANY_REQUESTS = 1006
+    GEN_AI_QUEUE_TIMEOUT = 1007
 
     # AI Provider Errors
     AI_PROVIDER_UNKNOWN = 2000
@@ -148,6 +150,14 @@ class ErrorMessages:
             message='Prompt Template Error.',
             detail='Check the template syntax.',
         ),
+        ErrorCode.GEN_AI_TOO_MANY_REQUESTS: ErrorMessage(
+            message='Too many requests.',
+            detail='The service is saturated, retry after the Retry-After delay.',
+        ),
+        ErrorCode.GEN_AI_QUEUE_TIMEOUT: ErrorMessage(
+            message='Service overloaded.',
+            detail='The request was not admitted in time, retry after the Retry-After delay.',
+        ),
         # AI Provider Errors
         ErrorCode.AI_PROVIDER_UNKNOWN: ErrorMessage(message='Unknown AI Provider.'),
         ErrorCode.AI_PROVIDER_BAD_REQUEST: ErrorMessage(
@@ -216,6 +216,62 @@ class QADebugData(BaseModel):
     )
 
 
+class SpeculativeRetrievalDebugData(BaseModel):
+    """The outcome of the speculative retrieval (started on the raw user question)"""
+
+    hit: bool = Field(
+        description='Whether the speculative documents were reused.', examples=[True]
+    )
+    similarity: Optional[float] = Field(
+        description='The similarity between the user question and the condensed question.',
+        examples=[0.93],
+        default=None,
+    )
+    hit_rate: float = Field(
+        description='The speculation hit rate since the application started.',
+        examples=[0.72],
+    )
+
+
+class SemanticCacheDebugData(BaseModel):
+    """The outcome of the semantic answer cache lookup"""
+
+    hit: bool = Field(
+        description='Whether the answer comes from the semantic answer cache.',
+        examples=[True],
+    )
+    similarity: Optional[float] = Field(
+        description='The similarity between the condensed question and the cached question.',
+        examples=[0.97],
+        default=None,
+    )
+    cached_question: Optional[str] = Field(
+        description='The condensed question of the cached answer.',
+        examples=['How to plan a trip to Morocco?'],
+        default=None,
+    )
+
+
+class ContextPackingDebugData(BaseModel):
+    """The documents context of the answering prompt"""
+
+    token_budget: int = Field(
+        description='The token budget of the context (0 is unlimited).', examples=[3000]
+    )
+    tokens: int = Field(description='The tokens of the context.', examples=[2850])
+    documents: int = Field(
+        description='The number of documents in the context.', examples=[4]
+    )
+    skipped_documents: int = Field(
+        description='The number of documents left out by the score gap cutoff or the token budget.',
+        examples=[2],
+    )
+    compact: bool = Field(
+        description='Whether the context is serialized without indentation.',
+        examples=[False],
+    )
+
+
 class RAGDebugData(QADebugData):
     """A RAG debug data"""
 
@@ -238,3 +294,15 @@ class RAGDebugData(QADebugData):
         ],
     )
     answer: LLMAnswer = Field(description='The RAG answer.')
+    speculative_retrieval: Optional[SpeculativeRetrievalDebugData] = Field(
+        description='The speculative retrieval outcome, when the speculative retrieval is enabled.',
+        default=None,
+    )
+    semantic_cache: Optional[SemanticCacheDebugData] = Field(
+        description='The semantic answer cache outcome, when the semantic answer cache is enabled.',
+        default=None,
+    )
+    context: Optional[ContextPackingDebugData] = Field(
+        description='The documents context of the answering prompt (not on semantic answer cache hit).',
+        default=None,
+    )
@@ -0,0 +1,44 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Module for the Streaming Models"""
+
+from enum import Enum, unique
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+@unique
+class StreamEventType(str, Enum):
+    """The types of the events sent by the streaming endpoints."""
+
+    CONDENSED_QUESTION = 'condensed_question'
+    DOCUMENTS = 'documents'
+    ANSWER_DELTA = 'answer_delta'
+    GUARDRAIL = 'guardrail'
+    FOOTNOTES = 'footnotes'
+    RESPONSE = 'response'
+    ERROR = 'error'
+
+
+class StreamEvent(BaseModel):
+    """An event sent by the streaming endpoints (as a server-sent event)."""
+
+    event: StreamEventType = Field(
+        description='The event type.', examples=[StreamEventType.ANSWER_DELTA]
+    )
+    data: Any = Field(
+        description='The event payload.', examples=[{'text': 'To find a page, '}]
+    )
@@ -0,0 +1,201 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+import logging
+from threading import RLock
+from typing import Optional
+
+import aiohttp
+from opensearchpy import AIOHttpConnection, AsyncOpenSearch, OpenSearch
+from opensearchpy._async.http_aiohttp import OpenSearchClientResponse
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+    is_prod_environment,
+)
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_setting import (
+    OpenSearchVectorStoreSetting,
+)
+from gen_ai_orchestrator.services.security.security_service import (
+    fetch_secret_key_value,
+)
+from gen_ai_orchestrator.utils.evicting_cache import EvictingTTLCache
+from gen_ai_orchestrator.utils.hashing import hash_setting
+from gen_ai_orchestrator.utils.strings import obfuscate
+
+logger = logging.getLogger(__name__)
+
+
+class KeepAliveAIOHttpConnection(AIOHttpConnection):
+    """The aiohttp connection of AsyncOpenSearch, with a tunable keep-alive timeout."""
+
+    async def _create_aiohttp_session(self) -> None:
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            skip_auto_headers=('accept', 'accept-encoding'),
+            auto_decompress=True,
+            loop=self.loop,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            response_class=OpenSearchClientResponse,
+            connector=aiohttp.TCPConnector(
+                limit=self._limit,
+                keepalive_timeout=application_settings.open_search_keepalive_timeout,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,
+                ssl=self._ssl_context,
+            ),
+            trust_env=self._trust_env,
+        )
+
+
+class OpenSearchClients:
+    """
+    The OpenSearch clients of a setting: the async client, used for the
+    retrieval, and the sync client, only created when needed (sync mode).
+    Each client has its own connection pool, with keep-alive.
+    """
+
+    def __init__(self, url: str, connection_kwargs: dict):
+        self.url = url
+        self.connection_kwargs = connection_kwargs
+        self.async_client = AsyncOpenSearch(
+            hosts=[url],
+            connection_class=KeepAliveAIOHttpConnection,
+            maxsize=application_settings.open_search_pool_maxsize,
+            **connection_kwargs,
+        )
+        self._sync_client: Optional[OpenSearch] = None
+
+    @property
+    def sync_client(self) -> OpenSearch:
+        if self._sync_client is None:
+            self._sync_client = OpenSearch(
+                hosts=[self.url],
+                pool_maxsize=application_settings.open_search_pool_maxsize,
+                **self.connection_kwargs,
+            )
+        return self._sync_client
+
+    def close_sync_client(self) -> None:
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    async def aclose(self) -> None:
+        """Close the connection pools."""
+        await self.async_client.close()
+        self.close_sync_client()
+
+
+class OpenSearchClientRegistry:
+    """
+    Registry of the OpenSearch clients, by setting.
+    The clients of a setting are closed when they are evicted (expired, least
+    recently used), or when the setting of their host and user changes
+    (e.g. a new password).
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache: EvictingTTLCache = EvictingTTLCache(
+            maxsize=maxsize, ttl=ttl, on_evict=self._on_evict
+        )
+        # The setting key of each host and user
+        self._targets: dict[tuple, str] = {}
+        self._closing: set[asyncio.Task] = set()
+        self._lock = RLock()
+
+    @staticmethod
+    def _url(setting: OpenSearchVectorStoreSetting) -> str:
+        return f"https://{setting.host}:{setting.port}"
+
+    @staticmethod
+    def _connection_kwargs(setting: OpenSearchVectorStoreSetting) -> dict:
+        password = fetch_secret_key_value(setting.password)
+        logger.info(
+            'OpenSearch user credentials: %s:%s',
+            setting.username,
+            obfuscate(password),
+        )
+        return {
+            'http_auth': (setting.username, password),
+            'use_ssl': is_prod_environment,
+            'verify_certs': is_prod_environment,
+            # Expected hostname on the server certificate.
+            # By default, is the same as host. If set to False, it will not verify hostname on certificate
+            'ssl_assert_hostname': setting.host if is_prod_environment else False,
+            'ssl_show_warn': is_prod_environment,
+            'timeout': application_settings.vector_store_timeout,
+        }
+
+    def get_or_create(self, setting: OpenSearchVectorStoreSetting) -> OpenSearchClients:
+        key = hash_setting(setting)
+        target = (setting.host, setting.port, setting.username)
+        with self._lock:
+            clients = self._cache.get(key)
+            if clients is None:
+                previous_key = self._targets.get(target)
+                if previous_key is not None and previous_key != key:
+                    logger.info(
+                        'OpenSearch setting changed for %s, the previous clients are closed',
+                        self._url(setting),
+                    )
+                    self._cache.evict(previous_key)
+
+                logger.info(f"New OpenSearch clients [{self._url(setting)}]")
+                clients = OpenSearchClients(
+                    self._url(setting), self._connection_kwargs(setting)
+                )
+                self._cache[key] = clients
+                self._targets[target] = key
+            else:
+                logger.debug('OpenSearch clients reused')
+
+            return clients
+
+    def _on_evict(self, key: str, clients: OpenSearchClients) -> None:
+        self._targets = {
+            target: target_key
+            for target, target_key in self._targets.items()
+            if target_key != key
+        }
+        try:
+            task = asyncio.get_running_loop().create_task(clients.aclose())
+        except RuntimeError:
+            # No event loop: the async client never opened its connection pool
+            clients.close_sync_client()
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Close all the clients."""
+        with self._lock:
+            clients = list(self._cache.values())
+            self._cache.clear()
+            self._targets.clear()
+
+        for client in clients:
+            await client.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        logger.info('OpenSearch clients closed')
+
+
+open_search_client_registry = OpenSearchClientRegistry(
+    maxsize=application_settings.open_search_client_registry_max_size,
+    ttl=application_settings.open_search_client_registry_ttl,
+)
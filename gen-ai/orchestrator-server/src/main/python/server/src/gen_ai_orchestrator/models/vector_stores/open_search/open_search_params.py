@@ -16,7 +16,7 @@
 
 from typing import List, Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from gen_ai_orchestrator.models.vector_stores.open_search.open_search_term_params import (
     OpenSearchTermParams,
@@ -45,10 +45,44 @@ class OpenSearchParams(BaseVectorStoreSearchParams):
         default=None,
     )
 
+    num_candidates: Optional[int] = Field(
+        description='The number of nearest neighbours searched by the k-NN query (its k), '
+        'of which the k best are returned: more candidates, more recall. k when not given.',
+        examples=[100],
+        default=None,
+        ge=1,
+        le=10000,
+    )
+    ef_search: Optional[int] = Field(
+        description='HNSW method: the size of the candidate list of the search (method parameter, '
+        'OpenSearch 2.16+). The index setting applies when not given.',
+        examples=[100],
+        default=None,
+        ge=1,
+    )
+    nprobes: Optional[int] = Field(
+        description='IVF method (Faiss): the number of lists searched (method parameter, '
+        'OpenSearch 2.16+). The index setting applies when not given.',
+        examples=[10],
+        default=None,
+        ge=1,
+    )
+
+    @model_validator(mode='after')
+    def check_num_candidates(self) -> 'OpenSearchParams':
+        if self.num_candidates is not None and self.num_candidates < self.k:
+            raise ValueError(
+                f"num_candidates ({self.num_candidates}) must be at least k ({self.k})"
+            )
+        return self
+
     def to_dict(self):
         result = {'k': self.k}
 
         if self.filter:
             result['filter'] = [{'term': term_param.term} for term_param in self.filter]
+        for name in ('num_candidates', 'ef_search', 'nprobes'):
+            if getattr(self, name) is not None:
+                result[name] = getattr(self, name)
 
         return result
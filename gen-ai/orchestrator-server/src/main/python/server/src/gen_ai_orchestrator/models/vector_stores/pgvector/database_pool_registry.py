@@ -12,12 +12,26 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+"""
+Database pool registry module.
+The connection pools (SQLAlchemy engines) of the PGVector vector stores, by
+setting: reused across requests, disposed once evicted, warmed up at startup,
+and measured in the metrics registry (db_pool.<host>:<port>/<database>.*):
+checked-out connections, overflow, checkout wait time and timeouts.
+Each connection checkout extends the pool time to live, so that the pool of a
+cached RAG chain is not disposed while the chain still uses it.
+"""
+
+import asyncio
 import logging
+import time
 from threading import RLock
+from typing import Callable, Optional
 
-from cachetools import TTLCache
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -28,29 +42,175 @@ from gen_ai_orchestrator.models.vector_stores.pgvector.pgvector_setting import (
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
 )
+from gen_ai_orchestrator.utils.evicting_cache import EvictingTTLCache
+from gen_ai_orchestrator.utils.metrics import metrics_registry
 from gen_ai_orchestrator.utils.strings import obfuscate
 
 logger = logging.getLogger(__name__)
 
 
+class MeteredPoolMixin:
+    """
+    Record the metrics of a pool: its checked-out and overflow connections, at
+    each checkout and checkin, its checkout wait time (pre-ping included) and its
+    checkout timeouts. The pool logging name is the metrics prefix: unlike other
+    attributes, it is kept when the pool is recreated (engine disposal).
+    """
+
+    def connect(self):
+        start = time.monotonic()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            metrics_registry.increment(f"{self.logging_name}.checkout_timeouts")
+            raise
+        finally:
+            metrics_registry.observe(
+                f"{self.logging_name}.checkout_wait", time.monotonic() - start
+            )
+            self._record_gauges()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._record_gauges()
+
+    def _record_gauges(self) -> None:
+        metrics_registry.set_gauge(f"{self.logging_name}.checked_out", self.checkedout())
+        # Negative until pool_size connections are open
+        metrics_registry.set_gauge(f"{self.logging_name}.overflow", max(0, self.overflow()))
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
 class DatabasePool:
-    def __init__(self, connection_string: str):
-        common_kwargs = dict(
+    """
+    The connection pools of a database: the async engine, used for the retrieval,
+    and the sync engine, only created when needed (sync mode, indexing tools).
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        name: str = 'default',
+        on_checkout: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            connection_string: The database URL
+            name: The pool name, in its metrics (db_pool.<name>.*)
+            on_checkout: Called at each connection checkout, of either engine
+        """
+        self.connection_string = connection_string
+        self.metrics_prefix = f"db_pool.{name}"
+        self.on_checkout = on_checkout
+        self.async_engine: AsyncEngine = create_async_engine(
+            connection_string,
+            poolclass=MeteredAsyncAdaptedQueuePool,
+            pool_logging_name=self.metrics_prefix,
+            **self._engine_kwargs(),
+        )
+        self._listen_checkout(self.async_engine.sync_engine)
+        self._sync_engine: Optional[Engine] = None
+        self._lock = RLock()
+
+    @staticmethod
+    def _engine_kwargs() -> dict:
+        return dict(
             pool_size=application_settings.db_pool_size,
             max_overflow=application_settings.db_max_overflow,
             pool_timeout=application_settings.db_pool_timeout,
             pool_recycle=application_settings.db_pool_recycle,
             pool_pre_ping=True,
+            # psycopg prepares the statements executed this many times on a connection
+            connect_args={'prepare_threshold': application_settings.db_prepare_threshold},
         )
-        self.sync_engine: Engine = create_engine(connection_string, **common_kwargs)
-        self.async_engine: AsyncEngine = create_async_engine(
-            connection_string, **common_kwargs
+
+    def _listen_checkout(self, engine: Engine) -> None:
+        # Engine listeners are kept when the pool is recreated (engine disposal)
+        if self.on_checkout is not None:
+            event.listen(engine, 'checkout', lambda *_: self.on_checkout())
+
+    @property
+    def sync_engine(self) -> Engine:
+        with self._lock:
+            if self._sync_engine is None:
+                self._sync_engine = create_engine(
+                    self.connection_string,
+                    poolclass=MeteredQueuePool,
+                    pool_logging_name=f"{self.metrics_prefix}.sync",
+                    **self._engine_kwargs(),
+                )
+                self._listen_checkout(self._sync_engine)
+            return self._sync_engine
+
+    async def awarm_up(self) -> int:
+        """
+        Open db_pool_size connections of the async engine, so that the first
+        requests do not pay for them. A failure is logged, not raised.
+
+        Returns:
+            The number of connections opened.
+        """
+        results = await asyncio.gather(
+            *(
+                self.async_engine.connect().start()
+                for _ in range(application_settings.db_pool_size)
+            ),
+            return_exceptions=True,
         )
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        for connection in connections:
+            # Back to the pool
+            await connection.close()
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.warning(
+                'Pool %s warm-up: %s connections opened out of %s (%s)',
+                self.metrics_prefix,
+                len(connections),
+                len(results),
+                errors[0],
+            )
+        else:
+            logger.info(
+                'Pool %s warmed up: %s connections opened',
+                self.metrics_prefix,
+                len(connections),
+            )
+        return len(connections)
+
+    async def adispose(self) -> None:
+        """Close the connections of both engines (checked-out ones once checked in)."""
+        await self.async_engine.dispose()
+        self.dispose_sync_engine()
+
+    def dispose_sync_engine(self) -> None:
+        with self._lock:
+            if self._sync_engine is not None:
+                self._sync_engine.dispose()
+                self._sync_engine = None
 
 
 class DatabasePoolRegistry:
-    def __init__(self):
-        self._cache: TTLCache = TTLCache(maxsize=128, ttl=3600)
+    """
+    Registry of the database pools, by setting.
+    Getting a pool, or checking out one of its connections, extends its time
+    to live: the pools are disposed once unused for the TTL, or least recently
+    used beyond the maximum size.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache: EvictingTTLCache = EvictingTTLCache(
+            maxsize=maxsize, ttl=ttl, on_evict=self._on_evict
+        )
+        self._disposing: set[asyncio.Task] = set()
         self._lock = RLock()
 
     @staticmethod
@@ -67,17 +227,66 @@ class DatabasePoolRegistry:
             f"@{setting.host}:{setting.port}/{setting.database}"
         )
 
+    @staticmethod
+    def _pool_name(setting: PGVectorStoreSetting) -> str:
+        return f"{setting.host}:{setting.port}/{setting.database}"
+
     def get_or_create(self, setting: PGVectorStoreSetting) -> DatabasePool:
         with self._lock:
-            if setting not in self._cache:
+            pool = self._cache.get(setting)
+            if pool is None:
                 logger.info(
                     f"New pool [{setting.provider.name}] {setting.host}/{setting.database}"
                 )
-                self._cache[setting] = DatabasePool(self._conn_string(setting))
+                pool = DatabasePool(
+                    self._conn_string(setting),
+                    name=self._pool_name(setting),
+                    on_checkout=lambda: self._touch(setting, pool),
+                )
             else:
                 logger.debug(f"Pool [{setting.provider.name}] reused")
+            # (Re)inserted: its time to live starts again
+            self._cache[setting] = pool
+
+            return pool
+
+    def _touch(self, setting: PGVectorStoreSetting, pool: DatabasePool) -> None:
+        """Restart the time to live of a pool in use, unless already evicted."""
+        with self._lock:
+            if self._cache.get(setting) is pool:
+                self._cache[setting] = pool
 
-            return self._cache[setting]
+    async def awarm_up(self, setting: PGVectorStoreSetting) -> DatabasePool:
+        """Create the pool of a setting, and open its connections."""
+        pool = self.get_or_create(setting)
+        await pool.awarm_up()
+        return pool
 
+    def _on_evict(self, setting: PGVectorStoreSetting, pool: DatabasePool) -> None:
+        logger.info('Pool %s evicted, its connections are closed', pool.metrics_prefix)
+        try:
+            task = asyncio.get_running_loop().create_task(pool.adispose())
+        except RuntimeError:
+            # No event loop: the async engine never opened its connections
+            pool.dispose_sync_engine()
+            return
+        self._disposing.add(task)
+        task.add_done_callback(self._disposing.discard)
 
-db_pool_registry = DatabasePoolRegistry()
+    async def aclose(self) -> None:
+        """Dispose all the pools."""
+        with self._lock:
+            pools = list(self._cache.values())
+            self._cache.clear()
+
+        for pool in pools:
+            await pool.adispose()
+        if self._disposing:
+            await asyncio.gather(*self._disposing, return_exceptions=True)
+        logger.info('Database pools disposed')
+
+
+db_pool_registry = DatabasePoolRegistry(
+    maxsize=application_settings.db_pool_registry_max_size,
+    ttl=application_settings.db_pool_registry_ttl,
+)
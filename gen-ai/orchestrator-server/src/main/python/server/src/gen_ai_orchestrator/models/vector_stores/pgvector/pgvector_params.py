@@ -16,7 +16,7 @@
 
 from typing import Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from gen_ai_orchestrator.models.vector_stores.vector_store_provider import (
     VectorStoreProvider,
@@ -43,8 +43,41 @@ class PGVectorParams(BaseVectorStoreSearchParams):
         default=None,
     )
 
+    ef_search: Optional[int] = Field(
+        description='HNSW index: the size of the candidate list of the search (hnsw.ef_search), '
+        'trading latency for recall. At least k: the search returns at most ef_search documents. '
+        'The database setting applies when not given.',
+        examples=[100],
+        default=None,
+        ge=1,
+        le=1000,
+    )
+    probes: Optional[int] = Field(
+        description='IVFFlat index: the number of lists searched (ivfflat.probes), '
+        'trading latency for recall. The database setting applies when not given.',
+        examples=[10],
+        default=None,
+        ge=1,
+        le=32768,
+    )
+
+    @model_validator(mode='after')
+    def check_ef_search(self) -> 'PGVectorParams':
+        if self.ef_search is not None and self.ef_search < self.k:
+            raise ValueError(
+                f"ef_search ({self.ef_search}) must be at least k ({self.k})"
+            )
+        return self
+
     def to_dict(self):
-        return {
+        result = {
             'k': self.k,
             'filter': self.filter,
         }
+
+        if self.ef_search is not None:
+            result['ef_search'] = self.ef_search
+        if self.probes is not None:
+            result['probes'] = self.probes
+
+        return result
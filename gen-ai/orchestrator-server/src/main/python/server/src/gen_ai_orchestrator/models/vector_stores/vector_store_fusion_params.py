@@ -0,0 +1,69 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Model for creating DocumentFusionParams."""
+
+from enum import Enum, unique
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+@unique
+class FusionMethod(str, Enum):
+    """Enumeration to list the fusion methods of the ranked document lists"""
+
+    # Weighted reciprocal rank fusion: sum of weight / (rrf_k + rank)
+    RRF = 'RRF'
+    # Weighted sum of the normalized scores
+    COMB_SUM = 'COMB_SUM'
+    # CombSUM multiplied by the number of lists holding the document
+    COMB_MNZ = 'COMB_MNZ'
+
+
+class DocumentFusionParams(BaseModel):
+    """
+    The fusion of the retrievers (vector search, full-text search, additional indexes).
+    The retrievers run concurrently, a retriever slower than the timeout is left out.
+    """
+
+    method: FusionMethod = Field(
+        description='The fusion method.',
+        examples=[FusionMethod.RRF],
+        default=FusionMethod.RRF,
+    )
+    rrf_k: int = Field(
+        description='The rank constant of the reciprocal rank fusion.',
+        examples=[60],
+        default=60,
+        gt=0,
+    )
+    weights: dict[str, float] = Field(
+        description="The weight of each retriever ('similarity', 'fts', or an additional "
+        'index name), 1 by default.',
+        examples=[{'similarity': 1.0, 'fts': 0.5}],
+        default={},
+    )
+    additional_indexes: list[str] = Field(
+        description='Other document indexes, searched by similarity and fused with the main one '
+        '(similarity and hybrid searches).',
+        examples=[['my-faq-index']],
+        default=[],
+    )
+    timeout: Optional[float] = Field(
+        description='The timeout (in seconds) of each retriever. The default timeout applies when not given.',
+        examples=[3.0],
+        default=None,
+        gt=0,
+    )
@@ -15,9 +15,13 @@
 """Model for creating BaseVectorStoreSearchParams."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    DocumentFusionParams,
+)
 from gen_ai_orchestrator.models.vector_stores.vector_store_provider import (
     VectorStoreProvider,
 )
@@ -43,7 +47,31 @@ class BaseVectorStoreSearchParams(ABC, BaseModel):
         examples=[DocumentSearchType.SIMILARITY_SEARCH],
         default=DocumentSearchType.HYBRID_SEARCH,
     )
+    fusion: DocumentFusionParams = Field(
+        description='The fusion of the retrievers (hybrid search, additional indexes).',
+        default_factory=DocumentFusionParams,
+    )
+    near_duplicate_threshold: Optional[float] = Field(
+        description='The estimated similarity (Jaccard index of the word shingles, with MinHash) '
+        'from which a document is collapsed into a better ranked one. Disabled when not given.',
+        examples=[0.8],
+        default=None,
+        gt=0,
+        le=1,
+    )
+    mmr_lambda: Optional[float] = Field(
+        description='Diversify the documents by maximal marginal relevance, with this trade-off '
+        'between relevance (1) and diversity (0). Disabled when not given.',
+        examples=[0.5],
+        default=None,
+        ge=0,
+        le=1,
+    )
 
     @abstractmethod
     def to_dict(self) -> dict:
         pass
+
+    def is_diversified(self) -> bool:
+        """Whether the documents are diversified (near-duplicate collapsing or MMR)."""
+        return self.near_duplicate_threshold is not None or self.mmr_lambda is not None
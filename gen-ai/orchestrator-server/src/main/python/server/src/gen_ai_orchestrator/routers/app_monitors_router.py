@@ -15,10 +15,13 @@
 """Application Monitors Router Module"""
 
 import logging
+from typing import Any
 
 from fastapi import APIRouter, status
 from pydantic import BaseModel
 
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
 logger = logging.getLogger(__name__)
 
 application_check_router = APIRouter(tags=['Application Monitors'])
@@ -72,3 +75,19 @@ def get_liveness() -> AppCheckResponse:
     """
     logger.debug('Liveness check -> OK')
     return AppCheckResponse(status='OK')
+
+
+@application_check_router.get(
+    '/metrics',
+    summary='Get the application metrics',
+    response_description='Return the in-process counters, gauges and timings',
+    status_code=status.HTTP_200_OK,
+)
+def get_metrics() -> dict[str, Any]:
+    """
+    ## Get the Application Metrics
+    Endpoint exposing the in-process metrics (caches hits and misses, timings, ...).
+    Returns:
+        Metrics: Returns a JSON response with the counters, gauges and timings
+    """
+    return metrics_registry.snapshot()
@@ -28,17 +28,26 @@
 """Router Module for Prompt Completion"""
 
 import logging
+from typing import AsyncIterator
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 
+from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
+    server_sent_events,
+)
 from gen_ai_orchestrator.routers.requests.requests import CompletionRequest
 from gen_ai_orchestrator.routers.responses.responses import (
     PlaygroundResponse,
     SentenceGenerationResponse,
 )
+from gen_ai_orchestrator.services.admission.admission_controller import (
+    admission_control,
+)
 from gen_ai_orchestrator.services.completion.completion_service import (
     generate,
     generate_sentences,
+    stream_generate,
 )
 
 logger = logging.getLogger(__name__)
@@ -46,6 +55,7 @@ logger = logging.getLogger(__name__)
 completion_router = APIRouter(
     prefix='/completion',
     tags=['Prompt completion'],
+    dependencies=[Depends(admission_control('completion'))],
 )
 
 
@@ -68,6 +78,27 @@ async def completion(request: CompletionRequest) -> PlaygroundResponse:
     return await generate(request)
 
 
+@completion_router.post('/stream', response_class=EventSourceResponse)
+async def completion_stream(
+    request: CompletionRequest,
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Playground API (streaming)
+
+    Args:
+        request: The completion request
+
+    Returns:
+        The LLM answer as server-sent events: answer_delta (repeated), then
+        response (the answer and observability info). An error interrupts the
+        stream with an error event.
+    """
+
+    logger.info('Completion (streaming)')
+    async for event in server_sent_events(stream_generate(request)):
+        yield event
+
+
 @completion_router.post('/sentences')
 async def completion_sentences(
     request: CompletionRequest,
@@ -14,13 +14,20 @@
 #
 """QA Router Module"""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from gen_ai_orchestrator.routers.requests.requests import QARequest
 from gen_ai_orchestrator.routers.responses.responses import QAResponse
+from gen_ai_orchestrator.services.admission.admission_controller import (
+    admission_control,
+)
 from gen_ai_orchestrator.services.qa.qa_service import qa
 
-qa_router = APIRouter(prefix='/qa', tags=['Question Answering'])
+qa_router = APIRouter(
+    prefix='/qa',
+    tags=['Question Answering'],
+    dependencies=[Depends(admission_control('qa'))],
+)
 
 
 @qa_router.post('')
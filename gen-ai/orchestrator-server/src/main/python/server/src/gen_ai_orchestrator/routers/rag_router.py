@@ -15,8 +15,10 @@
 """RAG Router Module"""
 
 import logging
+from typing import AsyncIterator
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -26,6 +28,7 @@ from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions im
 )
 from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
     create_error_info_bad_request,
+    server_sent_events,
 )
 from gen_ai_orchestrator.models.vector_stores.vector_store_types import (
     DocumentSearchParams,
@@ -33,11 +36,18 @@ from gen_ai_orchestrator.models.vector_stores.vector_store_types import (
 )
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.routers.responses.responses import RAGResponse
-from gen_ai_orchestrator.services.rag.rag_service import rag
+from gen_ai_orchestrator.services.admission.admission_controller import (
+    admission_control,
+)
+from gen_ai_orchestrator.services.rag.rag_service import rag, rag_stream
 
 logger = logging.getLogger(__name__)
 
-rag_router = APIRouter(prefix='/rag', tags=['Retrieval Augmented Generation'])
+rag_router = APIRouter(
+    prefix='/rag',
+    tags=['Retrieval Augmented Generation'],
+    dependencies=[Depends(admission_control('rag'))],
+)
 
 
 @rag_router.post('')
@@ -57,6 +67,32 @@ async def ask_rag(
     return await rag(request, debug)
 
 
+def validated_rag_request(http_request: Request, request: RAGRequest) -> RAGRequest:
+    """
+    Return the RAG request once validated.
+    It is checked before the stream starts, so that errors keep their HTTP status.
+    """
+    validate_vector_store_rag_query(
+        http_request, request.vector_store_setting, request.document_search_params
+    )
+    return request
+
+
+@rag_router.post('/stream', response_class=EventSourceResponse)
+async def ask_rag_stream(
+    request: RAGRequest = Depends(validated_rag_request), debug: bool = False
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    ## Ask a RAG System (streaming)
+    Ask question to a RAG System, and stream the answer as server-sent events:
+    condensed_question, documents, answer_delta (repeated), guardrail, footnotes,
+    then response (the complete RAG response). An error interrupts the stream
+    with an error event.
+    """
+    async for event in server_sent_events(rag_stream(request, debug)):
+        yield event
+
+
 def validate_vector_store_rag_query(
     http_request: Request,
     vector_store_setting: VectorStoreSetting,
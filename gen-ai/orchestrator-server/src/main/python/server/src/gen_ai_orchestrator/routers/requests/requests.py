@@ -188,6 +188,13 @@ class RAGRequest(BaseRequest):
     guardrail_setting: Optional[GuardrailSetting] = Field(
         description='Guardrail settings, to classify LLM output toxicity.', default=None
     )
+    context_token_budget: Optional[int] = Field(
+        description='Maximum number of tokens of the documents context in the answering prompt '
+        '(0 is unlimited). The default budget applies when not given.',
+        default=None,
+        ge=0,
+        examples=[3000],
+    )
 
     model_config = {
         'json_schema_extra': {
@@ -0,0 +1,268 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Admission Controller
+--------------------
+Admission control and load shedding of the RAG, QA and completion routers.
+
+* Each router has an adaptive concurrency limit (AIMD), driven by the observed
+  latency: it grows by one request per limit of fast responses, and shrinks
+  (multiplicative decrease) when the responses get slower than the latency
+  tolerance times their average.
+* Beyond the limit, requests wait in a bounded FIFO queue, each until its own
+  deadline (the queue timeout after its arrival).
+* Requests are rejected right away when the queue is full (429), or when their
+  deadline has passed (503), with a Retry-After delay: a few requests are
+  rejected quickly rather than all of them timing out slowly.
+* Limits, in-flight and queued requests, queue times and rejections are
+  recorded in the metrics registry (admission.*).
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import AsyncIterator, Callable
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIQueueTimeoutException,
+    GenAITooManyRequestsException,
+)
+from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Smoothing factor of the average latency (exponentially weighted)
+LATENCY_SMOOTHING = 0.05
+MAX_RETRY_AFTER = 60
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    An AIMD concurrency limiter with a bounded FIFO wait queue.
+    It is used from the event loop only (no locking).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float,
+        backoff_ratio: float,
+        max_queue_size: int,
+        queue_timeout: float,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self.average_latency = 0.0
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def retry_after(self) -> int:
+        """The delay (in seconds) for the queued requests to be served, roughly."""
+        return min(
+            MAX_RETRY_AFTER,
+            max(
+                1,
+                math.ceil(
+                    self.average_latency * (self.queued + 1) / int(self.limit)
+                ),
+            ),
+        )
+
+    def _rejection_info(self, cause: str) -> ErrorInfo:
+        return ErrorInfo(
+            error='AdmissionRejected',
+            cause=f"{cause} ({self.name} limit: {int(self.limit)} concurrent requests)",
+        )
+
+    def _reject(self, reason: str) -> None:
+        metrics_registry.increment('admission.rejected')
+        metrics_registry.increment(f"admission.{self.name}.rejected.{reason}")
+        logger.debug(
+            'Request rejected by the %s admission control (%s): %s in flight, %s queued',
+            self.name,
+            reason,
+            self.in_flight,
+            self.queued,
+        )
+
+    def _record_gauges(self) -> None:
+        metrics_registry.set_gauge(f"admission.{self.name}.limit", int(self.limit))
+        metrics_registry.set_gauge(f"admission.{self.name}.in_flight", self.in_flight)
+        metrics_registry.set_gauge(f"admission.{self.name}.queued", self.queued)
+
+    async def acquire(self) -> None:
+        """
+        Wait for a slot, in arrival order.
+
+        Raises:
+            GenAITooManyRequestsException: if the queue is full
+            GenAIQueueTimeoutException: if no slot was given before the deadline
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self._record_gauges()
+            return
+
+        if self.queued >= self.max_queue_size:
+            self._reject('queue_full')
+            raise GenAITooManyRequestsException(
+                self.retry_after, self._rejection_info('The admission queue is full')
+            )
+
+        start = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._record_gauges()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was given at the same time: it is given back
+                self._release_slot()
+            else:
+                self._waiters.remove(waiter)
+                self._record_gauges()
+            if isinstance(exc, asyncio.TimeoutError):
+                self._reject('queue_timeout')
+                raise GenAIQueueTimeoutException(
+                    self.retry_after,
+                    self._rejection_info(
+                        f"The request was not admitted within {self.queue_timeout} seconds"
+                    ),
+                ) from None
+            raise
+        metrics_registry.observe(
+            f"admission.{self.name}.queue_time", time.monotonic() - start
+        )
+
+    def release(self, latency: float) -> None:
+        """
+        Release a slot, and adapt the limit to the latency of its request.
+
+        Args:
+            latency: The time (in seconds) the request held its slot
+        """
+        metrics_registry.observe(f"admission.{self.name}.latency", latency)
+        self._adapt_limit(latency)
+        self._release_slot()
+
+    def _adapt_limit(self, latency: float) -> None:
+        now = time.monotonic()
+        if not self.average_latency:
+            self.average_latency = latency
+        elif latency > self.latency_tolerance * self.average_latency:
+            # Congestion: at most one decrease per average latency, the time for
+            # the previous decrease to take effect
+            if now - self._last_decrease >= self.average_latency:
+                self._last_decrease = now
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                logger.debug(
+                    'The %s admission limit is decreased to %s (latency: %.2fs)',
+                    self.name,
+                    int(self.limit),
+                    latency,
+                )
+        elif self.in_flight * 2 >= self.limit:
+            # Only a limit that is actually used is increased
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self.average_latency += LATENCY_SMOOTHING * (latency - self.average_latency)
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot is handed over to the waiter
+                waiter.set_result(None)
+                self.in_flight += 1
+        self._record_gauges()
+
+
+class AdmissionController:
+    """The admission control of the routers: one limiter per router."""
+
+    def __init__(self):
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def get_limiter(self, name: str) -> AdaptiveConcurrencyLimiter:
+        """Return the limiter with the given name, or create it from the settings."""
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(
+                name=name,
+                initial_limit=application_settings.admission_control_initial_limit,
+                min_limit=application_settings.admission_control_min_limit,
+                max_limit=application_settings.admission_control_max_limit,
+                latency_tolerance=application_settings.admission_control_latency_tolerance,
+                backoff_ratio=application_settings.admission_control_backoff_ratio,
+                max_queue_size=application_settings.admission_control_max_queue_size,
+                queue_timeout=application_settings.admission_control_queue_timeout,
+            )
+            self._limiters[name] = limiter
+        return limiter
+
+    def clear(self) -> None:
+        """Remove all the limiters."""
+        self._limiters.clear()
+
+
+admission_controller = AdmissionController()
+
+
+def admission_control(name: str) -> Callable[[], AsyncIterator[None]]:
+    """
+    Create the FastAPI dependency admitting the requests of a router.
+    The slot is held until the response is sent (streams included).
+
+    Args:
+        name: The limiter name (e.g. the router name)
+    """
+
+    async def admit() -> AsyncIterator[None]:
+        if not application_settings.admission_control_enabled:
+            yield
+            return
+
+        limiter = admission_controller.get_limiter(name)
+        await limiter.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            limiter.release(time.monotonic() - start)
+
+    return admit
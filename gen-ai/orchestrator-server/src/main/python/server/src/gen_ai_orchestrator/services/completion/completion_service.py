@@ -16,6 +16,7 @@
 
 import logging
 import time
+from typing import AsyncIterator
 
 from langchain_core.output_parsers import (
     NumberedListOutputParser,
@@ -29,6 +30,10 @@ from gen_ai_orchestrator.errors.handlers.openai.openai_exception_handler import
 from gen_ai_orchestrator.models.observability.observability_trace import (
     ObservabilityTrace,
 )
+from gen_ai_orchestrator.models.streaming.stream_event import (
+    StreamEvent,
+    StreamEventType,
+)
 from gen_ai_orchestrator.routers.requests.requests import CompletionRequest
 from gen_ai_orchestrator.routers.responses.responses import (
     PlaygroundResponse,
@@ -44,6 +49,7 @@ from gen_ai_orchestrator.services.observability.observabilty_service import (
 from gen_ai_orchestrator.services.utils.prompt_utility import (
     validate_prompt_template,
 )
+from gen_ai_orchestrator.utils.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +67,74 @@ async def generate(
     logger.info('Prompt completion (Playground) - Start of execution...')
     start_time = time.time()
 
+    chain, config, observability_handler = build_playground_chain(request)
+
+    parsedLlmAnswer = await chain.ainvoke(request.prompt.inputs, config=config)
+
+    logger.info(
+        'Prompt completion (Playground) - End of execution. (Duration : %.2f seconds)',
+        time.time() - start_time,
+    )
+
+    return PlaygroundResponse(
+        answer=parsedLlmAnswer,
+        observability_info=get_observability_info(
+            observability_handler,
+            ObservabilityTrace.PLAYGROUND.value,
+        ),
+    )
+
+
+@openai_exception_handler(provider='OpenAI or AzureOpenAIService')
+async def stream_generate(
+    request: CompletionRequest,
+) -> AsyncIterator[StreamEvent]:
+    """
+    Generate answer using a language model based on the provided request, and stream it.
+
+    :param request: A PlaygroundRequest object containing the llm setting.
+    :return: The answer_delta events, then a response event holding the PlaygroundResponse.
+    """
+    logger.info('Prompt completion (Playground streaming) - Start of execution...')
+    start_time = time.time()
+
+    chain, config, observability_handler = build_playground_chain(request)
+
+    answer = ''
+    async for chunk in chain.astream(request.prompt.inputs, config=config):
+        if not chunk:
+            continue
+        if not answer:
+            metrics_registry.observe(
+                'completion.stream.time_to_first_token', time.time() - start_time
+            )
+        answer += chunk
+        yield StreamEvent(event=StreamEventType.ANSWER_DELTA, data={'text': chunk})
+
+    logger.info(
+        'Prompt completion (Playground streaming) - End of execution. (Duration : %.2f seconds)',
+        time.time() - start_time,
+    )
+
+    yield StreamEvent(
+        event=StreamEventType.RESPONSE,
+        data=PlaygroundResponse(
+            answer=answer,
+            observability_info=get_observability_info(
+                observability_handler,
+                ObservabilityTrace.PLAYGROUND.value,
+            ),
+        ),
+    )
+
+
+def build_playground_chain(request: CompletionRequest):
+    """
+    Build the Playground chain and its config.
+
+    :param request: A PlaygroundRequest object containing the llm setting.
+    :return: The chain, its config and the observability handler (if any).
+    """
     logger.info('Prompt completion (Playground) - template validation')
     validate_prompt_template(request.prompt, 'Playground prompt')
 
@@ -87,20 +161,7 @@ async def generate(
         )
         config = {'callbacks': [observability_handler]}
 
-    parsedLlmAnswer = await chain.ainvoke(request.prompt.inputs, config=config)
-
-    logger.info(
-        'Prompt completion (Playground) - End of execution. (Duration : %.2f seconds)',
-        time.time() - start_time,
-    )
-
-    return PlaygroundResponse(
-        answer=parsedLlmAnswer,
-        observability_info=get_observability_info(
-            observability_handler,
-            ObservabilityTrace.PLAYGROUND.value,
-        ),
-    )
+    return chain, config, observability_handler
 
 
 @openai_exception_handler(provider='OpenAI or AzureOpenAIService')
@@ -36,4 +36,7 @@ async def check_em_setting(setting: EMSetting) -> bool:
     """
 
     logger.info('Get the EM Factory, then check the EM setting.')
-    return await get_em_factory(setting).check_embedding_model_setting()
+    # The provider must be called, the query embedding cache is bypassed
+    return await get_em_factory(
+        setting, query_cache_enabled=False
+    ).check_embedding_model_setting()
@@ -14,6 +14,7 @@
 #
 """Retriever callback handler for LangChain."""
 
+import json
 import logging
 from typing import Any, Dict
 
@@ -35,6 +36,8 @@ class RAGCallbackHandler(BaseCallbackHandler):
             'rag_chain_output': None,
             'documents': None,
         }
+        # Run id of the question condensation fast path (no LLM call), if any
+        self.condensation_fast_path_run_id = None
 
     def on_chain_start(
         self, serialized: Dict[str, Any], inputs: Dict[str, Any], **kwargs: Any
@@ -49,12 +52,23 @@ class RAGCallbackHandler(BaseCallbackHandler):
         if kwargs['name'] == 'rag_chain_output' and isinstance(inputs, AIMessage):
             self.records['rag_chain_output'] = inputs.content
 
+        if kwargs['name'] == 'rag_question_condensation_fast_path':
+            self.condensation_fast_path_run_id = kwargs.get('run_id')
+
         if kwargs['name'] == 'RunnableAssign<answer>' and 'documents' in inputs:
             self.records['documents'] = inputs['documents']
 
     def on_chain_end(self, outputs: Dict[str, Any], **kwargs: Any) -> None:
         """Print out that we finished a chain."""  # if outputs is instance of StringPromptValue
 
+        if (
+            self.condensation_fast_path_run_id is not None
+            and kwargs.get('run_id') == self.condensation_fast_path_run_id
+        ):
+            self.records['rag_question_condensation_chain_output'] = json.dumps(
+                outputs, ensure_ascii=False
+            )
+
         if isinstance(outputs, ChatPromptValue):
             self.records['chat_prompt'] = next(
                 (
@@ -31,6 +31,9 @@ from gen_ai_orchestrator.models.em.azureopenai.azure_openai_em_setting import (
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
 )
@@ -42,6 +45,13 @@ class AzureOpenAIEMFactory(LangChainEMFactory):
     setting: AzureOpenAIEMSetting
 
     def get_embedding_model(self) -> Embeddings:
+        return self.with_query_cache(
+            provider_client_registry.get_or_create(
+                self.setting, self._create_embedding_model
+            )
+        )
+
+    def _create_embedding_model(self) -> Embeddings:
         return AzureOpenAIEmbeddings(
             openai_api_key=fetch_secret_key_value(self.setting.api_key),
             openai_api_version=self.setting.api_version,
@@ -50,6 +60,9 @@ class AzureOpenAIEMFactory(LangChainEMFactory):
             # the model is not Nullable, it has a default value
             model=self.setting.model or OpenAIEmbeddings.__fields__['model'].default,
             timeout=application_settings.em_provider_timeout,
+            **provider_client_registry.get_openai_http_clients(
+                str(self.setting.api_base)
+            ),
         )
 
     @openai_exception_handler(provider='AzureOpenAIService')
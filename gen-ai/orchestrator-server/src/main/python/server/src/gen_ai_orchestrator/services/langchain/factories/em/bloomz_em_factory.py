@@ -16,6 +16,9 @@
 
 from langchain.embeddings.base import Embeddings
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.em.bloomz.bloomz_em_setting import (
     BloomzEMSetting,
 )
@@ -33,6 +36,14 @@ class BloomzEMFactory(LangChainEMFactory):
     setting: BloomzEMSetting
 
     def get_embedding_model(self) -> Embeddings:
-        return BloomzEmbeddings(
-            pooling=self.setting.pooling, api_base=self.setting.api_base
+        return self.with_query_cache(
+            BloomzEmbeddings(
+                pooling=self.setting.pooling,
+                api_base=self.setting.api_base,
+                timeout=application_settings.em_provider_timeout,
+                batch_size=application_settings.em_bloomz_batch_size,
+                max_concurrency=application_settings.em_bloomz_max_concurrency,
+                max_retries=application_settings.em_provider_max_retries,
+                retry_backoff=application_settings.em_provider_retry_backoff,
+            )
         )
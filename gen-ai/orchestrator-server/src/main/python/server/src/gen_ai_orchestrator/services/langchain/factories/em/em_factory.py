@@ -21,7 +21,14 @@ from typing import List
 from langchain.embeddings.base import Embeddings
 from pydantic import BaseModel
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.em.em_setting import BaseEMSetting
+from gen_ai_orchestrator.services.langchain.impls.em.cached_query_embeddings import (
+    CachedQueryEmbeddings,
+)
+from gen_ai_orchestrator.utils.hashing import hash_setting
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,8 @@ class LangChainEMFactory(ABC, BaseModel):
     """A base class for LangChain Embedding Model Factory"""
 
     setting: BaseEMSetting
+    """Cache the query embeddings of the embedding model (see get_em_factory)."""
+    query_cache_enabled: bool = False
 
     @abstractmethod
     def get_embedding_model(self) -> Embeddings:
@@ -39,6 +48,19 @@ class LangChainEMFactory(ABC, BaseModel):
         """
         pass
 
+    def with_query_cache(self, embedding_model: Embeddings) -> Embeddings:
+        """
+        Wrap the embedding model with the query embedding cache, when enabled.
+        :return: [Embeddings] the embedding model, caching its query embeddings.
+        """
+        if not (
+            self.query_cache_enabled and application_settings.em_query_cache_enabled
+        ):
+            return embedding_model
+        return CachedQueryEmbeddings(
+            embeddings=embedding_model, namespace=hash_setting(self.setting)
+        )
+
     async def check_embedding_model_setting(self) -> bool:
         """
         check the Embedding model setting validity
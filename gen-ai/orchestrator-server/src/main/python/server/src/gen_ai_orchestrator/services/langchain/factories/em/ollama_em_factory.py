@@ -28,6 +28,9 @@ from gen_ai_orchestrator.models.em.ollama.ollama_em_setting import (
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
 
 
 class OllamaEMFactory(LangChainEMFactory):
@@ -36,6 +39,13 @@ class OllamaEMFactory(LangChainEMFactory):
     setting: OllamaEMSetting
 
     def get_embedding_model(self) -> Embeddings:
+        return self.with_query_cache(
+            provider_client_registry.get_or_create(
+                self.setting, self._create_embedding_model
+            )
+        )
+
+    def _create_embedding_model(self) -> Embeddings:
         return OllamaEmbeddings(
             base_url=self.setting.base_url,
             model=self.setting.model,
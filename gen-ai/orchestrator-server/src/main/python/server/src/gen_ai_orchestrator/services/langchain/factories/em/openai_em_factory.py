@@ -31,6 +31,9 @@ from gen_ai_orchestrator.models.em.openai.openai_em_setting import (
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
 )
@@ -42,11 +45,19 @@ class OpenAIEMFactory(LangChainEMFactory):
     setting: OpenAIEMSetting
 
     def get_embedding_model(self) -> Embeddings:
+        return self.with_query_cache(
+            provider_client_registry.get_or_create(
+                self.setting, self._create_embedding_model
+            )
+        )
+
+    def _create_embedding_model(self) -> Embeddings:
         return OpenAIEmbeddings(
             openai_api_key=fetch_secret_key_value(self.setting.api_key),
             base_url=self.setting.base_url,
             model=self.setting.model,
             timeout=application_settings.em_provider_timeout,
+            **provider_client_registry.get_openai_http_clients(self.setting.base_url),
         )
 
     @openai_exception_handler(provider='OpenAI')
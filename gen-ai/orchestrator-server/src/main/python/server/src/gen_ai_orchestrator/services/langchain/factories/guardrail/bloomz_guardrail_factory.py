@@ -16,6 +16,9 @@
 
 from langchain_core.output_parsers import BaseOutputParser
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.guardrail.bloomz.bloomz_guardrail_setting import (
     BloomzGuardrailSetting,
 )
@@ -34,5 +37,7 @@ class BloomzGuardrailFactory(GuardrailFactory):
 
     def get_parser(self) -> BaseOutputParser:
         return BloomzGuardrailOutputParser(
-            max_score=self.setting.max_score, endpoint=self.setting.api_base
+            max_score=self.setting.max_score,
+            endpoint=self.setting.api_base,
+            timeout=application_settings.guardrail_provider_timeout,
         )
@@ -93,6 +93,9 @@ from gen_ai_orchestrator.models.observability.observability_type import (
 from gen_ai_orchestrator.models.security.raw_secret_key.raw_secret_key import (
     RawSecretKey,
 )
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_client_registry import (
+    open_search_client_registry,
+)
 from gen_ai_orchestrator.models.vector_stores.open_search.open_search_setting import (
     OpenSearchVectorStoreSetting,
 )
@@ -199,11 +202,14 @@ def get_llm_factory(setting: BaseLLMSetting) -> LangChainLLMFactory:
         raise GenAIUnknownProviderSettingException()
 
 
-def get_em_factory(setting: BaseEMSetting) -> LangChainEMFactory:
+def get_em_factory(
+    setting: BaseEMSetting, query_cache_enabled: bool = True
+) -> LangChainEMFactory:
     """
     Creates an LangChain EM Factory according to the given setting
     Args:
         setting: The EM setting
+        query_cache_enabled: Cache the query embeddings of the embedding model. Default to True.
 
     Returns:
         The LangChain EM Factory, or raise an exception otherwise
@@ -212,20 +218,40 @@ def get_em_factory(setting: BaseEMSetting) -> LangChainEMFactory:
     logger.info('Get Embedding Model Factory for the given setting')
     if isinstance(setting, OpenAIEMSetting):
         logger.debug('EM Factory - OpenAIEMFactory')
-        return OpenAIEMFactory(setting=setting)
+        return OpenAIEMFactory(
+            setting=setting, query_cache_enabled=query_cache_enabled
+        )
     elif isinstance(setting, AzureOpenAIEMSetting):
         logger.debug('EM Factory - AzureOpenAIEMFactory')
-        return AzureOpenAIEMFactory(setting=setting)
+        return AzureOpenAIEMFactory(
+            setting=setting, query_cache_enabled=query_cache_enabled
+        )
     elif isinstance(setting, OllamaEMSetting):
         logger.debug('LLM Factory - OllamaEMFactory')
-        return OllamaEMFactory(setting=setting)
+        return OllamaEMFactory(
+            setting=setting, query_cache_enabled=query_cache_enabled
+        )
     elif isinstance(setting, BloomzEMSetting):
         logger.debug('EM Factory - BloomzEMFactory')
-        return BloomzEMFactory(setting=setting)
+        return BloomzEMFactory(
+            setting=setting, query_cache_enabled=query_cache_enabled
+        )
     else:
         raise GenAIUnknownProviderSettingException()
 
 
+def get_default_pgvector_setting() -> PGVectorStoreSetting:
+    """Return the setting of the default PGVector vector store (application settings)."""
+    vector_store_credentials = fetch_default_vector_store_credentials()
+    return PGVectorStoreSetting(
+        host=application_settings.vector_store_host,
+        port=application_settings.vector_store_port,
+        username=vector_store_credentials.username,
+        password=RawSecretKey(secret=vector_store_credentials.password),
+        database=application_settings.vector_store_database,
+    )
+
+
 def get_vector_store_factory(
     setting: Optional[VectorStoreSetting],
     index_name: str,
@@ -248,14 +274,19 @@ def get_vector_store_factory(
     def create_opensearch_factory(
         vs_setting: Optional[OpenSearchVectorStoreSetting],
     ) -> OpenSearchFactory:
+        resolved_setting = vs_setting or OpenSearchVectorStoreSetting(
+            host=application_settings.vector_store_host,
+            port=application_settings.vector_store_port,
+            username=vector_store_credentials.username,
+            password=RawSecretKey(secret=vector_store_credentials.password),
+        )
+
+        # The clients are created for a new setting, and reused otherwise
+        clients = open_search_client_registry.get_or_create(resolved_setting)
+
         return OpenSearchFactory(
-            setting=vs_setting
-            or OpenSearchVectorStoreSetting(
-                host=application_settings.vector_store_host,
-                port=application_settings.vector_store_port,
-                username=vector_store_credentials.username,
-                password=RawSecretKey(secret=vector_store_credentials.password),
-            ),
+            setting=resolved_setting,
+            clients=clients,
             index_name=index_name,
             embedding_function=embedding_function,
         )
@@ -264,13 +295,7 @@ def get_vector_store_factory(
     def create_pgvector_factory(
         vs_setting: Optional[PGVectorStoreSetting],
     ) -> PGVectorFactory:
-        resolved_setting = vs_setting or PGVectorStoreSetting(
-            host=application_settings.vector_store_host,
-            port=application_settings.vector_store_port,
-            username=vector_store_credentials.username,
-            password=RawSecretKey(secret=vector_store_credentials.password),
-            database=application_settings.vector_store_database,
-        )
+        resolved_setting = vs_setting or get_default_pgvector_setting()
 
         # Résolution du pool : crée si nouveau setting, réutilise sinon
         pool = db_pool_registry.get_or_create(resolved_setting)
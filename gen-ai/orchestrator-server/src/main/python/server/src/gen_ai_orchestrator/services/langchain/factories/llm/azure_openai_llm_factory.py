@@ -19,7 +19,6 @@ from typing import Optional
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.utils import Input
-from langchain_openai import AzureChatOpenAI
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -32,7 +31,16 @@ from gen_ai_orchestrator.models.llm.azureopenai.azure_openai_llm_setting import
 )
 from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
     LangChainLLMFactory,
-    rate_limiter,
+)
+from gen_ai_orchestrator.services.langchain.factories.llm.rate_limiter_registry import (
+    ProviderRateLimiter,
+    rate_limiter_registry,
+)
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
+from gen_ai_orchestrator.services.langchain.impls.llm.rate_limited_chat_models import (
+    RateLimitedAzureChatOpenAI,
 )
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
@@ -45,7 +53,12 @@ class AzureOpenAILLMFactory(LangChainLLMFactory):
     setting: AzureOpenAILLMSetting
 
     def get_language_model(self) -> BaseLanguageModel:
-        return AzureChatOpenAI(
+        return provider_client_registry.get_or_create(
+            self.setting, self._create_language_model
+        )
+
+    def _create_language_model(self) -> BaseLanguageModel:
+        return RateLimitedAzureChatOpenAI(
             api_key=fetch_secret_key_value(self.setting.api_key),
             api_version=self.setting.api_version,
             azure_endpoint=str(self.setting.api_base),
@@ -54,8 +67,21 @@ class AzureOpenAILLMFactory(LangChainLLMFactory):
             temperature=self.setting.temperature,
             timeout=application_settings.llm_provider_timeout,
             max_retries=application_settings.llm_provider_max_retries,
-            rate_limiter=rate_limiter if application_settings.llm_rate_limits else None,
+            provider_rate_limiter=self._get_rate_limiter(),
             reasoning_effort=self.setting.reasoning_effort,
+            **provider_client_registry.get_openai_http_clients(
+                str(self.setting.api_base)
+            ),
+        )
+
+    def _get_rate_limiter(self) -> Optional[ProviderRateLimiter]:
+        if not application_settings.llm_rate_limits:
+            return None
+        return rate_limiter_registry.get_or_create(
+            provider=self.setting.provider.value,
+            endpoint=str(self.setting.api_base),
+            credential=self.setting.deployment_name,
+            deployment=self.setting.deployment_name,
         )
 
     @openai_exception_handler(provider='AzureOpenAIService')
@@ -20,7 +20,6 @@ from typing import Optional
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.utils import Input, Output
 from pydantic import BaseModel
@@ -87,12 +86,3 @@ class LangChainLLMFactory(ABC, BaseModel):
         """
         return await self.get_language_model().ainvoke(_input, config)
 
-
-rate_limiter = InMemoryRateLimiter(
-    # We can only make a request once every 10 seconds!!
-    requests_per_second=0.1,
-    # Wake up every 100 ms to check whether allowed to make a request,
-    check_every_n_seconds=0.1,
-    # Controls the maximum burst size.
-    max_bucket_size=10,
-)
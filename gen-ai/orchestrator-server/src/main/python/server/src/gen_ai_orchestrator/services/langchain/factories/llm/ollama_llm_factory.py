@@ -30,6 +30,9 @@ from gen_ai_orchestrator.models.llm.ollama.ollama_llm_setting import (
 from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
     LangChainLLMFactory,
 )
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
 
 
 class OllamaLLMFactory(LangChainLLMFactory):
@@ -38,10 +41,25 @@ class OllamaLLMFactory(LangChainLLMFactory):
     setting: OllamaLLMSetting
 
     def get_language_model(self) -> BaseLanguageModel:
+        return provider_client_registry.get_or_create(
+            self.setting, self._create_language_model
+        )
+
+    def _create_language_model(self) -> BaseLanguageModel:
         return ChatOllama(
             base_url=self.setting.base_url,
             model=self.setting.model,
             temperature=self.setting.temperature,
+            async_client_kwargs={
+                'transport': provider_client_registry.get_async_transport(
+                    self.setting.base_url
+                )
+            },
+            sync_client_kwargs={
+                'transport': provider_client_registry.get_sync_transport(
+                    self.setting.base_url
+                )
+            },
         )
 
     @ollama_exception_handler(provider='Ollama')
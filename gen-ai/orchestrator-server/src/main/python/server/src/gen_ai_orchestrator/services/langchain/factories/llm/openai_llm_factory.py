@@ -19,7 +19,6 @@ from typing import Optional
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.utils import Input, Output
-from langchain_openai import ChatOpenAI
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -32,11 +31,21 @@ from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
 )
 from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
     LangChainLLMFactory,
-    rate_limiter,
+)
+from gen_ai_orchestrator.services.langchain.factories.llm.rate_limiter_registry import (
+    ProviderRateLimiter,
+    rate_limiter_registry,
+)
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
+from gen_ai_orchestrator.services.langchain.impls.llm.rate_limited_chat_models import (
+    RateLimitedChatOpenAI,
 )
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
 )
+from gen_ai_orchestrator.utils.hashing import stable_hash
 
 
 class OpenAILLMFactory(LangChainLLMFactory):
@@ -45,15 +54,30 @@ class OpenAILLMFactory(LangChainLLMFactory):
     setting: OpenAILLMSetting
 
     def get_language_model(self) -> BaseLanguageModel:
-        return ChatOpenAI(
+        return provider_client_registry.get_or_create(
+            self.setting, self._create_language_model
+        )
+
+    def _create_language_model(self) -> BaseLanguageModel:
+        return RateLimitedChatOpenAI(
             api_key=fetch_secret_key_value(self.setting.api_key),
             base_url=self.setting.base_url,
             model=self.setting.model,
             temperature=self.setting.temperature,
             timeout=application_settings.llm_provider_timeout,
             max_retries=application_settings.llm_provider_max_retries,
-            rate_limiter=rate_limiter if application_settings.llm_rate_limits else None,
+            provider_rate_limiter=self._get_rate_limiter(),
             reasoning_effort=self.setting.reasoning_effort,
+            **provider_client_registry.get_openai_http_clients(self.setting.base_url),
+        )
+
+    def _get_rate_limiter(self) -> Optional[ProviderRateLimiter]:
+        if not application_settings.llm_rate_limits:
+            return None
+        return rate_limiter_registry.get_or_create(
+            provider=self.setting.provider.value,
+            endpoint=self.setting.base_url,
+            credential=stable_hash(self.setting.api_key.model_dump(mode='json')),
         )
 
     @openai_exception_handler(provider='OpenAI')
@@ -0,0 +1,226 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+LLM Rate Limiter Registry
+-------------------------
+Process-wide registry of the LLM rate limiters.
+
+* One limiter per provider, endpoint and deployment or API key, so that the
+  LLMs sharing a provider quota share its limiter, and only them.
+* Each limiter has a requests per minute and a tokens per minute budget
+  (token buckets holding one minute of budget).
+* A call reserves its request and tokens on arrival, and waits until they are
+  available: calls are served in arrival order, without polling.
+* Queue times are recorded in the metrics registry (llm.rate_limiter.*).
+"""
+
+import asyncio
+import logging
+import time
+from threading import RLock
+from typing import Optional
+
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    LLMRateLimitBudget,
+    application_settings,
+)
+from gen_ai_orchestrator.utils.hashing import stable_hash
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """
+    A token bucket, refilled continuously up to one minute of budget.
+    Its level is negative when budget is reserved ahead of its availability.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = float(per_minute)
+
+    def refill(self, elapsed: float) -> None:
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+
+    def wait_time(self, amount: int) -> float:
+        """Return the time (in seconds) until the amount is available."""
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount: int) -> None:
+        # An amount larger than the whole budget waits for a full bucket
+        self.level -= min(amount, self.capacity)
+
+
+class ProviderRateLimiter(BaseRateLimiter):
+    """A rate limiter with requests and tokens per minute budgets (0 is unlimited)."""
+
+    def __init__(
+        self, name: str, requests_per_minute: int, tokens_per_minute: int
+    ):
+        self.name = name
+        self._requests = (
+            _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+        )
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._last_refill = time.monotonic()
+        self._lock = RLock()
+
+    def _amounts(self, tokens: int) -> list[tuple[_Bucket, int]]:
+        return [
+            (bucket, amount)
+            for bucket, amount in ((self._requests, 1), (self._tokens, tokens))
+            if bucket is not None
+        ]
+
+    def reserve(self, tokens: int = 0, blocking: bool = True) -> Optional[float]:
+        """
+        Reserve a request and its tokens.
+
+        Args:
+            tokens: The estimated tokens of the request
+            blocking: Reserve even if the budget is not available yet
+
+        Returns:
+            The time (in seconds) to wait before sending the request, or None if
+            not blocking and the budget is not available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            amounts = self._amounts(tokens)
+            for bucket, _ in amounts:
+                bucket.refill(now - self._last_refill)
+            self._last_refill = now
+
+            wait_time = max(
+                (bucket.wait_time(amount) for bucket, amount in amounts), default=0.0
+            )
+            if wait_time > 0 and not blocking:
+                return None
+            for bucket, amount in amounts:
+                bucket.take(amount)
+            return wait_time
+
+    def release(self, tokens: int = 0) -> None:
+        """Give back a reservation that was not used (e.g. its call was cancelled)."""
+        with self._lock:
+            for bucket, amount in self._amounts(tokens):
+                bucket.level += min(amount, bucket.capacity)
+
+    def _record_queue_time(self, queue_time: float) -> None:
+        metrics_registry.observe('llm.rate_limiter.queue_time', queue_time)
+        metrics_registry.observe(
+            f"llm.rate_limiter.{self.name}.queue_time", queue_time
+        )
+        if queue_time > 0:
+            metrics_registry.increment('llm.rate_limiter.throttled')
+            logger.debug(
+                'LLM call throttled by the %s rate limiter for %.2f seconds',
+                self.name,
+                queue_time,
+            )
+
+    def acquire(self, *, blocking: bool = True, tokens: int = 0) -> bool:
+        wait_time = self.reserve(tokens, blocking)
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            time.sleep(wait_time)
+        self._record_queue_time(wait_time)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True, tokens: int = 0) -> bool:
+        wait_time = self.reserve(tokens, blocking)
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                self.release(tokens)
+                raise
+        self._record_queue_time(wait_time)
+        return True
+
+
+class RateLimiterRegistry:
+    """Registry of the LLM rate limiters, by provider, endpoint and credential."""
+
+    def __init__(self):
+        self._limiters: dict[str, ProviderRateLimiter] = {}
+        self._lock = RLock()
+
+    @staticmethod
+    def get_budget(
+        provider: str, deployment: Optional[str] = None
+    ) -> LLMRateLimitBudget:
+        """Return the budget of a deployment (or of a provider) from the settings."""
+        overrides = application_settings.llm_rate_limit_overrides
+        if deployment and f"{provider}/{deployment}" in overrides:
+            return overrides[f"{provider}/{deployment}"]
+        if provider in overrides:
+            return overrides[provider]
+        return LLMRateLimitBudget(
+            requests_per_minute=application_settings.llm_rate_limit_requests_per_minute,
+            tokens_per_minute=application_settings.llm_rate_limit_tokens_per_minute,
+        )
+
+    def get_or_create(
+        self,
+        provider: str,
+        endpoint: str,
+        credential: str,
+        deployment: Optional[str] = None,
+    ) -> ProviderRateLimiter:
+        """
+        Return the rate limiter of a provider quota, or create it.
+
+        Args:
+            provider: The LLM provider
+            endpoint: The provider endpoint
+            credential: What the quota applies to, besides the endpoint (the
+              deployment name, or a hash of the API key)
+            deployment: The deployment name (to look up its budget)
+        """
+        key = stable_hash([provider, endpoint, credential])
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                budget = self.get_budget(provider, deployment)
+                name = f"{provider}/{deployment or key[:8]}"
+                logger.info(
+                    'New %s rate limiter (%s requests and %s tokens per minute)',
+                    name,
+                    budget.requests_per_minute or 'unlimited',
+                    budget.tokens_per_minute or 'unlimited',
+                )
+                limiter = ProviderRateLimiter(
+                    name=name,
+                    requests_per_minute=budget.requests_per_minute,
+                    tokens_per_minute=budget.tokens_per_minute,
+                )
+                self._limiters[key] = limiter
+            return limiter
+
+    def clear(self) -> None:
+        """Remove all the rate limiters."""
+        with self._lock:
+            self._limiters.clear()
+
+
+rate_limiter_registry = RateLimiterRegistry()
@@ -0,0 +1,203 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Provider Client Registry
+------------------------
+Process-wide registry of the LangChain LLM and EM clients.
+
+* Clients are reused for the same provider setting (LRU + TTL eviction).
+* All clients targeting the same host share one HTTP transport, i.e. one
+  connection pool with keep-alive (and optionally HTTP/2).
+* Plain HTTP providers share one async client per host, TLS certificate
+  verification and timeout, on top of the host transport.
+* Clients and transports are closed on application shutdown.
+"""
+
+import logging
+from importlib.util import find_spec
+from threading import RLock
+from typing import Callable, TypeVar
+from urllib.parse import urlparse
+
+import httpx
+from cachetools import TTLCache
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+from pydantic import BaseModel
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.utils.hashing import hash_setting
+
+logger = logging.getLogger(__name__)
+T = TypeVar('T')
+
+
+def _host_key(url: str) -> str:
+    """Return the 'scheme://host:port' part of the given URL."""
+    parsed_url = urlparse(str(url))
+    return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+
+def _is_http2_enabled() -> bool:
+    if not application_settings.provider_http2:
+        return False
+    if find_spec('h2') is None:
+        logger.warning(
+            "HTTP/2 is enabled for the AI providers, but the 'h2' package is not installed. "
+            'Fallback to HTTP/1.1.'
+        )
+        return False
+    return True
+
+
+class ProviderClientRegistry:
+    """Registry of the AI provider clients and of their shared HTTP transports."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._clients: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Transports by host and TLS certificate verification
+        self._async_transports: dict[tuple[str, bool], httpx.AsyncHTTPTransport] = {}
+        self._sync_transports: dict[tuple[str, bool], httpx.HTTPTransport] = {}
+        # Async clients by host, TLS certificate verification and timeout
+        self._async_clients: dict[tuple[str, bool, float], httpx.AsyncClient] = {}
+        self._lock = RLock()
+
+    @staticmethod
+    def _transport_kwargs(verify: bool) -> dict:
+        return dict(
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=application_settings.provider_http_max_connections,
+                max_keepalive_connections=application_settings.provider_http_max_keepalive_connections,
+                keepalive_expiry=application_settings.provider_http_keepalive_expiry,
+            ),
+            http2=_is_http2_enabled(),
+        )
+
+    def get_async_transport(
+        self, url: str, verify: bool = True
+    ) -> httpx.AsyncHTTPTransport:
+        """
+        Return the async HTTP transport (connection pool) shared by all clients of the URL host.
+
+        Args:
+            url: The provider URL
+            verify: Verify the TLS certificate of the host
+        """
+        key = (_host_key(url), verify)
+        with self._lock:
+            if key not in self._async_transports:
+                logger.info('New async HTTP transport for [%s]', key[0])
+                self._async_transports[key] = httpx.AsyncHTTPTransport(
+                    **self._transport_kwargs(verify)
+                )
+            return self._async_transports[key]
+
+    def get_sync_transport(self, url: str, verify: bool = True) -> httpx.HTTPTransport:
+        """
+        Return the sync HTTP transport (connection pool) shared by all clients of the URL host.
+
+        Args:
+            url: The provider URL
+            verify: Verify the TLS certificate of the host
+        """
+        key = (_host_key(url), verify)
+        with self._lock:
+            if key not in self._sync_transports:
+                logger.info('New sync HTTP transport for [%s]', key[0])
+                self._sync_transports[key] = httpx.HTTPTransport(
+                    **self._transport_kwargs(verify)
+                )
+            return self._sync_transports[key]
+
+    def get_async_client(
+        self, url: str, timeout: float, verify: bool = True
+    ) -> httpx.AsyncClient:
+        """
+        Return the async HTTP client shared by the callers of the URL host with
+        the same timeout, on top of the host shared transport.
+
+        Args:
+            url: The provider URL
+            timeout: The request timeout (in seconds)
+            verify: Verify the TLS certificate of the host
+        """
+        key = (_host_key(url), verify, timeout)
+        with self._lock:
+            if key not in self._async_clients:
+                self._async_clients[key] = httpx.AsyncClient(
+                    transport=self.get_async_transport(url, verify), timeout=timeout
+                )
+            return self._async_clients[key]
+
+    def get_openai_http_clients(self, url: str) -> dict:
+        """
+        Build the OpenAI SDK HTTP clients on top of the shared transports.
+        The returned dict can be passed as keyword arguments to the LangChain OpenAI classes.
+        """
+        return {
+            'http_client': DefaultHttpxClient(transport=self.get_sync_transport(url)),
+            'http_async_client': DefaultAsyncHttpxClient(
+                transport=self.get_async_transport(url)
+            ),
+        }
+
+    def get_or_create(self, setting: BaseModel, builder: Callable[[], T]) -> T:
+        """
+        Return the client registered for the given provider setting, or build and register it.
+
+        Args:
+            setting: The LLM or EM provider setting
+            builder: The function building the client
+        """
+        key = hash_setting(setting)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                logger.debug('New %s client registered', type(setting).__name__)
+                client = builder()
+                self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        """Unregister all the clients. The shared transports are kept open."""
+        with self._lock:
+            self._clients.clear()
+
+    async def aclose(self) -> None:
+        """Unregister all the clients and close the shared clients and transports."""
+        with self._lock:
+            self._clients.clear()
+            async_clients = list(self._async_clients.values())
+            async_transports = list(self._async_transports.values())
+            sync_transports = list(self._sync_transports.values())
+            self._async_clients.clear()
+            self._async_transports.clear()
+            self._sync_transports.clear()
+
+        for client in async_clients:
+            await client.aclose()
+        for transport in async_transports:
+            await transport.aclose()
+        for transport in sync_transports:
+            transport.close()
+        logger.info('AI provider HTTP transports closed')
+
+
+provider_client_registry = ProviderClientRegistry(
+    maxsize=application_settings.provider_client_registry_max_size,
+    ttl=application_settings.provider_client_registry_ttl,
+)
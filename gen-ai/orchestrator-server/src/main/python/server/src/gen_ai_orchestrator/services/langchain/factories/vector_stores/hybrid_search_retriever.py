@@ -0,0 +1,41 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import logging
+from abc import ABC, abstractmethod
+
+from langchain_core.documents import Document
+from pydantic import BaseModel, ConfigDict
+
+logger = logging.getLogger(__name__)
+
+
+class HybridSearchRetriever(ABC, BaseModel):
+    """
+    A vector and full-text search, fused by the vector store itself in a single
+    request (instead of one request per search, fused by the RAG chain).
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @abstractmethod
+    async def ahybrid_search(self, query: str, key_words: list[str]) -> list[Document]:
+        """
+        Search the documents, ranked by their fused score.
+
+        Args:
+            query: The query of the vector search (the condensed question)
+            key_words: The key words of the full-text search (skipped when empty)
+        """
+        pass
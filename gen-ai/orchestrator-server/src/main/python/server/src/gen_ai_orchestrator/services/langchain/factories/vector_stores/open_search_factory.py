@@ -15,33 +15,38 @@
 """Model for creating OpenSearchFactory"""
 
 import logging
-from typing import Optional
+from typing import Optional, Union
 
-from langchain_community.vectorstores.opensearch_vector_search import (
-    OpenSearchVectorSearch,
-)
 from langchain_core.vectorstores import VectorStoreRetriever
+from opensearchpy import AsyncOpenSearch, OpenSearch
 
-from gen_ai_orchestrator.configurations.environment.settings import (
-    application_settings,
-    is_prod_environment,
-)
 from gen_ai_orchestrator.errors.handlers.opensearch.opensearch_exception_handler import (
     opensearch_exception_handler,
 )
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_client_registry import (
+    OpenSearchClients,
+)
 from gen_ai_orchestrator.models.vector_stores.open_search.open_search_setting import (
     OpenSearchVectorStoreSetting,
 )
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    DocumentFusionParams,
+)
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.full_text_search_retriever import (
     FullTextSearchRetriever,
 )
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_hybrid_retriever import (
+    OpenSearchHybridRetriever,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_text_retriever import (
+    OpenSearchTextRetriever,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_vector_search import (
+    AsyncOpenSearchVectorSearch,
+)
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
     LangChainVectorStoreFactory,
 )
-from gen_ai_orchestrator.services.security.security_service import (
-    fetch_secret_key_value,
-)
-from gen_ai_orchestrator.utils.strings import obfuscate
 
 logger = logging.getLogger(__name__)
 
@@ -54,32 +59,25 @@ class OpenSearchFactory(LangChainVectorStoreFactory):
 
     setting: OpenSearchVectorStoreSetting
 
+    """
+    Clients injected from the registry — no connection created here.
+    """
+    clients: OpenSearchClients
+
     def get_vector_store(
         self, async_mode: Optional[bool] = True
-    ) -> OpenSearchVectorSearch:
-        password = fetch_secret_key_value(self.setting.password)
-        logger.info(
-            'OpenSearch user credentials: %s:%s',
-            self.setting.username,
-            obfuscate(password),
-        )
-        return OpenSearchVectorSearch(
-            opensearch_url=f"https://{self.setting.host}:{self.setting.port}",
-            http_auth=(
-                self.setting.username,
-                fetch_secret_key_value(self.setting.password),
-            ),
-            use_ssl=is_prod_environment,
-            verify_certs=is_prod_environment,
-            # Expected hostname on the server certificate.
-            # By default, is the same as host. If set to False, it will not verify hostname on certificate
-            ssl_assert_hostname=self.setting.host if is_prod_environment else False,
-            ssl_show_warn=is_prod_environment,
+    ) -> AsyncOpenSearchVectorSearch:
+        return AsyncOpenSearchVectorSearch(
+            clients=self.clients,
             index_name=self.index_name,
             embedding_function=self.embedding_function,
-            timeout=application_settings.vector_store_timeout,
         )
 
+    def get_client(
+        self, async_mode: Optional[bool] = True
+    ) -> Union[OpenSearch, AsyncOpenSearch]:
+        return self.clients.async_client if async_mode else self.clients.sync_client
+
     def get_vector_store_retriever(
         self, search_kwargs: dict, async_mode: Optional[bool] = True
     ) -> VectorStoreRetriever:
@@ -90,10 +88,31 @@ class OpenSearchFactory(LangChainVectorStoreFactory):
     def get_text_store_retriever(
         self, search_kwargs: dict, async_mode: bool = True
     ) -> FullTextSearchRetriever:
-        raise NotImplementedError
+        return OpenSearchTextRetriever(
+            client=self.get_client(async_mode),
+            index_name=self.index_name,
+            k=search_kwargs.get('k', 10),
+            filter=search_kwargs.get('filter'),
+        )
+
+    def get_hybrid_search_retriever(
+        self, search_kwargs: dict, fusion: DocumentFusionParams
+    ) -> Optional[OpenSearchHybridRetriever]:
+        return OpenSearchHybridRetriever(
+            client=self.get_client(),
+            embedding_function=self.embedding_function,
+            index_name=self.index_name,
+            k=search_kwargs.get('k', 10),
+            filter=search_kwargs.get('filter'),
+            similarity_weight=fusion.weights.get('similarity', 1.0),
+            fts_weight=fusion.weights.get('fts', 1.0),
+            num_candidates=search_kwargs.get('num_candidates'),
+            ef_search=search_kwargs.get('ef_search'),
+            nprobes=search_kwargs.get('nprobes'),
+        )
 
     @opensearch_exception_handler
     async def check_vector_store_connection(self) -> bool:
         """To check the connection information, we ask for basic information about the cluster."""
-        self.get_vector_store().client.info()
+        await self.get_client().info()
         return True
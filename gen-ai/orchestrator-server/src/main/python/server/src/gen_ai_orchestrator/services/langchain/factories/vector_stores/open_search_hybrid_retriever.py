@@ -0,0 +1,117 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import logging
+from typing import Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from opensearchpy import AsyncOpenSearch
+
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.hybrid_search_retriever import (
+    HybridSearchRetriever,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_text_retriever import (
+    METADATA_FIELD,
+    TEXT_FIELD,
+    build_docs,
+    build_match_query,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_vector_search import (
+    build_knn_query,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_normalization_pipeline(weights: list[float]) -> dict:
+    """
+    Build the temporary search pipeline of the hybrid query: the scores of each
+    sub-query are min-max normalized, then combined by weighted arithmetic mean.
+    https://opensearch.org/docs/latest/search-plugins/search-pipelines/normalization-processor/
+    """
+    total = sum(weights) or 1.0
+    return {
+        'phase_results_processors': [
+            {
+                'normalization-processor': {
+                    'normalization': {'technique': 'min_max'},
+                    'combination': {
+                        'technique': 'arithmetic_mean',
+                        'parameters': {
+                            'weights': [weight / total for weight in weights]
+                        },
+                    },
+                }
+            }
+        ]
+    }
+
+
+class OpenSearchHybridRetriever(HybridSearchRetriever):
+    """
+    Native hybrid search of an OpenSearch index (neural-search plugin, 2.10+):
+    the k-NN and BM25 queries are sent as one hybrid query, fused by a search
+    pipeline defined in the request.
+    """
+
+    client: AsyncOpenSearch
+    embedding_function: Embeddings
+    index_name: str
+    k: int = 10
+    filter: Optional[list[dict]] = None
+    similarity_weight: float = 1.0
+    fts_weight: float = 1.0
+    num_candidates: Optional[int] = None
+    ef_search: Optional[int] = None
+    nprobes: Optional[int] = None
+
+    def build_knn_query(self, embedding: list[float]) -> dict:
+        knn_query = build_knn_query(
+            embedding,
+            self.k,
+            num_candidates=self.num_candidates,
+            ef_search=self.ef_search,
+            nprobes=self.nprobes,
+        )
+        if not self.filter:
+            return knn_query
+        return {'bool': {'must': [knn_query], 'filter': self.filter}}
+
+    def build_body(self, embedding: list[float], query: Optional[str]) -> dict:
+        queries = [self.build_knn_query(embedding)]
+        weights = [self.similarity_weight]
+        if query:
+            queries.append(build_match_query(query, self.filter))
+            weights.append(self.fts_weight)
+
+        return {
+            'size': self.k,
+            'query': {'hybrid': {'queries': queries}},
+            'search_pipeline': build_normalization_pipeline(weights),
+            '_source': [TEXT_FIELD, METADATA_FIELD],
+        }
+
+    async def ahybrid_search(self, query: str, key_words: list[str]) -> list[Document]:
+        logger.debug('Query : %s, key words: %s', query, key_words)
+        # The query embedding is usually cached (query embedding cache)
+        embedding = await self.embedding_function.aembed_query(query)
+        hits = await self.client.search(
+            index=self.index_name,
+            body=self.build_body(embedding, self.prepare_query(key_words)),
+        )
+        return build_docs(hits)
+
+    def prepare_query(self, keywords: list[str]) -> str:
+        return ' '.join(kw.strip() for kw in keywords if kw and kw.strip())
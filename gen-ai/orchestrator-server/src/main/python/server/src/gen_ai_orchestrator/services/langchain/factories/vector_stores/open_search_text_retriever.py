@@ -0,0 +1,92 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import logging
+from typing import Optional, Union
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from opensearchpy import AsyncOpenSearch, OpenSearch
+from pydantic import ConfigDict
+
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.full_text_search_retriever import (
+    FullTextSearchRetriever,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fields of the documents indexed by the LangChain OpenSearchVectorSearch
+TEXT_FIELD = 'text'
+VECTOR_FIELD = 'vector_field'
+METADATA_FIELD = 'metadata'
+
+
+def build_match_query(query: str, filter: Optional[list[dict]] = None) -> dict:
+    """Build the BM25 query of the key words, with the boolean filter (if any)."""
+    bool_query: dict = {'must': {'match': {TEXT_FIELD: {'query': query}}}}
+    if filter:
+        bool_query['filter'] = filter
+    return {'bool': bool_query}
+
+
+def build_docs(hits: dict) -> list[Document]:
+    # The score is kept for the score-based fusions (CombSUM, CombMNZ)
+    return [
+        Document(
+            page_content=hit['_source'][TEXT_FIELD],
+            metadata={**hit['_source'].get(METADATA_FIELD, {}), 'score': hit['_score']},
+        )
+        for hit in hits['hits']['hits']
+    ]
+
+
+class OpenSearchTextRetriever(FullTextSearchRetriever):
+    """BM25 full-text search of an OpenSearch index."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    client: Union[OpenSearch, AsyncOpenSearch]
+    index_name: str
+    k: int = 10
+    filter: Optional[list[dict]] = None
+
+    def build_body(self, query: str) -> dict:
+        return {
+            'size': self.k,
+            'query': build_match_query(query, self.filter),
+            '_source': [TEXT_FIELD, METADATA_FIELD],
+        }
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        logger.debug('Query : %s ', query)
+        hits = self.client.search(index=self.index_name, body=self.build_body(query))
+        return build_docs(hits)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        logger.debug('Query : %s ', query)
+        hits = await self.client.search(
+            index=self.index_name, body=self.build_body(query)
+        )
+        return build_docs(hits)
+
+    def prepare_query(self, keywords: list[str]) -> str:
+        # The match query is a disjunction of the analyzed terms
+        return ' '.join(kw.strip() for kw in keywords if kw and kw.strip())
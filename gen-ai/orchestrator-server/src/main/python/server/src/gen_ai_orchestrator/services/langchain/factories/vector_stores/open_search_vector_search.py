@@ -0,0 +1,155 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import logging
+from typing import Any, Optional
+
+from langchain_community.vectorstores.opensearch_vector_search import (
+    OpenSearchVectorSearch,
+)
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from opensearchpy import AsyncOpenSearch, OpenSearch
+
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_client_registry import (
+    OpenSearchClients,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_text_retriever import (
+    METADATA_FIELD,
+    TEXT_FIELD,
+    VECTOR_FIELD,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_knn_query(
+    embedding: list[float],
+    k: int,
+    num_candidates: Optional[int] = None,
+    ef_search: Optional[int] = None,
+    nprobes: Optional[int] = None,
+) -> dict:
+    """
+    Build the k-NN query of an embedding, with its search effort: the number of
+    nearest neighbours searched (k by default), and the method parameters of
+    the HNSW (ef_search) or IVF (nprobes) index.
+    """
+    knn_clause = {'vector': embedding, 'k': max(num_candidates or k, k)}
+    method_parameters = {
+        name: value
+        for name, value in (('ef_search', ef_search), ('nprobes', nprobes))
+        if value is not None
+    }
+    if method_parameters:
+        knn_clause['method_parameters'] = method_parameters
+    return {'knn': {VECTOR_FIELD: knn_clause}}
+
+
+class AsyncOpenSearchVectorSearch(OpenSearchVectorSearch):
+    """
+    The LangChain OpenSearchVectorSearch, on the registered clients (see
+    OpenSearchClientRegistry) instead of new ones, with a truly async
+    similarity search: the LangChain one runs the sync search in a thread.
+    The async search supports the approximate k-NN search, with a boolean filter
+    and a search effort (see build_knn_query).
+    """
+
+    def __init__(
+        self,
+        clients: OpenSearchClients,
+        index_name: str,
+        embedding_function: Embeddings,
+    ):
+        # The parent constructor is not called: it creates new clients
+        self.clients = clients
+        self.index_name = index_name
+        self.embedding_function = embedding_function
+        self.is_aoss = False
+        self.engine = 'nmslib'
+        self.bulk_size = 500
+        self.routing = None
+
+    @property
+    def client(self) -> OpenSearch:
+        return self.clients.sync_client
+
+    @property
+    def async_client(self) -> AsyncOpenSearch:
+        return self.clients.async_client
+
+    async def asimilarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        score_threshold: Optional[float] = 0.0,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        embedding = await self.embedding_function.aembed_query(query)
+        return await self.asimilarity_search_with_score_by_vector(
+            embedding, k, score_threshold, **kwargs
+        )
+
+    async def asimilarity_search_with_score_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        score_threshold: Optional[float] = 0.0,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        knn_query = build_knn_query(
+            embedding,
+            k,
+            num_candidates=kwargs.get('num_candidates'),
+            ef_search=kwargs.get('ef_search'),
+            nprobes=kwargs.get('nprobes'),
+        )
+        boolean_filter = kwargs.get('filter')
+        search_query = {
+            'size': k,
+            'min_score': score_threshold,
+            'query': (
+                {'bool': {'filter': boolean_filter, 'must': [knn_query]}}
+                if boolean_filter
+                else knn_query
+            ),
+            '_source': [TEXT_FIELD, METADATA_FIELD],
+        }
+
+        response = await self.async_client.search(
+            index=self.index_name, body=search_query
+        )
+        return [
+            (
+                Document(
+                    id=hit['_id'],
+                    page_content=hit['_source'][TEXT_FIELD],
+                    metadata=hit['_source'].get(METADATA_FIELD, {}),
+                ),
+                hit['_score'],
+            )
+            for hit in response['hits']['hits']
+        ]
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        score_threshold: Optional[float] = 0.0,
+        **kwargs: Any,
+    ) -> list[Document]:
+        docs_with_scores = await self.asimilarity_search_with_score(
+            query, k, score_threshold, **kwargs
+        )
+        return [doc for doc, _ in docs_with_scores]
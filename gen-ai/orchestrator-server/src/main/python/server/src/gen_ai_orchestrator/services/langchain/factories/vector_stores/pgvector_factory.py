@@ -18,7 +18,6 @@ import logging
 from typing import Optional
 
 from langchain_core.vectorstores import VectorStoreRetriever
-from langchain_postgres import PGVector
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -29,15 +28,29 @@ from gen_ai_orchestrator.models.vector_stores.pgvector.database_pool_registry im
 from gen_ai_orchestrator.models.vector_stores.pgvector.pgvector_setting import (
     PGVectorStoreSetting,
 )
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    DocumentFusionParams,
+)
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.full_text_search_retriever import (
     FullTextSearchRetriever,
 )
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_store import (
+    CollectionPGVector,
+    get_pgvector_store_cache,
+    get_search_settings,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.postgresql_hybrid_retriever import (
+    PostgreSQLHybridRetriever,
+)
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.postgresql_text_retriever import (
     PostgreSQLTextRetriever,
 )
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
     LangChainVectorStoreFactory,
 )
+from gen_ai_orchestrator.services.utils.search_filter import (
+    find_index_session_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,22 +68,39 @@ class PGVectorFactory(LangChainVectorStoreFactory):
 
     setting: PGVectorStoreSetting
 
-    def get_vector_store(self, async_mode: Optional[bool] = True) -> PGVector:
+    def get_vector_store(
+        self,
+        async_mode: Optional[bool] = True,
+        index_session_id: Optional[str] = None,
+        search_settings: Optional[dict[str, int]] = None,
+    ) -> CollectionPGVector:
+        """
+        Return the cached store of the collection (one per database pool).
+
+        Args:
+            async_mode: Whether the store uses the async engine
+            index_session_id: The index session searched, if known. A new one
+                resolves the collection id again.
+            search_settings: The search effort settings (SET LOCAL), e.g. {'hnsw.ef_search': 100}
+        """
         engine = self.pool.async_engine if async_mode else self.pool.sync_engine
-        return PGVector(
-            embeddings=self.embedding_function,
+        return get_pgvector_store_cache(self.pool).get_vector_store(
             collection_name=self.index_name,
-            connection=engine,
-            use_jsonb=True,
-            async_mode=async_mode,
+            embeddings=self.embedding_function,
+            engine=engine,
+            async_mode=bool(async_mode),
+            index_session_id=index_session_id,
+            search_settings=search_settings,
         )
 
     def get_vector_store_retriever(
         self, search_kwargs: dict, async_mode: Optional[bool] = True
     ) -> VectorStoreRetriever:
-        return self.get_vector_store(async_mode).as_retriever(
-            search_kwargs=search_kwargs
-        )
+        return self.get_vector_store(
+            async_mode,
+            find_index_session_id(search_kwargs.get('filter')),
+            get_search_settings(search_kwargs),
+        ).as_retriever(search_kwargs=search_kwargs)
 
     def get_text_store_retriever(
         self, search_kwargs: dict, async_mode: bool = True
@@ -78,8 +108,29 @@ class PGVectorFactory(LangChainVectorStoreFactory):
         engine = self.pool.async_engine if async_mode else self.pool.sync_engine
         return PostgreSQLTextRetriever(
             engine=engine,
-            table_name=self.index_name,
+            vector_store=self.get_vector_store(
+                async_mode, find_index_session_id(search_kwargs.get('filter'))
+            ),
+            k=search_kwargs.get('k', 10),
+            language=application_settings.vector_store_fts_language,
+        )
+
+    def get_hybrid_search_retriever(
+        self, search_kwargs: dict, fusion: DocumentFusionParams
+    ) -> Optional[PostgreSQLHybridRetriever]:
+        filter = search_kwargs.get('filter')
+        return PostgreSQLHybridRetriever(
+            vector_store=self.get_vector_store(
+                index_session_id=find_index_session_id(filter),
+                search_settings=get_search_settings(search_kwargs),
+            ),
             k=search_kwargs.get('k', 10),
+            filter=filter,
+            method=fusion.method,
+            rrf_k=fusion.rrf_k,
+            similarity_weight=fusion.weights.get('similarity', 1.0),
+            fts_weight=fusion.weights.get('fts', 1.0),
+            language=application_settings.vector_store_fts_language,
         )
 
     async def check_vector_store_connection(self) -> bool:
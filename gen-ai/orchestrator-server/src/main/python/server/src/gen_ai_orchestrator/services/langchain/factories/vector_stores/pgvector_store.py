@@ -0,0 +1,302 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the cached PGVector stores: built once per database pool and
+collection, they resolve the collection id once (and again on a new index
+session), then filter the embeddings on it.
+"""
+
+import copy
+import logging
+import uuid
+import weakref
+from typing import Any, List, Optional, Tuple, Union
+
+import sqlalchemy
+from cachetools import LRUCache
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_postgres import PGVector
+from langchain_postgres.vectorstores import _get_embedding_collection_store
+from sqlalchemy import Engine, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.models.vector_stores.pgvector.database_pool_registry import (
+    DatabasePool,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionPGVector(PGVector):
+    """
+    A PGVector store that resolves its collection id once, then searches the
+    embeddings by collection id (the LangChain one looks the collection up by
+    name, and joins it, on every search).
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Shared by the copies of the store (see with_embeddings), and set before
+        # the LangChain init, which sets the lazy async init flag
+        self._shared_state: dict[str, Any] = {
+            'async_init': False,
+            'collection_id': None,
+        }
+        # The search effort settings, e.g. {'hnsw.ef_search': 100}
+        self.search_settings: dict[str, int] = {}
+        super().__init__(*args, **kwargs)
+        # Cached by LangChain: the searches do not wait for the lazy async init
+        self.EmbeddingStore, self.CollectionStore = _get_embedding_collection_store(
+            self._embedding_length
+        )
+
+    @property
+    def _async_init(self) -> bool:
+        """The LangChain lazy async init flag: the init runs once for all the copies."""
+        return self._shared_state['async_init']
+
+    @_async_init.setter
+    def _async_init(self, async_init: bool) -> None:
+        self._shared_state['async_init'] = async_init
+
+    @property
+    def collection_id(self) -> Optional[uuid.UUID]:
+        return self._shared_state['collection_id']
+
+    @collection_id.setter
+    def collection_id(self, collection_id: Optional[uuid.UUID]) -> None:
+        self._shared_state['collection_id'] = collection_id
+
+    def invalidate(self) -> None:
+        """Forget the collection id: it is resolved again by the next search."""
+        self.collection_id = None
+
+    def with_embeddings(
+        self,
+        embeddings: Embeddings,
+        search_settings: Optional[dict[str, int]] = None,
+    ) -> 'CollectionPGVector':
+        """
+        Return a copy of the store using the given embedding model (a request may
+        wrap it, e.g. with the query embedding cache) and search settings. The
+        copy shares the engine, the sessions and the collection id of the store.
+        """
+        vector_store = copy.copy(self)
+        vector_store.embedding_function = embeddings
+        vector_store.search_settings = dict(search_settings or {})
+        return vector_store
+
+    def build_search_settings_statement(self) -> Optional[Any]:
+        """
+        Build the statement applying the search settings to the current
+        transaction: set_config(..., is_local => true) is SET LOCAL, with parameters.
+        """
+        if not self.search_settings:
+            return None
+        return select(
+            *[
+                func.set_config(name, str(value), True)
+                for name, value in sorted(self.search_settings.items())
+            ]
+        )
+
+    async def aapply_search_settings(self, session: AsyncSession) -> None:
+        statement = self.build_search_settings_statement()
+        if statement is not None:
+            await session.execute(statement)
+
+    def apply_search_settings(self, session: Session) -> None:
+        statement = self.build_search_settings_statement()
+        if statement is not None:
+            session.execute(statement)
+
+    async def aget_collection_id(self) -> uuid.UUID:
+        if self.collection_id is None:
+            async with self._make_async_session() as session:
+                collection = await self.aget_collection(session)
+            if not collection:
+                raise ValueError('Collection not found')
+            logger.debug('Collection %s resolved', self.collection_name)
+            self.collection_id = collection.uuid
+        return self.collection_id
+
+    def get_collection_id(self) -> uuid.UUID:
+        if self.collection_id is None:
+            with self._make_sync_session() as session:
+                collection = self.get_collection(session)
+            if not collection:
+                raise ValueError('Collection not found')
+            logger.debug('Collection %s resolved', self.collection_name)
+            self.collection_id = collection.uuid
+        return self.collection_id
+
+    def build_search_statement(
+        self,
+        collection_id: uuid.UUID,
+        embedding: List[float],
+        k: int,
+        filter: Optional[dict] = None,
+    ) -> Any:
+        filter_by = [self.EmbeddingStore.collection_id == collection_id]
+        if filter:
+            filter_clauses = self._create_filter_clause(filter)
+            if filter_clauses is not None:
+                filter_by.append(filter_clauses)
+
+        return (
+            select(
+                self.EmbeddingStore,
+                self.distance_strategy(embedding).label('distance'),
+            )
+            .filter(*filter_by)
+            .order_by(sqlalchemy.asc('distance'))
+            .limit(k)
+        )
+
+    async def asimilarity_search_with_score_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[dict] = None,
+    ) -> List[Tuple[Document, float]]:
+        collection_id = await self.aget_collection_id()
+        async with self._make_async_session() as session:
+            await self.aapply_search_settings(session)
+            results = (
+                await session.execute(
+                    self.build_search_statement(collection_id, embedding, k, filter)
+                )
+            ).all()
+        return self._results_to_docs_and_scores(results)
+
+    def similarity_search_with_score_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[dict] = None,
+    ) -> List[Tuple[Document, float]]:
+        collection_id = self.get_collection_id()
+        with self._make_sync_session() as session:
+            self.apply_search_settings(session)
+            results = session.execute(
+                self.build_search_statement(collection_id, embedding, k, filter)
+            ).all()
+        return self._results_to_docs_and_scores(results)
+
+
+def get_search_settings(search_kwargs: dict) -> dict[str, int]:
+    """
+    Return the search effort settings of the search params (see PGVectorParams).
+    hnsw.ef_search is raised to k when the documents are over-fetched: an HNSW
+    search returns at most ef_search documents.
+    """
+    search_settings = {}
+    if search_kwargs.get('ef_search') is not None:
+        search_settings['hnsw.ef_search'] = max(
+            search_kwargs['ef_search'], search_kwargs.get('k', 0)
+        )
+    if search_kwargs.get('probes') is not None:
+        search_settings['ivfflat.probes'] = search_kwargs['probes']
+    return search_settings
+
+
+class PGVectorStoreCache:
+    """
+    The PGVector stores of a database pool, by collection (and sync or async
+    mode). A store is built, and its collection id resolved, once. The collection
+    id is resolved again when the collection is searched with a new index
+    session: the collection may have been recreated by the indexing.
+    """
+
+    def __init__(self, max_size: int):
+        self._stores: LRUCache = LRUCache(maxsize=max_size)
+        self._index_sessions: LRUCache = LRUCache(maxsize=max_size)
+
+    def get_vector_store(
+        self,
+        collection_name: str,
+        embeddings: Embeddings,
+        engine: Union[Engine, AsyncEngine],
+        async_mode: bool,
+        index_session_id: Optional[str] = None,
+        search_settings: Optional[dict[str, int]] = None,
+    ) -> CollectionPGVector:
+        """
+        Return the store of the collection, using the given embedding model.
+
+        Args:
+            collection_name: The collection (index) name
+            embeddings: The embedding model of the request
+            engine: The (sync or async) engine of the database pool
+            async_mode: Whether the store is used asynchronously
+            index_session_id: The index session searched, if known
+            search_settings: The search settings of the request (see get_search_settings)
+        """
+        key = (collection_name, async_mode)
+        vector_store = self._stores.get(key)
+        if vector_store is None:
+            vector_store = CollectionPGVector(
+                embeddings=embeddings,
+                collection_name=collection_name,
+                connection=engine,
+                use_jsonb=True,
+                async_mode=async_mode,
+            )
+            self._stores[key] = vector_store
+
+        self.activate_index_session(collection_name, index_session_id)
+        return vector_store.with_embeddings(embeddings, search_settings)
+
+    def activate_index_session(
+        self, collection_name: str, index_session_id: Optional[str]
+    ) -> None:
+        """Invalidate the collection ids of the collection on a new index session."""
+        if index_session_id is None:
+            return
+
+        previous_index_session_id = self._index_sessions.get(collection_name)
+        self._index_sessions[collection_name] = index_session_id
+        if previous_index_session_id not in (None, index_session_id):
+            logger.info(
+                'New index session %s of the collection %s: its id is resolved again',
+                index_session_id,
+                collection_name,
+            )
+            for async_mode in (False, True):
+                vector_store = self._stores.get((collection_name, async_mode))
+                if vector_store is not None:
+                    vector_store.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+
+# One store cache per database pool
+_pgvector_store_caches: weakref.WeakKeyDictionary[
+    DatabasePool, PGVectorStoreCache
+] = weakref.WeakKeyDictionary()
+
+
+def get_pgvector_store_cache(pool: DatabasePool) -> PGVectorStoreCache:
+    """Return the PGVector store cache of a database pool."""
+    if pool not in _pgvector_store_caches:
+        _pgvector_store_caches[pool] = PGVectorStoreCache(
+            max_size=application_settings.pgvector_store_cache_max_size
+        )
+    return _pgvector_store_caches[pool]
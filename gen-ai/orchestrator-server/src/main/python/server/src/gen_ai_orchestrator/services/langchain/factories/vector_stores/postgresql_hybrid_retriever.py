@@ -0,0 +1,276 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the PostgreSQL hybrid search: the vector (ANN) and full-text
+searches, and their fusion, run as a single SQL statement.
+
+The statement holds one CTE per search, each one keeping its k best chunks
+(the ANN one ordered by distance only, so that the HNSW or IVFFlat index is
+used), ranked by a window function. The CTEs are fully outer joined on the
+chunk id, the fused score is computed in SQL (weighted RRF, CombSUM or
+CombMNZ), and only the k best chunks are returned, with their rank in each
+search.
+"""
+
+import functools
+import logging
+import operator
+from typing import Any, Iterable, Optional
+
+import sqlalchemy
+from langchain_core.documents import Document
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    FusionMethod,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.hybrid_search_retriever import (
+    HybridSearchRetriever,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_store import (
+    CollectionPGVector,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.postgresql_text_retriever import (
+    prepare_websearch_query,
+)
+
+logger = logging.getLogger(__name__)
+
+# The rank metadata key of the fused ranking, as set by the RAG chain fusion
+FUSION_RANK_KEYS = {
+    FusionMethod.RRF: 'rrf',
+    FusionMethod.COMB_SUM: 'combsum',
+    FusionMethod.COMB_MNZ: 'combmnz',
+}
+
+
+def add(terms: Iterable[Any]) -> Any:
+    """Add up SQL expressions."""
+    return functools.reduce(operator.add, terms)
+
+
+def rank_search(name: str, candidates: Any, score: Any) -> Any:
+    """
+    Rank the candidates of a search by score (the higher, the better): their
+    rank, their count, and their min-max normalized score (1 when all equal).
+    """
+    score_range = func.max(score).over() - func.min(score).over()
+    return select(
+        candidates.c.id,
+        func.row_number().over(order_by=score.desc()).label('rank'),
+        func.count().over().label('total'),
+        func.coalesce(
+            (score - func.min(score).over()) / func.nullif(score_range, 0.0), 1.0
+        ).label('normalized_score'),
+    ).cte(name)
+
+
+def build_hybrid_search_statement(
+    vector_store: CollectionPGVector,
+    collection_id: Any,
+    embedding: list[float],
+    query: Optional[str],
+    k: int,
+    filter: Optional[dict] = None,
+    method: FusionMethod = FusionMethod.RRF,
+    rrf_k: int = 60,
+    similarity_weight: float = 1.0,
+    fts_weight: float = 1.0,
+    language: str = 'french',
+) -> Any:
+    """
+    Build the hybrid search statement of a collection.
+
+    Args:
+        vector_store: The store of the collection (embedding table, distance, filters)
+        collection_id: The collection id
+        embedding: The query embedding
+        query: The websearch_to_tsquery query of the full-text search (skipped if empty)
+        k: The number of chunks of each search, and of the fused result
+        filter: The PGVector metadata filter, applied to both searches
+        method: The fusion method
+        rrf_k: The rank constant of the reciprocal rank fusion
+        similarity_weight: The weight of the vector search
+        fts_weight: The weight of the full-text search
+        language: The text search configuration of the full-text search
+
+    Returns:
+        The statement, selecting the document, cmetadata, score (fused) columns,
+        and the rank and total columns of each search (NULL rank when missed).
+    """
+    embedding_store = vector_store.EmbeddingStore
+    filter_by = [embedding_store.collection_id == collection_id]
+    if filter:
+        filter_clauses = vector_store._create_filter_clause(filter)
+        if filter_clauses is not None:
+            filter_by.append(filter_clauses)
+
+    # The nearest neighbours are selected first (index scan), then ranked
+    distance = vector_store.distance_strategy(embedding)
+    ann_candidates = (
+        select(embedding_store.id, distance.label('distance'))
+        .filter(*filter_by)
+        .order_by(sqlalchemy.asc('distance'))
+        .limit(k)
+        .subquery('ann_candidates')
+    )
+    searches = [
+        (
+            'similarity',
+            rank_search('ann', ann_candidates, -ann_candidates.c.distance),
+            float(similarity_weight),
+        )
+    ]
+
+    if query:
+        fts_vector = sqlalchemy.literal_column(
+            f"{embedding_store.__tablename__}.fts_vector"
+        )
+        ts_query = func.websearch_to_tsquery(
+            sqlalchemy.cast(sqlalchemy.literal(language), REGCONFIG),
+            func.unaccent(sqlalchemy.literal(query)),
+        )
+        fts_candidates = (
+            select(
+                embedding_store.id,
+                func.ts_rank(fts_vector, ts_query).label('score'),
+            )
+            .filter(*filter_by, fts_vector.op('@@')(ts_query))
+            .order_by(sqlalchemy.desc('score'))
+            .limit(k)
+            .subquery('fts_candidates')
+        )
+        searches.append(
+            (
+                'fts',
+                rank_search('fts', fts_candidates, fts_candidates.c.score),
+                float(fts_weight),
+            )
+        )
+
+    first = searches[0][1]
+    chunk_id = first.c.id
+    from_clause = first
+    for _, search, _ in searches[1:]:
+        from_clause = from_clause.join(search, search.c.id == chunk_id, full=True)
+        chunk_id = func.coalesce(chunk_id, search.c.id)
+
+    if FusionMethod.RRF == method:
+        score = add(
+            func.coalesce(weight / (rrf_k + search.c.rank), 0.0)
+            for _, search, weight in searches
+        )
+    else:
+        score = add(
+            func.coalesce(weight * search.c.normalized_score, 0.0)
+            for _, search, weight in searches
+        )
+        if FusionMethod.COMB_MNZ == method:
+            # The number of searches holding the chunk
+            score = score * add(
+                sqlalchemy.case((search.c.id.is_not(None), 1), else_=0)
+                for _, search, _ in searches
+            )
+
+    ranks = []
+    for name, search, _ in searches:
+        ranks += [
+            search.c.rank.label(f"{name}_rank"),
+            search.c.total.label(f"{name}_total"),
+        ]
+    fused = (
+        select(
+            chunk_id.label('id'),
+            sqlalchemy.cast(score, sqlalchemy.Float).label('score'),
+            *ranks,
+        )
+        .select_from(from_clause)
+        .order_by(sqlalchemy.desc('score'))
+        .limit(k)
+        .cte('fused')
+    )
+
+    return (
+        select(
+            embedding_store.document,
+            embedding_store.cmetadata,
+            *[column for column in fused.c if column.name != 'id'],
+        )
+        .join(fused, fused.c.id == embedding_store.id)
+        .order_by(fused.c.score.desc())
+    )
+
+
+def build_docs(rows: list[Any], rank_key: str) -> list[Document]:
+    """
+    Build the documents of the hybrid search rows, with their fused score and
+    their rank metadata (in each search, and in the fusion).
+    """
+    docs = []
+    for fused_rank, row in enumerate(rows, start=1):
+        mapping = row._mapping
+        rank = {
+            name: f"{mapping[f'{name}_rank']}/{mapping[f'{name}_total']}"
+            for name in ('similarity', 'fts')
+            if mapping.get(f"{name}_rank") is not None
+        }
+        rank[rank_key] = f"{fused_rank}/{len(rows)}"
+        docs.append(
+            Document(
+                page_content=row.document,
+                metadata={**row.cmetadata, 'score': row.score, 'rank': rank},
+            )
+        )
+    return docs
+
+
+class PostgreSQLHybridRetriever(HybridSearchRetriever):
+    """
+    Native hybrid search of a PGVector collection: the vector and full-text
+    searches are fused by PostgreSQL, in a single statement (one round trip,
+    one pool connection).
+    """
+
+    vector_store: CollectionPGVector
+    k: int = 10
+    filter: Optional[dict] = None
+    method: FusionMethod = FusionMethod.RRF
+    rrf_k: int = 60
+    similarity_weight: float = 1.0
+    fts_weight: float = 1.0
+    language: str = 'french'
+
+    async def ahybrid_search(self, query: str, key_words: list[str]) -> list[Document]:
+        logger.debug('Query : %s, key words: %s', query, key_words)
+        # The query embedding is usually cached (query embedding cache)
+        embedding = await self.vector_store.embeddings.aembed_query(query)
+        statement = build_hybrid_search_statement(
+            vector_store=self.vector_store,
+            collection_id=await self.vector_store.aget_collection_id(),
+            embedding=embedding,
+            query=prepare_websearch_query(key_words),
+            k=self.k,
+            filter=self.filter,
+            method=self.method,
+            rrf_k=self.rrf_k,
+            similarity_weight=self.similarity_weight,
+            fts_weight=self.fts_weight,
+            language=self.language,
+        )
+        async with self.vector_store._make_async_session() as session:
+            await self.vector_store.aapply_search_settings(session)
+            rows = (await session.execute(statement)).all()
+        return build_docs(rows, FUSION_RANK_KEYS[self.method])
@@ -13,6 +13,7 @@
 #   limitations under the License.
 #
 import logging
+import uuid
 from typing import Union
 
 from langchain_core.callbacks import (
@@ -27,48 +28,72 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.full_text_search_retriever import (
     FullTextSearchRetriever,
 )
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_store import (
+    CollectionPGVector,
+)
 
 logger = logging.getLogger(__name__)
 
 
 def build_docs(rows) -> list[Document]:
-    docs = [Document(page_content=row.document, metadata=row.cmetadata) for row in rows]
+    # The ts_rank score is kept for the score-based fusions (CombSUM, CombMNZ)
+    docs = [
+        Document(page_content=row.document, metadata={**row.cmetadata, 'score': row.score})
+        for row in rows
+    ]
 
     return docs
 
 
+def prepare_websearch_query(keywords: list[str]) -> str:
+    """Join the key words into a websearch_to_tsquery query, matching any of them."""
+    parts = []
+
+    for kw in keywords:
+        if not kw or not kw.strip():
+            continue
+        parts.append(kw.replace("'", "''").strip())
+
+    return ' OR '.join(parts)
+
+
+# Filtered on the collection id (resolved once by the vector store) rather than
+# joined on the collection name: a constant statement, prepared by psycopg once
+# executed a few times on a connection (see db_prepare_threshold)
+TEXT_SEARCH_SQL = text("""
+    WITH q AS (
+        SELECT websearch_to_tsquery(:language, unaccent(:query)) AS ts_query
+    )
+    SELECT
+        d.document,
+        d.cmetadata,
+        ts_rank(d.fts_vector, q.ts_query) AS score
+    FROM langchain_pg_embedding d
+    CROSS JOIN q
+    WHERE d.collection_id = :collection_id
+      AND d.fts_vector @@ q.ts_query
+    ORDER BY score DESC
+    LIMIT :k
+""")
+
+
 def build_sql() -> TextClause:
-    return text("""
-        WITH q AS (
-            SELECT websearch_to_tsquery(:language, unaccent(:query)) AS ts_query
-        )
-        SELECT
-            d.document,
-            d.cmetadata,
-            ts_rank(d.fts_vector, q.ts_query) AS score
-        FROM langchain_pg_embedding d
-        JOIN langchain_pg_collection lpc ON lpc.uuid = d.collection_id
-        CROSS JOIN q
-        WHERE lpc.name = :table_name
-          AND d.fts_vector @@ q.ts_query
-        ORDER BY score DESC
-        LIMIT :k
-    """)
+    return TEXT_SEARCH_SQL
 
 
 class PostgreSQLTextRetriever(FullTextSearchRetriever):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     engine: Union[Engine, AsyncEngine]
-    table_name: str
+    vector_store: CollectionPGVector
     language: str = 'french'
     k: int = 10
 
-    def build_params(self, query: str) -> dict:
+    def build_params(self, query: str, collection_id: uuid.UUID) -> dict:
         return {
             'query': query,
             'language': self.language,
-            'table_name': self.table_name,
+            'collection_id': collection_id,
             'k': self.k,
         }
 
@@ -77,24 +102,23 @@ class PostgreSQLTextRetriever(FullTextSearchRetriever):
     ) -> list[Document]:
         logger.debug('Query : %s ', query)
         with self.engine.connect() as conn:
-            rows = conn.execute(build_sql(), self.build_params(query)).fetchall()
+            rows = conn.execute(
+                build_sql(),
+                self.build_params(query, self.vector_store.get_collection_id()),
+            ).fetchall()
         return build_docs(rows)
 
     async def _aget_relevant_documents(
         self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
     ) -> list[Document]:
         logger.debug('Query : %s ', query)
+        collection_id = await self.vector_store.aget_collection_id()
         async with self.engine.connect() as conn:
-            result = await conn.execute(build_sql(), self.build_params(query))
+            result = await conn.execute(
+                build_sql(), self.build_params(query, collection_id)
+            )
             rows = result.fetchall()
         return build_docs(rows)
 
     def prepare_query(self, keywords: list[str]) -> str:
-        parts = []
-
-        for kw in keywords:
-            if not kw or not kw.strip():
-                continue
-            parts.append(kw.replace("'", "''").strip())
-
-        return ' OR '.join(parts)
+        return prepare_websearch_query(keywords)
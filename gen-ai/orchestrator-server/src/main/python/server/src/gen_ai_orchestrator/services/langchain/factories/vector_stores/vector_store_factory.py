@@ -33,12 +33,18 @@ from gen_ai_orchestrator.errors.handlers.opensearch.opensearch_exception_handler
     opensearch_exception_handler,
 )
 from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    DocumentFusionParams,
+)
 from gen_ai_orchestrator.models.vector_stores.vector_store_setting import (
     BaseVectorStoreSetting,
 )
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.full_text_search_retriever import (
     FullTextSearchRetriever,
 )
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.hybrid_search_retriever import (
+    HybridSearchRetriever,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +86,19 @@ class LangChainVectorStoreFactory(ABC, BaseModel):
     ) -> FullTextSearchRetriever:
         pass
 
+    def get_hybrid_search_retriever(
+        self, search_kwargs: dict, fusion: DocumentFusionParams
+    ) -> Optional[HybridSearchRetriever]:
+        """
+        Fabric the native hybrid search retriever (vector and full-text searches
+        fused by the vector store in a single request), if supported.
+        Args:
+            search_kwargs: the search filter
+            fusion: the fusion params (weights of the 'similarity' and 'fts' searches)
+        :return: A HybridSearchRetriever, or None if not supported by the vector store.
+        """
+        return None
+
     @opensearch_exception_handler
     async def check_vector_store_setting(self) -> bool:
         """
@@ -25,6 +25,9 @@ from gen_ai_orchestrator.errors.exceptions.document_compressor.document_compress
     GenAIDocumentCompressorUnknownLabelException,
 )
 from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,18 @@ class BloomzRerank(BaseDocumentCompressor):
     is_fault_tolerant: bool = True
     """If True, the treatment is fault-tolerant."""
 
+    @property
+    def _score_url(self) -> str:
+        return urljoin(self.endpoint, '/score')
+
+    def _score_payload(self, documents: Sequence[Document], query: str) -> dict:
+        return {
+            'contexts': [
+                {'query': query, 'context': document.page_content}
+                for document in documents
+            ]
+        }
+
     def compress_documents(
         self,
         documents: Sequence[Document],
@@ -67,54 +82,112 @@ class BloomzRerank(BaseDocumentCompressor):
         if len(documents) == 0:  # to avoid empty api call
             return []
 
-        url = urljoin(self.endpoint, '/score')
         try:
             response = requests.post(
-                url=url,
-                json={
-                    'contexts': [
-                        {'query': query, 'context': document.page_content}
-                        for document in documents
-                    ]
-                },
+                url=self._score_url,
+                json=self._score_payload(documents, query),
                 timeout=self.timeout,
             )
 
             if response.status_code != 200:
-                logger.error(
-                    f"[Compressor] Bad response {response.status_code} "
-                    f"{response.reason} - {response.text}"
+                return self._fallback_on_bad_response(
+                    documents, response.status_code, response.reason, response.text
                 )
 
-                if not self.is_fault_tolerant:
-                    raise GenAIDocumentCompressorErrorException(
-                        ErrorInfo(
-                            error=str(response.status_code),
-                            cause=f"Response: {response.text}, Reason: {response.reason}",
-                            request=f"[POST] {url}",
-                        )
-                    )
+            results = response.json().get('response', [])
+
+        except GenAIDocumentCompressorErrorException:
+            raise
+        except Exception as exc:
+            return self._fallback_on_exception(documents, exc)
+
+        return self._rank_documents(documents, results)
+
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """
+        Compress documents, without blocking the event loop.
+        The HTTP connections to the endpoint are pooled (see the provider client registry).
+
+        Args:
+            documents: A sequence of documents to compress.
+            query: The query to use for compressing the documents.
+            callbacks: Callbacks to run during the compression process.
+
+        Returns:
+            A sequence of compressed documents.
+        """
+        if len(documents) == 0:  # to avoid empty api call
+            return []
 
-                logger.warning('[Compressor] Fallback to original documents')
-                return documents
+        client = provider_client_registry.get_async_client(self.endpoint, self.timeout)
+        try:
+            response = await client.post(
+                url=self._score_url, json=self._score_payload(documents, query)
+            )
+
+            if response.status_code != 200:
+                return self._fallback_on_bad_response(
+                    documents,
+                    response.status_code,
+                    response.reason_phrase,
+                    response.text,
+                )
 
             results = response.json().get('response', [])
 
+        except GenAIDocumentCompressorErrorException:
+            raise
         except Exception as exc:
-            logger.error(f"[Compressor] Exception during rerank call: {exc}")
-
-            if not self.is_fault_tolerant:
-                raise GenAIDocumentCompressorErrorException(
-                    ErrorInfo(
-                        error=exc.__class__.__name__,
-                        cause=str(exc),
-                        request=f"[POST] {url}",
-                    )
+            return self._fallback_on_exception(documents, exc)
+
+        return self._rank_documents(documents, results)
+
+    def _fallback(self, documents: Sequence[Document]) -> Sequence[Document]:
+        """Keep the original order of the documents, up to max_documents."""
+        logger.warning('[Compressor] Fallback to original documents')
+        return documents[: self.max_documents]
+
+    def _fallback_on_bad_response(
+        self, documents: Sequence[Document], status_code: int, reason: str, text: str
+    ) -> Sequence[Document]:
+        logger.error(f"[Compressor] Bad response {status_code} {reason} - {text}")
+
+        if not self.is_fault_tolerant:
+            raise GenAIDocumentCompressorErrorException(
+                ErrorInfo(
+                    error=str(status_code),
+                    cause=f"Response: {text}, Reason: {reason}",
+                    request=f"[POST] {self._score_url}",
                 )
+            )
 
-            logger.warning('[Compressor] Fallback to original documents')
-            return documents
+        return self._fallback(documents)
 
+    def _fallback_on_exception(
+        self, documents: Sequence[Document], exc: Exception
+    ) -> Sequence[Document]:
+        logger.error(f"[Compressor] Exception during rerank call: {exc!r}")
+
+        if not self.is_fault_tolerant:
+            raise GenAIDocumentCompressorErrorException(
+                ErrorInfo(
+                    error=exc.__class__.__name__,
+                    cause=str(exc),
+                    request=f"[POST] {self._score_url}",
+                )
+            )
+
+        return self._fallback(documents)
+
+    def _rank_documents(
+        self, documents: Sequence[Document], results: list
+    ) -> Sequence[Document]:
+        """Sort the documents by score, and keep the best ones (see min_score and max_documents)."""
         scored_docs = []
 
         for i, doc_results in enumerate(results):
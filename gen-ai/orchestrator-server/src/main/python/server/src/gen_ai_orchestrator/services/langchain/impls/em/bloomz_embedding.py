@@ -13,16 +13,42 @@
 #   limitations under the License.
 #
 
+"""
+Bloomz Embeddings
+-----------------
+Client of the Bloomz embedding servers.
+
+* The texts are sent by sub-batches (batch_size), with at most max_concurrency
+  requests at a time.
+* The HTTP connections are pooled (see the provider client registry).
+* Failed requests (connection errors, timeouts, 429 and 5xx responses) are
+  retried with an exponential backoff.
+"""
+
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 from urllib.parse import urljoin
 
-import requests
+import httpx
 from langchain.embeddings.base import Embeddings
 from pydantic import BaseModel
 
+from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions import (
+    AIProviderAPIErrorException,
+)
+from gen_ai_orchestrator.models.em.em_provider import EMProvider
+from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
+
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 class InferenceRequest(BaseModel):
     text: Union[str, list]
@@ -34,26 +60,159 @@ class BloomzEmbeddings(BaseModel, Embeddings):
 
     pooling: str
     api_base: str
+    timeout: float = 4
+    """Request timeout (in seconds)."""
+    batch_size: int = 32
+    """Maximum number of texts per request."""
+    max_concurrency: int = 4
+    """Maximum number of concurrent requests."""
+    max_retries: int = 2
+    """Maximum number of retries of a failed request."""
+    retry_backoff: float = 0.5
+    """Delay (in seconds) before the first retry, doubled at each retry."""
+    verify_ssl: bool = False
+    """Verify the TLS certificate of the server."""
 
     @property
     def _api_url(self) -> str:
         return urljoin(self.api_base, '/embed')
 
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        return [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+
+    def _payload(self, texts: List[str]) -> dict:
+        return InferenceRequest(text=texts, pooling=self.pooling).model_dump(
+            mode='json'
+        )
+
+    def _retry_delay(
+        self, attempt: int, error: Union[httpx.Response, Exception]
+    ) -> float:
+        """Return the delay before the next attempt, or -1 when the request must not be retried."""
+        if attempt >= self.max_retries or (
+            isinstance(error, httpx.Response)
+            and error.status_code not in RETRYABLE_STATUS_CODES
+        ):
+            return -1
+
+        delay = self.retry_backoff * 2**attempt
+        logger.warning(
+            'Embedding request failed (%s), retry in %.2f seconds',
+            error.status_code if isinstance(error, httpx.Response) else repr(error),
+            delay,
+        )
+        return delay
+
+    def _embedding_error(
+        self, error: Union[httpx.Response, Exception]
+    ) -> AIProviderAPIErrorException:
+        if isinstance(error, httpx.Response):
+            info = ErrorInfo(
+                provider=EMProvider.BLOOMZ.value,
+                error=str(error.status_code),
+                cause=error.text,
+                request=f"[POST] {self._api_url}",
+            )
+        else:
+            info = ErrorInfo(
+                provider=EMProvider.BLOOMZ.value,
+                error=error.__class__.__name__,
+                cause=str(error),
+                request=f"[POST] {self._api_url}",
+            )
+        logger.error("Embedding request didn't succeed: %s", info.cause)
+        return AIProviderAPIErrorException(info)
+
+    def _embed_batch(
+        self, client: httpx.Client, texts: List[str]
+    ) -> List[List[float]]:
+        attempt = 0
+        while True:
+            try:
+                response = client.post(self._api_url, json=self._payload(texts))
+                if response.status_code == 200:
+                    return response.json()['embedding']
+                error = response
+            except httpx.TransportError as exc:
+                error = exc
+
+            delay = self._retry_delay(attempt, error)
+            if delay < 0:
+                raise self._embedding_error(error)
+            time.sleep(delay)
+            attempt += 1
+
+    async def _aembed_batch(
+        self, client: httpx.AsyncClient, texts: List[str]
+    ) -> List[List[float]]:
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(
+                    self._api_url, json=self._payload(texts)
+                )
+                if response.status_code == 200:
+                    return response.json()['embedding']
+                error = response
+            except httpx.TransportError as exc:
+                error = exc
+
+            delay = self._retry_delay(attempt, error)
+            if delay < 0:
+                raise self._embedding_error(error)
+            await asyncio.sleep(delay)
+            attempt += 1
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Get the embeddings for a list of texts."""
-        response = requests.post(
-            self._api_url,
-            json=InferenceRequest(text=texts, pooling=self.pooling).model_dump(
-                mode='json'
+        if not texts:
+            return []
+
+        # The client is not closed: its transport is shared
+        client = httpx.Client(
+            transport=provider_client_registry.get_sync_transport(
+                self.api_base, verify=self.verify_ssl
             ),
-            verify=False,
+            timeout=self.timeout,
         )
-        if response.status_code != 200:
-            logger.exception(
-                f"Embedding request didn't return expected status code {response.content}"
+        batches = self._batches(texts)
+        if len(batches) == 1:
+            return self._embed_batch(client, batches[0])
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(batches))
+        ) as executor:
+            results = executor.map(
+                lambda batch: self._embed_batch(client, batch), batches
             )
-        return response.json()['embedding']
+            return [embedding for result in results for embedding in result]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Get the embeddings for a list of texts, without blocking the event loop."""
+        if not texts:
+            return []
+
+        client = provider_client_registry.get_async_client(
+            self.api_base, self.timeout, verify=self.verify_ssl
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._aembed_batch(client, batch)
+
+        results = await asyncio.gather(
+            *(embed_batch(batch) for batch in self._batches(texts))
+        )
+        return [embedding for result in results for embedding in result]
 
     def embed_query(self, text: str) -> List[float]:
         """Compute query embeddings using a HuggingFace transformer model."""
         return self.embed_documents([text])[0]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Compute query embeddings, without blocking the event loop."""
+        return (await self.aembed_documents([text]))[0]
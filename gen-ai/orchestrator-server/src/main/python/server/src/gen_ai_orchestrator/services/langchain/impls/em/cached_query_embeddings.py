@@ -0,0 +1,175 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Query Embedding Cache
+---------------------
+Process-wide LRU cache of the query embeddings (condensed questions, search
+queries...), shared by all the embedding models.
+
+* Embeddings are keyed by embedding model setting and normalized text.
+* Vectors are kept as float32 arrays, and the cache size is bounded in bytes
+  (least recently used embeddings are evicted), with an optional TTL.
+* Only the query embeddings are cached, documents embeddings are not.
+* Concurrent misses of the same query share one embedding call (single-flight).
+* Hits and misses are counted in the metrics registry (em.query_cache.*).
+"""
+
+import logging
+from threading import RLock
+from typing import Any, List, Optional
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+from langchain_core.embeddings import Embeddings
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+from gen_ai_orchestrator.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(text: str) -> str:
+    """Strip the text and collapse its whitespaces."""
+    return ' '.join(text.split())
+
+
+class QueryEmbeddingCache:
+    """A thread-safe LRU cache of float32 query embeddings, bounded in bytes, with an optional TTL."""
+
+    def __init__(self, max_size_bytes: int, ttl: int = 0):
+        cache_kwargs = dict(
+            maxsize=max_size_bytes, getsizeof=lambda vector: vector.nbytes
+        )
+        self._cache: LRUCache = (
+            TTLCache(ttl=ttl, **cache_kwargs) if ttl > 0 else LRUCache(**cache_kwargs)
+        )
+        self._lock = RLock()
+
+    def get(self, namespace: str, text: str) -> Optional[List[float]]:
+        """
+        Return the cached embedding of the text, or None.
+
+        Args:
+            namespace: The embedding model namespace (its setting hash)
+            text: The query text
+        """
+        with self._lock:
+            vector = self._cache.get((namespace, normalize_query(text)))
+
+        metrics_registry.increment(
+            'em.query_cache.hits' if vector is not None else 'em.query_cache.misses'
+        )
+        metrics_registry.set_gauge(
+            'em.query_cache.hit_rate', get_query_cache_hit_rate()
+        )
+        return vector.tolist() if vector is not None else None
+
+    def put(self, namespace: str, text: str, embedding: List[float]) -> None:
+        """
+        Cache the embedding of the text.
+
+        Args:
+            namespace: The embedding model namespace (its setting hash)
+            text: The query text
+            embedding: The query embedding
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            try:
+                self._cache[(namespace, normalize_query(text))] = vector
+            except ValueError:
+                # The embedding is larger than the whole cache
+                return
+            metrics_registry.set_gauge(
+                'em.query_cache.size_bytes', self._cache.currsize
+            )
+
+    def clear(self) -> None:
+        """Remove all the cached embeddings."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+def get_query_cache_hit_rate() -> float:
+    """Return the query embedding cache hit rate since the application started."""
+    hits = metrics_registry.get_counter('em.query_cache.hits')
+    total = hits + metrics_registry.get_counter('em.query_cache.misses')
+    return hits / total if total else 0.0
+
+
+query_embedding_cache = QueryEmbeddingCache(
+    max_size_bytes=application_settings.em_query_cache_max_size_mb * 1024 * 1024,
+    ttl=application_settings.em_query_cache_ttl,
+)
+query_embedding_single_flight = SingleFlight('em.query_coalescing')
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    An Embeddings wrapper caching the query embeddings of the wrapped model.
+    The other attributes are read from the wrapped model.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        namespace: str,
+        cache: QueryEmbeddingCache = query_embedding_cache,
+    ):
+        self.embeddings = embeddings
+        self.namespace = namespace
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        embedding = self.cache.get(self.namespace, text)
+        if embedding is None:
+            embedding = self.embeddings.embed_query(text)
+            self.cache.put(self.namespace, text, embedding)
+        return embedding
+
+    async def aembed_query(self, text: str) -> List[float]:
+        embedding = self.cache.get(self.namespace, text)
+        if embedding is None:
+            if application_settings.em_query_coalescing_enabled:
+                embedding = await query_embedding_single_flight.do(
+                    (self.namespace, normalize_query(text)),
+                    lambda: self._aembed_and_cache_query(text),
+                )
+            else:
+                embedding = await self._aembed_and_cache_query(text)
+        return embedding
+
+    async def _aembed_and_cache_query(self, text: str) -> List[float]:
+        embedding = await self.embeddings.aembed_query(text)
+        self.cache.put(self.namespace, text, embedding)
+        return embedding
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'embeddings':
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
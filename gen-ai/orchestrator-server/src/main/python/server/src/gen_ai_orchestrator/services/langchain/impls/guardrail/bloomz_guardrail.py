@@ -22,6 +22,10 @@ from langchain_core.output_parsers.transform import (
 from pydantic import BaseModel
 from requests.exceptions import HTTPError
 
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    provider_client_registry,
+)
+
 
 class GuardrailOutput(BaseModel):
     content: str
@@ -36,6 +40,8 @@ class BloomzGuardrailOutputParser(BaseCumulativeTransformOutputParser[dict]):
     """Maximum acceptable toxicity score."""
     endpoint: str
     """The model API endpoint to use."""
+    timeout: float = 5
+    """Request timeout (in seconds)."""
     diff: bool = True
 
     @classmethod
@@ -59,16 +65,39 @@ class BloomzGuardrailOutputParser(BaseCumulativeTransformOutputParser[dict]):
             output['content'] = next['content'][len(prev['content']) :]
         return output
 
+    @property
+    def _guardrail_url(self) -> str:
+        return urljoin(self.endpoint, '/guardrail')
+
     def parse(self, text: str) -> dict:
         response = requests.post(
-            urljoin(self.endpoint, '/guardrail'), json={'text': [text]}
+            self._guardrail_url, json={'text': [text]}, timeout=self.timeout
         )
         if response.status_code != 200:
-            raise HTTPError(
-                f"Error {response.status_code}. Bloomz guardrail didn't respond as expected."
-            )
+            raise self._bad_response_error(response.status_code)
+
+        return self._guardrail_output(text, response.json())
+
+    async def aparse(self, text: str) -> dict:
+        """
+        Parse the text, without blocking the event loop.
+        The HTTP connections to the endpoint are pooled (see the provider client registry).
+        """
+        client = provider_client_registry.get_async_client(self.endpoint, self.timeout)
+        response = await client.post(self._guardrail_url, json={'text': [text]})
+        if response.status_code != 200:
+            raise self._bad_response_error(response.status_code)
+
+        return self._guardrail_output(text, response.json())
+
+    @staticmethod
+    def _bad_response_error(status_code: int) -> HTTPError:
+        return HTTPError(
+            f"Error {status_code}. Bloomz guardrail didn't respond as expected."
+        )
 
-        results = response.json()['response'][0]
+    def _guardrail_output(self, text: str, response: dict) -> dict:
+        results = response['response'][0]
 
         detected_toxicities = list(
             filter(lambda mode: mode['score'] > self.max_score, results)
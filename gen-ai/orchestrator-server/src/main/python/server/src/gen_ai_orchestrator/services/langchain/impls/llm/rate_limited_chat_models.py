@@ -0,0 +1,139 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Rate Limited Chat Models
+------------------------
+OpenAI chat models acquiring their provider rate limiter (see the rate limiter
+registry) before each call, for one request and its estimated tokens: the
+prompt tokens plus the maximum completion tokens.
+
+LangChain's own rate_limiter hook is not given the messages, so the token
+budget could not be applied through it.
+"""
+
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_openai import AzureChatOpenAI, ChatOpenAI
+from pydantic import Field
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.services.langchain.factories.llm.rate_limiter_registry import (
+    ProviderRateLimiter,
+)
+from gen_ai_orchestrator.utils.tokens import count_tokens
+
+# Tokens added by the chat format, per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class ProviderRateLimitedChatModel:
+    """Mixin of the chat models acquiring their provider rate limiter before each call."""
+
+    provider_rate_limiter: Optional[ProviderRateLimiter]
+
+    def estimate_tokens(self, messages: List[BaseMessage], **kwargs: Any) -> int:
+        """Estimate the tokens of a call: the prompt tokens plus the maximum completion tokens."""
+        prompt_tokens = sum(
+            count_tokens(message.text, self.model_name) + MESSAGE_OVERHEAD_TOKENS
+            for message in messages
+        )
+        completion_tokens = (
+            kwargs.get('max_completion_tokens')
+            or kwargs.get('max_tokens')
+            or self.max_tokens
+            or application_settings.llm_rate_limit_completion_tokens
+        )
+        return prompt_tokens + completion_tokens
+
+    def _acquire(self, messages: List[BaseMessage], **kwargs: Any) -> None:
+        if self.provider_rate_limiter is not None:
+            self.provider_rate_limiter.acquire(
+                tokens=self.estimate_tokens(messages, **kwargs)
+            )
+
+    async def _aacquire(self, messages: List[BaseMessage], **kwargs: Any) -> None:
+        if self.provider_rate_limiter is not None:
+            await self.provider_rate_limiter.aacquire(
+                tokens=self.estimate_tokens(messages, **kwargs)
+            )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # When streaming, the call is rate limited by _stream
+        if not self.streaming:
+            self._acquire(messages, **kwargs)
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # When streaming, the call is rate limited by _astream
+        if not self.streaming:
+            await self._aacquire(messages, **kwargs)
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        self._acquire(messages, **kwargs)
+        yield from super()._stream(messages, stop, run_manager, **kwargs)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await self._aacquire(messages, **kwargs)
+        async for chunk in super()._astream(messages, stop, run_manager, **kwargs):
+            yield chunk
+
+
+class RateLimitedChatOpenAI(ProviderRateLimitedChatModel, ChatOpenAI):
+    """ChatOpenAI acquiring its provider rate limiter before each call."""
+
+    provider_rate_limiter: Optional[ProviderRateLimiter] = Field(
+        default=None, exclude=True
+    )
+
+
+class RateLimitedAzureChatOpenAI(ProviderRateLimitedChatModel, AzureChatOpenAI):
+    """AzureChatOpenAI acquiring its provider rate limiter before each call."""
+
+    provider_rate_limiter: Optional[ProviderRateLimiter] = Field(
+        default=None, exclude=True
+    )
@@ -22,18 +22,25 @@ Responsibilities
 * Build the LangChain conversational RAG chain.
 * Populate the chat history from the dialog.
 * Register callback handlers (debug, observability).
-* Invoke the chain and apply the guardrail.
-* Return a fully assembled RAGResponse.
+* Invoke the chain and apply the guardrail (concurrently with the response
+  assembly, and incrementally on the streamed answer when enabled).
+* Return a fully assembled RAGResponse, or stream the chain progress.
 """
 
+import asyncio
 import logging
 import time
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
 from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.runnables import RunnableSerializable
 from langchain_core.runnables.config import RunnableConfig
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIGuardCheckException,
 )
@@ -48,6 +55,10 @@ from gen_ai_orchestrator.models.rag.rag_models import (
     ChatMessageType,
     LLMAnswer,
 )
+from gen_ai_orchestrator.models.streaming.stream_event import (
+    StreamEvent,
+    StreamEventType,
+)
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.routers.responses.responses import RAGResponse
 from gen_ai_orchestrator.services.langchain.callbacks.rag_callback_handler import (
@@ -58,11 +69,24 @@ from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
     get_guardrail_factory,
 )
 from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    QUESTION_CONDENSATION_FAST_PATH_RUN_NAME,
+    SEMANTIC_CACHE_HIT_RUN_NAME,
+    build_rag_chain_inputs,
     create_rag_chain,
+    get_documents_run_names,
 )
 from gen_ai_orchestrator.services.langchain.rag_response_builder import (
+    build_footnote_candidates,
     build_rag_response,
 )
+from gen_ai_orchestrator.services.langchain.semantic_answer_cache import (
+    save_in_semantic_cache,
+)
+from gen_ai_orchestrator.services.security.security_service import (
+    find_secret_keys,
+    prefetch_secret_key_values,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -165,16 +189,183 @@ async def execute_rag_chain(
 
     Steps
     -----
-    1. Build the LangChain chain.
+    1. Prefetch the secrets and get the LangChain chain (built, or reused from the chain cache).
     2. Populate chat history & extract dialog metadata.
     3. Configure callback handlers.
     4. Invoke the chain.
-    5. Run the guardrail check.
-    6. Assemble and return the response.
+    5. Run the guardrail check, while the response is assembled.
+    6. Cache the response (semantic answer cache miss).
     """
     logger.info('RAG chain - Start of execution...')
     start_time = time.time()
 
+    (
+        chain,
+        chain_inputs,
+        config,
+        records_handler,
+        observability_handler,
+    ) = await prepare_rag_chain(request, debug, custom_observability_handler)
+
+    chain_output = await chain.ainvoke(input=chain_inputs, config=config)
+
+    llm_answer = LLMAnswer(**chain_output['answer'])
+
+    response, _ = await build_guarded_rag_response(
+        chain_output=chain_output,
+        llm_answer=llm_answer,
+        request=request,
+        records_callback_handler=records_handler,
+        observability_handler=observability_handler,
+        rag_duration=round(time.time() - start_time, 3),
+        debug=debug,
+    )
+    logger.info(
+        'RAG chain - End of execution. (Duration: %.3f seconds)',
+        time.time() - start_time,
+    )
+    await save_in_semantic_cache(chain_output, response.answer, response.footnotes)
+
+    return response
+
+
+@opensearch_exception_handler
+@openai_exception_handler(provider='OpenAI or AzureOpenAIService')
+async def stream_rag_chain(
+    request: RAGRequest,
+    debug: bool,
+    custom_observability_handler: Optional[BaseCallbackHandler] = None,
+) -> AsyncIterator[StreamEvent]:
+    """
+    Execute the full RAG pipeline and stream its progress.
+
+    Events
+    ------
+    1. condensed_question: the condensed question and its key words.
+    2. documents: the footnote candidates (all the retrieved, or reranked, documents, or the
+       cached footnotes on semantic answer cache hit).
+    3. answer_delta: the answer text, as the LLM answer is incrementally parsed
+       (the whole cached answer on semantic answer cache hit).
+    4. guardrail: the guardrail output, when a guardrail is configured.
+    5. footnotes: the footnotes of the documents used in the answer.
+    6. response: the complete RAGResponse, as returned by execute_rag_chain.
+
+    Errors are raised to the caller. The streamed answer must be discarded
+    when the guardrail check fails. With the incremental guardrail enabled
+    (rag_guardrail_streaming_enabled), the answer is also checked while it is
+    streamed, and the stream is cut off as soon as toxicities are detected.
+    """
+    logger.info('RAG chain (streaming) - Start of execution...')
+    start_time = time.time()
+
+    (
+        chain,
+        chain_inputs,
+        config,
+        records_handler,
+        observability_handler,
+    ) = await prepare_rag_chain(request, debug, custom_observability_handler)
+
+    documents_run_names = get_documents_run_names(request)
+    incremental_guardrail = create_incremental_guardrail(request)
+    chain_output = None
+    streamed_answer = ''
+    try:
+        async for event in chain.astream_events(
+            chain_inputs, config=config, version='v2'
+        ):
+            event_type, name = event['event'], event['name']
+            if (
+                event_type == 'on_parser_end'
+                and name == 'rag_question_condensation_chain_output'
+            ) or (
+                event_type == 'on_chain_end'
+                and name == QUESTION_CONDENSATION_FAST_PATH_RUN_NAME
+            ):
+                yield StreamEvent(
+                    event=StreamEventType.CONDENSED_QUESTION,
+                    data=event['data']['output'],
+                )
+            elif event_type == 'on_chain_end' and name in documents_run_names:
+                yield StreamEvent(
+                    event=StreamEventType.DOCUMENTS,
+                    data=build_footnote_candidates(event['data']['output']),
+                )
+            elif event_type == 'on_chain_end' and name == SEMANTIC_CACHE_HIT_RUN_NAME:
+                yield StreamEvent(
+                    event=StreamEventType.DOCUMENTS,
+                    data=event['data']['output']['footnotes'],
+                )
+            elif event_type == 'on_parser_stream' and name == 'rag_chain_output':
+                answer_delta = get_answer_delta(
+                    streamed_answer, event['data']['chunk']
+                )
+                if answer_delta:
+                    if not streamed_answer:
+                        metrics_registry.observe(
+                            'rag.stream.time_to_first_token',
+                            time.time() - start_time,
+                        )
+                    streamed_answer += answer_delta
+                    if incremental_guardrail is not None:
+                        incremental_guardrail.check(streamed_answer)
+                    yield StreamEvent(
+                        event=StreamEventType.ANSWER_DELTA, data={'text': answer_delta}
+                    )
+            elif event_type == 'on_chain_end' and not event['parent_ids']:
+                chain_output = event['data']['output']
+    finally:
+        if incremental_guardrail is not None:
+            incremental_guardrail.cancel()
+
+    llm_answer = LLMAnswer(**chain_output['answer'])
+    if not streamed_answer and llm_answer.answer:
+        # The answer was not streamed (e.g. semantic answer cache hit)
+        yield StreamEvent(
+            event=StreamEventType.ANSWER_DELTA, data={'text': llm_answer.answer}
+        )
+
+    response, guardrail_output = await build_guarded_rag_response(
+        chain_output=chain_output,
+        llm_answer=llm_answer,
+        request=request,
+        records_callback_handler=records_handler,
+        observability_handler=observability_handler,
+        rag_duration=round(time.time() - start_time, 3),
+        debug=debug,
+    )
+    if guardrail_output is not None:
+        yield StreamEvent(event=StreamEventType.GUARDRAIL, data=guardrail_output)
+
+    logger.info(
+        'RAG chain (streaming) - End of execution. (Duration: %.3f seconds)',
+        time.time() - start_time,
+    )
+    await save_in_semantic_cache(chain_output, response.answer, response.footnotes)
+
+    yield StreamEvent(event=StreamEventType.FOOTNOTES, data=response.footnotes)
+    yield StreamEvent(event=StreamEventType.RESPONSE, data=response)
+
+
+async def prepare_rag_chain(
+    request: RAGRequest,
+    debug: bool,
+    custom_observability_handler: Optional[BaseCallbackHandler] = None,
+) -> tuple[
+    RunnableSerializable[Any, dict[str, Any]],
+    dict,
+    RunnableConfig,
+    RAGCallbackHandler,
+    Optional[BaseCallbackHandler],
+]:
+    """
+    Get the RAG chain and everything needed to run it for the given request.
+
+    Returns (chain, chain_inputs, config, records_handler, observability_handler).
+    """
+    # Secrets are resolved off the event loop, the factories then hit the secret cache
+    await prefetch_secret_key_values(find_secret_keys(request))
+
     chain = create_rag_chain(request=request)
 
     message_history = build_message_history(request)
@@ -188,39 +379,90 @@ async def execute_rag_chain(
         custom_handler=custom_observability_handler,
     )
 
-    chain_output = await chain.ainvoke(
-        input={
-            **request.question_answering_prompt.inputs,
-            'chat_history': message_history.messages,
-        },
-        config=RunnableConfig(
-            callbacks=callback_handlers,
-            metadata=build_runnable_metadata(session_id, user_id, tags),
-        ),
+    config = RunnableConfig(
+        callbacks=callback_handlers,
+        metadata=build_runnable_metadata(session_id, user_id, tags),
     )
 
-    llm_answer = LLMAnswer(**chain_output['answer'])
+    return (
+        chain,
+        build_rag_chain_inputs(request, message_history.messages),
+        config,
+        records_handler,
+        observability_handler,
+    )
 
-    # Guardrail
-    if request.guardrail_setting:
-        guardrail = get_guardrail_factory(
-            setting=request.guardrail_setting
-        ).get_parser()
-        guardrail_output = guardrail.parse(llm_answer.answer)
-        check_guardrail_output(guardrail_output)
 
-    rag_duration = '{:.3f}'.format(time.time() - start_time)
-    logger.info('RAG chain - End of execution. (Duration: %s seconds)', rag_duration)
+def get_answer_delta(streamed_answer: str, partial_llm_answer: Any) -> str:
+    """
+    Return the answer text not streamed yet.
 
-    return build_rag_response(
-        chain_output=chain_output,
-        llm_answer=llm_answer,
-        request=request,
-        records_callback_handler=records_handler,
-        observability_handler=observability_handler,
-        rag_duration=float(rag_duration),
-        debug=debug,
-    )
+    Args:
+        streamed_answer: The answer text already streamed
+        partial_llm_answer: The LLM answer, partially parsed by the JsonOutputParser
+    """
+    if not isinstance(partial_llm_answer, dict):
+        return ''
+
+    partial_answer = partial_llm_answer.get('answer') or ''
+    if not partial_answer.startswith(streamed_answer):
+        return ''
+    return partial_answer[len(streamed_answer) :]
+
+
+# ---------------------------------------------------------------------------
+# Guardrail
+# ---------------------------------------------------------------------------
+
+
+async def build_guarded_rag_response(
+    request: RAGRequest, llm_answer: LLMAnswer, **kwargs
+) -> tuple[RAGResponse, Optional[dict]]:
+    """
+    Assemble the RAGResponse (see build_rag_response) while the guardrail checks
+    the LLM answer: the assembly (footnotes, debug data) runs in a worker thread,
+    so that the guardrail call is not held up by it.
+
+    Returns:
+        (response, guardrail_output), the guardrail output being None when no
+        guardrail is configured.
+    Raises:
+        GenAIGuardCheckException: if the guardrail detected toxicities.
+    """
+    if not request.guardrail_setting:
+        return (
+            build_rag_response(llm_answer=llm_answer, request=request, **kwargs),
+            None,
+        )
+
+    guardrail_task = asyncio.create_task(apply_guardrail(request, llm_answer))
+    try:
+        response = await asyncio.to_thread(
+            build_rag_response, llm_answer=llm_answer, request=request, **kwargs
+        )
+    except BaseException:
+        guardrail_task.cancel()
+        raise
+
+    return response, await guardrail_task
+
+
+async def apply_guardrail(request: RAGRequest, llm_answer: LLMAnswer) -> Optional[dict]:
+    """
+    Run the guardrail configured in the request (if any) on the LLM answer.
+
+    Returns:
+        The guardrail output, or None when no guardrail is configured.
+    Raises:
+        GenAIGuardCheckException: if the guardrail detected toxicities.
+    """
+    if not request.guardrail_setting:
+        return None
+
+    guardrail = get_guardrail_factory(setting=request.guardrail_setting).get_parser()
+    guardrail_output = await guardrail.aparse(llm_answer.answer)
+    check_guardrail_output(guardrail_output)
+    return guardrail_output
 
 
 def check_guardrail_output(guardrail_output: dict) -> bool:
@@ -234,3 +476,73 @@ def check_guardrail_output(guardrail_output: dict) -> bool:
         message = f"Toxicity detected in LLM output ({','.join(guardrail_output['output_toxicity_reason'])})"
         raise GenAIGuardCheckException(ErrorInfo(cause=message))
     return True
+
+
+class IncrementalGuardrail:
+    """
+    Checks the answer while it is streamed. The answer streamed so far is checked
+    each time it has grown by check_chars characters, one check at a time, in
+    background: the stream is not paused by the checks.
+    """
+
+    def __init__(self, guardrail: BaseOutputParser, check_chars: int):
+        self.guardrail = guardrail
+        self.check_chars = check_chars
+        self._checked_length = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def check(self, streamed_answer: str) -> None:
+        """
+        Collect the outcome of the previous check (if done), then start a new one
+        if enough text was streamed since.
+
+        Args:
+            streamed_answer: The answer streamed so far
+        Raises:
+            GenAIGuardCheckException: if a previous check detected toxicities.
+                The other errors of a check are logged, and the check is skipped.
+        """
+        if self._task is not None and self._task.done():
+            task, self._task = self._task, None
+            try:
+                check_guardrail_output(task.result())
+            except GenAIGuardCheckException:
+                metrics_registry.increment('rag.guardrail.stream_cutoffs')
+                logger.warning('RAG chain (streaming) - Stream cut off by the guardrail')
+                raise
+            except Exception as exc:
+                # e.g. a guardrail outage: the whole answer is checked at the end anyway
+                metrics_registry.increment('rag.guardrail.stream_check_errors')
+                logger.warning(
+                    'RAG chain (streaming) - Incremental guardrail check failed, skipped: %s',
+                    exc,
+                )
+
+        if (
+            self._task is None
+            and len(streamed_answer) - self._checked_length >= self.check_chars
+        ):
+            self._checked_length = len(streamed_answer)
+            self._task = asyncio.create_task(self.guardrail.aparse(streamed_answer))
+
+    def cancel(self) -> None:
+        """Cancel the running check, if any (the whole answer is checked at the end)."""
+        if self._task is not None:
+            if not self._task.cancel() and not self._task.cancelled():
+                # The check is over: its outcome is retrieved, so that errors are not reported
+                self._task.exception()
+            self._task = None
+
+
+def create_incremental_guardrail(request: RAGRequest) -> Optional[IncrementalGuardrail]:
+    """Return the incremental guardrail of the stream, when enabled and a guardrail is configured."""
+    if (
+        not request.guardrail_setting
+        or not application_settings.rag_guardrail_streaming_enabled
+    ):
+        return None
+
+    return IncrementalGuardrail(
+        guardrail=get_guardrail_factory(setting=request.guardrail_setting).get_parser(),
+        check_chars=application_settings.rag_guardrail_streaming_check_chars,
+    )
@@ -16,55 +16,120 @@
 RAG Chain Builder
 -----------------
 Responsible for assembling the LangChain pipeline:
-  - question condensation
-  - hybrid retrieval (vector + full-text search)
-  - RRF ranking
+  - question condensation (skipped when the dialog has no history)
+  - speculative vector retrieval on the user question (optional)
+  - semantic answer cache lookup on the condensed question (optional)
+  - hybrid retrieval (vector + full-text search, additional indexes), the
+    retrievers running concurrently within a timeout, or a native hybrid
+    search fused by the vector store in a single request
+  - rank fusion (weighted RRF, CombSUM or CombMNZ)
+  - reranking of the over-fetched documents (optional, see compressor_setting)
+  - near-duplicate collapsing and MMR diversification (optional, see document_search_params)
+  - context packing (token budget and score gap cutoff)
   - answer generation
+
+Built chains only depend on the request settings and prompt templates,
+they are reused through the RAG chain cache. The prompt inputs, the
+question and the chat history are provided at call time.
 """
 
 import asyncio
 import json
 import logging
 from operator import itemgetter
-from typing import Any, List, Optional
+from typing import Any, Awaitable, Callable, List, Optional
 from urllib.parse import urlparse
 
-from langchain_core.documents import Document
+from langchain_core.documents import BaseDocumentCompressor, Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.prompts import PromptTemplate as LangChainPromptTemplate
 from langchain_core.runnables import (
+    RunnableBranch,
     RunnableLambda,
     RunnableParallel,
     RunnablePassthrough,
     RunnableSerializable,
 )
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.prompt.prompt_formatter import PromptFormatter
 from gen_ai_orchestrator.models.prompt.prompt_template import PromptTemplate
 from gen_ai_orchestrator.models.rag.rag_models import (
+    ContextPackingDebugData,
     LLMAnswer,
     LLMCondensedQuestion,
 )
-from gen_ai_orchestrator.models.vector_stores.vector_store_provider import (
-    VectorStoreProvider,
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    FusionMethod,
 )
 from gen_ai_orchestrator.models.vector_stores.vector_store_search_type import (
     DocumentSearchType,
 )
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_compressor_factory,
     get_em_factory,
     get_llm_factory,
     get_vector_store_factory,
 )
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.hybrid_search_retriever import (
+    HybridSearchRetriever,
+)
+from gen_ai_orchestrator.services.langchain.rag_chain_cache import (
+    build_rag_chain_cache_key,
+    rag_chain_cache,
+)
+from gen_ai_orchestrator.services.langchain.semantic_answer_cache import (
+    SemanticAnswerCache,
+    get_cached_chain_output,
+    is_semantic_cache_hit,
+)
+from gen_ai_orchestrator.services.langchain.speculative_retrieval import (
+    build_speculative_retrieval_starter,
+    retrieve_vector_documents,
+)
+from gen_ai_orchestrator.services.utils.diversification import (
+    find_near_duplicates,
+    mmr_select,
+)
+from gen_ai_orchestrator.services.utils.keyword_extractor import (
+    extract_keywords,
+)
 from gen_ai_orchestrator.services.utils.prompt_utility import (
     validate_prompt_template,
 )
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+from gen_ai_orchestrator.utils.tokens import count_tokens
 
 logger = logging.getLogger(__name__)
 
+# Run names of the retrieval steps, one of them is part of every RAG chain
+SIMILARITY_RETRIEVER_RUN_NAME = 'similarity_retriever_retrieve'
+HYBRID_RETRIEVER_RUN_NAME = 'hybrid_retrieve'
+FTS_RETRIEVER_RUN_NAME = 'fts_retrieve'
+FUSION_RETRIEVER_RUN_NAME = 'fusion_retrieve'
+RAG_RETRIEVER_RUN_NAMES = {
+    SIMILARITY_RETRIEVER_RUN_NAME,
+    HYBRID_RETRIEVER_RUN_NAME,
+    FTS_RETRIEVER_RUN_NAME,
+    FUSION_RETRIEVER_RUN_NAME,
+}
+# Run name of the reranking step, when a compressor setting is given
+RERANK_RUN_NAME = 'rag_rerank'
+# Run name of the diversification step, when enabled by the document search params
+DIVERSIFICATION_RUN_NAME = 'rag_diversification'
+# Run name of the question condensation without LLM (no dialog history)
+QUESTION_CONDENSATION_FAST_PATH_RUN_NAME = 'rag_question_condensation_fast_path'
+# Run name of the context packing step (token budget, score gap cutoff)
+CONTEXT_PACKING_RUN_NAME = 'rag_context_packing'
+# Run name of the answer returned by the semantic answer cache
+SEMANTIC_CACHE_HIT_RUN_NAME = 'rag_semantic_cache_hit'
+
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
@@ -120,50 +185,171 @@ def format_rag_context_documents(
         for doc in documents
     ]
 
-def format_documents_as_context(documents: list[Document]) -> str:
+def format_documents_as_context(
+    documents: list[Document], compact: bool = False
+) -> str:
     """Serialize retrieved documents to a JSON string for prompt injection."""
-    return json.dumps(
-        format_rag_context_documents(documents),
-        ensure_ascii=False,
-        indent=2,
-    )
+    return dump_context(format_rag_context_documents(documents), compact)
+
+
+def dump_context(context: Any, compact: bool = False) -> str:
+    """Serialize the context to JSON, indented or compact (no whitespace)."""
+    if compact:
+        return json.dumps(context, ensure_ascii=False, separators=(',', ':'))
+    return json.dumps(context, ensure_ascii=False, indent=2)
 
 
 # ---------------------------------------------------------------------------
-# RRF ranking
+# Context packing
 # ---------------------------------------------------------------------------
 
 
-def apply_rrf_ranking(
-    ranked_results: list[list[Document]],
-    k: int,
-    top_n: int,
+class PackedContext:
+    """The documents context of the answering prompt, packed within a token budget."""
+
+    def __init__(
+        self,
+        text: str,
+        documents: list[Document],
+        retrieved_documents: int,
+        token_budget: int,
+        compact: bool,
+        model: Optional[str] = None,
+    ):
+        self.text = text
+        self.documents = documents
+        self.retrieved_documents = retrieved_documents
+        self.token_budget = token_budget
+        self.compact = compact
+        self.model = model
+
+    def to_debug_data(self) -> ContextPackingDebugData:
+        return ContextPackingDebugData(
+            token_budget=self.token_budget,
+            tokens=count_tokens(self.text, self.model),
+            documents=len(self.documents),
+            skipped_documents=self.retrieved_documents - len(self.documents),
+            compact=self.compact,
+        )
+
+
+def get_document_score(doc: Document) -> Optional[float]:
+    """Return the fused score of a document: its reranking score, or its RRF score."""
+    for key in ('retriever_score', 'rrf_score'):
+        if doc.metadata.get(key) is not None:
+            return doc.metadata[key]
+    return None
+
+
+def apply_score_gap_cutoff(
+    documents: list[Document], score_gap: float
 ) -> list[Document]:
     """
-    Reciprocal Rank Fusion over multiple ranked document lists.
-
-    Each document is identified by (id, chunk).  Its RRF score is the sum of
-    1 / (k + rank) across all lists in which it appears, then the top_n
-    highest-scoring documents are returned.
+    Keep the documents before the first score drop larger than score_gap times
+    the best score. The documents are ranked by score, they are all kept if
+    one of them has no score.
     """
+    scores = [get_document_score(doc) for doc in documents]
+    if score_gap <= 0 or not documents or None in scores:
+        return documents
+
+    max_drop = score_gap * scores[0]
+    for index in range(1, len(documents)):
+        if scores[index - 1] - scores[index] > max_drop:
+            return documents[:index]
+    return documents
+
+
+def pack_context(
+    documents: list[Document],
+    token_budget: int = 0,
+    score_gap: float = 0,
+    compact: bool = False,
+    model: Optional[str] = None,
+) -> PackedContext:
+    """
+    Pack the ranked documents into the answering prompt context: after the
+    score gap cutoff, the documents are added in rank order as long as they
+    fit within the token budget (greedily: a document that does not fit is
+    skipped, the next ones may still fit).
+
+    Args:
+        documents: The documents, in rank order
+        token_budget: The maximum tokens of the context (0 is unlimited)
+        score_gap: The score gap cutoff (0 disables it)
+        compact: Serialize the context without indentation
+        model: The answering model name, to count the tokens with its encoding
+    """
+    candidates = apply_score_gap_cutoff(documents, score_gap)
+    if token_budget > 0:
+        packed_docs, tokens = [], 0
+        for doc in candidates:
+            # Counted at its nesting level in the context list
+            doc_tokens = count_tokens(
+                format_documents_as_context([doc], compact), model
+            )
+            if tokens + doc_tokens <= token_budget:
+                packed_docs.append(doc)
+                tokens += doc_tokens
+    else:
+        packed_docs = candidates
+
+    text = format_documents_as_context(packed_docs, compact)
+    if token_budget > 0:
+        # The tokens of the whole context are not exactly the sum of its documents ones
+        while packed_docs and count_tokens(text, model) > token_budget:
+            packed_docs = packed_docs[:-1]
+            text = format_documents_as_context(packed_docs, compact)
+
+    if len(packed_docs) < len(documents):
+        metrics_registry.increment(
+            'rag.context.skipped_documents', len(documents) - len(packed_docs)
+        )
+    return PackedContext(
+        text=text,
+        documents=packed_docs,
+        retrieved_documents=len(documents),
+        token_budget=token_budget,
+        compact=compact,
+        model=model,
+    )
 
-    def doc_key(doc: Document) -> tuple:
-        return doc.metadata.get('id'), doc.metadata.get('chunk')
 
-    # Accumulate RRF scores
-    scores: dict[tuple, float] = {}
+def build_context_packer(model: Optional[str] = None):
+    """Return the context packing step of the RAG chain, for the answering model."""
 
-    for results in ranked_results:
-        for rank, doc in enumerate(results, start=1):
-            key = doc_key(doc)
-            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    def pack(x: dict) -> PackedContext:
+        return pack_context(
+            documents=x['documents'],
+            token_budget=x['context_token_budget'],
+            score_gap=application_settings.rag_context_score_gap,
+            compact=application_settings.rag_context_compact,
+            model=model,
+        )
+
+    return pack
 
-    # Deduplicate while preserving any Document instance
+
+# ---------------------------------------------------------------------------
+# Rank fusion
+# ---------------------------------------------------------------------------
+
+
+def get_document_key(doc: Document) -> tuple:
+    """Return the identifier of a document across the ranked lists: (id, chunk)."""
+    return doc.metadata.get('id'), doc.metadata.get('chunk')
+
+
+def merge_ranked_documents(ranked_results: list[list[Document]]) -> dict[tuple, Document]:
+    """
+    Deduplicate the documents of the ranked lists, keeping the first Document
+    instance of each one, with the metadata of its duplicates merged into it.
+    """
     unique_docs: dict[tuple, Document] = {}
 
     for results in ranked_results:
         for doc in results:
-            key = doc_key(doc)
+            key = get_document_key(doc)
 
             if key not in unique_docs:
                 unique_docs[key] = doc
@@ -175,74 +361,263 @@ def apply_rrf_ranking(
                     if meta_key not in existing.metadata:
                         existing.metadata[meta_key] = meta_value
 
-    # Attach the computed score and sort
+    return unique_docs
+
+
+def sort_fused_documents(
+    ranked_results: list[list[Document]],
+    scores: dict[tuple, float],
+    rank_key: str,
+    top_n: int,
+) -> list[Document]:
+    """Sort the deduplicated documents by fused score, and attach their rank and score."""
     ranked_docs = sorted(
-        unique_docs.values(),
-        key=lambda doc: scores[doc_key(doc)],
+        merge_ranked_documents(ranked_results).values(),
+        key=lambda doc: scores[get_document_key(doc)],
         reverse=True,
     )
     for rank, doc in enumerate(ranked_docs, start=1):
-        doc.metadata['rank']['rrf'] = f"{rank}/{len(ranked_docs)}"
+        doc.metadata.setdefault('rank', {})[rank_key] = f"{rank}/{len(ranked_docs)}"
+        # The fused score, whatever the fusion method (see get_document_score)
+        doc.metadata['rrf_score'] = scores[get_document_key(doc)]
 
     return ranked_docs[:top_n]
 
 
+def apply_rrf_ranking(
+    ranked_results: list[list[Document]],
+    k: int,
+    top_n: int,
+    weights: Optional[list[float]] = None,
+) -> list[Document]:
+    """
+    Reciprocal Rank Fusion over multiple ranked document lists.
+
+    Each document is identified by (id, chunk).  Its RRF score is the sum of
+    weight / (k + rank) across all lists in which it appears (weight 1 by
+    default), then the top_n highest-scoring documents are returned.
+    """
+    weights = weights or [1.0] * len(ranked_results)
+
+    # Accumulate RRF scores
+    scores: dict[tuple, float] = {}
+
+    for results, weight in zip(ranked_results, weights):
+        for rank, doc in enumerate(results, start=1):
+            key = get_document_key(doc)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+
+    return sort_fused_documents(ranked_results, scores, 'rrf', top_n)
+
+
+def normalize_scores(results: list[Document]) -> list[float]:
+    """
+    Min-max normalize the scores of a ranked list into [0, 1].
+    Lists without a 'score' metadata on every document (e.g. a vector store
+    that does not return its distances) are scored by rank: (n - rank + 1) / n.
+    """
+    scores = [doc.metadata.get('score') for doc in results]
+    if not results or any(score is None for score in scores):
+        return [(len(results) - rank) / len(results) for rank in range(len(results))]
+
+    low, high = min(scores), max(scores)
+    if high == low:
+        return [1.0] * len(results)
+    return [(score - low) / (high - low) for score in scores]
+
+
+def apply_score_fusion(
+    ranked_results: list[list[Document]],
+    top_n: int,
+    weights: Optional[list[float]] = None,
+    mnz: bool = False,
+) -> list[Document]:
+    """
+    CombSUM (or CombMNZ) over multiple ranked document lists.
+
+    The score of each document is the sum of its weighted normalized scores
+    across all lists in which it appears. With CombMNZ, that sum is multiplied
+    by the number of lists holding the document, favouring the consensus.
+    """
+    weights = weights or [1.0] * len(ranked_results)
+
+    scores: dict[tuple, float] = {}
+    hits: dict[tuple, int] = {}
+
+    for results, weight in zip(ranked_results, weights):
+        for doc, score in zip(results, normalize_scores(results)):
+            key = get_document_key(doc)
+            scores[key] = scores.get(key, 0.0) + weight * score
+            hits[key] = hits.get(key, 0) + 1
+
+    if mnz:
+        scores = {key: score * hits[key] for key, score in scores.items()}
+
+    return sort_fused_documents(
+        ranked_results, scores, 'combmnz' if mnz else 'combsum', top_n
+    )
+
+
 # ---------------------------------------------------------------------------
-# Hybrid retriever
+# Fusion retriever
 # ---------------------------------------------------------------------------
 
 
-class HybridRetriever:
+class FusionSource:
     """
-    Combines a vector-store retriever and a full-text-search retriever,
-    then fuses their results with RRF.
+    A ranked list provider of the fusion retriever.
+    Its retrieve coroutine function returns None when the source does not
+    apply to the inputs (e.g. a full-text search without key words).
     """
 
     def __init__(
-        self, vector_retriever, fts_retriever, rrf_k: int = 60, rrf_top_n: int = 10
+        self,
+        name: str,
+        retrieve: Callable[[dict], Awaitable[Optional[list[Document]]]],
+        weight: float = 1.0,
     ):
-        self.vector_retriever = vector_retriever
-        self.fts_retriever = fts_retriever
-        self.rrf_k = rrf_k
-        self.rrf_top_n = rrf_top_n
+        self.name = name
+        self.retrieve = retrieve
+        self.weight = weight
 
-    async def retrieve(self, inputs: dict) -> list[Document]:
+
+def build_vector_fusion_source(
+    name: str, vector_retriever, weight: float = 1.0, speculative: bool = False
+) -> FusionSource:
+    """
+    Create a fusion source searching a vector store with the condensed question.
+    The speculative retrieval (if any) only applies to the main vector store.
+    """
+
+    async def retrieve(inputs: dict) -> list[Document]:
         condensed_question = inputs['chat_chain_result']['condensed_question']
-        key_words = inputs['chat_chain_result']['key_words']
+        if speculative:
+            return await retrieve_vector_documents(
+                vector_retriever, inputs, condensed_question
+            )
+        return await vector_retriever.ainvoke(input=condensed_question)
+
+    return FusionSource(name=name, retrieve=retrieve, weight=weight)
+
+
+def build_fts_fusion_source(
+    name: str, fts_retriever, weight: float = 1.0
+) -> FusionSource:
+    """Create a fusion source searching the key words (skipped without key words)."""
 
-        # If no keywords are provided, do not run the FTS search
-        # and do not perform RRF merging.
+    async def retrieve(inputs: dict) -> Optional[list[Document]]:
+        key_words = inputs['chat_chain_result']['key_words']
         if not key_words:
-            logger.debug(
-                'No keywords provided, skipping FTS retrieval and RRF ranking.'
-            )
+            return None
+        return await fts_retriever.ainvoke(input=fts_retriever.prepare_query(key_words))
+
+    return FusionSource(name=name, retrieve=retrieve, weight=weight)
 
-            docs_vector = await self.vector_retriever.ainvoke(
-                input=condensed_question
-            )
 
-            # Preserve similarity rank metadata even when FTS and RRF are skipped.
-            add_rank_metadata(docs=docs_vector, metadata_key='similarity')
+class FusionRetriever:
+    """
+    Runs several retrievers concurrently (vector and full-text searches,
+    additional indexes), then fuses their ranked lists (weighted RRF, CombSUM
+    or CombMNZ).
 
-            return docs_vector
+    At most max_concurrency sources run at the same time, each one within the
+    timeout: a source that times out is left out of the fusion,
+    rather than delaying the answer. A single remaining list is not fused.
+    """
 
-        docs_vector, docs_fts = await asyncio.gather(
-            self.vector_retriever.ainvoke(input=condensed_question),
-            self.fts_retriever.ainvoke(
-                input=self.fts_retriever.prepare_query(key_words)
-            ),
+    def __init__(
+        self,
+        sources: list[FusionSource],
+        method: FusionMethod = FusionMethod.RRF,
+        rrf_k: int = 60,
+        top_n: int = 10,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.sources = sources
+        self.method = method
+        self.rrf_k = rrf_k
+        self.top_n = top_n
+        self.timeout = timeout or application_settings.rag_fusion_source_timeout
+        self.max_concurrency = (
+            max_concurrency or application_settings.rag_fusion_max_concurrency
         )
 
-        add_rank_metadata(docs=docs_vector, metadata_key='similarity')
-        add_rank_metadata(docs=docs_fts, metadata_key='fts')
+    async def retrieve_source(
+        self, source: FusionSource, inputs: dict, semaphore: asyncio.Semaphore
+    ) -> Optional[list[Document]]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(source.retrieve(inputs), self.timeout)
+            except asyncio.TimeoutError:
+                metrics_registry.increment('rag.fusion.timeouts')
+                logger.warning(
+                    "The '%s' retriever timed out (%ss), it is left out of the fusion.",
+                    source.name,
+                    self.timeout,
+                )
+                return None
 
-        result = apply_rrf_ranking(
-            [docs_vector, docs_fts],
-            k=self.rrf_k,
-            top_n=self.rrf_top_n,
+    async def retrieve(self, inputs: dict) -> list[Document]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *[
+                self.retrieve_source(source, inputs, semaphore)
+                for source in self.sources
+            ]
         )
 
-        return result
+        ranked_results = []
+        weights = []
+        for source, docs in zip(self.sources, results):
+            if docs is not None:
+                add_rank_metadata(docs=docs, metadata_key=source.name)
+                ranked_results.append(docs)
+                weights.append(source.weight)
+
+        if not ranked_results:
+            logger.warning('No retriever responded in time, no documents are retrieved.')
+            return []
+        if len(ranked_results) == 1:
+            logger.debug('A single ranked list is retrieved, it is not fused.')
+            return ranked_results[0]
+
+        if FusionMethod.RRF == self.method:
+            return apply_rrf_ranking(
+                ranked_results, k=self.rrf_k, top_n=self.top_n, weights=weights
+            )
+        return apply_score_fusion(
+            ranked_results,
+            top_n=self.top_n,
+            weights=weights,
+            mnz=FusionMethod.COMB_MNZ == self.method,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Native hybrid retriever
+# ---------------------------------------------------------------------------
+
+
+class NativeHybridRetriever:
+    """
+    Runs the vector and full-text searches in a single request, fused by the
+    vector store itself (see vector_store_native_hybrid_search_enabled).
+    """
+
+    def __init__(self, hybrid_search_retriever: HybridSearchRetriever):
+        self.hybrid_search_retriever = hybrid_search_retriever
+
+    async def retrieve(self, inputs: dict) -> list[Document]:
+        ranked_docs = await self.hybrid_search_retriever.ahybrid_search(
+            query=inputs['chat_chain_result']['condensed_question'],
+            key_words=inputs['chat_chain_result']['key_words'],
+        )
+        for doc in ranked_docs:
+            # The fused score (see get_document_score)
+            doc.metadata['rrf_score'] = doc.metadata.get('score')
+
+        return add_rank_metadata(docs=ranked_docs, metadata_key='hybrid')
 
 
 # ---------------------------------------------------------------------------
@@ -256,7 +631,9 @@ class SimilarityRetriever:
 
     async def retrieve(self, inputs: dict) -> list[Document]:
         condensed_question = inputs['chat_chain_result']['condensed_question']
-        ranked_docs = await self.vector_retriever.ainvoke(input=condensed_question)
+        ranked_docs = await retrieve_vector_documents(
+            self.vector_retriever, inputs, condensed_question
+        )
 
         return add_rank_metadata(
             docs=ranked_docs,
@@ -289,6 +666,111 @@ class FTSRetriever:
         )
 
 
+# ---------------------------------------------------------------------------
+# Reranking
+# ---------------------------------------------------------------------------
+
+
+class RerankingRetriever:
+    """
+    Reranks the (over-fetched) documents of a retriever with a document compressor,
+    and keeps the best ones. On reranking failure, a fault-tolerant compressor
+    keeps the retriever order.
+    """
+
+    def __init__(self, retriever, compressor: BaseDocumentCompressor):
+        self.retriever = retriever
+        self.compressor = compressor
+
+    async def retrieve(self, inputs: dict) -> list[Document]:
+        documents = await self.retriever.ainvoke(inputs)
+
+        reranked_docs = await self.compressor.acompress_documents(
+            documents=documents,
+            query=inputs['chat_chain_result']['condensed_question'],
+        )
+
+        return add_rank_metadata(docs=list(reranked_docs), metadata_key='rerank')
+
+
+# ---------------------------------------------------------------------------
+# Diversification
+# ---------------------------------------------------------------------------
+
+
+class DiversifyingRetriever:
+    """
+    Collapses the near-duplicate documents of a retriever into the best ranked
+    ones, then selects the documents by maximal marginal relevance (MMR).
+    The query embedding is usually already cached (query embedding cache), the
+    document embeddings are read from their 'embedding' metadata when the vector
+    store provides them, otherwise they are computed.
+    """
+
+    def __init__(
+        self,
+        retriever,
+        embedding_model: Embeddings,
+        near_duplicate_threshold: Optional[float] = None,
+        mmr_lambda: Optional[float] = None,
+        max_documents: Optional[int] = None,
+    ):
+        self.retriever = retriever
+        self.embedding_model = embedding_model
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.mmr_lambda = mmr_lambda
+        self.max_documents = max_documents
+
+    async def retrieve(self, inputs: dict) -> list[Document]:
+        documents = await self.retriever.ainvoke(inputs)
+        max_documents = self.max_documents or len(documents)
+
+        if self.near_duplicate_threshold is not None:
+            kept = find_near_duplicates(
+                [doc.page_content for doc in documents], self.near_duplicate_threshold
+            )
+            if len(kept) < len(documents):
+                metrics_registry.increment(
+                    'rag.diversification.collapsed', len(documents) - len(kept)
+                )
+                documents = [documents[i] for i in kept]
+
+        if self.mmr_lambda is None or len(documents) <= 1:
+            return documents[:max_documents]
+
+        query_embedding, document_embeddings = await asyncio.gather(
+            self.embedding_model.aembed_query(
+                inputs['chat_chain_result']['condensed_question']
+            ),
+            self.get_document_embeddings(documents),
+        )
+        selected = mmr_select(
+            query_embedding, document_embeddings, max_documents, self.mmr_lambda
+        )
+        return add_rank_metadata(
+            docs=[documents[i] for i in selected], metadata_key='mmr'
+        )
+
+    async def get_document_embeddings(
+        self, documents: list[Document]
+    ) -> list[list[float]]:
+        """Return the stored embeddings of the documents, or compute them."""
+        if all(doc.metadata.get('embedding') for doc in documents):
+            return [doc.metadata['embedding'] for doc in documents]
+        return await self.embedding_model.aembed_documents(
+            [doc.page_content for doc in documents]
+        )
+
+
+def get_documents_run_names(request: RAGRequest) -> set[str]:
+    """Return the run names of the step providing the documents of the RAG prompt."""
+    if request.document_search_params.is_diversified():
+        return {DIVERSIFICATION_RUN_NAME}
+    if request.compressor_setting is not None:
+        return {RERANK_RUN_NAME}
+    return RAG_RETRIEVER_RUN_NAMES
+
+
 def add_rank_metadata(
     docs: list[Document],
     metadata_key: str,
@@ -312,19 +794,27 @@ def build_question_condensation_chain(llm, prompt: PromptTemplate):
     """
     Return a chain that rewrites the user question into a stand-alone query
     taking the conversation history into account.
+    The prompt inputs are read from 'question_condensing_inputs' at call time.
     """
     human_placeholder = (
         '{{ question }}' if prompt.formatter == PromptFormatter.JINJA2 else '{question}'
     )
     return (
-        ChatPromptTemplate.from_messages(
+        RunnableLambda(
+            lambda x: {
+                **x['question_condensing_inputs'],
+                'question': x['question'],
+                'chat_history': x['chat_history'],
+            }
+        )
+        | ChatPromptTemplate.from_messages(
             [
                 ('system', prompt.template),
                 MessagesPlaceholder(variable_name='chat_history'),
                 ('human', human_placeholder),
             ],
             template_format=prompt.formatter.value,  # type: ignore[arg-type]
-        ).partial(**prompt.inputs)
+        )
         | llm
         | JsonOutputParser(
             pydantic_object=LLMCondensedQuestion,
@@ -333,14 +823,103 @@ def build_question_condensation_chain(llm, prompt: PromptTemplate):
     )
 
 
+def build_question_condensation_step(condensation_chain):
+    """
+    Return the question condensation step of the RAG chain: the condensation
+    chain, or the condensation fast path when the dialog has no history.
+    """
+    return RunnableBranch(
+        (
+            use_question_condensation_fast_path,
+            RunnableLambda(
+                name=QUESTION_CONDENSATION_FAST_PATH_RUN_NAME,
+                func=condense_question_locally,
+            ),
+        ),
+        condensation_chain,
+    )
+
+
+def use_question_condensation_fast_path(x: dict) -> bool:
+    """
+    The condensation LLM call is skipped (when the fast path is enabled)
+    if there is no history: the question is already a stand-alone question.
+    """
+    fast_path = (
+        application_settings.rag_condensation_fast_path_enabled
+        and not x['chat_history']
+    )
+    metrics_registry.increment(
+        'rag.condensation.fast_path' if fast_path else 'rag.condensation.llm'
+    )
+    return fast_path
+
+
+def condense_question_locally(x: dict) -> dict:
+    """Use the user question as condensed question, with locally extracted key words."""
+    return LLMCondensedQuestion(
+        condensed_question=x['question'],
+        key_words=extract_keywords(
+            text=x['question'],
+            locale=x['question_answering_inputs'].get('locale'),
+            max_keywords=application_settings.rag_fast_path_max_keywords,
+        ),
+    ).model_dump()
+
+
 # ---------------------------------------------------------------------------
 # Main chain factory
 # ---------------------------------------------------------------------------
 
 
+def build_rag_chain_inputs(request: RAGRequest, chat_history: list) -> dict:
+    """
+    Build the per-request inputs of the RAG chain.
+
+    Args:
+        request: The RAG request
+        chat_history: The chat history messages
+
+    Returns:
+        The input dict expected by the chain built with create_rag_chain.
+    """
+    return {
+        'question': request.question_answering_prompt.inputs['question'],
+        'chat_history': chat_history,
+        'question_condensing_inputs': request.question_condensing_prompt.inputs,
+        'question_answering_inputs': request.question_answering_prompt.inputs,
+        'context_token_budget': (
+            application_settings.rag_context_token_budget
+            if request.context_token_budget is None
+            else request.context_token_budget
+        ),
+    }
+
+
 def create_rag_chain(
     request: RAGRequest,
     vector_db_async_mode: Optional[bool] = True,
+) -> RunnableSerializable[Any, dict[str, Any]]:
+    """
+    Return the RAG chain for the given request, from the RAG chain cache
+    when enabled, otherwise freshly built.
+
+    Args:
+        request: The RAG request
+        vector_db_async_mode: enable/disable the async_mode for vector DB client. Default to True.
+    """
+    if not application_settings.rag_chain_cache_enabled:
+        return build_rag_chain(request, vector_db_async_mode)
+
+    return rag_chain_cache.get_or_create(
+        key=build_rag_chain_cache_key(request, vector_db_async_mode),
+        builder=lambda: build_rag_chain(request, vector_db_async_mode),
+    )
+
+
+def build_rag_chain(
+    request: RAGRequest,
+    vector_db_async_mode: Optional[bool] = True,
 ) -> RunnableSerializable[Any, dict[str, Any]]:
     # -- Validate prompts --------------------------------------------------
     validate_prompt_template(
@@ -370,22 +949,62 @@ def create_rag_chain(
     )
 
     search_kwargs = request.document_search_params.to_dict()
+    # The reranking and diversification candidates are over-fetched
+    if request.compressor_setting is not None:
+        search_kwargs['k'] = (
+            request.document_search_params.k
+            * application_settings.rag_rerank_overfetch_factor
+        )
+    elif request.document_search_params.is_diversified():
+        search_kwargs['k'] = (
+            request.document_search_params.k
+            * application_settings.rag_diversification_overfetch_factor
+        )
 
+    # The hybrid search and the additional indexes are fused
+    fusion = request.document_search_params.fusion
+    fusion_sources = []
+    fusion_run_name = FUSION_RETRIEVER_RUN_NAME
+
+    native_hybrid_retriever = None
     if (
-        VectorStoreProvider.OPEN_SEARCH == request.document_search_params.provider
-        or DocumentSearchType.SIMILARITY_SEARCH
-        == request.document_search_params.search_type
+        DocumentSearchType.HYBRID_SEARCH == request.document_search_params.search_type
+        and application_settings.vector_store_native_hybrid_search_enabled
+        and not fusion.additional_indexes
     ):
-        similarity_retriever = SimilarityRetriever(
-            vector_retriever=vector_store_factory.get_vector_store_retriever(
-                search_kwargs=search_kwargs,
-                async_mode=vector_db_async_mode,
+        native_hybrid_retriever = vector_store_factory.get_hybrid_search_retriever(
+            search_kwargs=search_kwargs, fusion=fusion
+        )
+
+    if DocumentSearchType.SIMILARITY_SEARCH == request.document_search_params.search_type:
+        vector_retriever = vector_store_factory.get_vector_store_retriever(
+            search_kwargs=search_kwargs,
+            async_mode=vector_db_async_mode,
+        )
+        similarity_retriever = SimilarityRetriever(vector_retriever=vector_retriever)
+
+        retriever = RunnableLambda(
+            name=SIMILARITY_RETRIEVER_RUN_NAME, func=similarity_retriever.retrieve
+        )
+        if fusion.additional_indexes:
+            fusion_sources.append(
+                build_vector_fusion_source(
+                    'similarity',
+                    vector_retriever,
+                    weight=fusion.weights.get('similarity', 1.0),
+                    speculative=True,
+                )
             )
+
+    elif native_hybrid_retriever is not None:
+        hybrid_retriever = NativeHybridRetriever(
+            hybrid_search_retriever=native_hybrid_retriever
         )
 
         retriever = RunnableLambda(
-            name='similarity_retriever_retrieve', func=similarity_retriever.retrieve
+            name=HYBRID_RETRIEVER_RUN_NAME, func=hybrid_retriever.retrieve
         )
+        vector_retriever = None
 
     elif DocumentSearchType.HYBRID_SEARCH == request.document_search_params.search_type:
         vector_retriever = vector_store_factory.get_vector_store_retriever(
@@ -396,16 +1015,18 @@ def create_rag_chain(
             search_kwargs=search_kwargs,
             async_mode=vector_db_async_mode,
         )
-
-        hybrid_retriever = HybridRetriever(
-            vector_retriever=vector_retriever,
-            fts_retriever=fts_retriever,
-            rrf_top_n=request.document_search_params.k,
-        )
-
-        retriever = RunnableLambda(
-            name='hybrid_retrieve', func=hybrid_retriever.retrieve
-        )
+        fusion_run_name = HYBRID_RETRIEVER_RUN_NAME
+        fusion_sources += [
+            build_vector_fusion_source(
+                'similarity',
+                vector_retriever,
+                weight=fusion.weights.get('similarity', 1.0),
+                speculative=True,
+            ),
+            build_fts_fusion_source(
+                'fts', fts_retriever, weight=fusion.weights.get('fts', 1.0)
+            ),
+        ]
 
     else:
         # DocumentSearchType.FULL_TEXT_SEARCH == request.document_search_params.search_type
@@ -416,7 +1037,65 @@ def create_rag_chain(
             )
         )
 
-        retriever = RunnableLambda(name='fts_retrieve', func=fts_as_retriever.retrieve)
+        retriever = RunnableLambda(
+            name=FTS_RETRIEVER_RUN_NAME, func=fts_as_retriever.retrieve
+        )
+        vector_retriever = None
+
+    # The additional indexes are searched by similarity, like the main one
+    if fusion_sources:
+        for index_name in fusion.additional_indexes:
+            fusion_sources.append(
+                build_vector_fusion_source(
+                    index_name,
+                    get_vector_store_factory(
+                        setting=request.vector_store_setting,
+                        index_name=index_name,
+                        embedding_function=embedding_model,
+                    ).get_vector_store_retriever(
+                        search_kwargs=search_kwargs,
+                        async_mode=vector_db_async_mode,
+                    ),
+                    weight=fusion.weights.get(index_name, 1.0),
+                )
+            )
+
+        fusion_retriever = FusionRetriever(
+            sources=fusion_sources,
+            method=fusion.method,
+            rrf_k=fusion.rrf_k,
+            top_n=search_kwargs['k'],
+            timeout=fusion.timeout,
+        )
+        retriever = RunnableLambda(
+            name=fusion_run_name, func=fusion_retriever.retrieve
+        )
+
+    if request.compressor_setting is not None:
+        reranking_retriever = RerankingRetriever(
+            retriever=retriever,
+            compressor=get_compressor_factory(
+                setting=request.compressor_setting
+            ).get_compressor(),
+        )
+        retriever = RunnableLambda(
+            name=RERANK_RUN_NAME, func=reranking_retriever.retrieve
+        )
+
+    if request.document_search_params.is_diversified():
+        diversifying_retriever = DiversifyingRetriever(
+            retriever=retriever,
+            embedding_model=embedding_model,
+            near_duplicate_threshold=request.document_search_params.near_duplicate_threshold,
+            mmr_lambda=request.document_search_params.mmr_lambda,
+            # The reranked documents are already limited (compressor max_documents)
+            max_documents=None
+            if request.compressor_setting is not None
+            else request.document_search_params.k,
+        )
+        retriever = RunnableLambda(
+            name=DIVERSIFICATION_RUN_NAME, func=diversifying_retriever.retrieve
+        )
 
     condensation_chain = build_question_condensation_chain(
         question_condensing_llm, request.question_condensing_prompt
@@ -425,35 +1104,87 @@ def create_rag_chain(
     rag_prompt = LangChainPromptTemplate.from_template(
         template=request.question_answering_prompt.template,
         template_format=request.question_answering_prompt.formatter.value,  # type: ignore[arg-type]
-        partial_variables=request.question_answering_prompt.inputs,
+    )
+
+    # The speculative retrieval only applies to the vector retrieval
+    speculation = (
+        RunnableLambda(
+            name='rag_speculative_retrieval',
+            func=build_speculative_retrieval_starter(vector_retriever, embedding_model),
+        )
+        if vector_retriever is not None
+        else RunnableLambda(lambda _: None)
     )
 
     # -- Assemble pipeline -------------------------------------------------
     with_condensed_question = RunnableParallel(
         {
-            'chat_chain_result': condensation_chain,
+            'speculation': speculation,
+            'chat_chain_result': build_question_condensation_step(
+                condensation_chain
+            ),
             'question': itemgetter('question'),
             'chat_history': itemgetter('chat_history'),
+            'question_answering_inputs': itemgetter('question_answering_inputs'),
+            'context_token_budget': itemgetter('context_token_budget'),
         }
     )
 
-    rag_inputs = with_condensed_question | RunnableParallel(
+    semantic_cache = SemanticAnswerCache(
+        request=request,
+        embedding_model=embedding_model,
+        vector_store_factory=vector_store_factory,
+    )
+    with_cache_lookup = with_condensed_question | RunnablePassthrough.assign(
+        semantic_cache=RunnableLambda(
+            name='rag_semantic_cache_lookup', func=semantic_cache.lookup
+        )
+    )
+
+    rag_inputs = RunnableParallel(
         {
             'question': lambda x: x['chat_chain_result']['condensed_question'],
             'key_words': lambda x: x['chat_chain_result']['key_words'],
             'chat_history': itemgetter('chat_history'),
+            'question_answering_inputs': itemgetter('question_answering_inputs'),
+            'speculation': itemgetter('speculation'),
+            'semantic_cache': itemgetter('semantic_cache'),
+            'context_token_budget': itemgetter('context_token_budget'),
             'documents': retriever,
         }
     )
 
+    context_packing = RunnablePassthrough.assign(
+        context=RunnableLambda(
+            name=CONTEXT_PACKING_RUN_NAME,
+            func=build_context_packer(
+                getattr(request.question_answering_llm_setting, 'model', None)
+            ),
+        )
+    )
+
     answer_chain = (
-        {
-            'context': lambda x: format_documents_as_context(x['documents']),
-            'chat_history': format_chat_history,
-        }
+        RunnableLambda(
+            lambda x: {
+                **x['question_answering_inputs'],
+                'context': x['context'].text,
+                'chat_history': format_chat_history(x),
+            }
+        )
         | rag_prompt
         | question_answering_llm
         | JsonOutputParser(pydantic_object=LLMAnswer, name='rag_chain_output')
     )
 
-    return rag_inputs | RunnablePassthrough.assign(answer=answer_chain)
+    # On semantic answer cache hit, the retrieval and the answer generation are skipped
+    return with_cache_lookup | RunnableBranch(
+        (
+            is_semantic_cache_hit,
+            RunnableLambda(
+                name=SEMANTIC_CACHE_HIT_RUN_NAME, func=get_cached_chain_output
+            ),
+        ),
+        rag_inputs
+        | context_packing
+        | RunnablePassthrough.assign(answer=answer_chain),
+    )
@@ -0,0 +1,129 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+RAG Chain Cache
+---------------
+Keeps the compiled RAG chains in a bounded TTL cache, so that requests
+sharing the same settings and prompt templates reuse the same LangChain
+pipeline. Only the per-request inputs (question, history, prompt inputs)
+flow through the chain at call time.
+
+A chain is replaced once expired, or once its settings change (new key).
+The cache is cleared on application shutdown, before the clients and pools
+held by the chains are closed.
+"""
+
+import logging
+from threading import RLock
+from typing import Any, Callable, Optional
+
+from cachetools import TTLCache
+from langchain_core.runnables import RunnableSerializable
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.utils.hashing import stable_hash
+
+logger = logging.getLogger(__name__)
+
+# Request fields that shape the chain. Everything else is provided at call time.
+RAG_CHAIN_CACHE_KEY_FIELDS = {
+    'question_condensing_llm_setting',
+    'question_condensing_prompt',
+    'question_answering_llm_setting',
+    'question_answering_prompt',
+    'embedding_question_em_setting',
+    'document_index_name',
+    'document_search_params',
+    'vector_store_setting',
+    'compressor_setting',
+}
+
+# Prompt inputs are injected at call time, they are not part of the key.
+RAG_CHAIN_CACHE_KEY_EXCLUDED_FIELDS = {
+    'question_condensing_prompt': {'inputs'},
+    'question_answering_prompt': {'inputs'},
+}
+
+
+def build_rag_chain_cache_key(
+    request: RAGRequest, vector_db_async_mode: Optional[bool] = True
+) -> str:
+    """
+    Build a stable hash of the settings and prompt templates of a RAG request.
+
+    Args:
+        request: The RAG request
+        vector_db_async_mode: The vector DB client mode used to build the chain
+
+    Returns:
+        The SHA-256 hex digest identifying the chain.
+    """
+    payload = request.model_dump(
+        mode='json',
+        include=RAG_CHAIN_CACHE_KEY_FIELDS,
+        exclude=RAG_CHAIN_CACHE_KEY_EXCLUDED_FIELDS,
+    )
+    payload['vector_db_async_mode'] = vector_db_async_mode
+
+    return stable_hash(payload)
+
+
+class RAGChainCache:
+    """A thread-safe, bounded TTL cache of compiled RAG chains."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = RLock()
+
+    def get_or_create(
+        self,
+        key: str,
+        builder: Callable[[], RunnableSerializable[Any, dict[str, Any]]],
+    ) -> RunnableSerializable[Any, dict[str, Any]]:
+        """
+        Return the cached chain for the given key, or build and cache it.
+
+        Args:
+            key: The chain cache key (see build_rag_chain_cache_key)
+            builder: The function building the chain on cache miss
+        """
+        with self._lock:
+            chain = self._cache.get(key)
+            if chain is None:
+                logger.debug('RAG chain cache miss [key=%s]', key)
+                chain = builder()
+                self._cache[key] = chain
+            else:
+                logger.debug('RAG chain cache hit [key=%s]', key)
+
+            return chain
+
+    def clear(self) -> None:
+        """Remove all the cached chains."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+rag_chain_cache = RAGChainCache(
+    maxsize=application_settings.rag_chain_cache_max_size,
+    ttl=application_settings.rag_chain_cache_ttl,
+)
@@ -21,7 +21,7 @@ including footnotes, debug data, and observability metadata.
 
 import json
 import logging
-from typing import List
+from typing import List, Optional
 
 from langchain_core.documents import Document
 
@@ -42,8 +42,15 @@ from gen_ai_orchestrator.services.langchain.callbacks.rag_callback_handler impor
     RAGCallbackHandler,
 )
 from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    PackedContext,
     get_chunk_identifier,
 )
+from gen_ai_orchestrator.services.langchain.semantic_answer_cache import (
+    SemanticCacheLookup,
+)
+from gen_ai_orchestrator.services.langchain.speculative_retrieval import (
+    RetrievalSpeculation,
+)
 from gen_ai_orchestrator.services.observability.observabilty_service import (
     get_observability_info,
 )
@@ -75,19 +82,27 @@ def extract_rank(value: str | None) -> int:
     return int(value.split('/')[0])
 
 
+# Rank keys of the fused (or diversified) orders, MMR being applied last
+FUSED_RANK_KEYS = ('mmr', 'rrf', 'combsum', 'combmnz', 'hybrid')
+
+
 def footnote_sort_key(doc: Document) -> tuple[int, int]:
     rank_metadata = doc.metadata.get('rank', {})
 
-    if 'rrf' in rank_metadata:
-        return 0, extract_rank(rank_metadata['rrf'])
+    if 'rerank' in rank_metadata:
+        return 0, extract_rank(rank_metadata['rerank'])
+
+    for rank_key in FUSED_RANK_KEYS:
+        if rank_key in rank_metadata:
+            return 1, extract_rank(rank_metadata[rank_key])
 
     if 'similarity' in rank_metadata:
-        return 1, extract_rank(rank_metadata['similarity'])
+        return 2, extract_rank(rank_metadata['similarity'])
 
     if 'fts' in rank_metadata:
-        return 2, extract_rank(rank_metadata['fts'])
+        return 3, extract_rank(rank_metadata['fts'])
 
-    return 3, 999999
+    return 4, 999999
 
 
 def build_footnotes(
@@ -111,16 +126,26 @@ def build_footnotes(
         key=footnote_sort_key,
     )
 
-    return [
-        Footnote(
-            identifier=doc.metadata['id'],
-            title=doc.metadata['title'],
-            url=doc.metadata['source'],
-            content=get_source_content(doc),
-            metadata=doc.metadata.copy(),
-        )
-        for doc in sorted_docs
-    ]
+    return [build_footnote(doc) for doc in sorted_docs]
+
+
+def build_footnote_candidates(documents: list[Document]) -> list[Footnote]:
+    """
+    Return one Footnote per retrieved document, whether or not it is used in
+    the LLM answer. They are the footnote candidates streamed before the answer.
+    """
+    return [build_footnote(doc) for doc in sorted(documents, key=footnote_sort_key)]
+
+
+def build_footnote(doc: Document) -> Footnote:
+    """Build the Footnote of a retrieved document."""
+    return Footnote(
+        identifier=doc.metadata['id'],
+        title=doc.metadata['title'],
+        url=doc.metadata['source'],
+        content=get_source_content(doc),
+        metadata=doc.metadata.copy(),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -164,6 +189,9 @@ def build_rag_debug_data(
     request: RAGRequest,
     records_callback_handler: RAGCallbackHandler,
     rag_duration: float,
+    speculation: Optional[RetrievalSpeculation] = None,
+    semantic_cache: Optional[SemanticCacheLookup] = None,
+    context: Optional[PackedContext] = None,
 ) -> RAGDebugData:
     history = request.dialog.history if request.dialog else []
 
@@ -184,6 +212,9 @@ def build_rag_debug_data(
             records_callback_handler.records.get('rag_chain_output')
         ),
         duration=rag_duration,
+        speculative_retrieval=speculation.to_debug_data() if speculation else None,
+        semantic_cache=semantic_cache.to_debug_data() if semantic_cache else None,
+        context=context.to_debug_data() if context else None,
     )
 
 
@@ -201,15 +232,29 @@ def build_rag_response(
     rag_duration: float,
     debug: bool,
 ) -> RAGResponse:
-    """Assemble the final RAGResponse from all intermediate results."""
+    """
+    Assemble the final RAGResponse from all intermediate results.
+    The footnotes of a semantic answer cache hit are part of the chain output.
+    """
+    footnotes = chain_output.get('footnotes')
+    if footnotes is None:
+        footnotes = build_footnotes(chain_output['documents'], llm_answer)
+
     return RAGResponse(
         answer=llm_answer,
-        footnotes=build_footnotes(chain_output['documents'], llm_answer),
+        footnotes=footnotes,
         observability_info=get_observability_info(
             observability_handler,
             ObservabilityTrace.RAG.value,
         ),
-        debug=build_rag_debug_data(request, records_callback_handler, rag_duration)
+        debug=build_rag_debug_data(
+            request,
+            records_callback_handler,
+            rag_duration,
+            chain_output.get('speculation'),
+            chain_output.get('semantic_cache'),
+            chain_output.get('context'),
+        )
         if debug
         else None,
     )
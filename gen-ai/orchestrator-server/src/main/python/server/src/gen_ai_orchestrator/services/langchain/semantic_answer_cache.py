@@ -0,0 +1,337 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Semantic Answer Cache
+---------------------
+Once the question is condensed, its embedding is looked up in the semantic
+answer cache. When a cached condensed question is similar enough, the cached
+answer and footnotes are returned: the retrieval and the answer generation
+are skipped (hit). Otherwise, the answer is cached once generated (miss).
+
+Answers are cached per scope: the document index, the search parameters
+(including the index session filter), the answering prompt, the LLM, embedding
+model and compressor settings, and the answering prompt inputs (except the question).
+When a document index is searched with a new index session, the answers of
+its previous index sessions are invalidated.
+
+Hits and misses are counted in the metrics registry (rag.semantic_cache.*).
+"""
+
+import logging
+import weakref
+from typing import Optional
+
+from langchain_core.embeddings import Embeddings
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    SemanticCacheStore,
+    application_settings,
+)
+from gen_ai_orchestrator.models.rag.rag_models import (
+    Footnote,
+    LLMAnswer,
+    SemanticCacheDebugData,
+)
+from gen_ai_orchestrator.models.vector_stores.pgvector.database_pool_registry import (
+    DatabasePool,
+    db_pool_registry,
+)
+from gen_ai_orchestrator.models.vector_stores.pgvector.pgvector_setting import (
+    PGVectorStoreSetting,
+)
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_factory import (
+    PGVectorFactory,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
+    LangChainVectorStoreFactory,
+)
+from gen_ai_orchestrator.services.langchain.semantic_answer_store import (
+    CachedAnswer,
+    InMemorySemanticAnswerStore,
+    PGVectorSemanticAnswerStore,
+    SemanticAnswerStore,
+)
+from gen_ai_orchestrator.services.utils.search_filter import (
+    find_index_session_id,
+)
+from gen_ai_orchestrator.utils.hashing import stable_hash
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Request fields that shape the answer of a condensed question
+SEMANTIC_CACHE_SCOPE_FIELDS = {
+    'question_answering_llm_setting',
+    'question_answering_prompt',
+    'embedding_question_em_setting',
+    'document_index_name',
+    'document_search_params',
+    'vector_store_setting',
+    'compressor_setting',
+}
+
+# The answering prompt inputs are part of the scope at call time
+SEMANTIC_CACHE_SCOPE_EXCLUDED_FIELDS = {
+    'question_answering_prompt': {'inputs'},
+}
+
+in_memory_semantic_answer_store = InMemorySemanticAnswerStore(
+    max_size=application_settings.rag_semantic_cache_max_size,
+    ttl=application_settings.rag_semantic_cache_ttl,
+)
+
+# One PGVector store per database pool
+_pgvector_semantic_answer_stores: weakref.WeakKeyDictionary[
+    DatabasePool, PGVectorSemanticAnswerStore
+] = weakref.WeakKeyDictionary()
+
+
+def get_pgvector_semantic_answer_store(
+    pool: DatabasePool,
+) -> PGVectorSemanticAnswerStore:
+    """Return the PGVector semantic answer store of a database pool."""
+    if pool not in _pgvector_semantic_answer_stores:
+        _pgvector_semantic_answer_stores[pool] = PGVectorSemanticAnswerStore(
+            engine=pool.async_engine,
+            max_size=application_settings.rag_semantic_cache_max_size,
+            ttl=application_settings.rag_semantic_cache_ttl,
+            index_dimensions=application_settings.rag_semantic_cache_index_dimensions,
+            ef_search=application_settings.rag_semantic_cache_ef_search,
+            eviction_interval=application_settings.rag_semantic_cache_eviction_interval,
+        )
+    return _pgvector_semantic_answer_stores[pool]
+
+
+async def setup_semantic_answer_store(setting: PGVectorStoreSetting) -> None:
+    """
+    Set up the PGVector semantic answer store of a vector store setting (on
+    startup). A failure is logged, not raised: the store is set up in
+    background on its first use.
+
+    Args:
+        setting: The PGVector vector store setting
+    """
+    store = get_pgvector_semantic_answer_store(db_pool_registry.get_or_create(setting))
+    try:
+        await store.setup()
+    except Exception as exc:
+        logger.warning('The semantic answer cache table could not be set up: %s', exc)
+
+
+def get_semantic_answer_store(
+    vector_store_factory: LangChainVectorStoreFactory,
+) -> SemanticAnswerStore:
+    """
+    Return the semantic answer store configured in the settings.
+    The PGVector store lives in the database of the PGVector vector store,
+    the in-memory store is used for the other vector stores.
+
+    Args:
+        vector_store_factory: The vector store factory of the RAG chain
+    """
+    if application_settings.rag_semantic_cache_store == SemanticCacheStore.PGVECTOR:
+        if isinstance(vector_store_factory, PGVectorFactory):
+            return get_pgvector_semantic_answer_store(vector_store_factory.pool)
+
+        logger.warning(
+            'The pgvector semantic answer store requires a PGVector vector store, '
+            'the in-memory store is used.'
+        )
+
+    return in_memory_semantic_answer_store
+
+
+def get_semantic_cache_hit_rate() -> float:
+    """Return the semantic answer cache hit rate since the application started."""
+    hits = metrics_registry.get_counter('rag.semantic_cache.hits')
+    total = hits + metrics_registry.get_counter('rag.semantic_cache.misses')
+    return hits / total if total else 0.0
+
+
+class SemanticCacheLookup:
+    """The semantic answer cache lookup of a RAG chain call."""
+
+    def __init__(
+        self,
+        store: SemanticAnswerStore,
+        scope: str,
+        cached_answer: CachedAnswer,
+        embedding: list[float],
+        similarity: Optional[float],
+        hit: bool,
+    ):
+        self.store = store
+        self.scope = scope
+        # On hit, the cached answer. On miss, the answer to cache (without answer yet)
+        self.cached_answer = cached_answer
+        self.embedding = embedding
+        self.similarity = similarity
+        self.hit = hit
+
+    async def save(self, answer: LLMAnswer, footnotes: list[Footnote]) -> None:
+        """
+        Cache the generated answer, on cache miss. Errors are logged, not raised.
+
+        Args:
+            answer: The RAG answer (guardrail checked)
+            footnotes: The RAG answer footnotes
+        """
+        if self.hit or not answer.answer:
+            return
+
+        try:
+            await self.store.add(
+                self.scope,
+                self.embedding,
+                self.cached_answer.model_copy(
+                    update={'answer': answer, 'footnotes': footnotes}
+                ),
+            )
+        except Exception as exc:
+            logger.warning('The answer could not be cached: %s', exc)
+
+    def to_debug_data(self) -> SemanticCacheDebugData:
+        """Return the semantic answer cache outcome for the RAG debug data."""
+        return SemanticCacheDebugData(
+            hit=self.hit,
+            similarity=self.similarity,
+            cached_question=self.cached_answer.question if self.hit else None,
+        )
+
+
+class SemanticAnswerCache:
+    """The semantic answer cache of a RAG chain."""
+
+    def __init__(
+        self,
+        request: RAGRequest,
+        embedding_model: Embeddings,
+        vector_store_factory: LangChainVectorStoreFactory,
+    ):
+        self.embedding_model = embedding_model
+        self.vector_store_factory = vector_store_factory
+        self.document_index_name = request.document_index_name
+        self.index_session_id = find_index_session_id(
+            request.document_search_params.to_dict().get('filter')
+        )
+        self.scope = stable_hash(
+            request.model_dump(
+                mode='json',
+                include=SEMANTIC_CACHE_SCOPE_FIELDS,
+                exclude=SEMANTIC_CACHE_SCOPE_EXCLUDED_FIELDS,
+            )
+        )
+
+    async def lookup(self, x: dict) -> Optional[SemanticCacheLookup]:
+        """
+        Look up the condensed question in the semantic answer cache.
+        It returns None when the cache is disabled or unavailable.
+        """
+        if not application_settings.rag_semantic_cache_enabled:
+            return None
+
+        question = x['chat_chain_result']['condensed_question']
+        inputs = {
+            key: value
+            for key, value in x['question_answering_inputs'].items()
+            if key != 'question'
+        }
+        scope = stable_hash({'chain': self.scope, 'inputs': inputs})
+        store = get_semantic_answer_store(self.vector_store_factory)
+
+        try:
+            await store.activate_index_session(
+                self.document_index_name, self.index_session_id
+            )
+            embedding = await self.embedding_model.aembed_query(question)
+            result = await store.search(
+                scope, embedding, application_settings.rag_semantic_cache_threshold
+            )
+        except Exception as exc:
+            logger.warning('Semantic answer cache lookup failed: %s', exc)
+            return None
+
+        hit = result is not None
+        metrics_registry.increment(
+            'rag.semantic_cache.hits' if hit else 'rag.semantic_cache.misses'
+        )
+        metrics_registry.set_gauge(
+            'rag.semantic_cache.hit_rate', get_semantic_cache_hit_rate()
+        )
+        logger.debug(
+            'Semantic answer cache %s (similarity: %s)',
+            'hit' if hit else 'miss',
+            result[1] if hit else None,
+        )
+
+        if hit:
+            cached_answer, similarity = result
+        else:
+            cached_answer, similarity = (
+                CachedAnswer(
+                    document_index_name=self.document_index_name,
+                    index_session_id=self.index_session_id,
+                    question=question,
+                    answer=LLMAnswer(),
+                    footnotes=[],
+                ),
+                None,
+            )
+
+        return SemanticCacheLookup(
+            store=store,
+            scope=scope,
+            cached_answer=cached_answer,
+            embedding=embedding,
+            similarity=similarity,
+            hit=hit,
+        )
+
+
+def is_semantic_cache_hit(x: dict) -> bool:
+    """Whether the answer of the RAG chain call comes from the semantic answer cache."""
+    return x['semantic_cache'] is not None and x['semantic_cache'].hit
+
+
+def get_cached_chain_output(x: dict) -> dict:
+    """
+    Return the RAG chain output of a semantic answer cache hit: the cached
+    answer and footnotes, without retrieved documents.
+    """
+    if x['speculation'] is not None:
+        x['speculation'].task.cancel()
+
+    cached_answer = x['semantic_cache'].cached_answer
+    return {
+        'question': x['chat_chain_result']['condensed_question'],
+        'key_words': x['chat_chain_result']['key_words'],
+        'chat_history': x['chat_history'],
+        'question_answering_inputs': x['question_answering_inputs'],
+        'speculation': None,
+        'semantic_cache': x['semantic_cache'],
+        'documents': [],
+        'footnotes': cached_answer.footnotes,
+        'answer': cached_answer.answer.model_dump(),
+    }
+
+
+async def save_in_semantic_cache(
+    chain_output: dict, answer: LLMAnswer, footnotes: list[Footnote]
+) -> None:
+    """Cache the answer of a RAG chain call, on semantic answer cache miss."""
+    lookup = chain_output.get('semantic_cache')
+    if lookup is not None:
+        await lookup.save(answer, footnotes)
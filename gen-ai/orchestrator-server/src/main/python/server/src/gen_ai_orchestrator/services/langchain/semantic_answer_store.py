@@ -0,0 +1,441 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Semantic Answer Stores
+----------------------
+Stores of the semantic answer cache. Cached answers are saved with the
+embedding of their condensed question, in a scope (see semantic_answer_cache),
+and looked up by cosine similarity within that scope.
+
+* InMemorySemanticAnswerStore: process-local, bounded (LRU) with a TTL.
+* PGVectorSemanticAnswerStore: shared by the orchestrator instances, in a
+  table of the PGVector database (HNSW indexed), bounded (LRU) with a TTL.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from threading import RLock
+from typing import Optional
+
+import numpy as np
+from cachetools import TTLCache
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from gen_ai_orchestrator.models.rag.rag_models import Footnote, LLMAnswer
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class CachedAnswer(BaseModel):
+    """An answer of the semantic answer cache"""
+
+    document_index_name: str = Field(description='The document index name.')
+    index_session_id: Optional[str] = Field(
+        description='The index session of the retrieved documents.', default=None
+    )
+    question: str = Field(description='The condensed question.')
+    answer: LLMAnswer = Field(description='The RAG answer.')
+    footnotes: list[Footnote] = Field(description='The RAG answer footnotes.')
+
+
+class SemanticAnswerStore(ABC):
+    """The store of the semantic answer cache."""
+
+    def __init__(self):
+        # Last index session seen per document index
+        self._index_sessions: dict[str, Optional[str]] = {}
+
+    @abstractmethod
+    async def search(
+        self, scope: str, embedding: list[float], min_similarity: float
+    ) -> Optional[tuple[CachedAnswer, float]]:
+        """
+        Return the cached answer of the most similar question in the scope,
+        with its similarity, if it reaches the minimum similarity.
+
+        Args:
+            scope: The cache scope
+            embedding: The condensed question embedding
+            min_similarity: The minimum cosine similarity
+        """
+
+    @abstractmethod
+    async def add(
+        self, scope: str, embedding: list[float], cached_answer: CachedAnswer
+    ) -> None:
+        """
+        Add an answer to the cache.
+
+        Args:
+            scope: The cache scope
+            embedding: The condensed question embedding
+            cached_answer: The answer to cache
+        """
+
+    @abstractmethod
+    async def invalidate(
+        self, document_index_name: str, active_index_session_id: Optional[str] = None
+    ) -> None:
+        """
+        Remove the cached answers of a document index, except the ones of the
+        active index session (all of them when no index session is given).
+
+        Args:
+            document_index_name: The document index name
+            active_index_session_id: The active index session
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all the cached answers."""
+
+    async def activate_index_session(
+        self, document_index_name: str, index_session_id: Optional[str]
+    ) -> None:
+        """
+        Invalidate the answers of the previous index sessions, when a document
+        index is searched with a new index session.
+
+        Args:
+            document_index_name: The document index name
+            index_session_id: The index session of the search filter (if any)
+        """
+        if index_session_id is None:
+            return
+
+        previous_index_session_id = self._index_sessions.get(
+            document_index_name, index_session_id
+        )
+        self._index_sessions[document_index_name] = index_session_id
+        if previous_index_session_id != index_session_id:
+            logger.info(
+                'New index session %s for the index %s, its cached answers are invalidated',
+                index_session_id,
+                document_index_name,
+            )
+            metrics_registry.increment('rag.semantic_cache.invalidations')
+            await self.invalidate(document_index_name, index_session_id)
+
+
+def normalize_embedding(embedding: list[float]) -> np.ndarray:
+    """Return the embedding as a unit float32 vector, so that cosine similarity is a dot product."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class InMemorySemanticAnswerStore(SemanticAnswerStore):
+    """A process-local store, bounded by its maximum size (LRU eviction) and a TTL."""
+
+    def __init__(self, max_size: int, ttl: int):
+        super().__init__()
+        # Entries are (scope, normalized embedding, cached answer), by entry id
+        self._entries: TTLCache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = RLock()
+
+    async def search(
+        self, scope: str, embedding: list[float], min_similarity: float
+    ) -> Optional[tuple[CachedAnswer, float]]:
+        with self._lock:
+            self._entries.expire()
+            candidates = [
+                (entry_id, vector, cached_answer)
+                for entry_id, (entry_scope, vector, cached_answer) in self._entries.items()
+                if entry_scope == scope
+            ]
+        if not candidates:
+            return None
+
+        similarities = np.stack([vector for _, vector, _ in candidates]) @ (
+            normalize_embedding(embedding)
+        )
+        best = int(np.argmax(similarities))
+        if similarities[best] < min_similarity:
+            return None
+
+        entry_id, _, cached_answer = candidates[best]
+        with self._lock:
+            # Mark the entry as recently used
+            self._entries.get(entry_id)
+        return cached_answer, float(similarities[best])
+
+    async def add(
+        self, scope: str, embedding: list[float], cached_answer: CachedAnswer
+    ) -> None:
+        with self._lock:
+            self._entries[uuid.uuid4()] = (
+                scope,
+                normalize_embedding(embedding),
+                cached_answer,
+            )
+
+    async def invalidate(
+        self, document_index_name: str, active_index_session_id: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            for entry_id, (_, _, cached_answer) in list(self._entries.items()):
+                if (
+                    cached_answer.document_index_name == document_index_name
+                    and (
+                        active_index_session_id is None
+                        or cached_answer.index_session_id != active_index_session_id
+                    )
+                ):
+                    del self._entries[entry_id]
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index_sessions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._entries.expire()
+            return len(self._entries)
+
+
+class PGVectorSemanticAnswerStore(SemanticAnswerStore):
+    """
+    A store shared by the orchestrator instances, in a table of the PGVector database.
+    Its size is bounded (least recently used answers are evicted) and answers expire after the TTL.
+
+    The table and its indexes are set up at startup (see setup). Until then, the
+    store is set up in background: lookups are misses and answers are not cached.
+    The embeddings of the indexed dimension are searched through an HNSW index
+    (approximate, among the ef_search nearest candidates of the scope filter),
+    the others exactly. Expired and least recently used answers are evicted in
+    batch, at most once per eviction interval.
+    """
+
+    TABLE_NAME = 'rag_semantic_answer_cache'
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        max_size: int,
+        ttl: int,
+        index_dimensions: int,
+        ef_search: int,
+        eviction_interval: int,
+    ):
+        super().__init__()
+        self._engine = engine
+        self._max_size = max_size
+        self._ttl = ttl
+        self._index_dimensions = int(index_dimensions)
+        self._ef_search = ef_search
+        self._eviction_interval = eviction_interval
+        self._next_eviction = 0.0
+        self._set_up = False
+        self._setup_lock = asyncio.Lock()
+        self._setup_task: Optional[asyncio.Task] = None
+
+    async def setup(self) -> None:
+        """Create the cache table and its indexes, if they do not exist."""
+        if self._set_up:
+            return
+
+        async with self._setup_lock:
+            if self._set_up:
+                return
+            async with self._engine.begin() as connection:
+                await self._create_table(connection)
+            self._set_up = True
+            logger.info('Semantic answer cache table %s set up', self.TABLE_NAME)
+
+    async def _create_table(self, connection: AsyncConnection) -> None:
+        await connection.execute(text('CREATE EXTENSION IF NOT EXISTS vector'))
+        await connection.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    id uuid PRIMARY KEY,
+                    scope varchar NOT NULL,
+                    document_index_name varchar NOT NULL,
+                    index_session_id varchar,
+                    embedding vector NOT NULL,
+                    cached_answer jsonb NOT NULL,
+                    created_at timestamptz NOT NULL DEFAULT now(),
+                    last_used_at timestamptz NOT NULL DEFAULT now()
+                )
+                """
+            )
+        )
+        for column in ('scope', 'document_index_name', 'created_at', 'last_used_at'):
+            await connection.execute(
+                text(
+                    f'CREATE INDEX IF NOT EXISTS ix_{self.TABLE_NAME}_{column} '
+                    f'ON {self.TABLE_NAME} ({column})'
+                )
+            )
+        # HNSW indexes need a fixed dimension: a partial index on the cast embeddings
+        dimensions = self._index_dimensions
+        await connection.execute(
+            text(
+                f'CREATE INDEX IF NOT EXISTS ix_{self.TABLE_NAME}_embedding_{dimensions} '
+                f'ON {self.TABLE_NAME} USING hnsw '
+                f'((embedding::vector({dimensions})) vector_cosine_ops) '
+                f'WHERE vector_dims(embedding) = {dimensions}'
+            )
+        )
+
+    def _is_set_up(self) -> bool:
+        """Whether the store is set up. Otherwise, it is set up in background."""
+        if not self._set_up and (self._setup_task is None or self._setup_task.done()):
+            self._setup_task = asyncio.create_task(self._setup_in_background())
+        return self._set_up
+
+    async def _setup_in_background(self) -> None:
+        try:
+            await self.setup()
+        except Exception as exc:
+            logger.warning('The semantic answer cache table could not be set up: %s', exc)
+
+    def _search_query(self, dimensions: int) -> str:
+        if dimensions == self._index_dimensions:
+            # Same expression and predicate as the HNSW index
+            embedding = f'embedding::vector({dimensions})'
+            query_embedding = f'CAST(:embedding AS vector({dimensions}))'
+            dimensions_filter = f'AND vector_dims(embedding) = {dimensions}'
+        else:
+            embedding = 'embedding'
+            query_embedding = 'CAST(:embedding AS vector)'
+            dimensions_filter = ''
+        return f"""
+            SELECT id, cached_answer,
+                   1 - ({embedding} <=> {query_embedding}) AS similarity
+            FROM {self.TABLE_NAME}
+            WHERE scope = :scope
+              AND created_at > now() - make_interval(secs => :ttl)
+              {dimensions_filter}
+            ORDER BY {embedding} <=> {query_embedding}
+            LIMIT 1
+            """
+
+    async def search(
+        self, scope: str, embedding: list[float], min_similarity: float
+    ) -> Optional[tuple[CachedAnswer, float]]:
+        if not self._is_set_up():
+            return None
+
+        async with self._engine.begin() as connection:
+            await connection.execute(
+                select(func.set_config('hnsw.ef_search', str(self._ef_search), True))
+            )
+            row = (
+                await connection.execute(
+                    text(self._search_query(len(embedding))),
+                    {
+                        'embedding': json.dumps(embedding),
+                        'scope': scope,
+                        'ttl': self._ttl,
+                    },
+                )
+            ).first()
+            if row is None or row.similarity < min_similarity:
+                return None
+
+            await connection.execute(
+                text(
+                    f'UPDATE {self.TABLE_NAME} SET last_used_at = now() WHERE id = :id'
+                ),
+                {'id': row.id},
+            )
+            return CachedAnswer.model_validate(row.cached_answer), float(
+                row.similarity
+            )
+
+    async def add(
+        self, scope: str, embedding: list[float], cached_answer: CachedAnswer
+    ) -> None:
+        if not self._is_set_up():
+            return
+
+        async with self._engine.begin() as connection:
+            await connection.execute(
+                text(
+                    f"""
+                    INSERT INTO {self.TABLE_NAME}
+                        (id, scope, document_index_name, index_session_id, embedding, cached_answer)
+                    VALUES
+                        (:id, :scope, :document_index_name, :index_session_id,
+                         CAST(:embedding AS vector), CAST(:cached_answer AS jsonb))
+                    """
+                ),
+                {
+                    'id': uuid.uuid4(),
+                    'scope': scope,
+                    'document_index_name': cached_answer.document_index_name,
+                    'index_session_id': cached_answer.index_session_id,
+                    'embedding': json.dumps(embedding),
+                    'cached_answer': cached_answer.model_dump_json(),
+                },
+            )
+            if time.monotonic() >= self._next_eviction:
+                self._next_eviction = time.monotonic() + self._eviction_interval
+                await self._evict(connection)
+
+    async def _evict(self, connection: AsyncConnection) -> None:
+        """Evict the expired answers, then the least recently used ones."""
+        await connection.execute(
+            text(
+                f'DELETE FROM {self.TABLE_NAME} '
+                'WHERE created_at <= now() - make_interval(secs => :ttl)'
+            ),
+            {'ttl': self._ttl},
+        )
+        await connection.execute(
+            text(
+                f"""
+                DELETE FROM {self.TABLE_NAME}
+                WHERE id IN (
+                    SELECT id FROM {self.TABLE_NAME}
+                    ORDER BY last_used_at DESC
+                    OFFSET :max_size
+                )
+                """
+            ),
+            {'max_size': self._max_size},
+        )
+
+    async def invalidate(
+        self, document_index_name: str, active_index_session_id: Optional[str] = None
+    ) -> None:
+        query = f'DELETE FROM {self.TABLE_NAME} WHERE document_index_name = :document_index_name'
+        if active_index_session_id is not None:
+            query += ' AND index_session_id IS DISTINCT FROM :active_index_session_id'
+
+        await self.setup()
+        async with self._engine.begin() as connection:
+            await connection.execute(
+                text(query),
+                {
+                    'document_index_name': document_index_name,
+                    'active_index_session_id': active_index_session_id,
+                },
+            )
+
+    async def clear(self) -> None:
+        await self.setup()
+        async with self._engine.begin() as connection:
+            await connection.execute(text(f'DELETE FROM {self.TABLE_NAME}'))
+        self._index_sessions.clear()
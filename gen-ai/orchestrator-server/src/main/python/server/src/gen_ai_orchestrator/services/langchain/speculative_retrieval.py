@@ -0,0 +1,217 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Speculative Retrieval
+---------------------
+The vector retrieval is started on the raw user question, concurrently with
+the question condensation. Once the question is condensed:
+
+* if it is similar enough to the user question, the speculative documents
+  are reused (hit),
+* otherwise the speculative retrieval is cancelled, and the retrieval is done
+  with the condensed question (miss).
+
+Hits and misses are counted in the metrics registry (rag.speculation.*).
+"""
+
+import asyncio
+import logging
+import math
+import re
+from difflib import SequenceMatcher
+from typing import Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.runnables import RunnableConfig
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    SpeculativeRetrievalSimilarity,
+    application_settings,
+)
+from gen_ai_orchestrator.models.rag.rag_models import (
+    SpeculativeRetrievalDebugData,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+    """Lower case the question, and remove its punctuation and extra spaces."""
+    return ' '.join(re.findall(r'[^\W_]+', question.lower()))
+
+
+def string_similarity(question: str, condensed_question: str) -> float:
+    """Return the similarity ratio (between 0 and 1) of the normalized questions."""
+    return SequenceMatcher(
+        None, normalize_question(question), normalize_question(condensed_question)
+    ).ratio()
+
+
+async def embedding_similarity(
+    embedding_model: Embeddings, question: str, condensed_question: str
+) -> float:
+    """Return the cosine similarity of the question embeddings."""
+    first, second = await asyncio.gather(
+        embedding_model.aembed_query(question),
+        embedding_model.aembed_query(condensed_question),
+    )
+    norms = math.hypot(*first) * math.hypot(*second)
+    if not norms:
+        return 0.0
+    return math.fsum(a * b for a, b in zip(first, second)) / norms
+
+
+class RetrievalSpeculation:
+    """A vector retrieval started on the raw user question, before its condensation."""
+
+    def __init__(
+        self,
+        question: str,
+        task: asyncio.Task,
+        embedding_model: Optional[Embeddings] = None,
+    ):
+        self.question = question
+        self.task = task
+        self.embedding_model = embedding_model
+        self.hit: Optional[bool] = None
+        self.similarity: Optional[float] = None
+        # Retrieve the speculative task exception (if any), even when it is not awaited
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _similarity(self, condensed_question: str) -> float:
+        if condensed_question == self.question:
+            return 1.0
+        if (
+            application_settings.rag_speculative_retrieval_similarity
+            == SpeculativeRetrievalSimilarity.EMBEDDING
+            and self.embedding_model is not None
+        ):
+            return await embedding_similarity(
+                self.embedding_model, self.question, condensed_question
+            )
+        return string_similarity(self.question, condensed_question)
+
+    async def resolve(self, condensed_question: str) -> Optional[list[Document]]:
+        """
+        Return the speculative documents if the condensed question is similar
+        enough to the user question, otherwise cancel the speculative retrieval.
+
+        Args:
+            condensed_question: The condensed question
+        Returns:
+            The speculative documents, or None on speculation miss.
+        """
+        try:
+            self.similarity = await self._similarity(condensed_question)
+        except Exception as exc:
+            logger.warning('Question similarity failed: %s', exc)
+            self.similarity = None
+
+        documents = None
+        if (
+            self.similarity is not None
+            and self.similarity
+            >= application_settings.rag_speculative_retrieval_threshold
+        ):
+            try:
+                documents = await self.task
+            except Exception as exc:
+                logger.warning('Speculative retrieval failed: %s', exc)
+        else:
+            self.task.cancel()
+
+        self.hit = documents is not None
+        metrics_registry.increment(
+            'rag.speculation.hits' if self.hit else 'rag.speculation.misses'
+        )
+        metrics_registry.set_gauge(
+            'rag.speculation.hit_rate', get_speculation_hit_rate()
+        )
+        logger.debug(
+            'Speculative retrieval %s (similarity: %s)',
+            'hit' if self.hit else 'miss',
+            self.similarity,
+        )
+        return documents
+
+    def to_debug_data(self) -> Optional[SpeculativeRetrievalDebugData]:
+        """Return the speculation outcome for the RAG debug data (None if unresolved)."""
+        if self.hit is None:
+            return None
+        return SpeculativeRetrievalDebugData(
+            hit=self.hit,
+            similarity=self.similarity,
+            hit_rate=get_speculation_hit_rate(),
+        )
+
+
+def get_speculation_hit_rate() -> float:
+    """Return the speculation hit rate since the application started."""
+    hits = metrics_registry.get_counter('rag.speculation.hits')
+    total = hits + metrics_registry.get_counter('rag.speculation.misses')
+    return hits / total if total else 0.0
+
+
+def build_speculative_retrieval_starter(
+    vector_retriever, embedding_model: Optional[Embeddings] = None
+):
+    """
+    Return the function starting the speculative retrieval of a RAG chain call.
+    It returns None when the speculative retrieval is disabled.
+    The RAG chain config (callbacks, tags, etc.) is forwarded to the retriever.
+
+    Args:
+        vector_retriever: The vector store retriever
+        embedding_model: The embedding model (used for the embedding similarity)
+    """
+
+    async def start_speculative_retrieval(
+        x: dict, config: Optional[RunnableConfig] = None
+    ) -> Optional[RetrievalSpeculation]:
+        if not application_settings.rag_speculative_retrieval_enabled:
+            return None
+
+        return RetrievalSpeculation(
+            question=x['question'],
+            task=asyncio.create_task(
+                vector_retriever.ainvoke(x['question'], config=config)
+            ),
+            embedding_model=embedding_model,
+        )
+
+    return start_speculative_retrieval
+
+
+async def retrieve_vector_documents(
+    vector_retriever, inputs: dict, condensed_question: str
+) -> list[Document]:
+    """
+    Return the documents of the vector retrieval: the speculative documents
+    on speculation hit, otherwise the documents retrieved for the condensed question.
+
+    Args:
+        vector_retriever: The vector store retriever
+        inputs: The retriever inputs, with the speculation (if any)
+        condensed_question: The condensed question
+    """
+    speculation = inputs.get('speculation')
+    if speculation is not None:
+        documents = await speculation.resolve(condensed_question)
+        if documents is not None:
+            return documents
+
+    return await vector_retriever.ainvoke(input=condensed_question)
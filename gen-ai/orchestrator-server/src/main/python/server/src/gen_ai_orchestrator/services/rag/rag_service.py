@@ -14,11 +14,53 @@
 #
 """Module for the RAG Service"""
 
+from typing import AsyncIterator
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.models.streaming.stream_event import StreamEvent
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.routers.responses.responses import RAGResponse
-from gen_ai_orchestrator.services.langchain.rag_chain import execute_rag_chain
+from gen_ai_orchestrator.services.langchain.rag_chain import (
+    execute_rag_chain,
+    stream_rag_chain,
+)
+from gen_ai_orchestrator.utils.hashing import stable_hash
+from gen_ai_orchestrator.utils.single_flight import SingleFlight
+
+rag_single_flight = SingleFlight('rag.coalescing')
 
 
 async def rag(request: RAGRequest, debug: bool) -> RAGResponse:
-    """Launch execution of the RAG chain"""
-    return await execute_rag_chain(request, debug)
+    """
+    Launch execution of the RAG chain.
+    Concurrent identical requests share the same execution (see rag_coalescing_enabled).
+    """
+    if not application_settings.rag_coalescing_enabled:
+        return await execute_rag_chain(request, debug)
+    return await rag_single_flight.do(
+        rag_request_key(request, debug), lambda: execute_rag_chain(request, debug)
+    )
+
+
+def rag_request_key(request: RAGRequest, debug: bool) -> str:
+    """
+    Compute the canonical hash of a RAG request, without its excluded fields
+    (see rag_coalescing_excluded_fields).
+    """
+    exclude = {}
+    for path in application_settings.rag_coalescing_excluded_fields:
+        *parents, field = path.split('.')
+        node = exclude
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[field] = True
+    return stable_hash(
+        {'request': request.model_dump(mode='json', exclude=exclude), 'debug': debug}
+    )
+
+
+def rag_stream(request: RAGRequest, debug: bool) -> AsyncIterator[StreamEvent]:
+    """Launch execution of the RAG chain in streaming mode"""
+    return stream_rag_chain(request, debug)
@@ -0,0 +1,167 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Secret Cache
+------------
+Process-wide cache of the secrets fetched from the secret managers.
+
+* Secrets are kept for a limited time (TTL) and refreshed in background
+  before they expire (refresh-ahead), so the secret managers stay out of the
+  request hot path.
+* Concurrent misses for the same secret share a single lookup (single-flight).
+* Async callers await the lookup, which runs in a thread pool, so the event
+  loop is never blocked.
+* Hits, misses, refreshes and coalesced lookups are counted in the metrics
+  registry (secret_cache.*).
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import RLock
+from typing import Callable, Hashable, Optional
+
+from cachetools import TTLCache
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+SecretLoader = Callable[[], Optional[str]]
+
+
+class SecretCache:
+    """A thread-safe TTL cache of secret values, with refresh-ahead and single-flight lookups."""
+
+    def __init__(
+        self, maxsize: int, ttl: int, refresh_ratio: float, max_workers: int
+    ):
+        self._refresh_after = ttl * refresh_ratio
+        # Entries are (secret value, fetch time)
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight: dict[Hashable, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='secret-cache'
+        )
+        self._lock = RLock()
+
+    def _lookup(self, key: Hashable, loader: SecretLoader) -> tuple[Future, bool]:
+        """
+        Return the future of the secret value and whether the caller owns the lookup.
+        A cached value is returned as a resolved future.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                value, fetched_at = entry
+                metrics_registry.increment('secret_cache.hits')
+                if time.monotonic() - fetched_at >= self._refresh_after:
+                    self._refresh(key, loader)
+                future = Future()
+                future.set_result(value)
+                return future, False
+
+            metrics_registry.increment('secret_cache.misses')
+            future = self._in_flight.get(key)
+            if future is not None:
+                metrics_registry.increment('secret_cache.coalesced')
+                return future, False
+
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def _load(self, key: Hashable, loader: SecretLoader, future: Future) -> None:
+        """Run the loader and resolve the in-flight future. None values are not cached."""
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(exc)
+            return
+
+        with self._lock:
+            if value is not None:
+                self._cache[key] = (value, time.monotonic())
+            self._in_flight.pop(key, None)
+        future.set_result(value)
+
+    def _refresh(self, key: Hashable, loader: SecretLoader) -> None:
+        """Reload the secret in background, unless a lookup is already in progress."""
+        if key in self._in_flight:
+            return
+
+        logger.debug('Secret cache refresh-ahead [key=%s]', key)
+        metrics_registry.increment('secret_cache.refreshes')
+        future = Future()
+        future.add_done_callback(self._log_refresh_error)
+        self._in_flight[key] = future
+        self._executor.submit(self._load, key, loader, future)
+
+    @staticmethod
+    def _log_refresh_error(future: Future) -> None:
+        if future.exception() is not None:
+            logger.warning(
+                'Secret refresh failed, the cached value is kept until its expiry: %s',
+                future.exception(),
+            )
+
+    def get(self, key: Hashable, loader: SecretLoader) -> Optional[str]:
+        """
+        Return the cached secret value, or load it in the calling thread.
+
+        Args:
+            key: The secret cache key
+            loader: The (blocking) function fetching the secret value
+        """
+        future, owner = self._lookup(key, loader)
+        if owner:
+            self._load(key, loader, future)
+        return future.result()
+
+    async def aget(self, key: Hashable, loader: SecretLoader) -> Optional[str]:
+        """
+        Return the cached secret value, or load it in the thread pool without blocking the event loop.
+
+        Args:
+            key: The secret cache key
+            loader: The (blocking) function fetching the secret value
+        """
+        future, owner = self._lookup(key, loader)
+        if owner:
+            self._executor.submit(self._load, key, loader, future)
+        return await asyncio.wrap_future(future)
+
+    def clear(self) -> None:
+        """Remove all the cached secrets."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+secret_cache = SecretCache(
+    maxsize=application_settings.secret_cache_max_size,
+    ttl=application_settings.secret_cache_ttl,
+    refresh_ratio=application_settings.secret_cache_refresh_ratio,
+    max_workers=application_settings.secret_cache_max_workers,
+)
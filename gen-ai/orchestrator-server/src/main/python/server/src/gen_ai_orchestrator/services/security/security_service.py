@@ -14,8 +14,12 @@
 #
 """Module for the Security Service"""
 
+import asyncio
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from pydantic import BaseModel
 
 from gen_ai_orchestrator.models.security.aws_secret_key.aws_secret_key import (
     AwsSecretKey,
@@ -27,6 +31,7 @@ from gen_ai_orchestrator.models.security.raw_secret_key.raw_secret_key import (
     RawSecretKey,
 )
 from gen_ai_orchestrator.models.security.security_types import SecretKey
+from gen_ai_orchestrator.services.security.secret_cache import secret_cache
 from gen_ai_orchestrator.utils.aws.aws_secrets_manager_client import (
     AWSSecretsManagerClient,
 )
@@ -37,29 +42,108 @@ from gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_aws_secrets_manager_client() -> AWSSecretsManagerClient:
+    """Return the AWS Secrets Manager client, created once and reused."""
+    return AWSSecretsManagerClient()
+
+
+@lru_cache(maxsize=1)
+def get_gcp_secret_manager_client() -> GCPSecretManagerClient:
+    """Return the GCP Secret Manager client, created once and reused."""
+    return GCPSecretManagerClient()
+
+
+def _load_aws_secret(secret_name: str) -> Optional[str]:
+    aws_secret = get_aws_secrets_manager_client().get_ai_provider_secret(secret_name)
+    return aws_secret.secret if aws_secret is not None else None
+
+
+def _load_gcp_secret(secret_name: str) -> Optional[str]:
+    gcp_secret = get_gcp_secret_manager_client().get_ai_provider_secret(secret_name)
+    return gcp_secret.secret if gcp_secret is not None else None
+
+
+def _secret_lookup(secret_key: SecretKey):
+    """Return the secret cache key and loader of a secret manager key (None for other keys)."""
+    if isinstance(secret_key, AwsSecretKey):
+        # Get secret from AWS Secrets Manager
+        return (secret_key.type, secret_key.secret_name), lambda: _load_aws_secret(
+            secret_key.secret_name
+        )
+    if isinstance(secret_key, GcpSecretKey):
+        # Get secret from GCP Secret Manager
+        return (secret_key.type, secret_key.secret_name), lambda: _load_gcp_secret(
+            secret_key.secret_name
+        )
+    return None
+
+
 def fetch_secret_key_value(secret_key: SecretKey) -> Optional[str]:
     """
     Fetch the value of the given secret key.
+    Secrets stored in a secret manager are served from the secret cache.
 
     Args:
         secret_key: The secret key
     """
-    secret_value = None
     if isinstance(secret_key, RawSecretKey):
-        secret_value = secret_key.secret
-    elif isinstance(secret_key, AwsSecretKey):
-        # Get secret from AWS Secrets Manager
-        aws_secret = AWSSecretsManagerClient().get_ai_provider_secret(
-            secret_key.secret_name
-        )
-        if aws_secret is not None:
-            secret_value = aws_secret.secret
-    elif isinstance(secret_key, GcpSecretKey):
-        # Get secret from GCP Secret Manager
-        gcp_secret = GCPSecretManagerClient().get_ai_provider_secret(
-            secret_key.secret_name
-        )
-        if gcp_secret is not None:
-            secret_value = gcp_secret.secret
+        return secret_key.secret
+
+    lookup = _secret_lookup(secret_key)
+    if lookup is None:
+        return None
+    return secret_cache.get(*lookup)
+
+
+async def afetch_secret_key_value(secret_key: SecretKey) -> Optional[str]:
+    """
+    Fetch the value of the given secret key without blocking the event loop.
+    Secrets stored in a secret manager are served from the secret cache.
+
+    Args:
+        secret_key: The secret key
+    """
+    if isinstance(secret_key, RawSecretKey):
+        return secret_key.secret
+
+    lookup = _secret_lookup(secret_key)
+    if lookup is None:
+        return None
+    return await secret_cache.aget(*lookup)
+
+
+def find_secret_keys(model: BaseModel) -> list[SecretKey]:
+    """Return the secret keys found in the given model and in its nested models."""
+    secret_keys = []
+    for field_name in type(model).model_fields:
+        value = getattr(model, field_name)
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if isinstance(item, (AwsSecretKey, GcpSecretKey, RawSecretKey)):
+                secret_keys.append(item)
+            elif isinstance(item, BaseModel):
+                secret_keys.extend(find_secret_keys(item))
+    return secret_keys
+
+
+async def prefetch_secret_key_values(secret_keys: Iterable[SecretKey]) -> None:
+    """
+    Load the given secrets into the secret cache without blocking the event loop,
+    so that the following fetch_secret_key_value calls are cache hits.
+    Errors are left to the caller of fetch_secret_key_value.
+
+    Args:
+        secret_keys: The secret keys
+    """
+    await asyncio.gather(
+        *(afetch_secret_key_value(secret_key) for secret_key in secret_keys),
+        return_exceptions=True,
+    )
+
 
-    return secret_value
+def clear_secret_cache() -> None:
+    """Remove the cached secrets and the secret manager clients."""
+    secret_cache.clear()
+    get_aws_secrets_manager_client.cache_clear()
+    get_gcp_secret_manager_client.cache_clear()
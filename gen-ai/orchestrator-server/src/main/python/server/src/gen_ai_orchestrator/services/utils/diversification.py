@@ -0,0 +1,136 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the document diversification (NumPy vectorized):
+near-duplicate detection (word shingles and MinHash), and maximal marginal
+relevance (MMR) selection.
+"""
+
+import zlib
+from typing import Sequence
+
+import numpy as np
+
+# Number of words of a shingle
+SHINGLE_SIZE = 3
+# Number of hash functions of the MinHash signatures
+NUM_PERMUTATIONS = 64
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+
+# The hash functions (a * x + b) mod p, with fixed coefficients so that the
+# signatures are stable across processes
+_random = np.random.RandomState(seed=1)
+_A = _random.randint(1, 1 << 32, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _random.randint(0, 1 << 32, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def get_shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Return the word shingles of a text (lowercased, whitespaces collapsed)."""
+    words = text.lower().split()
+    if len(words) <= size:
+        return {' '.join(words)}
+    return {' '.join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signatures(texts: Sequence[str]) -> np.ndarray:
+    """
+    Compute the MinHash signatures of the texts.
+
+    Returns:
+        A (texts, NUM_PERMUTATIONS) array: the fraction of equal values of two
+        signatures estimates the Jaccard similarity of their shingles.
+    """
+    signatures = np.empty((len(texts), NUM_PERMUTATIONS), dtype=np.uint64)
+    for i, text in enumerate(texts):
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in get_shingles(text)),
+            dtype=np.uint64,
+        )
+        # uint64 products wrap around, which is fine for hashing
+        signatures[i] = (
+            (np.outer(hashes, _A) + _B) % MERSENNE_PRIME
+        ).min(axis=0)
+    return signatures
+
+
+def find_near_duplicates(texts: Sequence[str], threshold: float) -> list[int]:
+    """
+    Find the near-duplicates of a ranked list of texts.
+
+    Args:
+        texts: The texts, best ranked first
+        threshold: The estimated Jaccard similarity from which two texts are near-duplicates
+
+    Returns:
+        The indexes of the texts to keep: the texts that are not a near-duplicate
+        of a better ranked text, in rank order.
+    """
+    if len(texts) < 2:
+        return list(range(len(texts)))
+
+    signatures = minhash_signatures(texts)
+    kept: list[int] = []
+    for i in range(len(texts)):
+        if kept:
+            similarities = (signatures[kept] == signatures[i]).mean(axis=1)
+            if similarities.max() >= threshold:
+                continue
+        kept.append(i)
+    return kept
+
+
+def mmr_select(
+    query_embedding: Sequence[float],
+    embeddings: Sequence[Sequence[float]],
+    k: int,
+    lambda_mult: float = 0.5,
+) -> list[int]:
+    """
+    Select the embeddings by maximal marginal relevance: each step selects the
+    embedding maximizing lambda_mult * relevance - (1 - lambda_mult) * redundancy,
+    the relevance being its cosine similarity with the query, and the redundancy
+    its highest cosine similarity with the embeddings already selected.
+
+    Args:
+        query_embedding: The query embedding
+        embeddings: The candidate embeddings
+        k: The number of embeddings to select
+        lambda_mult: The trade-off between relevance (1) and diversity (0)
+
+    Returns:
+        The indexes of the selected embeddings, in selection order.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if not len(vectors) or k <= 0:
+        return []
+
+    vectors = vectors / np.maximum(
+        np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12
+    )
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+    relevance = vectors @ query
+    similarities = vectors @ vectors.T
+
+    selected = [int(np.argmax(relevance))]
+    redundancy = similarities[selected[0]].copy()
+    while len(selected) < min(k, len(vectors)):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        np.maximum(redundancy, similarities[best], out=redundancy)
+    return selected
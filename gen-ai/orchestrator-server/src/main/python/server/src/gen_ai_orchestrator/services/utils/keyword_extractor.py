@@ -0,0 +1,78 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Module for the local keyword extractor (no LLM call)"""
+
+import re
+from typing import Optional
+
+from gen_ai_orchestrator.services.utils.stop_words import (
+    ALL_STOP_WORDS,
+    LOCALE_ALIASES,
+    STOP_WORDS,
+)
+
+# Words made of letters and digits, possibly joined by hyphens or apostrophes (e.g. "e-mail")
+WORD_PATTERN = re.compile(r"[^\W_]+(?:[-'’][^\W_]+)*")
+# French and Italian elisions ("l'", "d'", "qu'", "dell'"...) and English contractions ("'s", "n't"...)
+ELISION_PATTERN = re.compile(
+    r"^(?:[cdjlmnst]|qu|jusqu|lorsqu|puisqu|dell|nell|all|dall|sull)['’]"
+)
+CONTRACTION_PATTERN = re.compile(r"['’](?:s|t|d|ll|re|ve|m)$")
+
+
+def get_stop_words(locale: Optional[str]) -> frozenset[str]:
+    """
+    Return the stop words of the given locale.
+
+    Args:
+        locale: An ISO language code ('fr', 'fr_FR', 'fr-FR') or a language name ('French')
+    Returns:
+        The stop words of the locale, or the stop words of all the supported
+        languages when the locale is unknown.
+    """
+    if not locale:
+        return ALL_STOP_WORDS
+
+    normalized_locale = locale.strip().lower()
+    language = LOCALE_ALIASES.get(
+        normalized_locale,
+        LOCALE_ALIASES.get(re.split(r'[-_]', normalized_locale)[0]),
+    )
+    return STOP_WORDS.get(language, ALL_STOP_WORDS)
+
+
+def extract_keywords(
+    text: str, locale: Optional[str] = None, max_keywords: int = 10
+) -> list[str]:
+    """
+    Extract the keywords of a text: its words, without stop words, elisions,
+    contractions, duplicates and single characters, in their order of appearance.
+
+    Args:
+        text: The text (typically the user question)
+        locale: The text language (see get_stop_words)
+        max_keywords: The maximum number of keywords
+    """
+    stop_words = get_stop_words(locale)
+    keywords = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        word = CONTRACTION_PATTERN.sub('', ELISION_PATTERN.sub('', word))
+        if len(word) < 2 or word in stop_words or word in keywords:
+            continue
+        keywords.append(word)
+        if len(keywords) == max_keywords:
+            break
+
+    return keywords
@@ -0,0 +1,44 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Module for the inspection of the document search filters"""
+
+from typing import Any, Optional
+
+
+def find_index_session_id(search_filter: Any) -> Optional[str]:
+    """
+    Return the index session id of a document search filter, if any.
+    OpenSearch term filters ({'term': {'metadata.index_session_id.keyword': ...}})
+    and PGVector metadata filters ({'index_session_id': ...} or
+    {'index_session_id': {'$eq': ...}}) are supported.
+    """
+    if isinstance(search_filter, list):
+        for item in search_filter:
+            index_session_id = find_index_session_id(item)
+            if index_session_id is not None:
+                return index_session_id
+
+    elif isinstance(search_filter, dict):
+        for key, value in search_filter.items():
+            if 'index_session_id' in key.split('.'):
+                if isinstance(value, dict):
+                    value = value.get('$eq')
+                if isinstance(value, str):
+                    return value
+            index_session_id = find_index_session_id(value)
+            if index_session_id is not None:
+                return index_session_id
+
+    return None
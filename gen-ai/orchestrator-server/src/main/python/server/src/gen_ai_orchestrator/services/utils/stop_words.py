@@ -0,0 +1,106 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Stop words per language, used by the local keyword extractor"""
+
+STOP_WORDS: dict[str, frozenset[str]] = {
+    'fr': frozenset(
+        """
+        a à afin ai aie aient ainsi ait alors as au aucun aucune auquel aura aurai
+        auraient aurais aurait auront aussi autre autres aux auxquelles auxquels
+        avaient avais avait avant avec avez aviez avoir avons bon c ça car ce ceci
+        cela celle celles celui cependant certain certains ces cet cette ceux chaque
+        chez ci combien comme comment d dans de des donc dont du elle elles en encore
+        est et étaient étais était été êtes être eu eux faire fait faut ici il ils
+        j je jusqu l la là le lequel les lesquelles lesquels leur leurs lors lui m
+        ma mais me même mes moi mon n ne ni non nos notre nous on ont ou où par
+        parce pas peu peut peuvent peux plus pour pourquoi puis puisque qu quand que
+        quel quelle quelles quels qui quoi s sa sans se sera serai seraient serais
+        serait seront ses si sien soi soit sommes son sont sous suis sur t ta te tes
+        toi ton tous tout toute toutes très tu un une vers vos votre vous y
+        """.split()
+    ),
+    'en': frozenset(
+        """
+        a about above after again against all am an and any are aren as at be
+        because been before being below between both but by can cannot could d did
+        didn do does doesn doing don down during each few for from further had
+        hadn has hasn have haven having he her here hers herself him himself his
+        how i if in into is isn it its itself just ll m me more most my myself no
+        nor not now of off on once only or other our ours ourselves out over own
+        re s same she should so some such t than that the their theirs them
+        themselves then there these they this those through to too under until up
+        ve very was wasn we were weren what when where which while who whom why
+        will with won would you your yours yourself yourselves
+        """.split()
+    ),
+    'de': frozenset(
+        """
+        aber alle allem allen aller alles als also am an ander andere anderem
+        anderen anderer anderes auch auf aus bei bin bis bist da damit dann das
+        dass dein deine dem den der des dich die dies diese diesem diesen dieser
+        dieses dir doch dort du durch ein eine einem einen einer eines er es etwas
+        euch euer für hab habe haben hat hatte hier hin ich ihm ihn ihnen ihr ihre
+        im in ist ja jede jedem jeden jeder jedes kann kein keine man mein meine
+        mich mir mit muss nach nicht nichts noch nun nur ob oder ohne sehr sein
+        seine sich sie sind so solche soll sondern über um und uns unser unter
+        vom von vor war waren was weil welche wenn wer wie wieder will wir wird
+        wo wollen zu zum zur
+        """.split()
+    ),
+    'es': frozenset(
+        """
+        a al algo algunas algunos ante antes como con contra cual cuando de del
+        desde donde durante e el él ella ellas ellos en entre era es esa esas ese
+        eso esos esta está están estas este esto estos fue fueron ha han hasta
+        hay la las le les lo los más me mi mis mucho muy nada ni no nos nosotros
+        o otra otro para pero poco por porque qué que quien se sea ser si sí
+        sin sobre son su sus también te tiene tu tus un una uno unos y ya yo
+        """.split()
+    ),
+    'it': frozenset(
+        """
+        a ad al alla alle anche che chi ci come con cosa da dal dalla dei del
+        della delle di dove e è gli ha hanno ho i il in io la le lei li lo loro
+        lui ma mi mia mio ne negli nei nel nella noi non o per perché più quale
+        quando quella quello questa questo se si sono su sua suo sul sulla ti tra
+        tu un una uno voi
+        """.split()
+    ),
+}
+
+# Locale aliases: ISO codes, English and native language names
+LOCALE_ALIASES: dict[str, str] = {
+    'fr': 'fr',
+    'french': 'fr',
+    'français': 'fr',
+    'francais': 'fr',
+    'en': 'en',
+    'english': 'en',
+    'anglais': 'en',
+    'de': 'de',
+    'german': 'de',
+    'deutsch': 'de',
+    'allemand': 'de',
+    'es': 'es',
+    'spanish': 'es',
+    'español': 'es',
+    'espagnol': 'es',
+    'it': 'it',
+    'italian': 'it',
+    'italiano': 'it',
+    'italien': 'it',
+}
+
+ALL_STOP_WORDS: frozenset[str] = frozenset().union(*STOP_WORDS.values())
@@ -0,0 +1,51 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Evicting cache utility module.
+A TTL cache notifying the items it evicts (expired, least recently used, or
+replaced), so that the resources they hold (clients, connection pools) can be
+released instead of being left to the garbage collector.
+"""
+
+from typing import Any, Callable, Hashable
+
+from cachetools import TTLCache
+
+
+class EvictingTTLCache(TTLCache):
+    """A TTLCache calling on_evict(key, value) for each item it evicts."""
+
+    def __init__(
+        self, maxsize: int, ttl: float, on_evict: Callable[[Hashable, Any], None]
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.on_evict = on_evict
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, value in expired:
+            self.on_evict(key, value)
+        return expired
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.on_evict(key, value)
+        return key, value
+
+    def evict(self, key: Hashable) -> None:
+        """Remove an item, and notify its eviction."""
+        value = self.pop(key, None)
+        if value is not None:
+            self.on_evict(key, value)
@@ -0,0 +1,42 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Hashing utility module"""
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def stable_hash(payload: Any) -> str:
+    """
+    Compute a stable SHA-256 hex digest of a JSON serializable payload.
+    Dict keys are sorted, so the digest does not depend on their order.
+    It is used to build cache keys from settings that may hold secrets.
+    """
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+
+
+def hash_setting(setting: BaseModel) -> str:
+    """Compute a stable hash of a provider setting, including its type."""
+    return stable_hash(
+        {
+            'type': type(setting).__qualname__,
+            'setting': setting.model_dump(mode='json'),
+        }
+    )
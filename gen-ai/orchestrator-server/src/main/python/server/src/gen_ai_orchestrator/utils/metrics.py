@@ -0,0 +1,90 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+In-process metrics module.
+Counters, gauges and timings are kept in memory and exposed by the
+application monitors router (see /metrics).
+"""
+
+from threading import Lock
+from typing import Any
+
+
+class MetricsRegistry:
+    """A thread-safe registry of named counters, gauges and timings."""
+
+    def __init__(self):
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, dict[str, float]] = {}
+        self._lock = Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increment the counter with the given name."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of the gauge with the given name."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a duration (or any sampled value) for the timing with the given name."""
+        with self._lock:
+            timing = self._timings.setdefault(
+                name, {'count': 0, 'sum': 0.0, 'max': 0.0}
+            )
+            timing['count'] += 1
+            timing['sum'] += value
+            timing['max'] = max(timing['max'], value)
+
+    def get_counter(self, name: str) -> float:
+        """Return the value of the counter with the given name (0 if unknown)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def ratio(self, numerator: str, denominator: str) -> float:
+        """Return the ratio between two counters (0 if the denominator is 0)."""
+        with self._lock:
+            total = self._counters.get(denominator, 0)
+            return self._counters.get(numerator, 0) / total if total else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of all the metrics."""
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges),
+                'timings': {
+                    name: {
+                        **timing,
+                        'mean': timing['sum'] / timing['count']
+                        if timing['count']
+                        else 0.0,
+                    }
+                    for name, timing in self._timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Reset all the metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,85 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Single-flight utility module.
+Concurrent calls sharing the same key are coalesced: the first one runs, the
+others await its result (or its exception). The call keeps running as long as
+one of its callers waits for it, and is cancelled once all of them are gone.
+Calls and coalesced calls are counted in the metrics registry, with their ratio.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Coalesce the concurrent calls sharing the same key (event loop only)."""
+
+    def __init__(self, metrics_prefix: str):
+        """
+        Args:
+            metrics_prefix: The prefix of the metrics (e.g. 'rag.coalescing')
+        """
+        self.metrics_prefix = metrics_prefix
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._waiters: dict[Hashable, int] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the call, or wait for the same call already in flight.
+
+        Args:
+            key: The key of the call
+            call: The coroutine function to run when no call is in flight
+        """
+        metrics_registry.increment(f"{self.metrics_prefix}.calls")
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._tasks[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            metrics_registry.increment(f"{self.metrics_prefix}.coalesced")
+        metrics_registry.set_gauge(
+            f"{self.metrics_prefix}.ratio",
+            metrics_registry.ratio(
+                f"{self.metrics_prefix}.coalesced", f"{self.metrics_prefix}.calls"
+            ),
+        )
+
+        self._waiters[key] += 1
+        try:
+            # Shielded: a cancelled caller does not cancel the others
+            return await asyncio.shield(task)
+        finally:
+            if self._tasks.get(key) is task:
+                self._waiters[key] -= 1
+                if not self._waiters[key] and not task.done():
+                    # Forgotten first: a call being cancelled is not reused
+                    self._forget(key, task)
+                    task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            del self._waiters[key]
+
+    def __len__(self) -> int:
+        return len(self._tasks)
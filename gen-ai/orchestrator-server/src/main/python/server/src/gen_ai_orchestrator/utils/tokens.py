@@ -0,0 +1,68 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Token counting utility module.
+Tokens are counted with the tiktoken encoding of the model (o200k_base for
+unknown models). When the encoding is not available (e.g. it cannot be
+downloaded), they are estimated from the text length.
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import Optional
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = 'o200k_base'
+# Rough average for the estimation fallback
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=32)
+def get_encoding(model: Optional[str] = None) -> Optional[tiktoken.Encoding]:
+    """Return the tiktoken encoding of the model, or None if it is not available."""
+    try:
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as exc:
+        logger.warning(
+            'The tiktoken encoding is not available, tokens are estimated from the text length: %s',
+            exc,
+        )
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens of a text.
+
+    Args:
+        text: The text
+        model: The model name, to select its encoding
+    """
+    if not text:
+        return 0
+
+    encoding = get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
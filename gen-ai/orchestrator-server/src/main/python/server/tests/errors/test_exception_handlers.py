@@ -195,3 +195,35 @@ async def test_opensearch_exception_handler_transport_error():
 
     with pytest.raises(GenAIOpenSearchTransportException):
         await decorated_function()
+
+
+@pytest.mark.asyncio
+async def test_openai_exception_handler_streaming_context_len_error():
+    @openai_exception_handler(provider='OpenAI or AzureOpenAIService')
+    async def decorated_generator(*args, **kwargs):
+        yield 'first chunk'
+        raise BadRequestError(
+            message='error',
+            response=_response,
+            body={'code': 'context_length_exceeded'},
+        )
+
+    chunks = []
+    with pytest.raises(AIProviderAPIContextLengthExceededException):
+        async for chunk in decorated_generator():
+            chunks.append(chunk)
+    assert chunks == ['first chunk']
+
+
+@pytest.mark.asyncio
+async def test_opensearch_exception_handler_streaming_index_not_found_error():
+    @opensearch_exception_handler
+    async def decorated_generator(*args, **kwargs):
+        yield 'first chunk'
+        raise OpenSearchNotFoundError('400', 'index_not_found_exception')
+
+    chunks = []
+    with pytest.raises(GenAIOpenSearchIndexNotFoundException):
+        async for chunk in decorated_generator():
+            chunks.append(chunk)
+    assert chunks == ['first chunk']
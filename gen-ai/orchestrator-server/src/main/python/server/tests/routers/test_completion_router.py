@@ -12,6 +12,8 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import json
+
 from fastapi.testclient import TestClient
 
 from gen_ai_orchestrator.main import app
@@ -111,3 +113,71 @@ def test_generate():
         'answer': 'Hi! Im a fake LLM',
         'observability_info': None,
     }
+
+
+def test_generate_stream():
+    response = client.post(
+        '/completion/stream',
+        json={
+            'llm_setting': {
+                'provider': 'FakeLLM',
+                'api_key': {
+                    'type': 'Raw',
+                    'secret': 'ab7***************************A1IV4B',
+                },
+                'model': 'dddddd',
+                'temperature': '0.0',
+                'responses': ['Hi! Im a fake LLM'],
+            },
+            'prompt': {
+                'formatter': 'jinja2',
+                'template': '',
+                'inputs': {},
+            },
+            'observability_setting': None,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+    events = [
+        (block.split('\n')[0], json.loads(block.split('\n')[1].removeprefix('data: ')))
+        for block in response.text.strip().split('\n\n')
+    ]
+    assert events[-1] == (
+        'event: response',
+        {'answer': 'Hi! Im a fake LLM', 'observability_info': None},
+    )
+    assert ''.join(data['text'] for _, data in events[:-1]) == 'Hi! Im a fake LLM'
+    assert {event for event, _ in events[:-1]} == {'event: answer_delta'}
+
+
+def test_generate_stream_template_error():
+    response = client.post(
+        '/completion/stream',
+        json={
+            'llm_setting': {
+                'provider': 'FakeLLM',
+                'api_key': {
+                    'type': 'Raw',
+                    'secret': 'ab7***************************A1IV4B',
+                },
+                'model': 'dddddd',
+                'temperature': '0.0',
+                'responses': ['Hi! Im a fake LLM'],
+            },
+            'prompt': {
+                'formatter': 'jinja2',
+                'template': '{% if %}',
+                'inputs': {},
+            },
+        },
+    )
+
+    assert response.status_code == 200
+    event, data = response.text.strip().split('\n')[:2]
+    assert event == 'event: error'
+    assert (
+        json.loads(data.removeprefix('data: '))['code']
+        == ErrorCode.GEN_AI_PROMPT_TEMPLATE_ERROR.value
+    )
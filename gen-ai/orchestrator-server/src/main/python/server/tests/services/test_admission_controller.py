@@ -0,0 +1,129 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIQueueTimeoutException,
+    GenAITooManyRequestsException,
+)
+from gen_ai_orchestrator.main import app
+from gen_ai_orchestrator.models.errors.errors_models import ErrorCode
+from gen_ai_orchestrator.services.admission.admission_controller import (
+    AdaptiveConcurrencyLimiter,
+    admission_controller,
+)
+
+
+def _limiter(**kwargs) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        **{
+            'name': 'test',
+            'initial_limit': 1,
+            'min_limit': 1,
+            'max_limit': 10,
+            'latency_tolerance': 2.0,
+            'backoff_ratio': 0.5,
+            'max_queue_size': 2,
+            'queue_timeout': 5,
+            **kwargs,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_admitted_in_arrival_order():
+    limiter = _limiter()
+    await limiter.acquire()
+    admitted = []
+
+    async def request(name: str):
+        await limiter.acquire()
+        admitted.append(name)
+
+    first = asyncio.create_task(request('first'))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(request('second'))
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+
+    # The queue is full: rejected right away
+    with pytest.raises(GenAITooManyRequestsException) as exc_info:
+        await limiter.acquire()
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after >= 1
+
+    limiter.release(0.1)
+    await first
+    assert admitted == ['first']
+    limiter.release(0.1)
+    await second
+    assert admitted == ['first', 'second']
+    assert (limiter.in_flight, limiter.queued) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_queued_request_is_rejected_at_its_deadline():
+    limiter = _limiter(queue_timeout=0.01)
+    await limiter.acquire()
+
+    with pytest.raises(GenAIQueueTimeoutException) as exc_info:
+        await limiter.acquire()
+
+    assert exc_info.value.status_code == 503
+    assert (limiter.in_flight, limiter.queued) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_limit_increases_with_fast_responses_and_decreases_with_slow_ones():
+    limiter = _limiter(initial_limit=4)
+    for _ in range(8):
+        await limiter.acquire()
+        limiter.release(1.0)
+    # Never more than 1 request in flight: the limit of 4 is not used
+    assert limiter.limit == 4
+
+    for _ in range(8):
+        for _ in range(int(limiter.limit)):
+            await limiter.acquire()
+        for _ in range(int(limiter.limit)):
+            limiter.release(1.0)
+    assert limiter.limit > 5
+
+    limit = limiter.limit
+    await limiter.acquire()
+    limiter.release(10.0)
+    assert limiter.limit == limit / 2
+    # Not decreased again before the previous decrease takes effect
+    await limiter.acquire()
+    limiter.release(10.0)
+    assert limiter.limit == limit / 2
+
+
+def test_saturated_router_responds_with_retry_after():
+    admission_controller.clear()
+    limiter = admission_controller.get_limiter('completion')
+    limiter.max_queue_size = 0
+    limiter.in_flight = int(limiter.limit)
+    try:
+        response = TestClient(app).post('/completion/', json={})
+    finally:
+        admission_controller.clear()
+
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert response.json()['code'] == ErrorCode.GEN_AI_TOO_MANY_REQUESTS.value
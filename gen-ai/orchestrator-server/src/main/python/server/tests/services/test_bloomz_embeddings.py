@@ -0,0 +1,128 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+import json
+from unittest.mock import ANY, patch
+
+import httpx
+import pytest
+
+from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions import (
+    AIProviderAPIErrorException,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding import (
+    BloomzEmbeddings,
+)
+
+REGISTRY = (
+    'gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.'
+    'provider_client_registry'
+)
+
+
+def _embeddings(**kwargs) -> BloomzEmbeddings:
+    return BloomzEmbeddings(
+        pooling='last', api_base='http://bloomz.example.com', retry_backoff=0, **kwargs
+    )
+
+
+def _embed(request: httpx.Request) -> httpx.Response:
+    """Embed each text as [its length]."""
+    texts = json.loads(request.content)['text']
+    return httpx.Response(200, json={'embedding': [[len(text)] for text in texts]})
+
+
+@pytest.mark.asyncio
+async def test_aembed_documents_sends_concurrent_sub_batches():
+    batch_sizes = []
+    running, max_running = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        batch_sizes.append(len(json.loads(request.content)['text']))
+        return _embed(request)
+
+    texts = ['a' * i for i in range(1, 11)]
+    with patch(
+        f"{REGISTRY}.get_async_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ) as mocked_get_async_client:
+        embeddings = await _embeddings(
+            batch_size=3, max_concurrency=2
+        ).aembed_documents(texts)
+
+    mocked_get_async_client.assert_called_once_with(
+        'http://bloomz.example.com', ANY, verify=False
+    )
+    assert embeddings == [[i] for i in range(1, 11)]
+    assert sorted(batch_sizes) == [1, 3, 3, 3]
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_aembed_query_retries_the_failed_requests():
+    responses = iter(
+        [httpx.Response(503, text='Overloaded'), httpx.ConnectError('Refused')]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses, None)
+        if isinstance(response, Exception):
+            raise response
+        return response or _embed(request)
+
+    with patch(
+        f"{REGISTRY}.get_async_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ):
+        assert await _embeddings(max_retries=2).aembed_query('hello') == [5]
+
+
+@pytest.mark.asyncio
+async def test_aembed_query_raises_once_the_retries_are_exhausted():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(400 if calls > 2 else 503, text='Error')
+
+    with patch(
+        f"{REGISTRY}.get_async_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ):
+        with pytest.raises(AIProviderAPIErrorException):
+            await _embeddings(max_retries=1).aembed_query('hello')
+        assert calls == 2
+
+        # Client errors are not retried
+        with pytest.raises(AIProviderAPIErrorException):
+            await _embeddings(max_retries=1).aembed_query('hello')
+        assert calls == 3
+
+
+def test_embed_documents_sends_sub_batches():
+    with patch(
+        f"{REGISTRY}.get_sync_transport", return_value=httpx.MockTransport(_embed)
+    ):
+        embeddings = _embeddings(batch_size=4).embed_documents(
+            ['a' * i for i in range(1, 11)]
+        )
+
+    assert embeddings == [[i] for i in range(1, 11)]
@@ -0,0 +1,62 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from gen_ai_orchestrator.services.utils.diversification import (
+    find_near_duplicates,
+    get_shingles,
+    minhash_signatures,
+    mmr_select,
+)
+
+FAQ = (
+    'To reset your password, open the settings page of your account, click on '
+    'the reset password button, then follow the link sent to your e-mail address.'
+)
+
+
+def test_get_shingles():
+    assert get_shingles('One  two Three four') == {'one two three', 'two three four'}
+    assert get_shingles('Too short') == {'too short'}
+
+
+def test_minhash_signatures_estimate_the_jaccard_similarity():
+    signatures = minhash_signatures([FAQ, FAQ.upper(), 'Opening hours: 9 to 18.'])
+
+    assert (signatures[0] == signatures[1]).all()
+    assert (signatures[0] == signatures[2]).mean() < 0.1
+
+
+def test_near_duplicates_are_collapsed_into_the_best_ranked_text():
+    texts = [
+        'Opening hours of the agencies: from 9 to 18, from Monday to Friday.',
+        FAQ,
+        FAQ.replace('your e-mail address', 'your mailbox'),
+        FAQ,
+    ]
+
+    assert find_near_duplicates(texts, threshold=0.7) == [0, 1]
+    assert find_near_duplicates(texts, threshold=1) == [0, 1, 2]
+    assert find_near_duplicates(texts[:1], threshold=0.7) == [0]
+
+
+def test_mmr_select_trades_relevance_for_diversity():
+    query = [1.0, 0.0]
+    embeddings = [[0.9, 0.1], [0.9, 0.12], [0.6, -0.5]]
+
+    # Relevance only
+    assert mmr_select(query, embeddings, k=2, lambda_mult=1) == [0, 1]
+    # The second most relevant is almost identical to the first one
+    assert mmr_select(query, embeddings, k=2, lambda_mult=0.5) == [0, 2]
+    assert mmr_select(query, embeddings, k=5) == [0, 2, 1]
+    assert mmr_select(query, [], k=2) == []
@@ -0,0 +1,139 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    LLMRateLimitBudget,
+)
+from gen_ai_orchestrator.models.llm.azureopenai.azure_openai_llm_setting import (
+    AzureOpenAILLMSetting,
+)
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_llm_factory,
+)
+from gen_ai_orchestrator.services.langchain.factories.llm.rate_limiter_registry import (
+    ProviderRateLimiter,
+    RateLimiterRegistry,
+)
+from gen_ai_orchestrator.services.langchain.impls.llm.rate_limited_chat_models import (
+    RateLimitedChatOpenAI,
+)
+
+
+def _azure_setting(deployment_name: str, secret: str = 'ab7***A1IV4B'):
+    return AzureOpenAILLMSetting(
+        provider='AzureOpenAIService',
+        api_key={'type': 'Raw', 'secret': secret},
+        deployment_name=deployment_name,
+        api_base='https://doc.tock.ai/tock',
+        api_version='2024-02-01',
+        temperature=0,
+    )
+
+
+def test_requests_are_served_in_arrival_order():
+    # 2 requests per minute: one every 30 seconds once the bucket is empty
+    limiter = ProviderRateLimiter('test', requests_per_minute=2, tokens_per_minute=0)
+
+    wait_times = [limiter.reserve() for _ in range(4)]
+
+    assert wait_times[:2] == [0, 0]
+    assert wait_times[2] == pytest.approx(30, abs=0.1)
+    assert wait_times[3] == pytest.approx(60, abs=0.1)
+
+
+def test_tokens_budget():
+    limiter = ProviderRateLimiter('test', requests_per_minute=0, tokens_per_minute=600)
+
+    assert limiter.reserve(tokens=500) == 0
+    # Not available now: nothing is reserved when not blocking
+    assert limiter.reserve(tokens=300, blocking=False) is None
+    assert limiter.reserve(tokens=100, blocking=False) == 0
+    # More than the whole budget: it waits for a full bucket
+    assert limiter.reserve(tokens=1000) == pytest.approx(60, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calls_give_back_their_reservation():
+    limiter = ProviderRateLimiter('test', requests_per_minute=1, tokens_per_minute=0)
+    await limiter.aacquire()
+
+    waiting_call = asyncio.create_task(limiter.aacquire())
+    await asyncio.sleep(0)
+    waiting_call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_call
+
+    assert limiter.reserve() == pytest.approx(60, abs=0.1)
+
+
+def test_limiters_are_shared_per_deployment():
+    first = get_llm_factory(_azure_setting('deployment-a')).get_language_model()
+    other_key = get_llm_factory(
+        _azure_setting('deployment-a', 'other')
+    ).get_language_model()
+    other_deployment = get_llm_factory(
+        _azure_setting('deployment-b')
+    ).get_language_model()
+
+    assert first is not other_key
+    assert first.provider_rate_limiter is other_key.provider_rate_limiter
+    assert first.provider_rate_limiter is not other_deployment.provider_rate_limiter
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.factories.llm.rate_limiter_registry.application_settings.llm_rate_limit_overrides',
+    {
+        'AzureOpenAIService': LLMRateLimitBudget(requests_per_minute=10),
+        'AzureOpenAIService/gpt-4o': LLMRateLimitBudget(tokens_per_minute=1000),
+    },
+)
+def test_budgets_are_overridden_per_provider_and_deployment():
+    registry = RateLimiterRegistry()
+
+    assert registry.get_budget('AzureOpenAIService', 'gpt-4o') == LLMRateLimitBudget(
+        tokens_per_minute=1000
+    )
+    assert registry.get_budget('AzureOpenAIService', 'gpt-35') == LLMRateLimitBudget(
+        requests_per_minute=10
+    )
+    assert registry.get_budget('OpenAI').requests_per_minute == 600
+
+
+@pytest.mark.asyncio
+async def test_chat_model_acquires_the_request_and_its_estimated_tokens():
+    limiter = ProviderRateLimiter('test', requests_per_minute=0, tokens_per_minute=0)
+    limiter.aacquire = AsyncMock(return_value=True)
+    model = RateLimitedChatOpenAI(
+        api_key='key', model='gpt-4o', max_tokens=100, provider_rate_limiter=limiter
+    )
+    result = ChatResult(generations=[ChatGeneration(message=AIMessage('Hello!'))])
+
+    with patch.object(
+        ChatOpenAI, '_agenerate', AsyncMock(return_value=result)
+    ) as mocked_agenerate:
+        answer = await model.ainvoke('Hi, how are you?')
+
+    assert answer.content == 'Hello!'
+    mocked_agenerate.assert_awaited_once()
+    tokens = limiter.aacquire.call_args.kwargs['tokens']
+    # The prompt tokens, plus the maximum completion tokens
+    assert 100 < tokens < 120
@@ -0,0 +1,114 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_client_registry import (
+    KeepAliveAIOHttpConnection,
+    OpenSearchClientRegistry,
+)
+from gen_ai_orchestrator.models.vector_stores.open_search.open_search_setting import (
+    OpenSearchVectorStoreSetting,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_vector_search import (
+    AsyncOpenSearchVectorSearch,
+)
+
+
+def _setting(password: str = 'password') -> OpenSearchVectorStoreSetting:
+    return OpenSearchVectorStoreSetting(
+        host='localhost',
+        port=9200,
+        username='admin',
+        password={'type': 'Raw', 'secret': password},
+    )
+
+
+@pytest.mark.asyncio
+async def test_clients_are_reused_and_closed_when_their_setting_changes():
+    registry = OpenSearchClientRegistry(maxsize=4, ttl=60)
+
+    clients = registry.get_or_create(_setting())
+    assert registry.get_or_create(_setting()) is clients
+    assert clients.async_client.transport.connection_class is KeepAliveAIOHttpConnection
+
+    with patch.object(clients.async_client, 'close', AsyncMock()) as close:
+        new_clients = registry.get_or_create(_setting('new-password'))
+        await registry.aclose()
+
+    assert new_clients is not clients
+    close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_evicted_clients_are_closed():
+    registry = OpenSearchClientRegistry(maxsize=1, ttl=60)
+    clients = registry.get_or_create(_setting())
+
+    with patch.object(clients.async_client, 'close', AsyncMock()) as close:
+        registry.get_or_create(
+            OpenSearchVectorStoreSetting(
+                host='other-host',
+                port=9200,
+                username='admin',
+                password={'type': 'Raw', 'secret': 'password'},
+            )
+        )
+        await registry.aclose()
+
+    close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_runs_on_the_async_client():
+    clients = OpenSearchClientRegistry(maxsize=1, ttl=60).get_or_create(_setting())
+    embedding_function = MagicMock(spec=Embeddings)
+    embedding_function.aembed_query = AsyncMock(return_value=[0.1, 0.2])
+    vector_store = AsyncOpenSearchVectorSearch(
+        clients=clients, index_name='my-index', embedding_function=embedding_function
+    )
+    hits = {
+        'hits': {
+            'hits': [
+                {
+                    '_id': '1',
+                    '_score': 0.9,
+                    '_source': {'text': 'Use the search bar.', 'metadata': {'id': 'doc-0'}},
+                }
+            ]
+        }
+    }
+    retriever = vector_store.as_retriever(
+        search_kwargs={'k': 2, 'filter': [{'term': {'metadata.id': 'doc-0'}}]}
+    )
+
+    with patch.object(
+        clients.async_client, 'search', AsyncMock(return_value=hits)
+    ) as search:
+        docs = await retriever.ainvoke('How to find a page?')
+
+    assert search.call_args.kwargs['body']['query'] == {
+        'bool': {
+            'filter': [{'term': {'metadata.id': 'doc-0'}}],
+            'must': [{'knn': {'vector_field': {'vector': [0.1, 0.2], 'k': 2}}}],
+        }
+    }
+    assert [(doc.page_content, doc.metadata) for doc in docs] == [
+        ('Use the search bar.', {'id': 'doc-0'})
+    ]
+    # The sync client is only created when needed
+    assert clients._sync_client is None
@@ -0,0 +1,139 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from opensearchpy import AsyncOpenSearch
+
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_hybrid_retriever import (
+    OpenSearchHybridRetriever,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_text_retriever import (
+    OpenSearchTextRetriever,
+)
+
+FILTER = [{'term': {'metadata.index_session_id': 'session'}}]
+HITS = {
+    'hits': {
+        'hits': [
+            {
+                '_score': 2.5,
+                '_source': {
+                    'text': 'Use the search bar.',
+                    'metadata': {'id': 'doc-0', 'chunk': '1/1'},
+                },
+            }
+        ]
+    }
+}
+
+
+@pytest.mark.asyncio
+async def test_open_search_text_retriever_runs_a_bm25_query():
+    client = AsyncOpenSearch(hosts=['https://localhost:9200'])
+    retriever = OpenSearchTextRetriever(
+        client=client, index_name='my-index', k=4, filter=FILTER
+    )
+
+    with patch.object(client, 'search', AsyncMock(return_value=HITS)) as search:
+        docs = await retriever.ainvoke(
+            input=retriever.prepare_query(['search bar', ' ', 'page '])
+        )
+
+    search.assert_awaited_once_with(
+        index='my-index',
+        body={
+            'size': 4,
+            'query': {
+                'bool': {
+                    'must': {'match': {'text': {'query': 'search bar page'}}},
+                    'filter': FILTER,
+                }
+            },
+            '_source': ['text', 'metadata'],
+        },
+    )
+    assert docs[0].page_content == 'Use the search bar.'
+    assert docs[0].metadata == {'id': 'doc-0', 'chunk': '1/1', 'score': 2.5}
+
+
+@pytest.mark.asyncio
+async def test_open_search_hybrid_retriever_sends_a_single_hybrid_query():
+    client = AsyncOpenSearch(hosts=['https://localhost:9200'])
+    embedding_function = MagicMock(spec=Embeddings)
+    embedding_function.aembed_query = AsyncMock(return_value=[0.1, 0.2])
+    retriever = OpenSearchHybridRetriever(
+        client=client,
+        embedding_function=embedding_function,
+        index_name='my-index',
+        k=4,
+        similarity_weight=3.0,
+        fts_weight=1.0,
+    )
+
+    with patch.object(client, 'search', AsyncMock(return_value=HITS)) as search:
+        docs = await retriever.ahybrid_search('How to find a page?', ['search'])
+
+    body = search.call_args.kwargs['body']
+    assert body['query'] == {
+        'hybrid': {
+            'queries': [
+                {'knn': {'vector_field': {'vector': [0.1, 0.2], 'k': 4}}},
+                {'bool': {'must': {'match': {'text': {'query': 'search'}}}}},
+            ]
+        }
+    }
+    assert body['search_pipeline']['phase_results_processors'][0][
+        'normalization-processor'
+    ]['combination']['parameters'] == {'weights': [0.75, 0.25]}
+    assert docs[0].metadata['score'] == 2.5
+
+    # Without key words, only the k-NN query is sent
+    with patch.object(client, 'search', AsyncMock(return_value=HITS)) as search:
+        await retriever.ahybrid_search('How to find a page?', [])
+
+    body = search.call_args.kwargs['body']
+    assert len(body['query']['hybrid']['queries']) == 1
+
+
+@pytest.mark.asyncio
+async def test_open_search_hybrid_retriever_sends_the_search_effort():
+    client = AsyncOpenSearch(hosts=['https://localhost:9200'])
+    embedding_function = MagicMock(spec=Embeddings)
+    embedding_function.aembed_query = AsyncMock(return_value=[0.1, 0.2])
+    retriever = OpenSearchHybridRetriever(
+        client=client,
+        embedding_function=embedding_function,
+        index_name='my-index',
+        k=4,
+        num_candidates=50,
+        ef_search=100,
+    )
+
+    with patch.object(client, 'search', AsyncMock(return_value=HITS)) as search:
+        await retriever.ahybrid_search('How to find a page?', [])
+
+    body = search.call_args.kwargs['body']
+    assert body['size'] == 4
+    assert body['query']['hybrid']['queries'][0] == {
+        'knn': {
+            'vector_field': {
+                'vector': [0.1, 0.2],
+                'k': 50,
+                'method_parameters': {'ef_search': 100},
+            }
+        }
+    }
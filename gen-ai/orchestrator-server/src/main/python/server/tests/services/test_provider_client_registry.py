@@ -0,0 +1,117 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import pytest
+
+from gen_ai_orchestrator.models.em.openai.openai_em_setting import (
+    OpenAIEMSetting,
+)
+from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
+    OpenAILLMSetting,
+)
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_em_factory,
+    get_llm_factory,
+)
+from gen_ai_orchestrator.services.langchain.factories.provider_client_registry import (
+    ProviderClientRegistry,
+    provider_client_registry,
+)
+
+
+def _openai_llm_setting(model: str = 'gpt-4o') -> OpenAILLMSetting:
+    return OpenAILLMSetting(
+        provider='OpenAI',
+        api_key={'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+        model=model,
+        temperature=0,
+    )
+
+
+def test_llm_client_is_reused_for_the_same_setting():
+    provider_client_registry.clear()
+
+    first = get_llm_factory(_openai_llm_setting()).get_language_model()
+    second = get_llm_factory(_openai_llm_setting()).get_language_model()
+    other = get_llm_factory(_openai_llm_setting('gpt-4o-mini')).get_language_model()
+
+    assert first is second
+    assert first is not other
+    provider_client_registry.clear()
+
+
+def test_clients_share_the_transport_of_their_host():
+    provider_client_registry.clear()
+
+    llm = get_llm_factory(_openai_llm_setting()).get_language_model()
+    em = get_em_factory(
+        OpenAIEMSetting(
+            provider='OpenAI',
+            api_key={'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+            model='text-embedding-3-small',
+        )
+    ).get_embedding_model()
+
+    transport = provider_client_registry.get_async_transport(
+        'https://api.openai.com/v1'
+    )
+    assert llm.http_async_client._transport is transport
+    assert em.http_async_client._transport is transport
+    provider_client_registry.clear()
+
+
+def test_transports_are_shared_per_host():
+    registry = ProviderClientRegistry(maxsize=2, ttl=60)
+
+    assert registry.get_async_transport(
+        'https://host-a/v1'
+    ) is registry.get_async_transport('https://host-a/v2')
+    assert registry.get_async_transport(
+        'https://host-a/v1'
+    ) is not registry.get_async_transport('https://host-b/v1')
+    assert registry.get_sync_transport(
+        'https://host-a/v1'
+    ) is registry.get_sync_transport('https://host-a')
+
+
+def test_async_clients_are_shared_per_host_and_timeout():
+    registry = ProviderClientRegistry(maxsize=2, ttl=60)
+
+    client = registry.get_async_client('https://host-a/v1', 5)
+    assert registry.get_async_client('https://host-a/v2', 5) is client
+    assert registry.get_async_client('https://host-a/v1', 10) is not client
+    assert registry.get_async_client('https://host-b/v1', 5) is not client
+    assert client._transport is registry.get_async_transport('https://host-a')
+
+
+def test_registry_evicts_least_recently_used_client():
+    registry = ProviderClientRegistry(maxsize=1, ttl=60)
+
+    first = registry.get_or_create(_openai_llm_setting('a'), object)
+    registry.get_or_create(_openai_llm_setting('b'), object)
+
+    assert registry.get_or_create(_openai_llm_setting('a'), object) is not first
+
+
+@pytest.mark.asyncio
+async def test_registry_closes_transports():
+    registry = ProviderClientRegistry(maxsize=2, ttl=60)
+    transport = registry.get_async_transport('https://host-a/v1')
+    client = registry.get_async_client('https://host-a/v1', 5)
+
+    await registry.aclose()
+
+    assert client.is_closed
+    assert registry.get_async_transport('https://host-a/v1') is not transport
+    await registry.aclose()
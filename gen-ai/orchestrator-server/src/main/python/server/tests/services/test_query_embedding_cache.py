@@ -0,0 +1,123 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gen_ai_orchestrator.models.em.openai.openai_em_setting import (
+    OpenAIEMSetting,
+)
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_em_factory,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.cached_query_embeddings import (
+    CachedQueryEmbeddings,
+    QueryEmbeddingCache,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+
+def _embeddings() -> MagicMock:
+    embeddings = MagicMock(spec=Embeddings)
+    embeddings.embed_query.return_value = [0.1, 0.2, 0.3]
+    embeddings.aembed_query = AsyncMock(return_value=[0.4, 0.5, 0.6])
+    return embeddings
+
+
+def test_query_embeddings_are_cached_per_namespace_and_normalized_text():
+    cache = QueryEmbeddingCache(max_size_bytes=1024)
+    embeddings = _embeddings()
+    cached_embeddings = CachedQueryEmbeddings(embeddings, 'setting-a', cache)
+    hits = metrics_registry.get_counter('em.query_cache.hits')
+
+    first = cached_embeddings.embed_query('Hello,  how are you?')
+    second = cached_embeddings.embed_query(' Hello, how are you? ')
+    CachedQueryEmbeddings(embeddings, 'setting-b', cache).embed_query(
+        'Hello, how are you?'
+    )
+
+    # Cached vectors are float32
+    assert first == [0.1, 0.2, 0.3]
+    assert second == pytest.approx(first)
+    assert embeddings.embed_query.call_count == 2
+    assert metrics_registry.get_counter('em.query_cache.hits') == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_async_query_embeddings_are_cached():
+    cache = QueryEmbeddingCache(max_size_bytes=1024, ttl=60)
+    embeddings = _embeddings()
+    cached_embeddings = CachedQueryEmbeddings(embeddings, 'setting', cache)
+
+    await cached_embeddings.aembed_query('Hello')
+    embedding = await cached_embeddings.aembed_query('Hello')
+
+    assert embedding == pytest.approx([0.4, 0.5, 0.6])
+    embeddings.aembed_query.assert_awaited_once_with('Hello')
+
+
+@pytest.mark.asyncio
+async def test_concurrent_query_embedding_misses_share_one_call():
+    cache = QueryEmbeddingCache(max_size_bytes=1024)
+    embeddings = _embeddings()
+
+    async def aembed_query(text):
+        await asyncio.sleep(0.01)
+        return [0.4, 0.5, 0.6]
+
+    embeddings.aembed_query.side_effect = aembed_query
+    cached_embeddings = CachedQueryEmbeddings(embeddings, 'setting', cache)
+
+    results = await asyncio.gather(
+        cached_embeddings.aembed_query('Hello'),
+        cached_embeddings.aembed_query(' Hello '),
+        cached_embeddings.aembed_query('Goodbye'),
+    )
+
+    assert results[0] == results[1] == pytest.approx([0.4, 0.5, 0.6])
+    assert embeddings.aembed_query.await_count == 2
+    assert len(cache) == 2
+
+
+def test_cache_size_is_bounded_in_bytes():
+    # Room for two float32 vectors of 3 dimensions
+    cache = QueryEmbeddingCache(max_size_bytes=24)
+    cache.put('setting', 'first', [0.1, 0.2, 0.3])
+    cache.put('setting', 'second', [0.1, 0.2, 0.3])
+    cache.get('setting', 'first')
+    cache.put('setting', 'third', [0.1, 0.2, 0.3])
+
+    assert len(cache) == 2
+    assert cache.get('setting', 'second') is None
+    assert cache.get('setting', 'first') is not None
+
+
+def test_get_em_factory_applies_the_query_cache():
+    setting = OpenAIEMSetting(
+        provider='OpenAI',
+        api_key={'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+        model='text-embedding-3-small',
+    )
+
+    embedding_model = get_em_factory(setting).get_embedding_model()
+    uncached_embedding_model = get_em_factory(
+        setting, query_cache_enabled=False
+    ).get_embedding_model()
+
+    assert isinstance(embedding_model, CachedQueryEmbeddings)
+    assert embedding_model.embeddings is uncached_embedding_model
+    assert embedding_model.model == 'text-embedding-3-small'
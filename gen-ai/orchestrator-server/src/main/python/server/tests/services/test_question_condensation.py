@@ -0,0 +1,112 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest.mock import patch
+
+import pytest
+from langchain_community.chat_models.fake import FakeListChatModel
+from langchain_core.messages import HumanMessage
+
+from gen_ai_orchestrator.models.prompt.prompt_template import PromptTemplate
+from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    build_question_condensation_chain,
+    build_question_condensation_step,
+)
+from gen_ai_orchestrator.services.utils.keyword_extractor import (
+    extract_keywords,
+    get_stop_words,
+)
+from gen_ai_orchestrator.services.utils.stop_words import (
+    ALL_STOP_WORDS,
+    STOP_WORDS,
+)
+
+
+def _condensation_step():
+    llm = FakeListChatModel(
+        responses=['{"condensed_question": "LLM question", "key_words": ["llm"]}']
+    )
+    chain = build_question_condensation_chain(
+        llm, PromptTemplate(formatter='f-string', template='Reformulate', inputs={})
+    )
+    return llm, build_question_condensation_step(chain)
+
+
+def _inputs(chat_history: list) -> dict:
+    return {
+        'question': "Comment faire opposition à ma carte aujourd'hui ?",
+        'chat_history': chat_history,
+        'question_condensing_inputs': {},
+        'question_answering_inputs': {'locale': 'French'},
+    }
+
+
+def test_get_stop_words():
+    assert get_stop_words('French') is STOP_WORDS['fr']
+    assert get_stop_words('fr_FR') is STOP_WORDS['fr']
+    assert get_stop_words('en-US') is STOP_WORDS['en']
+    assert get_stop_words('Klingon') is ALL_STOP_WORDS
+    assert get_stop_words(None) is ALL_STOP_WORDS
+
+
+def test_extract_keywords():
+    assert extract_keywords(
+        "Comment faire opposition à ma carte bancaire ? L'opposition est-elle gratuite ?",
+        'fr',
+    ) == ['opposition', 'carte', 'bancaire', 'est-elle', 'gratuite']
+    assert extract_keywords("What's the card's replacement fee?", 'English') == [
+        'card',
+        'replacement',
+        'fee',
+    ]
+    assert extract_keywords('one two three four', 'en', max_keywords=2) == [
+        'one',
+        'two',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_condensation_is_skipped_without_history():
+    llm, step = _condensation_step()
+
+    with patch.object(FakeListChatModel, 'ainvoke', wraps=llm.ainvoke) as mocked:
+        output = await step.ainvoke(_inputs(chat_history=[]))
+
+    mocked.assert_not_called()
+    assert output == {
+        'condensed_question': "Comment faire opposition à ma carte aujourd'hui ?",
+        'key_words': ['opposition', 'carte', "aujourd'hui"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_condensation_is_done_with_history():
+    _, step = _condensation_step()
+
+    output = await step.ainvoke(_inputs(chat_history=[HumanMessage(content='Hi')]))
+
+    assert output == {'condensed_question': 'LLM question', 'key_words': ['llm']}
+
+
+@pytest.mark.asyncio
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_condensation_fast_path_enabled',
+    False,
+)
+async def test_condensation_fast_path_can_be_disabled():
+    _, step = _condensation_step()
+
+    output = await step.ainvoke(_inputs(chat_history=[]))
+
+    assert output['condensed_question'] == 'LLM question'
@@ -12,24 +12,35 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
 import os
+from typing import Optional
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from langchain_community.chat_models.fake import FakeListChatModel
 from langchain_core.documents import Document
 from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from opensearchpy import NotFoundError as OpenSearchNotFoundError
 from requests.exceptions import HTTPError
 
 from gen_ai_orchestrator.errors.exceptions.document_compressor.document_compressor_exceptions import (
+    GenAIDocumentCompressorErrorException,
     GenAIDocumentCompressorUnknownLabelException,
 )
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIGuardCheckException,
 )
+from gen_ai_orchestrator.errors.exceptions.vector_store.opensearch_exceptions import (
+    GenAIOpenSearchIndexNotFoundException,
+)
 from gen_ai_orchestrator.models.guardrail.bloomz.bloomz_guardrail_setting import (
     BloomzGuardrailSetting,
 )
 from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer
+from gen_ai_orchestrator.models.streaming.stream_event import StreamEventType
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
     get_guardrail_factory,
@@ -38,14 +49,30 @@ from gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rer
     BloomzRerank,
 )
 from gen_ai_orchestrator.services.langchain.rag_chain import (
+    IncrementalGuardrail,
     check_guardrail_output,
     execute_rag_chain,
+    get_answer_delta,
+    stream_rag_chain,
 )
 from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    FusionRetriever,
+    FusionSource,
+    apply_rrf_ranking,
+    apply_score_fusion,
+    apply_score_gap_cutoff,
+    dump_context,
     format_rag_context_documents,
     get_chunk_identifier,
     get_web_source_url,
+    pack_context,
+)
+from gen_ai_orchestrator.services.langchain.rag_response_builder import (
+    footnote_sort_key,
 )
+from gen_ai_orchestrator.services.rag.rag_service import rag
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+from gen_ai_orchestrator.utils.tokens import count_tokens
 
 
 def _rag_request() -> RAGRequest:
@@ -95,6 +122,7 @@ def _rag_request() -> RAGRequest:
             'document_index_name': 'my-index-name',
             'document_search_params': {
                 'provider': 'OpenSearch',
+                'search_type': 'SIMILARITY_SEARCH',
                 'filter': [],
                 'k': 4,
             },
@@ -151,6 +179,92 @@ def test_format_rag_context_documents_adds_source_metadata_and_composite_chunk_i
     ]
 
 
+def _ranked_document(
+    doc_id: str,
+    text: Optional[str] = None,
+    chunk: str = '1/1',
+    rank: Optional[dict] = None,
+    **metadata,
+) -> Document:
+    return Document(
+        page_content=text or f"Content {doc_id}.",
+        metadata={
+            'id': doc_id,
+            'chunk': chunk,
+            'title': 'A file',
+            'source': 'document.pdf',
+            'rank': dict(rank or {}),
+            **metadata,
+        },
+    )
+
+
+def test_pack_context_skips_the_documents_beyond_the_token_budget():
+    docs = [
+        _ranked_document('doc', 'First chunk', chunk='1/4', retriever_score=0.9),
+        _ranked_document(
+            'doc', 'A much longer chunk ' * 50, chunk='2/4', retriever_score=0.8
+        ),
+        _ranked_document('doc', 'Third chunk', chunk='3/4', retriever_score=0.7),
+    ]
+
+    def tokens(doc: Document) -> int:
+        return count_tokens(
+            dump_context(format_rag_context_documents([doc]), compact=True)
+        )
+
+    context = pack_context(
+        docs, token_budget=tokens(docs[0]) + tokens(docs[2]) + 1, compact=True
+    )
+
+    assert context.documents == [docs[0], docs[2]]
+    assert context.text == dump_context(
+        format_rag_context_documents([docs[0], docs[2]]), compact=True
+    )
+    assert '\n' not in context.text and ', ' not in context.text
+    debug_data = context.to_debug_data()
+    assert debug_data.documents == 2
+    assert debug_data.skipped_documents == 1
+    assert debug_data.tokens == count_tokens(context.text)
+
+    # No budget: all the documents, indented
+    context = pack_context(docs)
+    assert context.documents == docs
+    assert context.text.startswith('[\n  {')
+
+
+def test_pack_context_keeps_the_indented_context_within_the_token_budget():
+    docs = [
+        _ranked_document('doc', 'some content ' * 20, chunk=f"{chunk}/4")
+        for chunk in range(1, 5)
+    ]
+    # The documents serialized on their own cost less than within the context list
+    token_budget = sum(
+        count_tokens(dump_context(format_rag_context_documents([doc])[0]))
+        for doc in docs
+    )
+
+    context = pack_context(docs, token_budget=token_budget)
+
+    assert 0 < len(context.documents) < len(docs)
+    assert context.text.startswith('[\n  {')
+    assert count_tokens(context.text) <= token_budget
+    assert context.to_debug_data().tokens <= token_budget
+
+
+def test_score_gap_cutoff_leaves_out_the_documents_after_the_first_large_drop():
+    docs = [
+        _ranked_document('doc', 'First', chunk='1/4', retriever_score=0.9),
+        _ranked_document('doc', 'Second', chunk='2/4', retriever_score=0.85),
+        _ranked_document('doc', 'Third', chunk='3/4', retriever_score=0.4),
+        _ranked_document('doc', 'Fourth', chunk='4/4', retriever_score=0.38),
+    ]
+
+    assert apply_score_gap_cutoff(docs, score_gap=0.2) == docs[:2]
+    assert apply_score_gap_cutoff(docs, score_gap=0.6) == docs
+    assert apply_score_gap_cutoff(docs, score_gap=0) == docs
+
+
 @patch('gen_ai_orchestrator.services.langchain.rag_chain.create_rag_chain')
 @pytest.mark.asyncio
 async def test_execute_rag_chain_matches_footnotes_with_composite_chunk_id(
@@ -195,7 +309,8 @@ async def test_execute_rag_chain_matches_footnotes_with_composite_chunk_id(
 
 
 @patch(
-    'gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.requests.post'
+    'gen_ai_orchestrator.services.langchain.impls.guardrail.bloomz_guardrail.BloomzGuardrailOutputParser.aparse',
+    new_callable=AsyncMock,
 )
 @patch(
     'gen_ai_orchestrator.services.langchain.factories.langchain_factory.get_compressor_factory'
@@ -335,11 +450,14 @@ Answer in {locale}:""",
     }
     request = RAGRequest(**query_dict)
     inputs = {
-        **request.question_answering_prompt.inputs,
+        'question': request.question_answering_prompt.inputs['question'],
         'chat_history': [
             HumanMessage(content='Hello, how can I do this?'),
             AIMessage(content='you can do this with the following method ....'),
         ],
+        'question_condensing_inputs': request.question_condensing_prompt.inputs,
+        'question_answering_inputs': request.question_answering_prompt.inputs,
+        'context_token_budget': 0,
     }
     docs = [
         Document(
@@ -367,11 +485,11 @@ Answer in {locale}:""",
     mocked_chain.ainvoke = AsyncMock(return_value=response)
     mocked_rag_answer = mocked_chain.ainvoke.return_value
 
-    mocked_response = MagicMock()
-    mocked_response.status_code = 200
-    mocked_response.content = {'response': []}
-
-    mocked_guardrail_parse.return_value = mocked_response
+    mocked_guardrail_parse.return_value = {
+        'content': 'an answer from llm',
+        'output_toxicity': False,
+        'output_toxicity_reason': [],
+    }
 
     # Call function
     await execute_rag_chain(request, debug=True)
@@ -397,9 +515,8 @@ Answer in {locale}:""",
     )
     mocked_get_document_compressor_factory(setting=request.compressor_setting)
     # Assert the rag guardrail is called
-    mocked_guardrail_parse.assert_called_once_with(
-        os.path.join(request.guardrail_setting.api_base, 'guardrail'),
-        json={'text': [mocked_rag_answer['answer']['answer']]},
+    mocked_guardrail_parse.assert_awaited_once_with(
+        mocked_rag_answer['answer']['answer']
     )
 
 
@@ -443,6 +560,7 @@ def test_guardrail_parse_succeed_with_toxicities_encountered(
     mocked_guardrail_response.assert_called_once_with(
         os.path.join(guardrail.endpoint, 'guardrail'),
         json={'text': [rag_response['answer']['answer']]},
+        timeout=guardrail.timeout,
     )
     assert guardrail_output == {
         'content': 'This is a sample text.',
@@ -483,6 +601,7 @@ def test_guardrail_parse_fail(mocked_guardrail_response):
     mocked_guardrail_response.assert_called_once_with(
         os.path.join(guardrail.endpoint, 'guardrail'),
         json={'text': [rag_response['answer']['answer']]},
+        timeout=guardrail.timeout,
     )
 
 
@@ -628,3 +747,615 @@ def test_check_guardrail_output_is_ok():
     }
 
     assert check_guardrail_output(guardrail_output) is True
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+@pytest.mark.asyncio
+async def test_stream_rag_chain(
+    mocked_get_llm_factory, mocked_get_em_factory, mocked_get_vector_store_factory
+):
+    doc = Document(
+        page_content='A web page\n\nThe useful source content.',
+        metadata={
+            'id': 'doc-1',
+            'chunk': '2/5',
+            'title': 'A web page',
+            'source': 'https://intranet.example.com/page',
+        },
+    )
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(
+            responses=['{"condensed_question": "How to find a page?", "key_words": []}']
+        ),
+        FakeListChatModel(
+            responses=[
+                '{"status": "found_in_context", "answer": "Use the intranet page.", '
+                '"context_usage": [{"chunk": "doc-1:2/5", "used_in_response": true}]}'
+            ]
+        ),
+    ]
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = RunnableLambda(
+        lambda _: [doc]
+    )
+
+    events = [event async for event in stream_rag_chain(_rag_request(), debug=False)]
+    event_types = [event.event for event in events]
+
+    assert event_types[:2] == [
+        StreamEventType.CONDENSED_QUESTION,
+        StreamEventType.DOCUMENTS,
+    ]
+    assert event_types[-2:] == [StreamEventType.FOOTNOTES, StreamEventType.RESPONSE]
+    assert events[0].data['condensed_question'] == 'How to find a page?'
+    assert events[1].data[0].identifier == 'doc-1'
+    answer_deltas = [
+        event.data['text']
+        for event in events
+        if event.event == StreamEventType.ANSWER_DELTA
+    ]
+    assert len(answer_deltas) > 1
+    assert ''.join(answer_deltas) == 'Use the intranet page.'
+    assert events[-1].data.answer.answer == 'Use the intranet page.'
+    assert [footnote.identifier for footnote in events[-2].data] == ['doc-1']
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+@pytest.mark.asyncio
+async def test_stream_rag_chain_maps_the_errors_raised_while_streaming(
+    mocked_get_llm_factory, mocked_get_em_factory, mocked_get_vector_store_factory
+):
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(
+            responses=['{"condensed_question": "How to find a page?", "key_words": []}']
+        ),
+        FakeListChatModel(responses=['{"status": "found_in_context"}']),
+    ]
+
+    def retrieve(_):
+        raise OpenSearchNotFoundError(404, 'index_not_found_exception')
+
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = RunnableLambda(
+        retrieve
+    )
+
+    events = []
+    with pytest.raises(GenAIOpenSearchIndexNotFoundException):
+        async for event in stream_rag_chain(_rag_request(), debug=False):
+            events.append(event)
+    assert [event.event for event in events] == [StreamEventType.CONDENSED_QUESTION]
+
+
+def test_get_answer_delta():
+    assert get_answer_delta('', {'status': 'found'}) == ''
+    assert get_answer_delta('', {'answer': 'Use'}) == 'Use'
+    assert get_answer_delta('Use', {'answer': 'Use the'}) == ' the'
+    assert get_answer_delta('Use', None) == ''
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_compressor_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+@pytest.mark.asyncio
+async def test_rag_chain_reranks_the_over_fetched_documents(
+    mocked_get_llm_factory,
+    mocked_get_em_factory,
+    mocked_get_vector_store_factory,
+    mocked_get_compressor_factory,
+):
+    docs = [
+        Document(
+            page_content=f"Page {i}\n\nContent {i}.",
+            metadata={
+                'id': f"doc-{i}",
+                'chunk': '1/1',
+                'title': f"Page {i}",
+                'source': f"https://intranet.example.com/page-{i}",
+            },
+        )
+        for i in range(3)
+    ]
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(responses=['{"condensed_question": "unused"}']),
+        FakeListChatModel(
+            responses=[
+                '{"status": "found_in_context", "answer": "See the pages.", '
+                '"context_usage": [{"chunk": "doc-0:1/1", "used_in_response": true}, '
+                '{"chunk": "doc-2:1/1", "used_in_response": true}]}'
+            ]
+        ),
+    ]
+    vector_store_factory = mocked_get_vector_store_factory.return_value
+    vector_store_factory.get_vector_store_retriever.return_value = RunnableLambda(
+        lambda _: docs
+    )
+    compressor = mocked_get_compressor_factory.return_value.get_compressor.return_value
+    # The reranker keeps the 2 best documents, in reverse order
+    compressor.acompress_documents = AsyncMock(return_value=[docs[2], docs[0]])
+    request = RAGRequest(
+        **{
+            **_rag_request().model_dump(),
+            'compressor_setting': {
+                'provider': 'BloomzRerank',
+                'endpoint': 'http://test-rerank.com',
+                'max_documents': 2,
+            },
+        }
+    )
+
+    response = await execute_rag_chain(request, debug=False)
+
+    assert vector_store_factory.get_vector_store_retriever.call_args.kwargs[
+        'search_kwargs'
+    ]['k'] == 12
+    compressor.acompress_documents.assert_awaited_once_with(
+        documents=docs, query='How to find a page?'
+    )
+    assert [footnote.identifier for footnote in response.footnotes] == [
+        'doc-2',
+        'doc-0',
+    ]
+
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+@pytest.mark.asyncio
+async def test_rag_chain_diversifies_the_over_fetched_documents(
+    mocked_get_llm_factory, mocked_get_em_factory, mocked_get_vector_store_factory
+):
+    texts = [
+        'How to find a page? Use the search bar at the top of the intranet home page.',
+        'How to find a page? Use the search bar at the top of the intranet home page!',
+        'How to find a page? Browse the site map, from the intranet footer links.',
+        'How to find a page? Ask the intranet team, by mail or on the chat.',
+    ]
+    docs = [
+        Document(
+            page_content=text,
+            metadata={
+                'id': f"doc-{i}",
+                'chunk': '1/1',
+                'title': f"Page {i}",
+                'source': f"https://intranet.example.com/page-{i}",
+                'index_session_id': 'session',
+            },
+        )
+        for i, text in enumerate(texts)
+    ]
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(responses=['{"condensed_question": "unused"}']),
+        FakeListChatModel(
+            responses=[
+                '{"status": "found_in_context", "answer": "Search it.", '
+                '"context_usage": [{"chunk": "doc-0:1/1", "used_in_response": true}]}'
+            ]
+        ),
+    ]
+    embedding_model = mocked_get_em_factory.return_value.get_embedding_model.return_value
+    embedding_model.aembed_query = AsyncMock(return_value=[1.0, 0.0])
+    # doc-2 is close to doc-0, doc-3 is not
+    embedding_model.aembed_documents = AsyncMock(
+        return_value=[[0.9, 0.1], [0.9, 0.12], [0.6, -0.5]]
+    )
+    vector_store_factory = mocked_get_vector_store_factory.return_value
+    vector_store_factory.get_vector_store_retriever.return_value = RunnableLambda(
+        lambda _: docs
+    )
+    request = _rag_request().model_dump()
+    request['document_search_params'].update(
+        k=2, near_duplicate_threshold=0.7, mmr_lambda=0.5
+    )
+
+    response = await execute_rag_chain(RAGRequest(**request), debug=True)
+
+    assert vector_store_factory.get_vector_store_retriever.call_args.kwargs[
+        'search_kwargs'
+    ]['k'] == 4
+    # The second document is a near-duplicate of the first one
+    embedding_model.aembed_documents.assert_awaited_once_with(
+        [texts[0], texts[2], texts[3]]
+    )
+    assert [doc.metadata.id for doc in response.debug.documents] == [
+        'doc-0',
+        'doc-3',
+    ]
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.vector_store_native_hybrid_search_enabled',
+    True,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+@pytest.mark.asyncio
+async def test_rag_chain_runs_the_native_hybrid_search(
+    mocked_get_llm_factory, mocked_get_em_factory, mocked_get_vector_store_factory
+):
+    docs = [
+        Document(
+            page_content='Use the search bar.',
+            metadata={
+                'id': 'doc-0',
+                'chunk': '1/1',
+                'title': 'Page 0',
+                'source': 'https://intranet.example.com/page-0',
+                'index_session_id': 'session',
+                'score': 0.8,
+            },
+        )
+    ]
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(responses=['{"condensed_question": "unused"}']),
+        FakeListChatModel(
+            responses=[
+                '{"status": "found_in_context", "answer": "Search it.", '
+                '"context_usage": [{"chunk": "doc-0:1/1", "used_in_response": true}]}'
+            ]
+        ),
+    ]
+    vector_store_factory = mocked_get_vector_store_factory.return_value
+    hybrid_search_retriever = vector_store_factory.get_hybrid_search_retriever.return_value
+    hybrid_search_retriever.ahybrid_search = AsyncMock(return_value=docs)
+    request = _rag_request().model_dump()
+    request['document_search_params'].update(
+        search_type='HYBRID_SEARCH', fusion={'weights': {'fts': 0.5}}
+    )
+
+    response = await execute_rag_chain(RAGRequest(**request), debug=True)
+
+    assert vector_store_factory.get_hybrid_search_retriever.call_args.kwargs[
+        'fusion'
+    ].weights == {'fts': 0.5}
+    hybrid_search_retriever.ahybrid_search.assert_awaited_once_with(
+        query='How to find a page?', key_words=ANY
+    )
+    vector_store_factory.get_vector_store_retriever.assert_not_called()
+    vector_store_factory.get_text_store_retriever.assert_not_called()
+    assert [doc.metadata.id for doc in response.debug.documents] == ['doc-0']
+
+
+def test_weighted_rrf_ranking():
+    similarity_docs = [_ranked_document(doc_id) for doc_id in 'abc']
+    fts_docs = [_ranked_document(doc_id) for doc_id in 'bc']
+
+    ranked_docs = apply_rrf_ranking([similarity_docs, fts_docs], k=60, top_n=2)
+    assert [doc.metadata['id'] for doc in ranked_docs] == ['b', 'c']
+
+    # The full-text search ranking barely counts
+    ranked_docs = apply_rrf_ranking(
+        [
+            [_ranked_document(doc_id) for doc_id in 'abc'],
+            [_ranked_document(doc_id) for doc_id in 'bc'],
+        ],
+        k=60,
+        top_n=2,
+        weights=[1.0, 0.01],
+    )
+    assert [doc.metadata['id'] for doc in ranked_docs] == ['a', 'b']
+    assert ranked_docs[0].metadata['rank']['rrf'] == '1/3'
+
+
+def test_score_fusion_favours_the_consensus_with_comb_mnz():
+    # 'a' has the best scores, 'b' is found in both lists
+    ranked_results = [
+        [
+            _ranked_document(doc_id, score=score)
+            for doc_id, score in zip('abc', [0.9, 0.5, 0.1])
+        ],
+        [
+            _ranked_document(doc_id, score=score)
+            for doc_id, score in zip('dbe', [2.0, 1.8, 1.0])
+        ],
+    ]
+
+    # Normalized scores: a 1, b 0.5, c 0 and d 1, b 0.8, e 0
+    ranked_docs = apply_score_fusion(ranked_results, top_n=3)
+    assert [doc.metadata['id'] for doc in ranked_docs] == ['b', 'a', 'd']
+    assert ranked_docs[0].metadata['rrf_score'] == pytest.approx(0.5 + 0.8)
+
+    ranked_docs = apply_score_fusion(ranked_results, top_n=2, weights=[1.0, 0.1], mnz=True)
+    assert [doc.metadata['id'] for doc in ranked_docs] == ['b', 'a']
+    assert ranked_docs[0].metadata['rrf_score'] == pytest.approx((0.5 + 0.08) * 2)
+    assert ranked_docs[0].metadata['rank']['combmnz'] == '1/5'
+
+
+@pytest.mark.parametrize('method', ['rrf', 'combsum', 'combmnz', 'hybrid', 'mmr'])
+def test_footnote_sort_key_follows_the_fused_order(method):
+    first = _ranked_document('first', rank={'similarity': '3/3', method: '1/3'})
+    second = _ranked_document('second', rank={'fts': '1/1', method: '2/3'})
+    third = _ranked_document('third', rank={'similarity': '1/3', method: '3/3'})
+    reranked = _ranked_document('reranked', rank={'rerank': '1/1', method: '3/3'})
+
+    assert sorted([third, reranked, second, first], key=footnote_sort_key) == [
+        reranked,
+        first,
+        second,
+        third,
+    ]
+
+
+def test_footnote_sort_key_follows_the_mmr_order_over_the_fused_one():
+    first = _ranked_document('first', rank={'rrf': '2/2', 'mmr': '1/2'})
+    second = _ranked_document('second', rank={'rrf': '1/2', 'mmr': '2/2'})
+
+    assert sorted([second, first], key=footnote_sort_key) == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_fusion_retriever_leaves_out_the_sources_timing_out():
+    inputs = {'chat_chain_result': {'condensed_question': 'question', 'key_words': []}}
+
+    async def fast(_):
+        return [_ranked_document(doc_id) for doc_id in 'ab']
+
+    async def slow(_):
+        await asyncio.sleep(10)
+        return [_ranked_document('c')]
+
+    async def not_applicable(_):
+        return None
+
+    fusion_retriever = FusionRetriever(
+        sources=[
+            FusionSource('similarity', fast),
+            FusionSource('faq', slow),
+            FusionSource('fts', not_applicable),
+        ],
+        timeout=0.01,
+    )
+
+    ranked_docs = await asyncio.wait_for(fusion_retriever.retrieve(inputs), 1)
+
+    # A single list remains: it is not fused
+    assert [doc.metadata['id'] for doc in ranked_docs] == ['a', 'b']
+    assert ranked_docs[0].metadata['rank'] == {'similarity': '1/2'}
+    assert metrics_registry.get_counter('rag.fusion.timeouts') >= 1
+
+
+@pytest.mark.asyncio
+async def test_fusion_retriever_returns_no_documents_when_all_sources_time_out():
+    inputs = {'chat_chain_result': {'condensed_question': 'question', 'key_words': []}}
+
+    async def slow(_):
+        await asyncio.sleep(10)
+        return [_ranked_document('a')]
+
+    fusion_retriever = FusionRetriever(
+        sources=[FusionSource('similarity', slow), FusionSource('fts', slow)],
+        timeout=0.01,
+    )
+
+    # asyncio.wait_for raises asyncio.TimeoutError (not the builtin on 3.10)
+    assert await asyncio.wait_for(fusion_retriever.retrieve(inputs), 1) == []
+
+
+def _score_transport(handler) -> patch:
+    return patch(
+        'gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.provider_client_registry.get_async_client',
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_acompress_documents_should_succeed():
+    bloomz_reranker = BloomzRerank(endpoint='http://example.com', max_documents=1)
+    documents = [
+        Document(page_content='Page content 1'),
+        Document(page_content='Page content 2'),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url == 'http://example.com/score'
+        return httpx.Response(
+            200,
+            json={
+                'response': [
+                    [{'label': 'entailment', 'score': 0.6}],
+                    [{'label': 'entailment', 'score': 0.9}],
+                ]
+            },
+        )
+
+    with _score_transport(handler):
+        result = await bloomz_reranker.acompress_documents(
+            documents=documents, query='Some query'
+        )
+
+    assert result == [
+        Document(page_content='Page content 2', metadata={'retriever_score': 0.9})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_acompress_documents_falls_back_on_timeout():
+    bloomz_reranker = BloomzRerank(endpoint='http://example.com', max_documents=1)
+    documents = [
+        Document(page_content='Page content 1'),
+        Document(page_content='Page content 2'),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout('timeout', request=request)
+
+    with _score_transport(handler):
+        result = await bloomz_reranker.acompress_documents(
+            documents=documents, query='Some query'
+        )
+        assert result == documents[:1]
+
+        bloomz_reranker.is_fault_tolerant = False
+        with pytest.raises(GenAIDocumentCompressorErrorException):
+            await bloomz_reranker.acompress_documents(
+                documents=documents, query='Some query'
+            )
+
+
+@pytest.mark.asyncio
+async def test_guardrail_aparse_succeed_with_toxicities_encountered():
+    guardrail = get_guardrail_factory(
+        BloomzGuardrailSetting(
+            provider='BloomzGuardrail', max_score=0.5, api_base='http://test-guard.com'
+        )
+    ).get_parser()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url == 'http://test-guard.com/guardrail'
+        return httpx.Response(
+            200,
+            json={
+                'response': [
+                    [
+                        {'label': 'insult', 'score': 0.2},
+                        {'label': 'threat', 'score': 0.7},
+                    ]
+                ]
+            },
+        )
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.guardrail.bloomz_guardrail.provider_client_registry.get_async_client',
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ):
+        guardrail_output = await guardrail.aparse('This is a sample text.')
+
+    assert guardrail_output == {
+        'content': 'This is a sample text.',
+        'output_toxicity': True,
+        'output_toxicity_reason': ['threat'],
+    }
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain.application_settings.rag_guardrail_streaming_check_chars',
+    10,
+)
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain.application_settings.rag_guardrail_streaming_enabled',
+    True,
+)
+@patch(
+    'gen_ai_orchestrator.services.langchain.impls.guardrail.bloomz_guardrail.BloomzGuardrailOutputParser.aparse',
+    new_callable=AsyncMock,
+)
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+@pytest.mark.asyncio
+async def test_stream_rag_chain_is_cut_off_by_the_incremental_guardrail(
+    mocked_get_llm_factory,
+    mocked_get_em_factory,
+    mocked_get_vector_store_factory,
+    mocked_guardrail_parse,
+):
+    answer = 'A toxic answer, streamed character by character until it is cut off.'
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(responses=['{"condensed_question": "unused"}']),
+        FakeListChatModel(
+            responses=[f'{{"status": "found_in_context", "answer": "{answer}"}}']
+        ),
+    ]
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = RunnableLambda(
+        lambda _: []
+    )
+    mocked_guardrail_parse.return_value = {
+        'content': '',
+        'output_toxicity': True,
+        'output_toxicity_reason': ['insult'],
+    }
+    request = RAGRequest(
+        **{
+            **_rag_request().model_dump(),
+            'guardrail_setting': {
+                'provider': 'BloomzGuardrail',
+                'api_base': 'http://test-guard.com',
+                'max_score': 0.5,
+            },
+        }
+    )
+
+    streamed_answer = ''
+    with pytest.raises(GenAIGuardCheckException):
+        async for event in stream_rag_chain(request, debug=False):
+            if event.event == StreamEventType.ANSWER_DELTA:
+                streamed_answer += event.data['text']
+
+    # The first check is done on the first 10 characters, the stream is cut off once it is over
+    mocked_guardrail_parse.assert_awaited_once_with(streamed_answer[:10])
+    assert 10 <= len(streamed_answer) < len(answer)
+
+
+@pytest.mark.asyncio
+async def test_incremental_guardrail_skips_the_failed_checks():
+    guardrail = MagicMock()
+    guardrail.aparse = AsyncMock(
+        side_effect=httpx.ConnectError('Guardrail unavailable')
+    )
+    incremental_guardrail = IncrementalGuardrail(guardrail, check_chars=10)
+
+    incremental_guardrail.check('A first answer chunk')
+    await asyncio.sleep(0)
+    # The failed check is skipped, and a new one is started
+    incremental_guardrail.check('A first answer chunk, then a second one')
+    await asyncio.sleep(0)
+    incremental_guardrail.cancel()
+
+    assert guardrail.aparse.await_count == 2
+    assert metrics_registry.get_counter('rag.guardrail.stream_check_errors') >= 1
+
+
+@pytest.mark.asyncio
+@patch('gen_ai_orchestrator.services.rag.rag_service.execute_rag_chain')
+async def test_identical_rag_requests_are_coalesced(mocked_execute_rag_chain):
+    async def execute_rag_chain(request, debug):
+        await asyncio.sleep(0.01)
+        return request.dialog.dialog_id
+
+    mocked_execute_rag_chain.side_effect = execute_rag_chain
+
+    def request_of(dialog_id: str, question: str = 'How to find a page?'):
+        request = _rag_request().model_dump()
+        request['dialog']['dialog_id'] = dialog_id
+        request['question_answering_prompt']['inputs']['question'] = question
+        return RAGRequest(**request)
+
+    responses = await asyncio.gather(
+        rag(request_of('dialog-1'), debug=False),
+        # Dialog identifiers are excluded from the comparison by default
+        rag(request_of('dialog-2'), debug=False),
+        rag(request_of('dialog-3', 'Another question'), debug=False),
+        rag(request_of('dialog-4'), debug=True),
+    )
+
+    assert responses == ['dialog-1', 'dialog-1', 'dialog-3', 'dialog-4']
+    assert mocked_execute_rag_chain.call_count == 3
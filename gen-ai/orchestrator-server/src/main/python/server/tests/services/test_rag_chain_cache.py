@@ -0,0 +1,207 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_community.chat_models.fake import FakeListChatModel
+from langchain_core.messages import HumanMessage
+
+from gen_ai_orchestrator.main import app, lifespan
+from gen_ai_orchestrator.models.prompt.prompt_template import PromptTemplate
+from gen_ai_orchestrator.models.vector_stores.vector_store_provider import (
+    VectorStoreProvider,
+)
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.rag_chain_builder import (
+    build_question_condensation_chain,
+    build_rag_chain_inputs,
+    create_rag_chain,
+)
+from gen_ai_orchestrator.services.langchain.rag_chain_cache import (
+    RAGChainCache,
+    build_rag_chain_cache_key,
+    rag_chain_cache,
+)
+
+
+def _rag_request(question: str = 'How to find a page?', **kwargs) -> RAGRequest:
+    query_dict = {
+        'dialog': {'history': [], 'tags': []},
+        'question_condensing_llm_setting': {
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+            'temperature': 1.2,
+            'model': 'gpt-3.5-turbo',
+        },
+        'question_condensing_prompt': {
+            'formatter': 'f-string',
+            'template': 'Reformulate in {locale}',
+            'inputs': {'locale': 'French'},
+        },
+        'question_answering_llm_setting': {
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+            'temperature': 1.2,
+            'model': 'gpt-3.5-turbo',
+        },
+        'question_answering_prompt': {
+            'formatter': 'f-string',
+            'template': 'Context: {context}\nQuestion: {question}',
+            'inputs': {'question': question},
+        },
+        'embedding_question_em_setting': {
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+            'model': 'text-embedding-ada-002',
+        },
+        'document_index_name': 'my-index-name',
+        'document_search_params': {'provider': 'OpenSearch', 'filter': [], 'k': 4},
+        'vector_store_setting': {
+            'provider': 'OpenSearch',
+            'host': 'localhost',
+            'port': 9200,
+            'username': 'admin',
+            'password': {'type': 'Raw', 'secret': 'admin'},
+        },
+    }
+    query_dict.update(kwargs)
+    return RAGRequest(**query_dict)
+
+
+def test_cache_key_ignores_per_request_inputs():
+    first = _rag_request(question='How to find a page?')
+    second = _rag_request(
+        question='Where is my card?',
+        dialog={
+            'dialog_id': 'another-dialog',
+            'history': [{'text': 'Hello', 'type': 'HUMAN'}],
+            'tags': ['tag'],
+        },
+    )
+
+    assert build_rag_chain_cache_key(first) == build_rag_chain_cache_key(second)
+
+
+def test_cache_key_depends_on_settings_and_templates():
+    reference = build_rag_chain_cache_key(_rag_request())
+
+    other_index = _rag_request(document_index_name='another-index')
+    other_template = _rag_request(
+        question_answering_prompt={
+            'formatter': 'f-string',
+            'template': 'Answer {question} using {context}',
+            'inputs': {'question': 'How to find a page?'},
+        }
+    )
+
+    assert reference != build_rag_chain_cache_key(other_index)
+    assert reference != build_rag_chain_cache_key(other_template)
+    assert reference != build_rag_chain_cache_key(
+        _rag_request(), vector_db_async_mode=False
+    )
+
+
+def test_rag_chain_cache_builds_once_per_key():
+    cache = RAGChainCache(maxsize=2, ttl=60)
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return object()
+
+    first = cache.get_or_create('key', builder)
+    second = cache.get_or_create('key', builder)
+
+    assert first is second
+    assert len(calls) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get_or_create('key', builder) is not first
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+@patch('gen_ai_orchestrator.main.db_pool_registry', new_callable=AsyncMock)
+@patch('gen_ai_orchestrator.main.open_search_client_registry', new_callable=AsyncMock)
+@patch('gen_ai_orchestrator.main.provider_client_registry', new_callable=AsyncMock)
+@patch(
+    'gen_ai_orchestrator.main.application_settings.vector_store_provider',
+    VectorStoreProvider.OPEN_SEARCH,
+)
+async def test_rag_chain_cache_is_cleared_on_shutdown(
+    mocked_provider_client_registry, *_
+):
+    rag_chain_cache.get_or_create('key', object)
+
+    async with lifespan(app):
+        assert len(rag_chain_cache) == 1
+
+    assert len(rag_chain_cache) == 0
+    mocked_provider_client_registry.aclose.assert_awaited_once()
+
+
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.build_rag_chain')
+def test_create_rag_chain_reuses_cached_chain(mocked_build_rag_chain):
+    rag_chain_cache.clear()
+    mocked_build_rag_chain.side_effect = lambda *args: object()
+
+    first = create_rag_chain(_rag_request(question='How to find a page?'))
+    second = create_rag_chain(_rag_request(question='Where is my card?'))
+
+    assert first is second
+    mocked_build_rag_chain.assert_called_once()
+    rag_chain_cache.clear()
+
+
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.build_rag_chain')
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+def test_create_rag_chain_without_cache(mocked_build_rag_chain):
+    mocked_build_rag_chain.side_effect = lambda *args: object()
+
+    first = create_rag_chain(_rag_request())
+    second = create_rag_chain(_rag_request())
+
+    assert first is not second
+    assert mocked_build_rag_chain.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_condensation_chain_reads_prompt_inputs_at_call_time():
+    llm = FakeListChatModel(
+        responses=['{"condensed_question": "Where is my card?", "key_words": []}']
+    )
+    chain = build_question_condensation_chain(
+        llm,
+        PromptTemplate(
+            formatter='f-string', template='Reformulate in {locale}', inputs={}
+        ),
+    )
+    request = _rag_request(question='Where is my card?')
+
+    with patch.object(
+        FakeListChatModel, 'ainvoke', wraps=llm.ainvoke
+    ) as mocked_ainvoke:
+        output = await chain.ainvoke(
+            build_rag_chain_inputs(request, [HumanMessage(content='Hello')])
+        )
+
+    prompt_value = mocked_ainvoke.call_args.args[0]
+    assert prompt_value.messages[0].content == 'Reformulate in French'
+    assert prompt_value.messages[-1].content == 'Where is my card?'
+    assert output['condensed_question'] == 'Where is my card?'
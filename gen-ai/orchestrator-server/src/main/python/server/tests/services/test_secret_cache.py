@@ -0,0 +1,161 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from gen_ai_orchestrator.models.security.aws_secret_key.aws_secret_key import (
+    AwsSecretKey,
+)
+from gen_ai_orchestrator.models.security.raw_secret_key.raw_secret_key import (
+    RawSecretKey,
+)
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.security.secret_cache import SecretCache
+from gen_ai_orchestrator.services.security.security_service import (
+    afetch_secret_key_value,
+    clear_secret_cache,
+    fetch_secret_key_value,
+    find_secret_keys,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+
+def test_secret_is_loaded_once():
+    cache = SecretCache(maxsize=2, ttl=60, refresh_ratio=0.8, max_workers=1)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return 'value'
+
+    hits = metrics_registry.get_counter('secret_cache.hits')
+    misses = metrics_registry.get_counter('secret_cache.misses')
+
+    assert cache.get('key', loader) == 'value'
+    assert cache.get('key', loader) == 'value'
+    assert len(calls) == 1
+    assert metrics_registry.get_counter('secret_cache.hits') == hits + 1
+    assert metrics_registry.get_counter('secret_cache.misses') == misses + 1
+
+
+def test_none_and_errors_are_not_cached():
+    cache = SecretCache(maxsize=2, ttl=60, refresh_ratio=0.8, max_workers=1)
+
+    assert cache.get('key', lambda: None) is None
+    with pytest.raises(ValueError):
+        cache.get('key', lambda: (_ for _ in ()).throw(ValueError('boom')))
+    assert len(cache) == 0
+    assert cache.get('key', lambda: 'value') == 'value'
+
+
+def test_secret_is_refreshed_ahead_of_expiry():
+    cache = SecretCache(maxsize=2, ttl=60, refresh_ratio=0, max_workers=1)
+    refreshed = threading.Event()
+    values = iter(['first', 'second'])
+
+    def loader():
+        value = next(values)
+        if value == 'second':
+            refreshed.set()
+        return value
+
+    assert cache.get('key', loader) == 'first'
+    # The cached value is served while it is refreshed in background
+    assert cache.get('key', loader) == 'first'
+    assert refreshed.wait(timeout=5)
+    time.sleep(0.05)
+    assert cache.get('key', loader) == 'second'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_a_single_lookup():
+    cache = SecretCache(maxsize=2, ttl=60, refresh_ratio=0.8, max_workers=2)
+    calls = []
+
+    def loader():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.1)
+        return 'value'
+
+    values = await asyncio.gather(*(cache.aget('key', loader) for _ in range(5)))
+
+    assert values == ['value'] * 5
+    assert len(calls) == 1
+    # The lookup runs out of the event loop thread
+    assert calls[0].startswith('secret-cache')
+
+
+@pytest.mark.asyncio
+@patch('boto3.client')
+@patch(
+    'gen_ai_orchestrator.utils.aws.aws_secrets_manager_client.AWSSecretsManagerClient.get_secret'
+)
+async def test_aws_secret_and_client_are_reused(mock_get_secret, mock_boto3_client):
+    clear_secret_cache()
+    mock_get_secret.return_value = '{"secret": "my_secret_key_value"}'
+    secret_key = AwsSecretKey(secret_name='my_secret_key')
+
+    assert await afetch_secret_key_value(secret_key) == 'my_secret_key_value'
+    assert fetch_secret_key_value(secret_key) == 'my_secret_key_value'
+    assert fetch_secret_key_value(secret_key) == 'my_secret_key_value'
+
+    mock_boto3_client.assert_called_once_with(service_name='secretsmanager')
+    mock_get_secret.assert_called_once_with('my_secret_key')
+    clear_secret_cache()
+
+
+def test_find_secret_keys_of_a_request():
+    request = RAGRequest(
+        dialog=None,
+        question_condensing_llm_setting={
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'llm-key'},
+            'temperature': 0,
+            'model': 'gpt-4o',
+        },
+        question_condensing_prompt={
+            'formatter': 'f-string',
+            'template': 'Reformulate',
+            'inputs': {},
+        },
+        question_answering_llm_setting={
+            'provider': 'OpenAI',
+            'api_key': {'type': 'AwsSecretsManager', 'secret_name': 'llm-secret'},
+            'temperature': 0,
+            'model': 'gpt-4o',
+        },
+        question_answering_prompt={
+            'formatter': 'f-string',
+            'template': '{context} {question}',
+            'inputs': {'question': 'Hello'},
+        },
+        embedding_question_em_setting={
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'em-key'},
+            'model': 'text-embedding-3-small',
+        },
+        document_index_name='my-index',
+        document_search_params={'provider': 'OpenSearch', 'filter': [], 'k': 4},
+    )
+
+    secret_keys = find_secret_keys(request)
+
+    assert RawSecretKey(secret='llm-key') in secret_keys
+    assert RawSecretKey(secret='em-key') in secret_keys
+    assert AwsSecretKey(secret_name='llm-secret') in secret_keys
@@ -32,6 +32,7 @@ from gen_ai_orchestrator.models.security.raw_secret_key.raw_secret_key import (
     RawSecretKey,
 )
 from gen_ai_orchestrator.services.security.security_service import (
+    clear_secret_cache,
     fetch_secret_key_value,
 )
 from gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client import (
@@ -40,6 +41,9 @@ from gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client import (
 
 
 class TestSecurityService(unittest.TestCase):
+    def setUp(self):
+        clear_secret_cache()
+
     def test_fetch_unknown_secret_key_value(self):
         # Test data
         my_secret_api_key = '123abc!'
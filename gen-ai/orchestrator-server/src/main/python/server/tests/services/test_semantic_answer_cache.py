@@ -0,0 +1,255 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_community.chat_models.fake import FakeListChatModel
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.runnables import RunnableLambda
+
+from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.rag_chain import execute_rag_chain
+from gen_ai_orchestrator.services.langchain.semantic_answer_cache import (
+    find_index_session_id,
+    in_memory_semantic_answer_store,
+)
+from gen_ai_orchestrator.services.langchain.semantic_answer_store import (
+    CachedAnswer,
+    InMemorySemanticAnswerStore,
+    PGVectorSemanticAnswerStore,
+)
+
+LLM_SETTING = {
+    'provider': 'OpenAI',
+    'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+    'temperature': 0,
+    'model': 'gpt-4o',
+}
+
+
+def _cached_answer(answer: str, index_session_id: str = 'session-1') -> CachedAnswer:
+    return CachedAnswer(
+        document_index_name='my-index',
+        index_session_id=index_session_id,
+        question=answer,
+        answer=LLMAnswer(answer=answer),
+        footnotes=[],
+    )
+
+
+def test_find_index_session_id():
+    assert (
+        find_index_session_id(
+            [
+                {'term': {'metadata.tags.keyword': 'faq'}},
+                {'term': {'metadata.index_session_id.keyword': 'session-1'}},
+            ]
+        )
+        == 'session-1'
+    )
+    assert find_index_session_id({'index_session_id': 'session-2'}) == 'session-2'
+    assert (
+        find_index_session_id({'$and': [{'index_session_id': {'$eq': 'session-3'}}]})
+        == 'session-3'
+    )
+    assert find_index_session_id([{'term': {'metadata.id': 'doc-1'}}]) is None
+    assert find_index_session_id(None) is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_search():
+    store = InMemorySemanticAnswerStore(max_size=10, ttl=60)
+    await store.add('scope', [1.0, 0.0], _cached_answer('first'))
+    await store.add('scope', [0.0, 1.0], _cached_answer('second'))
+    await store.add('other-scope', [1.0, 0.1], _cached_answer('other'))
+
+    cached_answer, similarity = await store.search('scope', [0.9, 0.1], 0.9)
+    assert cached_answer.answer.answer == 'first'
+    assert similarity == pytest.approx(0.9939, abs=1e-4)
+    assert await store.search('scope', [0.7, 0.7], 0.9) is None
+    assert await store.search('unknown-scope', [1.0, 0.0], 0.9) is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_evicts_the_least_recently_used_answer():
+    store = InMemorySemanticAnswerStore(max_size=2, ttl=60)
+    await store.add('scope', [1.0, 0.0], _cached_answer('first'))
+    await store.add('scope', [0.0, 1.0], _cached_answer('second'))
+    # The first answer is used, the second one is evicted
+    assert await store.search('scope', [1.0, 0.0], 0.9) is not None
+    await store.add('scope', [-1.0, 0.0], _cached_answer('third'))
+
+    assert len(store) == 2
+    assert await store.search('scope', [0.0, 1.0], 0.9) is None
+    assert await store.search('scope', [1.0, 0.0], 0.9) is not None
+
+
+@pytest.mark.asyncio
+async def test_new_index_session_invalidates_the_cached_answers():
+    store = InMemorySemanticAnswerStore(max_size=10, ttl=60)
+    await store.activate_index_session('my-index', 'session-1')
+    await store.add('scope', [1.0, 0.0], _cached_answer('first', 'session-1'))
+
+    await store.activate_index_session('my-index', 'session-1')
+    assert len(store) == 1
+
+    await store.activate_index_session('my-index', 'session-2')
+    assert len(store) == 0
+
+
+def _pgvector_store() -> tuple[PGVectorSemanticAnswerStore, MagicMock]:
+    connection = MagicMock()
+    connection.execute = AsyncMock(
+        return_value=MagicMock(first=MagicMock(return_value=None))
+    )
+    engine = MagicMock()
+    engine.begin.return_value.__aenter__ = AsyncMock(return_value=connection)
+    engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+    store = PGVectorSemanticAnswerStore(
+        engine=engine,
+        max_size=10,
+        ttl=60,
+        index_dimensions=2,
+        ef_search=100,
+        eviction_interval=60,
+    )
+    return store, connection
+
+
+def _executed_queries(connection: MagicMock) -> list[str]:
+    return [str(call.args[0]) for call in connection.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_pgvector_store_is_set_up_in_background_on_first_use():
+    store, connection = _pgvector_store()
+
+    # Not set up yet: a miss, without waiting for the table creation
+    assert await store.search('scope', [1.0, 0.0], 0.9) is None
+    await asyncio.wait_for(store._setup_task, 1)
+    queries = _executed_queries(connection)
+    assert not any('SELECT id' in query for query in queries)
+    assert any('USING hnsw' in query for query in queries)
+    assert any('(last_used_at)' in query for query in queries)
+
+    connection.execute.reset_mock()
+    assert await store.search('scope', [1.0, 0.0], 0.9) is None
+    # The indexed dimension is searched through the HNSW index expression
+    assert 'ORDER BY embedding::vector(2) <=>' in _executed_queries(connection)[-1]
+
+
+@pytest.mark.asyncio
+async def test_pgvector_store_evicts_at_most_once_per_interval():
+    store, connection = _pgvector_store()
+    await store.setup()
+    connection.execute.reset_mock()
+
+    await store.add('scope', [1.0, 0.0], _cached_answer('first'))
+    await store.add('scope', [0.0, 1.0], _cached_answer('second'))
+
+    queries = _executed_queries(connection)
+    assert len([query for query in queries if 'INSERT' in query]) == 2
+    assert len([query for query in queries if 'ORDER BY last_used_at' in query]) == 1
+
+
+@pytest.mark.asyncio
+@patch(
+    'gen_ai_orchestrator.services.langchain.semantic_answer_cache.application_settings.rag_semantic_cache_enabled',
+    True,
+)
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+async def test_rag_chain_returns_the_cached_answer(
+    mocked_get_llm_factory, mocked_get_em_factory, mocked_get_vector_store_factory
+):
+    await in_memory_semantic_answer_store.clear()
+    doc = Document(
+        page_content='A web page\n\nThe useful source content.',
+        metadata={
+            'id': 'doc-1',
+            'chunk': '2/5',
+            'title': 'A web page',
+            'source': 'https://intranet.example.com/page',
+            'index_session_id': 'session-1',
+        },
+    )
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(responses=['{"condensed_question": "unused"}']),
+        FakeListChatModel(
+            responses=[
+                '{"status": "found_in_context", "answer": "Use the intranet page.", '
+                '"context_usage": [{"chunk": "doc-1:2/5", "used_in_response": true}]}'
+            ]
+        ),
+        FakeListChatModel(responses=['{"condensed_question": "unused"}']),
+        FakeListChatModel(responses=['{"answer": "A generated answer."}']),
+    ]
+    mocked_get_em_factory.return_value.get_embedding_model.return_value = (
+        DeterministicFakeEmbedding(size=16)
+    )
+    vector_retriever = RunnableLambda(lambda _: [doc])
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = vector_retriever
+    request = RAGRequest(
+        dialog={'history': [], 'tags': []},
+        question_condensing_llm_setting=LLM_SETTING,
+        question_condensing_prompt={
+            'formatter': 'f-string',
+            'template': 'Reformulate',
+            'inputs': {},
+        },
+        question_answering_llm_setting=LLM_SETTING,
+        question_answering_prompt={
+            'formatter': 'f-string',
+            'template': '{context} {question}',
+            'inputs': {'question': 'How to find a page?'},
+        },
+        embedding_question_em_setting={
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+            'model': 'text-embedding-3-small',
+        },
+        document_index_name='my-index',
+        document_search_params={
+            'provider': 'OpenSearch',
+            'search_type': 'SIMILARITY_SEARCH',
+            'filter': [{'term': {'metadata.index_session_id.keyword': 'session-1'}}],
+            'k': 4,
+        },
+    )
+
+    first_response = await execute_rag_chain(request, debug=True)
+    with patch.object(
+        RunnableLambda, 'ainvoke', autospec=True, side_effect=RunnableLambda.ainvoke
+    ) as mocked_ainvoke:
+        second_response = await execute_rag_chain(request, debug=True)
+
+    assert first_response.debug.semantic_cache.hit is False
+    assert second_response.debug.semantic_cache.hit is True
+    assert second_response.debug.semantic_cache.similarity == pytest.approx(1.0)
+    assert second_response.answer.answer == 'Use the intranet page.'
+    assert second_response.footnotes == first_response.footnotes
+    assert len(second_response.footnotes) == 1
+    assert not [
+        call for call in mocked_ainvoke.call_args_list if call.args[0] is vector_retriever
+    ]
+    await in_memory_semantic_answer_store.clear()
@@ -0,0 +1,249 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+import math
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_community.chat_models.fake import FakeListChatModel
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    SpeculativeRetrievalSimilarity,
+)
+from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.services.langchain.rag_chain import execute_rag_chain
+from gen_ai_orchestrator.services.langchain.speculative_retrieval import (
+    RetrievalSpeculation,
+    build_speculative_retrieval_starter,
+    retrieve_vector_documents,
+    string_similarity,
+)
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+
+SPECULATIVE_DOCS = [Document(page_content='speculative', metadata={'id': '1'})]
+CONDENSED_DOCS = [Document(page_content='condensed', metadata={'id': '2'})]
+LLM_SETTING = {
+    'provider': 'OpenAI',
+    'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+    'temperature': 0,
+    'model': 'gpt-4o',
+}
+
+
+async def _speculative_search():
+    await asyncio.sleep(0.01)
+    return SPECULATIVE_DOCS
+
+
+def test_string_similarity():
+    assert string_similarity('How to find a page?', 'how to find a page') == 1.0
+    assert string_similarity('How to find a page?', 'Where is my card?') < 0.5
+
+
+@pytest.mark.asyncio
+async def test_speculation_hit():
+    hits = metrics_registry.get_counter('rag.speculation.hits')
+    speculation = RetrievalSpeculation(
+        question='How to find a page?',
+        task=asyncio.create_task(_speculative_search()),
+    )
+
+    documents = await speculation.resolve('How to find a page ?')
+
+    assert documents == SPECULATIVE_DOCS
+    assert speculation.hit is True
+    assert speculation.similarity == 1.0
+    assert metrics_registry.get_counter('rag.speculation.hits') == hits + 1
+    assert speculation.to_debug_data().hit is True
+
+
+@pytest.mark.asyncio
+async def test_speculation_miss_cancels_the_speculative_retrieval():
+    misses = metrics_registry.get_counter('rag.speculation.misses')
+    task = asyncio.create_task(_speculative_search())
+    speculation = RetrievalSpeculation(question='And this one?', task=task)
+
+    documents = await speculation.resolve('How to block my credit card?')
+    await asyncio.sleep(0)
+
+    assert documents is None
+    assert speculation.hit is False
+    assert task.cancelled()
+    assert metrics_registry.get_counter('rag.speculation.misses') == misses + 1
+
+
+@pytest.mark.asyncio
+async def test_retrieve_vector_documents_falls_back_on_speculation_miss():
+    vector_retriever = AsyncMock()
+    vector_retriever.ainvoke.return_value = CONDENSED_DOCS
+    speculation = RetrievalSpeculation(
+        question='And this one?', task=asyncio.create_task(_speculative_search())
+    )
+
+    documents = await retrieve_vector_documents(
+        vector_retriever,
+        {'speculation': speculation},
+        'How to block my credit card?',
+    )
+
+    assert documents == CONDENSED_DOCS
+    vector_retriever.ainvoke.assert_awaited_once_with(
+        input='How to block my credit card?'
+    )
+
+
+@pytest.mark.asyncio
+async def test_speculative_retrieval_is_disabled_by_default():
+    vector_retriever = AsyncMock()
+    start = build_speculative_retrieval_starter(vector_retriever)
+
+    assert await start({'question': 'How to find a page?'}) is None
+    vector_retriever.ainvoke.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch(
+    'gen_ai_orchestrator.services.langchain.speculative_retrieval.application_settings.rag_speculative_retrieval_enabled',
+    True,
+)
+async def test_speculative_retrieval_starts_on_the_user_question():
+    vector_retriever = AsyncMock()
+    vector_retriever.ainvoke.return_value = SPECULATIVE_DOCS
+    start = build_speculative_retrieval_starter(vector_retriever)
+
+    speculation = await start({'question': 'How to find a page?'})
+
+    assert await speculation.task == SPECULATIVE_DOCS
+    vector_retriever.ainvoke.assert_awaited_once_with(
+        'How to find a page?', config=None
+    )
+
+
+@pytest.mark.asyncio
+@patch(
+    'gen_ai_orchestrator.services.langchain.speculative_retrieval.application_settings.rag_speculative_retrieval_enabled',
+    True,
+)
+async def test_speculative_retrieval_forwards_the_chain_config():
+    vector_retriever = AsyncMock()
+    vector_retriever.ainvoke.return_value = SPECULATIVE_DOCS
+    start = RunnableLambda(build_speculative_retrieval_starter(vector_retriever))
+
+    speculation = await start.ainvoke(
+        {'question': 'How to find a page?'}, config={'tags': ['rag']}
+    )
+
+    assert await speculation.task == SPECULATIVE_DOCS
+    config = vector_retriever.ainvoke.await_args.kwargs['config']
+    assert 'rag' in config['tags']
+
+
+@pytest.mark.asyncio
+@patch(
+    'gen_ai_orchestrator.services.langchain.speculative_retrieval.application_settings.rag_speculative_retrieval_similarity',
+    SpeculativeRetrievalSimilarity.EMBEDDING,
+)
+async def test_speculation_embedding_similarity_embeds_each_question():
+    embedding_model = AsyncMock()
+    embedding_model.aembed_query.side_effect = lambda text: (
+        [1.0, 0.0] if text == 'How to find a page?' else [1.0, 1.0]
+    )
+    speculation = RetrievalSpeculation(
+        question='How to find a page?',
+        task=asyncio.create_task(_speculative_search()),
+        embedding_model=embedding_model,
+    )
+
+    await speculation.resolve('Where is the page?')
+
+    assert speculation.similarity == pytest.approx(math.sqrt(0.5))
+    assert embedding_model.aembed_query.await_count == 2
+    embedding_model.aembed_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch(
+    'gen_ai_orchestrator.services.langchain.speculative_retrieval.application_settings.rag_speculative_retrieval_enabled',
+    True,
+)
+@patch(
+    'gen_ai_orchestrator.services.langchain.rag_chain_builder.application_settings.rag_chain_cache_enabled',
+    False,
+)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_vector_store_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain_builder.get_llm_factory')
+async def test_rag_chain_reuses_speculative_documents(
+    mocked_get_llm_factory, mocked_get_em_factory, mocked_get_vector_store_factory
+):
+    doc = Document(
+        page_content='A web page\n\nThe useful source content.',
+        metadata={
+            'id': 'doc-1',
+            'chunk': '2/5',
+            'title': 'A web page',
+            'source': 'https://intranet.example.com/page',
+            'index_session_id': 'session',
+        },
+    )
+    mocked_get_llm_factory.return_value.get_language_model.side_effect = [
+        FakeListChatModel(
+            responses=['{"condensed_question": "How to find a page ?", "key_words": []}']
+        ),
+        FakeListChatModel(
+            responses=[
+                '{"status": "found_in_context", "answer": "Use the intranet page.", '
+                '"context_usage": [{"chunk": "doc-1:2/5", "used_in_response": true}]}'
+            ]
+        ),
+    ]
+    vector_retriever = RunnableLambda(lambda _: [doc])
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = vector_retriever
+    request = RAGRequest(
+        dialog={'history': [{'text': 'Hello', 'type': 'HUMAN'}], 'tags': []},
+        question_condensing_llm_setting=LLM_SETTING,
+        question_condensing_prompt={
+            'formatter': 'f-string',
+            'template': 'Reformulate',
+            'inputs': {},
+        },
+        question_answering_llm_setting=LLM_SETTING,
+        question_answering_prompt={
+            'formatter': 'f-string',
+            'template': '{context} {question}',
+            'inputs': {'question': 'How to find a page?'},
+        },
+        embedding_question_em_setting={
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'ab7***A1IV4B'},
+            'model': 'text-embedding-3-small',
+        },
+        document_index_name='my-index',
+        document_search_params={'provider': 'OpenSearch', 'filter': [], 'k': 4},
+    )
+
+    with patch.object(
+        RunnableLambda, 'ainvoke', autospec=True, side_effect=RunnableLambda.ainvoke
+    ) as mocked_ainvoke:
+        response = await execute_rag_chain(request, debug=True)
+
+    vector_retriever_calls = [
+        call for call in mocked_ainvoke.call_args_list if call.args[0] is vector_retriever
+    ]
+    assert len(vector_retriever_calls) == 1
+    assert response.debug.speculative_retrieval.hit is True
+    assert response.answer.answer == 'Use the intranet page.'
@@ -0,0 +1,111 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+
+import pytest
+
+from gen_ai_orchestrator.utils.metrics import metrics_registry
+from gen_ai_orchestrator.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_the_same_key_are_coalesced():
+    single_flight = SingleFlight('test.coalescing')
+    calls = []
+
+    async def call(value: str) -> str:
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value.upper()
+
+    results = await asyncio.gather(
+        single_flight.do('a', lambda: call('a')),
+        single_flight.do('a', lambda: call('a')),
+        single_flight.do('b', lambda: call('b')),
+    )
+
+    assert results == ['A', 'A', 'B']
+    assert calls == ['a', 'b']
+    assert len(single_flight) == 0
+    # Once done, the call runs again
+    assert await single_flight.do('a', lambda: call('a')) == 'A'
+    assert calls == ['a', 'b', 'a']
+    assert metrics_registry.get_counter('test.coalescing.coalesced') == 1
+    assert metrics_registry.snapshot()['gauges']['test.coalescing.ratio'] == 0.25
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_share_the_exception():
+    single_flight = SingleFlight('test.coalescing')
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise ValueError('Failed')
+
+    results = await asyncio.gather(
+        single_flight.do('a', call), single_flight.do('a', call), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_once_all_its_callers_are_gone():
+    single_flight = SingleFlight('test.coalescing')
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def call():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.create_task(single_flight.do('a', call))
+    second = asyncio.create_task(single_flight.do('a', call))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+
+@pytest.mark.asyncio
+async def test_call_being_cancelled_is_not_reused():
+    single_flight = SingleFlight('test.coalescing')
+    started = asyncio.Event()
+
+    async def slow_call():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def call():
+        return 'new'
+
+    first = asyncio.create_task(single_flight.do('a', slow_call))
+    await started.wait()
+    first.cancel()
+    await asyncio.sleep(0)
+
+    # The cancelled call is forgotten at once, before it is done
+    assert len(single_flight) == 0
+    assert await single_flight.do('a', call) == 'new'
@@ -0,0 +1,395 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+ANN benchmark of a vector store index (a PGVector collection or an OpenSearch
+index): the recall@k, latency and throughput of its approximate nearest
+neighbour searches, for a grid of search effort settings (the search params of
+the orchestrator), against the exact nearest neighbours computed with NumPy
+over the vectors exported from the index.
+
+The searches are the ones of the orchestrator, by vector: the query embeddings
+are computed once beforehand, so that only the vector store is measured.
+"""
+import asyncio
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+from langchain_postgres.vectorstores import DistanceStrategy
+from opensearchpy.helpers import async_scan
+from pydantic import TypeAdapter
+from scripts.indexing.ann_benchmark.models import (
+    AnnBenchmarkReport,
+    AnnBenchmarkResult,
+)
+from scripts.indexing.pgvector.index_management import Distance
+from sqlalchemy import select
+
+from gen_ai_orchestrator.models.vector_stores.vector_store_types import (
+    DocumentSearchParams,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_vector_search import (
+    VECTOR_FIELD,
+    AsyncOpenSearchVectorSearch,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_factory import (
+    PGVectorFactory,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_store import (
+    CollectionPGVector,
+    get_search_settings,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
+    LangChainVectorStoreFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of documents per OpenSearch scroll page
+EXPORT_PAGE_SIZE = 1000
+# Number of queries per exact search matrix product
+EXACT_SEARCH_BATCH_SIZE = 256
+
+PGVECTOR_DISTANCES = {
+    DistanceStrategy.COSINE: Distance.COSINE,
+    DistanceStrategy.EUCLIDEAN: Distance.L2,
+    DistanceStrategy.MAX_INNER_PRODUCT: Distance.INNER_PRODUCT,
+}
+# The space types of the OpenSearch k-NN plugin (l2 being the LangChain default)
+OPEN_SEARCH_DISTANCES = {
+    'cosinesimil': Distance.COSINE,
+    'l2': Distance.L2,
+    'innerproduct': Distance.INNER_PRODUCT,
+}
+
+AnnSearch = Callable[[list[float]], Awaitable[list[str]]]
+
+
+async def export_pgvector(
+    vector_store: CollectionPGVector,
+) -> tuple[list[str], np.ndarray, Distance]:
+    """Export the ids and vectors of a collection, and its distance."""
+    collection_id = await vector_store.aget_collection_id()
+    embedding_store = vector_store.EmbeddingStore
+    statement = select(embedding_store.id, embedding_store.embedding).where(
+        embedding_store.collection_id == collection_id
+    )
+    async with vector_store._make_async_session() as session:
+        rows = (await session.execute(statement)).all()
+    ids = [str(row.id) for row in rows]
+    vectors = np.asarray([row.embedding for row in rows], dtype=np.float32)
+    return ids, vectors, PGVECTOR_DISTANCES[vector_store._distance_strategy]
+
+
+async def export_open_search(
+    vector_store: AsyncOpenSearchVectorSearch,
+) -> tuple[list[str], np.ndarray, Distance]:
+    """Export the ids and vectors of an index, and its distance (space type)."""
+    client = vector_store.async_client
+    mappings = await client.indices.get_mapping(index=vector_store.index_name)
+    # The response is keyed by the concrete index name (the index may be an alias)
+    vector_mapping = next(iter(mappings.values()))['mappings']['properties'][
+        VECTOR_FIELD
+    ]
+    space_type = vector_mapping.get('space_type') or vector_mapping.get(
+        'method', {}
+    ).get('space_type', 'l2')
+
+    ids, vectors = [], []
+    async for hit in async_scan(
+        client,
+        index=vector_store.index_name,
+        query={'_source': [VECTOR_FIELD]},
+        size=EXPORT_PAGE_SIZE,
+    ):
+        ids.append(hit['_id'])
+        vectors.append(hit['_source'][VECTOR_FIELD])
+    return ids, np.asarray(vectors, dtype=np.float32), OPEN_SEARCH_DISTANCES[space_type]
+
+
+async def export_vectors(
+    factory: LangChainVectorStoreFactory,
+) -> tuple[list[str], np.ndarray, Distance]:
+    """
+    Export the ids and vectors of the index of a vector store factory, and the
+    distance of its searches.
+    """
+    vector_store = factory.get_vector_store()
+    if isinstance(vector_store, CollectionPGVector):
+        return await export_pgvector(vector_store)
+    return await export_open_search(vector_store)
+
+
+def exact_neighbours(
+    vectors: np.ndarray, queries: np.ndarray, distance: Distance, k: int
+) -> list[list[int]]:
+    """
+    Find the exact nearest neighbours of the queries (brute force).
+
+    Returns:
+        The indexes of the k nearest vectors of each query, nearest first.
+    """
+    k = min(k, len(vectors))
+    if distance == Distance.COSINE:
+        vectors = vectors / np.maximum(
+            np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12
+        )
+        queries = queries / np.maximum(
+            np.linalg.norm(queries, axis=1, keepdims=True), 1e-12
+        )
+    squared_norms = (vectors**2).sum(axis=1)
+
+    neighbours = []
+    for start in range(0, len(queries), EXACT_SEARCH_BATCH_SIZE):
+        # The higher, the nearer
+        scores = queries[start : start + EXACT_SEARCH_BATCH_SIZE] @ vectors.T
+        if distance == Distance.L2:
+            # ||q - v||² = ||q||² - 2 q.v + ||v||², ||q||² being the same for all v
+            scores = 2 * scores - squared_norms
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        neighbours.extend(np.take_along_axis(top, order, axis=1).tolist())
+    return neighbours
+
+
+def expand_grid(grid: dict[str, list[int]]) -> list[dict[str, int]]:
+    """Return the index defaults ({}), then all the combinations of the grid values."""
+    names = sorted(name for name, values in grid.items() if values)
+    combinations = [
+        dict(zip(names, values))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+    return [{}] + [combination for combination in combinations if combination]
+
+
+def get_ann_search(
+    factory: LangChainVectorStoreFactory, provider: str, k: int, search_effort: dict
+) -> AnnSearch:
+    """
+    Return the search by vector of the orchestrator, with the given search effort.
+
+    Raises:
+        ValueError: if the search effort is not valid (e.g. ef_search < k)
+    """
+    search_kwargs = (
+        TypeAdapter(DocumentSearchParams)
+        .validate_python({'provider': provider, 'k': k, **search_effort})
+        .to_dict()
+    )
+    unknown_params = set(search_effort) - set(search_kwargs)
+    if unknown_params:
+        raise ValueError(
+            f"Unknown {provider} search params: {', '.join(sorted(unknown_params))}"
+        )
+    if isinstance(factory, PGVectorFactory):
+        # The search effort is applied by the store (SET LOCAL)
+        vector_store = factory.get_vector_store(
+            search_settings=get_search_settings(search_kwargs)
+        )
+        kwargs = {}
+    else:
+        vector_store = factory.get_vector_store()
+        kwargs = {name: value for name, value in search_kwargs.items() if name != 'k'}
+
+    async def search(embedding: list[float]) -> list[str]:
+        docs_with_scores = await vector_store.asimilarity_search_with_score_by_vector(
+            embedding, k=k, **kwargs
+        )
+        return [doc.id for doc, _ in docs_with_scores]
+
+    return search
+
+
+def recall(ann_ids: list[str], exact_ids: list[str]) -> float:
+    return len(set(ann_ids) & set(exact_ids)) / len(exact_ids) if exact_ids else 1.0
+
+
+async def benchmark_search(
+    search: AnnSearch,
+    search_effort: dict[str, int],
+    embeddings: list[list[float]],
+    exact_ids: list[list[str]],
+    repeat: int,
+    warmup_rounds: int,
+    concurrency: int,
+) -> AnnBenchmarkResult:
+    """
+    Run the searches of all the queries (warmup_rounds + repeat times, at most
+    concurrency at once), and measure their recall@k (first measured round),
+    latency and throughput.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed_search(embedding: list[float], measured: bool) -> list[str]:
+        async with semaphore:
+            start = time.perf_counter()
+            ids = await search(embedding)
+            if measured:
+                latencies.append(time.perf_counter() - start)
+            return ids
+
+    for _ in range(warmup_rounds):
+        await asyncio.gather(*(timed_search(e, False) for e in embeddings))
+
+    start = time.perf_counter()
+    rounds = [
+        await asyncio.gather(*(timed_search(e, True) for e in embeddings))
+        for _ in range(repeat)
+    ]
+    duration = time.perf_counter() - start
+
+    recalls = [recall(ids, exact) for ids, exact in zip(rounds[0], exact_ids)]
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return AnnBenchmarkResult(
+        search_effort=search_effort,
+        recall_at_k=float(np.mean(recalls)),
+        min_recall_at_k=float(np.min(recalls)),
+        latency_p50_ms=float(p50),
+        latency_p95_ms=float(p95),
+        latency_p99_ms=float(p99),
+        throughput=len(latencies) / duration,
+    )
+
+
+def recommend(
+    results: list[AnnBenchmarkResult], target_recall: float
+) -> Optional[AnnBenchmarkResult]:
+    """Return the fastest setting (p95 latency) reaching the target recall."""
+    reaching = [result for result in results if result.recall_at_k >= target_recall]
+    return min(reaching, key=lambda result: result.latency_p95_ms, default=None)
+
+
+async def run_ann_benchmark(
+    factory: LangChainVectorStoreFactory,
+    provider: str,
+    queries: list[str],
+    k: int,
+    search_effort_grid: dict[str, list[int]],
+    repeat: int = 3,
+    warmup_rounds: int = 1,
+    concurrency: int = 1,
+    target_recall: float = 0.95,
+) -> AnnBenchmarkReport:
+    """
+    Benchmark the ANN searches of the index of a vector store factory.
+
+    Args:
+        factory: The vector store factory (its index and embedding model)
+        provider: The vector store provider
+        queries: The sample queries
+        k: The number of documents searched
+        search_effort_grid: The search effort values, per search param
+        repeat: The number of measured searches per query and setting
+        warmup_rounds: The number of unmeasured searches per query and setting
+        concurrency: The number of concurrent searches
+        target_recall: The recall@k of the recommended setting
+    """
+    logger.info('Exporting the vectors of %s...', factory.index_name)
+    ids, vectors, distance = await export_vectors(factory)
+    if not ids:
+        raise ValueError(f"The index {factory.index_name} is empty.")
+    logger.info('%s vectors exported (%s distance).', len(ids), distance.value)
+
+    embedding_model = factory.embedding_function
+    embeddings = [await embedding_model.aembed_query(query) for query in queries]
+    exact_ids = [
+        [ids[index] for index in neighbours]
+        for neighbours in exact_neighbours(
+            vectors, np.asarray(embeddings, dtype=np.float32), distance, k
+        )
+    ]
+
+    results = []
+    for search_effort in expand_grid(search_effort_grid):
+        try:
+            search = get_ann_search(factory, provider, k, search_effort)
+        except ValueError as e:
+            logger.warning('Search effort %s skipped: %s', search_effort, e)
+            continue
+        result = await benchmark_search(
+            search,
+            search_effort,
+            embeddings,
+            exact_ids,
+            repeat=repeat,
+            warmup_rounds=warmup_rounds,
+            concurrency=concurrency,
+        )
+        logger.info(
+            '%s: recall@%s=%.3f, p95=%.1fms',
+            search_effort or 'index defaults',
+            k,
+            result.recall_at_k,
+            result.latency_p95_ms,
+        )
+        results.append(result)
+
+    return AnnBenchmarkReport(
+        provider=provider,
+        document_index_name=factory.index_name,
+        distance=distance.value,
+        vectors_count=len(ids),
+        queries_count=len(queries),
+        k=k,
+        concurrency=concurrency,
+        target_recall=target_recall,
+        results=results,
+        recommendation=recommend(results, target_recall),
+    )
+
+
+def format_report(report: AnnBenchmarkReport) -> str:
+    """Format the report in Markdown."""
+
+    def format_effort(result: AnnBenchmarkResult) -> str:
+        return (
+            ', '.join(f"{name}={value}" for name, value in result.search_effort.items())
+            or 'index defaults'
+        )
+
+    lines = [
+        f"# ANN benchmark of {report.document_index_name} ({report.provider})",
+        '',
+        f"{report.vectors_count} vectors ({report.distance} distance), "
+        f"{report.queries_count} queries, k={report.k}, "
+        f"concurrency={report.concurrency}, {report.date:%Y-%m-%d %H:%M:%S}",
+        '',
+        f"| Search effort | Recall@{report.k} | Min recall@{report.k} "
+        '| p50 (ms) | p95 (ms) | p99 (ms) | Searches/s |',
+        '|---|---|---|---|---|---|---|',
+    ]
+    lines += [
+        f"| {format_effort(result)} | {result.recall_at_k:.3f} "
+        f"| {result.min_recall_at_k:.3f} | {result.latency_p50_ms:.1f} "
+        f"| {result.latency_p95_ms:.1f} | {result.latency_p99_ms:.1f} "
+        f"| {result.throughput:.1f} |"
+        for result in report.results
+    ]
+    lines.append('')
+    if report.recommendation:
+        lines.append(
+            f"Recommended: {format_effort(report.recommendation)}, the fastest "
+            f"setting reaching a recall@{report.k} of {report.target_recall}."
+        )
+    else:
+        lines.append(
+            f"No setting reaches a recall@{report.k} of {report.target_recall}: "
+            'widen the grid, or rebuild the index with more effort '
+            '(e.g. HNSW m and ef_construction, IVFFlat lists).'
+        )
+    return '\n'.join(lines)
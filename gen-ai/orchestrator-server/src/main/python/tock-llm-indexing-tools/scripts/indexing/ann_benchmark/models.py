@@ -0,0 +1,152 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, model_validator
+from scripts.common.models import FromJsonMixin
+
+from gen_ai_orchestrator.models.em.em_types import EMSetting
+from gen_ai_orchestrator.models.observability.langfuse.langfuse_setting import (
+    LangfuseObservabilitySetting,
+)
+from gen_ai_orchestrator.models.vector_stores.vector_store_types import (
+    VectorStoreSetting,
+)
+
+
+class AnnBenchmarkDataset(BaseModel):
+    observability_setting: LangfuseObservabilitySetting = Field(
+        description='The Langfuse setting.'
+    )
+    dataset_name: str = Field(description='The dataset name.')
+    max_items: Optional[int] = Field(
+        description='The maximum number of dataset items used as queries.',
+        default=None,
+        ge=1,
+    )
+
+
+class RunAnnBenchmarkInput(FromJsonMixin):
+    em_setting: EMSetting = Field(
+        description='The embeddings setting (the one used to index the documents).'
+    )
+    vector_store_setting: VectorStoreSetting = Field(
+        description='The vector store settings.'
+    )
+    document_index_name: str = Field(
+        description='The PGVector collection or the OpenSearch index to benchmark.'
+    )
+    queries: List[str] = Field(
+        description='The sample queries (in addition to the dataset ones).',
+        default=[],
+    )
+    dataset: Optional[AnnBenchmarkDataset] = Field(
+        description='The Langfuse dataset whose questions are used as queries.',
+        default=None,
+    )
+    k: int = Field(description='The number of documents searched.', default=4, ge=1)
+    search_effort_grid: dict[str, List[int]] = Field(
+        description='The search effort values to benchmark, per search param: '
+        'ef_search and probes (PGVector), num_candidates, ef_search and nprobes '
+        '(OpenSearch). All their combinations are benchmarked, after the index defaults.',
+        examples=[{'ef_search': [40, 100, 200]}],
+        default={},
+    )
+    repeat: int = Field(
+        description='The number of measured searches per query and setting.',
+        default=3,
+        ge=1,
+    )
+    warmup_rounds: int = Field(
+        description='The number of unmeasured searches per query and setting.',
+        default=1,
+        ge=0,
+    )
+    concurrency: int = Field(
+        description='The number of concurrent searches.', default=1, ge=1
+    )
+    target_recall: float = Field(
+        description='The recall@k of the recommended setting (the fastest reaching it).',
+        default=0.95,
+        gt=0,
+        le=1,
+    )
+    output_directory: Path = Field(
+        description='The directory of the JSON and Markdown reports.',
+        default=Path('ann_benchmark'),
+    )
+
+    @model_validator(mode='after')
+    def check_queries(self) -> 'RunAnnBenchmarkInput':
+        if not self.queries and self.dataset is None:
+            raise ValueError('Queries or a dataset are required.')
+        return self
+
+    def format(self):
+        header_text = ' RUN ANN BENCHMARK INPUT '
+        details_str = f"""
+        The EM model         : {self.em_setting.model} ({self.em_setting.provider})
+        The Vector DB        : {self.vector_store_setting.host} ({self.vector_store_setting.provider})
+        The index name       : {self.document_index_name}
+        The dataset name     : {self.dataset.dataset_name if self.dataset else '-'}
+        k                    : {self.k}
+        Search effort grid   : {self.search_effort_grid}
+        Repeat / concurrency : {self.repeat} / {self.concurrency}
+        """
+
+        # Find the longest line in the details
+        details = details_str.splitlines()
+        max_detail_length = max(len(detail) for detail in details)
+        # Construct the header and separator lines
+        header_line = header_text.center(max_detail_length, '-')
+        separator = '-' * max_detail_length
+
+        to_string = f'{header_line}\n{details_str}\n{separator}'
+        return '\n'.join(
+            line.strip() for line in to_string.splitlines() if line.strip()
+        )
+
+
+class AnnBenchmarkResult(BaseModel):
+    search_effort: dict[str, int] = Field(
+        description='The search effort params (none: the index defaults).'
+    )
+    recall_at_k: float = Field(description='The average recall@k of the queries.')
+    min_recall_at_k: float = Field(description='The lowest recall@k of the queries.')
+    latency_p50_ms: float = Field(description='The median search latency.')
+    latency_p95_ms: float = Field(description='The 95th percentile search latency.')
+    latency_p99_ms: float = Field(description='The 99th percentile search latency.')
+    throughput: float = Field(description='The number of searches per second.')
+
+
+class AnnBenchmarkReport(BaseModel):
+    provider: str = Field(description='The vector store provider.')
+    document_index_name: str = Field(description='The benchmarked index.')
+    distance: str = Field(description='The distance of the exact search.')
+    vectors_count: int = Field(description='Number of vectors of the index.')
+    queries_count: int = Field(description='Number of queries.')
+    k: int = Field(description='The number of documents searched.')
+    concurrency: int = Field(description='The number of concurrent searches.')
+    target_recall: float = Field(description='The target recall@k.')
+    results: List[AnnBenchmarkResult] = Field(
+        description='The results, per search effort setting.'
+    )
+    recommendation: Optional[AnnBenchmarkResult] = Field(
+        description='The fastest setting (p95 latency) reaching the target recall.',
+        default=None,
+    )
+    date: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,121 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark the ANN searches of a vector store index (PGVector collection or OpenSearch index).
+
+Usage:
+    run_ann_benchmark.py [-v] --json-config-file=<jcf>
+
+Description:
+    The vectors of the index are exported, and the exact nearest neighbours of the sample
+    queries (and/or the questions of a Langfuse dataset) are computed with NumPy. The ANN
+    searches of the orchestrator then run for each search effort setting of the grid (after
+    the index defaults), and their recall@k, p50/p95/p99 latency and throughput are reported.
+    The fastest setting reaching the target recall is recommended.
+    The report is saved as JSON and Markdown files in the output directory.
+
+Arguments:
+    --json-config-file=<jcf>   Path to the input config file. This is a required argument.
+
+Options:
+    -v                         Enable verbose output for debugging purposes.
+    -h, --help                 Display this help message and exit.
+    --version                  Display the version of the script.
+
+Examples:
+    python run_ann_benchmark.py --json-config-file=path/to/config-file.json
+"""
+import asyncio
+import os
+
+from docopt import docopt
+from langfuse import Langfuse
+from scripts.common.logging_config import configure_logging
+from scripts.indexing.ann_benchmark.ann_benchmark import (
+    format_report,
+    run_ann_benchmark,
+)
+from scripts.indexing.ann_benchmark.models import (
+    AnnBenchmarkDataset,
+    RunAnnBenchmarkInput,
+)
+
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_em_factory,
+    get_vector_store_factory,
+)
+from gen_ai_orchestrator.services.security.security_service import (
+    fetch_secret_key_value,
+)
+
+
+def load_dataset_questions(dataset: AnnBenchmarkDataset) -> list[str]:
+    client = Langfuse(
+        host=str(dataset.observability_setting.url),
+        public_key=dataset.observability_setting.public_key,
+        secret_key=fetch_secret_key_value(dataset.observability_setting.secret_key),
+    )
+    items = client.get_dataset(dataset.dataset_name).items[: dataset.max_items]
+    return [item.input['question'] for item in items]
+
+
+async def main():
+    cli_args = docopt(__doc__, version='Run ANN Benchmark 1.0.0')
+    logger = configure_logging(cli_args)
+
+    input_config = RunAnnBenchmarkInput.from_json_file(cli_args['--json-config-file'])
+    logger.debug(f"\n{input_config.format()}")
+
+    queries = list(input_config.queries)
+    if input_config.dataset:
+        queries += load_dataset_questions(input_config.dataset)
+    logger.info(f"{len(queries)} queries loaded.")
+
+    factory = get_vector_store_factory(
+        setting=input_config.vector_store_setting,
+        index_name=input_config.document_index_name,
+        embedding_function=get_em_factory(
+            input_config.em_setting
+        ).get_embedding_model(),
+    )
+    report = await run_ann_benchmark(
+        factory,
+        provider=input_config.vector_store_setting.provider,
+        queries=queries,
+        k=input_config.k,
+        search_effort_grid=input_config.search_effort_grid,
+        repeat=input_config.repeat,
+        warmup_rounds=input_config.warmup_rounds,
+        concurrency=input_config.concurrency,
+        target_recall=input_config.target_recall,
+    )
+
+    os.makedirs(input_config.output_directory, exist_ok=True)
+    file_name = (
+        f"{input_config.output_directory}/{input_config.document_index_name}"
+        f"-{report.date:%Y%m%d-%H%M%S}"
+    )
+    with open(f"{file_name}.json", 'w', encoding='utf-8') as f:
+        f.write(report.model_dump_json(indent=2))
+    markdown = format_report(report)
+    with open(f"{file_name}.md", 'w', encoding='utf-8') as f:
+        f.write(markdown)
+
+    logger.info(f"\n{markdown}")
+    logger.info(f"Report saved in {file_name}.json and {file_name}.md")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
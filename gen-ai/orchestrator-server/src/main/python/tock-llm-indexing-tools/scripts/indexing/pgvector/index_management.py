@@ -0,0 +1,547 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+PGVector index management: the ANN (HNSW, IVFFlat), full-text (fts_vector
+column and GIN index) and metadata indexes of the LangChain embedding table,
+and the EXPLAIN check of the retrieval queries of the orchestrator.
+
+All the collections share the langchain_pg_embedding table, so do its indexes.
+"""
+import hashlib
+import logging
+import math
+from dataclasses import dataclass, field
+from enum import Enum, unique
+from typing import Any, Optional
+
+from langchain_core.embeddings import FakeEmbeddings
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from gen_ai_orchestrator.models.vector_stores.vector_store_fusion_params import (
+    FusionMethod,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_store import (
+    CollectionPGVector,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.postgresql_hybrid_retriever import (
+    build_hybrid_search_statement,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.postgresql_text_retriever import (
+    TEXT_SEARCH_SQL,
+)
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_TABLE = 'langchain_pg_embedding'
+COLLECTION_TABLE = 'langchain_pg_collection'
+FTS_COLUMN = 'fts_vector'
+# An IMMUTABLE unaccent, usable in a generated column (unaccent is STABLE)
+IMMUTABLE_UNACCENT = 'tock_immutable_unaccent'
+# PostgreSQL identifiers are truncated beyond 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+
+@unique
+class AnnMethod(str, Enum):
+    HNSW = 'hnsw'
+    IVFFLAT = 'ivfflat'
+
+
+@unique
+class Distance(str, Enum):
+    """The distances of pgvector, and their operator class (cosine for the orchestrator)."""
+
+    COSINE = 'cosine'
+    L2 = 'l2'
+    INNER_PRODUCT = 'ip'
+
+    @property
+    def operator_class(self) -> str:
+        return f"vector_{self.value}_ops"
+
+
+@dataclass
+class IndexInfo:
+    name: str
+    definition: str
+    size: str
+    scans: int
+    valid: bool
+
+    @property
+    def method(self) -> Optional[str]:
+        for method in ('hnsw', 'ivfflat', 'gin', 'btree'):
+            if f"USING {method} " in self.definition:
+                return method
+        return None
+
+
+@dataclass
+class CheckResult:
+    """The EXPLAIN plan of a retrieval query, and its sequential scans."""
+
+    query: str
+    seq_scans: list[str] = field(default_factory=list)
+    index_scans: list[str] = field(default_factory=list)
+    skipped_reason: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.seq_scans
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN a statement (its bind parameters being processed as usual)."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any, analyze: bool = False):
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    options = 'ANALYZE, FORMAT JSON' if element.analyze else 'FORMAT JSON'
+    return f"EXPLAIN ({options}) {compiler.process(element.statement, **kw)}"
+
+
+def index_name(*parts: str) -> str:
+    """Build an index name, shortened with a hash when too long."""
+    name = '_'.join(['ix', EMBEDDING_TABLE, *parts])
+    if len(name) <= MAX_IDENTIFIER_LENGTH:
+        return name
+    digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]
+    return f"{name[: MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+
+
+def autocommit(engine: Engine) -> Connection:
+    """A connection out of any transaction (CREATE INDEX CONCURRENTLY, VACUUM...)."""
+    return engine.connect().execution_options(isolation_level='AUTOCOMMIT')
+
+
+def count_rows(conn: Connection) -> int:
+    """The estimated row count of the embedding table (statistics, no scan)."""
+    return conn.execute(
+        text(
+            'SELECT greatest(reltuples, 0)::bigint FROM pg_class '
+            'WHERE oid = CAST(:table AS regclass)'
+        ),
+        {'table': EMBEDDING_TABLE},
+    ).scalar_one()
+
+
+def get_embedding_dimensions(conn: Connection) -> Optional[int]:
+    """The dimensions of the embedding column type (None for an untyped vector)."""
+    typmod = conn.execute(
+        text("""
+            SELECT atttypmod FROM pg_attribute
+            WHERE attrelid = CAST(:table AS regclass) AND attname = 'embedding'
+        """),
+        {'table': EMBEDDING_TABLE},
+    ).scalar_one()
+    return typmod if typmod > 0 else None
+
+
+def default_ivfflat_lists(rows: int) -> int:
+    """The pgvector recommendation: rows / 1000 up to 1M rows, sqrt(rows) beyond."""
+    if rows <= 1_000_000:
+        return max(10, rows // 1000)
+    return int(math.sqrt(rows))
+
+
+def create_ann_index(
+    engine: Engine,
+    method: AnnMethod,
+    distance: Distance = Distance.COSINE,
+    m: int = 16,
+    ef_construction: int = 64,
+    lists: Optional[int] = None,
+    dimensions: Optional[int] = None,
+    concurrently: bool = True,
+) -> str:
+    """
+    Create the ANN index of the embedding column (if it does not exist yet).
+
+    pgvector only indexes a typed vector column: an untyped one (the LangChain
+    default) is altered to vector(dimensions) first, which requires all the
+    embeddings to have these dimensions.
+
+    Returns:
+        The index name
+    """
+    name = index_name(method.value, distance.value)
+    with autocommit(engine) as conn:
+        column_dimensions = get_embedding_dimensions(conn)
+        if column_dimensions is None:
+            if dimensions is None:
+                raise ValueError(
+                    'The embedding column has no dimensions: '
+                    'give them (--dimensions) to type the column before indexing it.'
+                )
+            logger.info('Typing the embedding column as vector(%s)...', dimensions)
+            conn.execute(
+                text(
+                    f"ALTER TABLE {EMBEDDING_TABLE} "
+                    f"ALTER COLUMN embedding TYPE vector({int(dimensions)})"
+                )
+            )
+        elif dimensions is not None and dimensions != column_dimensions:
+            raise ValueError(
+                f"The embedding column has {column_dimensions} dimensions, not {dimensions}."
+            )
+
+        if AnnMethod.HNSW == method:
+            options = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+        else:
+            lists = lists or default_ivfflat_lists(count_rows(conn))
+            options = f"lists = {int(lists)}"
+
+        logger.info('Creating the %s index (%s)...', name, options)
+        conn.execute(
+            text(
+                f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {name} "
+                f"ON {EMBEDDING_TABLE} USING {method.value} (embedding {distance.operator_class}) "
+                f"WITH ({options})"
+            )
+        )
+    return name
+
+
+def inspect_indexes(engine: Engine) -> list[IndexInfo]:
+    """The indexes of the embedding table, with their size, scans and validity."""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT
+                    i.relname AS name,
+                    pg_get_indexdef(i.oid) AS definition,
+                    pg_size_pretty(pg_relation_size(i.oid)) AS size,
+                    coalesce(s.idx_scan, 0) AS scans,
+                    x.indisvalid AS valid
+                FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = x.indexrelid
+                WHERE x.indrelid = CAST(:table AS regclass)
+                ORDER BY i.relname
+            """),
+            {'table': EMBEDDING_TABLE},
+        ).all()
+    return [IndexInfo(**row._mapping) for row in rows]
+
+
+def rebuild_indexes(
+    engine: Engine, names: Optional[list[str]] = None, concurrently: bool = True
+) -> list[str]:
+    """
+    Rebuild indexes: the given ones, or all the ANN indexes (an IVFFlat index
+    is trained on the rows at build time, and degrades as they change).
+
+    Returns:
+        The rebuilt index names
+    """
+    indexes = {index.name: index for index in inspect_indexes(engine)}
+    if names:
+        unknown = set(names) - set(indexes)
+        if unknown:
+            raise ValueError(f"Unknown indexes on {EMBEDDING_TABLE}: {sorted(unknown)}")
+    else:
+        names = [
+            name
+            for name, index in indexes.items()
+            if index.method in (AnnMethod.HNSW.value, AnnMethod.IVFFLAT.value)
+        ]
+
+    with autocommit(engine) as conn:
+        for name in names:
+            logger.info('Rebuilding the %s index...', name)
+            conn.execute(
+                text(f"REINDEX INDEX {'CONCURRENTLY ' if concurrently else ''}{name}")
+            )
+    return names
+
+
+def get_fts_language(conn: Connection) -> Optional[str]:
+    """The text search configuration of the fts_vector column (None if missing)."""
+    expression = conn.execute(
+        text("""
+            SELECT pg_get_expr(d.adbin, d.adrelid)
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+            WHERE a.attrelid = CAST(:table AS regclass)
+              AND a.attname = :column AND NOT a.attisdropped
+        """),
+        {'table': EMBEDDING_TABLE, 'column': FTS_COLUMN},
+    ).first()
+    if expression is None:
+        return None
+    # e.g. to_tsvector('french'::regconfig, tock_immutable_unaccent(document))
+    definition = expression[0] or ''
+    return definition.split("'")[1] if "'" in definition else ''
+
+
+def create_fts_index(
+    engine: Engine,
+    language: str = 'french',
+    replace: bool = False,
+    concurrently: bool = True,
+) -> str:
+    """
+    Create the fts_vector column, generated from the unaccented document in the
+    given language (the orchestrator unaccents the queries the same way), and
+    its GIN index.
+
+    Args:
+        engine: The database engine
+        language: The text search configuration (e.g. 'french', 'english', 'simple')
+        replace: Replace the column generated in another language
+        concurrently: Build the index without locking the writes
+
+    Returns:
+        The GIN index name
+    """
+    name = index_name(FTS_COLUMN, language)
+    with autocommit(engine) as conn:
+        # Fails on an unknown text search configuration
+        conn.execute(text('SELECT CAST(:language AS regconfig)'), {'language': language})
+        conn.execute(text('CREATE EXTENSION IF NOT EXISTS unaccent'))
+        schema = conn.execute(
+            text(
+                'SELECT extnamespace::regnamespace::text FROM pg_extension '
+                "WHERE extname = 'unaccent'"
+            )
+        ).scalar_one()
+        # Schema-qualified: an IMMUTABLE function must not depend on the search path
+        conn.execute(
+            text(f"""
+                CREATE OR REPLACE FUNCTION {IMMUTABLE_UNACCENT}(text) RETURNS text
+                LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+                AS $$ SELECT {schema}.unaccent('{schema}.unaccent'::regdictionary, $1) $$
+            """)
+        )
+
+        current_language = get_fts_language(conn)
+        if current_language is not None and current_language != language:
+            if not replace:
+                raise ValueError(
+                    f"The {FTS_COLUMN} column is generated in '{current_language}': "
+                    'replace it (--replace) to change its language.'
+                )
+            logger.info('Dropping the %s column (%s)...', FTS_COLUMN, current_language)
+            conn.execute(
+                text(f"ALTER TABLE {EMBEDDING_TABLE} DROP COLUMN {FTS_COLUMN}")
+            )
+
+        logger.info('Creating the %s column (%s)...', FTS_COLUMN, language)
+        # The language is checked above, and quoted as a literal
+        quoted_language = language.replace("'", "''")
+        conn.execute(
+            text(
+                f"ALTER TABLE {EMBEDDING_TABLE} ADD COLUMN IF NOT EXISTS {FTS_COLUMN} tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector('{quoted_language}'::regconfig, "
+                f"{IMMUTABLE_UNACCENT}(coalesce(document, '')))) STORED"
+            )
+        )
+
+        logger.info('Creating the %s index...', name)
+        conn.execute(
+            text(
+                f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {name} "
+                f"ON {EMBEDDING_TABLE} USING gin ({FTS_COLUMN})"
+            )
+        )
+    return name
+
+
+def create_metadata_indexes(engine: Engine, concurrently: bool = True) -> list[str]:
+    """
+    Create the metadata indexes: the jsonb_path_ops GIN index of cmetadata
+    (containment and jsonpath operators), and the B-tree index of the
+    collection id (every retrieval query filters on it).
+
+    Returns:
+        The index names
+    """
+    indexes = {
+        # The name of the index declared by LangChain
+        'ix_cmetadata_gin': 'USING gin (cmetadata jsonb_path_ops)',
+        index_name('collection_id'): '(collection_id)',
+    }
+    with autocommit(engine) as conn:
+        for name, definition in indexes.items():
+            logger.info('Creating the %s index...', name)
+            conn.execute(
+                text(
+                    f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {name} "
+                    f"ON {EMBEDDING_TABLE} {definition}"
+                )
+            )
+    return list(indexes)
+
+
+def analyze(engine: Engine) -> None:
+    """Update the planner statistics of the embedding and collection tables."""
+    with autocommit(engine) as conn:
+        for table in (EMBEDDING_TABLE, COLLECTION_TABLE):
+            logger.info('Analyzing the %s table...', table)
+            conn.execute(text(f"ANALYZE {table}"))
+
+
+def find_scans(plan: dict, result: CheckResult) -> None:
+    """Collect the scans of the embedding table in an EXPLAIN plan (JSON format)."""
+    if plan.get('Relation Name') == EMBEDDING_TABLE:
+        if plan['Node Type'] == 'Seq Scan':
+            result.seq_scans.append(
+                f"{'Parallel ' if plan.get('Parallel Aware') else ''}Seq Scan "
+                f"(estimated rows: {plan.get('Plan Rows')})"
+            )
+        elif 'Index Name' in plan:
+            result.index_scans.append(f"{plan['Node Type']} using {plan['Index Name']}")
+    for subplan in plan.get('Plans', []):
+        find_scans(subplan, result)
+
+
+def explain(
+    conn: Connection,
+    query: str,
+    statement: Any,
+    params: Optional[dict] = None,
+    analyze: bool = False,
+) -> CheckResult:
+    """EXPLAIN a retrieval query, and find its scans of the embedding table."""
+    plan = conn.execute(Explain(statement, analyze), params or {}).scalar_one()
+    result = CheckResult(query=query)
+    find_scans(plan[0]['Plan'], result)
+    return result
+
+
+def check_retrieval_queries(
+    engine: Engine,
+    collection_name: str,
+    query: str,
+    language: str = 'french',
+    k: int = 4,
+    analyze: bool = False,
+) -> list[CheckResult]:
+    """
+    EXPLAIN the retrieval queries of the orchestrator on a collection (vector,
+    filtered vector, full-text and hybrid searches), and find their sequential
+    scans of the embedding table.
+    The probe embedding is one of the collection: the embedding model is not
+    called. On a small table, a sequential scan is the planner's right choice.
+
+    Args:
+        engine: The database engine
+        collection_name: The collection (document index) name
+        query: The key words of the full-text searches
+        language: The text search configuration of the full-text searches
+        k: The number of documents of the searches
+        analyze: Run the queries (EXPLAIN ANALYZE), for the actual plans and timings
+    """
+    with engine.connect() as conn:
+        collection_id = conn.execute(
+            text(f"SELECT uuid FROM {COLLECTION_TABLE} WHERE name = :name"),
+            {'name': collection_name},
+        ).scalar_one_or_none()
+        if collection_id is None:
+            raise ValueError(f"Unknown collection: {collection_name}")
+        probe = conn.execute(
+            text(
+                f"SELECT embedding::text, cmetadata FROM {EMBEDDING_TABLE} "
+                'WHERE collection_id = :collection_id LIMIT 1'
+            ),
+            {'collection_id': collection_id},
+        ).first()
+        if probe is None:
+            raise ValueError(f"The collection {collection_name} is empty.")
+        fts_language = get_fts_language(conn)
+
+    embedding = [float(value) for value in probe[0].strip('[]').split(',')]
+    vector_store = CollectionPGVector(
+        # Not called: the searches are built from the probe embedding
+        embeddings=FakeEmbeddings(size=len(embedding)),
+        collection_name=collection_name,
+        connection=engine,
+        use_jsonb=True,
+        create_extension=False,
+    )
+    index_session_id = (probe[1] or {}).get('index_session_id')
+
+    statements = [
+        (
+            'vector search',
+            vector_store.build_search_statement(collection_id, embedding, k),
+            None,
+        ),
+    ]
+    if index_session_id:
+        statements.append(
+            (
+                'vector search, filtered on the index session',
+                vector_store.build_search_statement(
+                    collection_id, embedding, k, {'index_session_id': index_session_id}
+                ),
+                None,
+            )
+        )
+
+    results = []
+    if fts_language is None:
+        results.append(
+            CheckResult(
+                query='full-text and hybrid searches',
+                skipped_reason=f"no {FTS_COLUMN} column (see the create-fts command)",
+            )
+        )
+    else:
+        if fts_language != language:
+            logger.warning(
+                'The %s column is generated in %s, the queries in %s.',
+                FTS_COLUMN,
+                fts_language,
+                language,
+            )
+        statements += [
+            (
+                'full-text search',
+                TEXT_SEARCH_SQL,
+                {
+                    'query': query,
+                    'language': language,
+                    'collection_id': collection_id,
+                    'k': k,
+                },
+            ),
+            (
+                'hybrid search',
+                build_hybrid_search_statement(
+                    vector_store=vector_store,
+                    collection_id=collection_id,
+                    embedding=embedding,
+                    query=query,
+                    k=k,
+                    method=FusionMethod.RRF,
+                    language=language,
+                ),
+                None,
+            ),
+        ]
+
+    with engine.connect() as conn:
+        for name, statement, params in statements:
+            results.append(explain(conn, name, statement, params, analyze))
+    return results
@@ -0,0 +1,184 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Manage the indexes of a PGVector vector store (the langchain_pg_embedding table).
+
+Usage:
+    run_index_management.py create-ann [-v] --vector-store-json-config=<vs_cfg>
+        [--method=<method>] [--distance=<distance>] [--m=<m>] [--ef-construction=<ef>]
+        [--lists=<lists>] [--dimensions=<dim>] [--blocking]
+    run_index_management.py inspect [-v] --vector-store-json-config=<vs_cfg>
+    run_index_management.py rebuild [-v] --vector-store-json-config=<vs_cfg>
+        [--index=<name>...] [--blocking]
+    run_index_management.py create-fts [-v] --vector-store-json-config=<vs_cfg>
+        [--language=<language>] [--replace] [--blocking]
+    run_index_management.py create-metadata-indexes [-v] --vector-store-json-config=<vs_cfg>
+        [--blocking]
+    run_index_management.py analyze [-v] --vector-store-json-config=<vs_cfg>
+    run_index_management.py check [-v] --vector-store-json-config=<vs_cfg>
+        --collection=<name> [--query=<query>] [--language=<language>] [--k=<k>] [--analyze]
+    run_index_management.py (-h | --help)
+    run_index_management.py --version
+
+Commands:
+    create-ann                  Create the ANN index (HNSW or IVFFlat) of the embedding column.
+    inspect                     List the indexes of the embedding table (size, scans, validity).
+    rebuild                     Rebuild the given indexes, or all the ANN indexes
+                                (needed by an IVFFlat index once the rows have changed a lot).
+    create-fts                  Create the fts_vector column, generated from the unaccented document
+                                in the given language, and its GIN index (required by the
+                                full-text and hybrid searches of the orchestrator).
+    create-metadata-indexes     Create the jsonb_path_ops GIN index of cmetadata, and the index of
+                                the collection id.
+    analyze                     Update the planner statistics (run it after a large indexing).
+    check                       EXPLAIN the retrieval queries of the orchestrator on a collection,
+                                and report their sequential scans of the embedding table
+                                (exit code 1 if any).
+
+Arguments:
+    --vector-store-json-config=<vs_cfg>   Path to the PGVector configuration JSON file.
+
+Options:
+    --method=<method>           The ANN index method: hnsw or ivfflat [default: hnsw]
+    --distance=<distance>       The distance: cosine, l2 or ip (the orchestrator uses cosine)
+                                [default: cosine]
+    --m=<m>                     HNSW: the maximum number of connections per layer [default: 16]
+    --ef-construction=<ef>      HNSW: the size of the candidate list at build time [default: 64]
+    --lists=<lists>             IVFFlat: the number of lists (by default: rows / 1000 up to 1M rows,
+                                sqrt(rows) beyond)
+    --dimensions=<dim>          The embedding dimensions, to type an untyped embedding column
+                                (the LangChain default, which pgvector cannot index)
+    --index=<name>              An index to rebuild (repeatable)
+    --language=<language>       The text search configuration. It must be the orchestrator one
+                                (tock_gen_ai_orchestrator_vector_store_fts_language) [default: french]
+    --replace                   Replace the fts_vector column generated in another language
+    --collection=<name>         The collection (document index name) whose queries are checked
+    --query=<query>             The key words of the checked full-text searches [default: question]
+    --k=<k>                     The number of documents of the checked searches [default: 4]
+    --analyze                   Run the checked queries (EXPLAIN ANALYZE)
+    --blocking                  Build the indexes without CONCURRENTLY (faster, but writes are locked)
+    -v                          Enable verbose output for debugging purposes.
+    -h, --help                  Display this help message and exit.
+    --version                   Display the version of the script.
+
+Examples:
+    python run_index_management.py create-ann --vector-store-json-config=vector_store.json \
+        --dimensions=1536
+    python run_index_management.py create-fts --vector-store-json-config=vector_store.json \
+        --language=english
+    python run_index_management.py check --vector-store-json-config=vector_store.json \
+        --collection=ns_03_bot_cmso_session_6f7a7023_ef29_448a_ba33_44ec2e21cd32
+"""
+import json
+import sys
+
+from docopt import docopt
+from scripts.common.logging_config import configure_logging
+from scripts.indexing.pgvector.index_management import (
+    AnnMethod,
+    Distance,
+    analyze,
+    check_retrieval_queries,
+    create_ann_index,
+    create_fts_index,
+    create_metadata_indexes,
+    inspect_indexes,
+    rebuild_indexes,
+)
+
+from gen_ai_orchestrator.models.vector_stores.pgvector.database_pool_registry import (
+    db_pool_registry,
+)
+from gen_ai_orchestrator.models.vector_stores.pgvector.pgvector_setting import (
+    PGVectorStoreSetting,
+)
+
+
+def main():
+    cli_args = docopt(__doc__, version='Run Index Management 1.0.0')
+    logger = configure_logging(cli_args)
+
+    with open(cli_args['--vector-store-json-config'], encoding='utf-8') as config_file:
+        setting = PGVectorStoreSetting(**json.load(config_file))
+    engine = db_pool_registry.get_or_create(setting).sync_engine
+    concurrently = not cli_args['--blocking']
+
+    if cli_args['create-ann']:
+        name = create_ann_index(
+            engine,
+            method=AnnMethod(cli_args['--method']),
+            distance=Distance(cli_args['--distance']),
+            m=int(cli_args['--m']),
+            ef_construction=int(cli_args['--ef-construction']),
+            lists=int(cli_args['--lists']) if cli_args['--lists'] else None,
+            dimensions=int(cli_args['--dimensions']) if cli_args['--dimensions'] else None,
+            concurrently=concurrently,
+        )
+        logger.info(f"ANN index {name} created.")
+
+    elif cli_args['inspect']:
+        for index in inspect_indexes(engine):
+            logger.info(
+                f"{index.name} ({index.method}, {index.size}, {index.scans} scans"
+                f"{'' if index.valid else ', INVALID: rebuild it'}): {index.definition}"
+            )
+
+    elif cli_args['rebuild']:
+        names = rebuild_indexes(engine, cli_args['--index'], concurrently=concurrently)
+        logger.info(f"Rebuilt indexes: {', '.join(names) or 'none'}")
+
+    elif cli_args['create-fts']:
+        name = create_fts_index(
+            engine,
+            language=cli_args['--language'],
+            replace=cli_args['--replace'],
+            concurrently=concurrently,
+        )
+        logger.info(f"Full-text index {name} created.")
+
+    elif cli_args['create-metadata-indexes']:
+        names = create_metadata_indexes(engine, concurrently=concurrently)
+        logger.info(f"Metadata indexes created: {', '.join(names)}")
+
+    elif cli_args['analyze']:
+        analyze(engine)
+        logger.info('Statistics updated.')
+
+    elif cli_args['check']:
+        results = check_retrieval_queries(
+            engine,
+            collection_name=cli_args['--collection'],
+            query=cli_args['--query'],
+            language=cli_args['--language'],
+            k=int(cli_args['--k']),
+            analyze=cli_args['--analyze'],
+        )
+        for result in results:
+            if result.skipped_reason:
+                logger.warning(f"{result.query}: skipped, {result.skipped_reason}")
+            elif result.ok:
+                logger.info(
+                    f"{result.query}: OK ({', '.join(result.index_scans) or 'no index scan'})"
+                )
+            else:
+                logger.warning(
+                    f"{result.query}: SEQUENTIAL SCAN - {', '.join(result.seq_scans)}"
+                )
+        if not all(result.ok for result in results):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()